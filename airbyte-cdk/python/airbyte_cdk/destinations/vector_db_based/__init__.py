@@ -13,6 +13,7 @@ from .config import (
 )
 from .document_processor import Chunk, DocumentProcessor
 from .embedder import CohereEmbedder, Embedder, FakeEmbedder, OpenAIEmbedder
+from .embedding_cache import EmbeddingCache
 from .indexer import Indexer
 from .writer import Writer
 
@@ -24,6 +25,7 @@ __all__ = [
     "CohereEmbeddingConfigModel",
     "DocumentProcessor",
     "Embedder",
+    "EmbeddingCache",
     "FakeEmbedder",
     "FakeEmbeddingConfigModel",
     "FromFieldEmbedder",
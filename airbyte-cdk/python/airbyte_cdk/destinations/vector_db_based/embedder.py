@@ -60,6 +60,14 @@ class Embedder(ABC):
     def embedding_dimensions(self) -> int:
         pass
 
+    @property
+    def identity(self) -> Optional[str]:
+        """
+        Identity of the embedding model, used to key the embeddings stored in an EmbeddingCache. Embeddings are only cached for embedders
+        returning an identity that includes their model, as the embeddings of a text then only depend on this identity.
+        """
+        return None
+
 
 OPEN_AI_VECTOR_SIZE = 1536
 
@@ -100,6 +108,10 @@ class BaseOpenAIEmbedder(Embedder):
         # vector size produced by text-embedding-ada-002 model
         return OPEN_AI_VECTOR_SIZE
 
+    @property
+    def identity(self) -> Optional[str]:
+        return f"{type(self).__name__}:{self.embeddings.model}:{self.embeddings.deployment}"
+
 
 class OpenAIEmbedder(BaseOpenAIEmbedder):
     def __init__(self, config: OpenAIEmbeddingConfigModel, chunk_size: int):
@@ -136,6 +148,10 @@ class CohereEmbedder(Embedder):
         # vector size produced by text-embedding-ada-002 model
         return COHERE_VECTOR_SIZE
 
+    @property
+    def identity(self) -> Optional[str]:
+        return f"{type(self).__name__}:{self.embeddings.model}"
+
 
 class FakeEmbedder(Embedder):
     def __init__(self, config: FakeEmbeddingConfigModel):
@@ -188,6 +204,10 @@ class OpenAICompatibleEmbedder(Embedder):
         # vector size produced by the model
         return self.config.dimensions
 
+    @property
+    def identity(self) -> Optional[str]:
+        return f"{type(self).__name__}:{self.config.base_url}:{self.config.model_name}:{self.config.dimensions}"
+
 
 class FromFieldEmbedder(Embedder):
     def __init__(self, config: FromFieldEmbeddingConfigModel):
@@ -0,0 +1,136 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from airbyte_cdk.destinations.vector_db_based.utils import create_chunks
+
+logger = logging.getLogger("airbyte")
+
+# SQLite limits the number of parameters of a query
+_QUERY_BATCH_SIZE = 500
+# When the cache grows over its maximum size, the least recently used embeddings are evicted until it is back under this ratio of
+# its maximum size so that eviction does not happen on every write
+_EVICTION_TARGET_RATIO = 0.9
+
+
+class EmbeddingCache:
+    """
+    Persistent cache of embeddings stored in a local SQLite file so that chunks whose text did not change since a previous sync are not
+    embedded again.
+
+    Embeddings are keyed by the SHA-256 hash of the identity of the embedding model and of the chunk text. Once the cache grows over
+    max_size_bytes, the least recently used embeddings are evicted. The cache can be used from several threads.
+    """
+
+    def __init__(self, path: str, max_size_bytes: int = 1024 * 1024 * 1024) -> None:
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, embedding BLOB NOT NULL, last_used INTEGER NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        size, last_used = self._connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(key) + LENGTH(embedding)), 0), COALESCE(MAX(last_used), 0) FROM embeddings"
+        ).fetchone()
+        self._size = size
+        # a counter rather than a timestamp so that the order of use is exact
+        self._clock = last_used
+
+    @staticmethod
+    def _key(model: str, text: str) -> bytes:
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8", errors="surrogatepass")).digest()
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Return the cached embedding of each text, or None for the texts whose embedding is not cached.
+        """
+        keys = [self._key(model, text) for text in texts]
+        found: Dict[bytes, List[float]] = {}
+        with self._lock:
+            self._clock += 1
+            for batch in create_chunks(list(set(keys)), _QUERY_BATCH_SIZE):
+                placeholders = ",".join("?" * len(batch))
+                query = f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})"
+                for key, embedding in self._connection.execute(query, batch):
+                    found[key] = array("d", embedding).tolist()
+            for batch in create_chunks(list(found), _QUERY_BATCH_SIZE):
+                placeholders = ",".join("?" * len(batch))
+                self._connection.execute(f"UPDATE embeddings SET last_used = ? WHERE key IN ({placeholders})", (self._clock, *batch))
+            embeddings = [found.get(key) for key in keys]
+            hits = sum(1 for embedding in embeddings if embedding is not None)
+            self.hits += hits
+            self.misses += len(embeddings) - hits
+        return embeddings
+
+    def put_many(self, model: str, texts: Sequence[str], embeddings: Sequence[Optional[List[float]]]) -> None:
+        """
+        Cache the embedding of each text. Texts without embedding are ignored.
+        """
+        rows = {
+            self._key(model, text): array("d", embedding).tobytes() for text, embedding in zip(texts, embeddings) if embedding is not None
+        }
+        if not rows:
+            return
+        with self._lock:
+            self._clock += 1
+            size_before_write = self._size
+            self._connection.execute("BEGIN")
+            try:
+                for batch in create_chunks(list(rows), _QUERY_BATCH_SIZE):
+                    placeholders = ",".join("?" * len(batch))
+                    replaced = self._connection.execute(
+                        f"SELECT COALESCE(SUM(LENGTH(key) + LENGTH(embedding)), 0) FROM embeddings WHERE key IN ({placeholders})", batch
+                    ).fetchone()[0]
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, embedding, last_used) VALUES (?, ?, ?)",
+                        [(key, rows[key], self._clock) for key in batch],
+                    )
+                    self._size += sum(len(key) + len(rows[key]) for key in batch) - replaced
+                if self._size > self.max_size_bytes:
+                    self._evict()
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                self._size = size_before_write
+                raise
+
+    def _evict(self) -> None:
+        target_size = self.max_size_bytes * _EVICTION_TARGET_RATIO
+        while self._size > target_size:
+            rows = self._connection.execute(
+                "SELECT key, LENGTH(key) + LENGTH(embedding) FROM embeddings ORDER BY last_used, rowid LIMIT ?", (_QUERY_BATCH_SIZE,)
+            ).fetchall()
+            if not rows:
+                self._size = 0
+                return
+            evicted_keys = []
+            for key, size in rows:
+                evicted_keys.append(key)
+                self._size -= size
+                if self._size <= target_size:
+                    break
+            placeholders = ",".join("?" * len(evicted_keys))
+            self._connection.execute(f"DELETE FROM embeddings WHERE key IN ({placeholders})", evicted_keys)
+
+    def log_statistics(self) -> None:
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0.0
+        logger.info(
+            f"Embedding cache: {self.hits} hits, {self.misses} misses ({hit_rate:.1%} hit rate), "
+            f"{self._size} bytes used out of {self.max_size_bytes}"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
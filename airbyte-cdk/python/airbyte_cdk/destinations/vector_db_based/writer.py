@@ -3,12 +3,14 @@
 #
 
 
-from collections import defaultdict
-from typing import Dict, Iterable, List, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 from airbyte_cdk.destinations.vector_db_based.config import ProcessingConfigModel
 from airbyte_cdk.destinations.vector_db_based.document_processor import Chunk, DocumentProcessor
 from airbyte_cdk.destinations.vector_db_based.embedder import Document, Embedder
+from airbyte_cdk.destinations.vector_db_based.embedding_cache import EmbeddingCache
 from airbyte_cdk.destinations.vector_db_based.indexer import Indexer
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
 
@@ -24,16 +26,45 @@ class Writer:
     The destination connector is responsible to create a writer instance and pass the input messages iterable to the write method.
     The batch size can be configured by the destination connector to give the freedom of either letting the user configure it or hardcoding it to a sensible value depending on the destination.
     The omit_raw_text parameter can be used to omit the raw text from the chunks. This can be useful if the raw text is very large and not needed for the destination.
+
+    By default, batches are processed serially: reading and chunking records stops while a batch is embedded and indexed.
+    Setting max_pending_batches enables a pipeline:
+    * The main thread keeps reading and chunking records while up to max_pending_batches batches are being embedded or indexed
+    * Batches are embedded by embedding_workers threads, so the embedder has to be thread safe if there are more than one
+    * Batches are indexed by a single thread in the order they were created, so deletions and writes happen in the same order as serially
+    * A state message is emitted once every batch created before it has been indexed
+
+    If an embedding_cache is passed, the embeddings of chunks whose text was already embedded by the same model are read from the cache
+    and only the other chunks are sent to the embedder.
     """
 
     def __init__(
-        self, processing_config: ProcessingConfigModel, indexer: Indexer, embedder: Embedder, batch_size: int, omit_raw_text: bool
+        self,
+        processing_config: ProcessingConfigModel,
+        indexer: Indexer,
+        embedder: Embedder,
+        batch_size: int,
+        omit_raw_text: bool,
+        max_pending_batches: int = 0,
+        embedding_workers: int = 1,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ) -> None:
         self.processing_config = processing_config
         self.indexer = indexer
         self.embedder = embedder
         self.batch_size = batch_size
         self.omit_raw_text = omit_raw_text
+        self.max_pending_batches = max_pending_batches
+        self.embedding_workers = embedding_workers
+        self.embedding_cache = embedding_cache
+        # The pipeline is set up again by every write with max_pending_batches set
+        self._embedding_executor: Optional[ThreadPoolExecutor] = None
+        self._indexing_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_batches: Deque["Future[None]"] = deque()
+        self._last_indexed_batch: Optional["Future[None]"] = None
+        # Each state message waits for the indexing of the last batch created before it. As batches are indexed in order, all the records
+        # which came before the state message have been written to the destination once this batch is indexed
+        self._pending_states: Deque[Tuple[AirbyteMessage, Optional["Future[None]"]]] = deque()
         self._init_batch()
 
     def _init_batch(self) -> None:
@@ -54,18 +85,92 @@ class Writer:
             self.indexer.delete(ids, namespace, stream)
 
         for (namespace, stream), chunks in self.chunks.items():
-            embeddings = self.embedder.embed_documents([self._convert_to_document(chunk) for chunk in chunks])
-            for i, document in enumerate(chunks):
-                document.embedding = embeddings[i]
-                if self.omit_raw_text:
-                    document.page_content = None
+            self._embed_chunks(chunks)
             self.indexer.index(chunks, namespace, stream)
 
         self._init_batch()
 
+    def _embed_chunks(self, chunks: List[Chunk]) -> None:
+        embeddings = self._embed_documents([self._convert_to_document(chunk) for chunk in chunks])
+        for i, document in enumerate(chunks):
+            document.embedding = embeddings[i]
+            if self.omit_raw_text:
+                document.page_content = None
+
+    def _embed_documents(self, documents: List[Document]) -> List[Optional[List[float]]]:
+        model = self.embedder.identity if self.embedding_cache else None
+        if self.embedding_cache is None or model is None:
+            return self.embedder.embed_documents(documents)
+
+        texts = [document.page_content for document in documents]
+        embeddings = self.embedding_cache.get_many(model, texts)
+        missing_indexes = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing_indexes:
+            computed_embeddings = self.embedder.embed_documents([documents[i] for i in missing_indexes])
+            for i, embedding in zip(missing_indexes, computed_embeddings):
+                embeddings[i] = embedding
+            self.embedding_cache.put_many(model, [texts[i] for i in missing_indexes], computed_embeddings)
+        return embeddings
+
+    def _embed_batch(self, chunks: Dict[Tuple[str, str], List[Chunk]]) -> Dict[Tuple[str, str], List[Chunk]]:
+        for stream_chunks in chunks.values():
+            self._embed_chunks(stream_chunks)
+        return chunks
+
+    def _index_batch(
+        self, ids_to_delete: Dict[Tuple[str, str], List[str]], embedded_chunks: "Future[Dict[Tuple[str, str], List[Chunk]]]"
+    ) -> None:
+        chunks = embedded_chunks.result()
+        for (namespace, stream), ids in ids_to_delete.items():
+            self.indexer.delete(ids, namespace, stream)
+
+        for (namespace, stream), stream_chunks in chunks.items():
+            self.indexer.index(stream_chunks, namespace, stream)
+
+    def _submit_batch(self) -> None:
+        """
+        Hand the current batch over to the embedding and indexing threads. Blocks while max_pending_batches batches are already in flight.
+        """
+        if not self.chunks and not self.ids_to_delete:
+            return
+        assert self._embedding_executor and self._indexing_executor  # for mypy, batches are only submitted by pipelined writes
+        embedded_chunks = self._embedding_executor.submit(self._embed_batch, self.chunks)
+        self._last_indexed_batch = self._indexing_executor.submit(self._index_batch, self.ids_to_delete, embedded_chunks)
+        self._pending_batches.append(self._last_indexed_batch)
+        self._init_batch()
+        while len(self._pending_batches) > self.max_pending_batches:
+            # raises if the batch failed to be embedded or indexed
+            self._pending_batches.popleft().result()
+
+    def _emit_ready_states(self, wait: bool) -> Iterable[AirbyteMessage]:
+        while self._pending_states:
+            state, barrier = self._pending_states[0]
+            if barrier is not None:
+                if not wait and not barrier.done():
+                    return
+                barrier.result()
+            self._pending_states.popleft()
+            yield state
+
     def write(self, configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
         self.processor = DocumentProcessor(self.processing_config, configured_catalog)
         self.indexer.pre_sync(configured_catalog)
+        if self.max_pending_batches > 0:
+            yield from self._write_pipelined(input_messages)
+        else:
+            yield from self._write_serially(input_messages)
+        if self.embedding_cache:
+            self.embedding_cache.log_statistics()
+        yield from self.indexer.post_sync()
+
+    def _add_record(self, message: AirbyteMessage) -> None:
+        record_chunks, record_id_to_delete = self.processor.process(message.record)
+        self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
+        if record_id_to_delete is not None:
+            self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
+        self.number_of_chunks += len(record_chunks)
+
+    def _write_serially(self, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
         for message in input_messages:
             if message.type == Type.STATE:
                 # Emitting a state message indicates that all records which came before it have been written to the destination. So we flush
@@ -73,13 +178,33 @@ class Writer:
                 self._process_batch()
                 yield message
             elif message.type == Type.RECORD:
-                record_chunks, record_id_to_delete = self.processor.process(message.record)
-                self.chunks[(message.record.namespace, message.record.stream)].extend(record_chunks)
-                if record_id_to_delete is not None:
-                    self.ids_to_delete[(message.record.namespace, message.record.stream)].append(record_id_to_delete)
-                self.number_of_chunks += len(record_chunks)
+                self._add_record(message)
                 if self.number_of_chunks >= self.batch_size:
                     self._process_batch()
 
         self._process_batch()
-        yield from self.indexer.post_sync()
+
+    def _write_pipelined(self, input_messages: Iterable[AirbyteMessage]) -> Iterable[AirbyteMessage]:
+        self._embedding_executor = ThreadPoolExecutor(max_workers=self.embedding_workers, thread_name_prefix="vector_db_embedding")
+        self._indexing_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vector_db_indexing")
+        self._pending_batches = deque()
+        self._last_indexed_batch = None
+        self._pending_states = deque()
+        try:
+            for message in input_messages:
+                if message.type == Type.STATE:
+                    self._submit_batch()
+                    self._pending_states.append((message, self._last_indexed_batch))
+                elif message.type == Type.RECORD:
+                    self._add_record(message)
+                    if self.number_of_chunks >= self.batch_size:
+                        self._submit_batch()
+                yield from self._emit_ready_states(wait=False)
+
+            self._submit_batch()
+            while self._pending_batches:
+                self._pending_batches.popleft().result()
+            yield from self._emit_ready_states(wait=True)
+        finally:
+            self._embedding_executor.shutdown(wait=True, cancel_futures=True)
+            self._indexing_executor.shutdown(wait=True, cancel_futures=True)
@@ -10,16 +10,18 @@ import os.path
 import socket
 import sys
 import tempfile
+import threading
+import time
 from collections import defaultdict
 from functools import wraps
-from typing import Any, DefaultDict, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import requests
 from airbyte_cdk.connector import TConfig
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
 from airbyte_cdk.logger import init_logger
-from airbyte_cdk.models import AirbyteMessage, FailureType, Status, Type
+from airbyte_cdk.models import AirbyteMessage, FailureType, Level, Status, Type
 from airbyte_cdk.models.airbyte_protocol import AirbyteStateStats, ConnectorSpecification  # type: ignore [attr-defined]
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.connector_state_manager import HashableStreamDescriptor
@@ -27,6 +29,7 @@ from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_o
 from airbyte_cdk.utils import is_cloud_environment, message_utils
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+from airbyte_cdk.utils.message_serializer import AirbyteMessageSerializer, BufferedMessageWriter
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from requests import PreparedRequest, Response, Session
 
@@ -34,10 +37,11 @@ logger = init_logger("airbyte")
 
 VALID_URL_SCHEMES = ["https"]
 CLOUD_DEPLOYMENT_MODE = "cloud"
+PRIVATE_NETWORK_CHECK_TTL_SECONDS = 60.0
 
 
 class AirbyteEntrypoint(object):
-    def __init__(self, source: Source):
+    def __init__(self, source: Source, fast_serialization: bool = False):
         init_uncaught_exception_handler(logger)
 
         # Deployment mode is read when instantiating the entrypoint because it is the common path shared by syncs and connector builder test requests
@@ -46,6 +50,8 @@ class AirbyteEntrypoint(object):
 
         self.source = source
         self.logger = logging.getLogger(f"airbyte.{getattr(source, 'name', '')}")
+        # Opt-in: serializes RECORD messages without going through pydantic while producing the exact same output
+        self._message_to_string = AirbyteMessageSerializer().serialize if fast_serialization else self.airbyte_message_to_string
 
     @staticmethod
     def parse_args(args: List[str]) -> argparse.Namespace:
@@ -100,30 +106,26 @@ class AirbyteEntrypoint(object):
                 os.environ[ENV_REQUEST_CACHE_PATH] = temp_dir  # set this as default directory for request_cache to store *.sqlite files
                 if cmd == "spec":
                     message = AirbyteMessage(type=Type.SPEC, spec=source_spec)
-                    yield from [
-                        self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)
-                    ]
-                    yield self.airbyte_message_to_string(message)
+                    yield from [self._message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)]
+                    yield self._message_to_string(message)
                 else:
                     raw_config = self.source.read_config(parsed_args.config)
                     config = self.source.configure(raw_config, temp_dir)
 
-                    yield from [
-                        self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)
-                    ]
+                    yield from [self._message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)]
                     if cmd == "check":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.check(source_spec, config))
+                        yield from map(self._message_to_string, self.check(source_spec, config))
                     elif cmd == "discover":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.discover(source_spec, config))
+                        yield from map(self._message_to_string, self.discover(source_spec, config))
                     elif cmd == "read":
                         config_catalog = self.source.read_catalog(parsed_args.catalog)
                         state = self.source.read_state(parsed_args.state)
 
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.read(source_spec, config, config_catalog, state))
+                        yield from map(self._message_to_string, self.read(source_spec, config, config_catalog, state))
                     else:
                         raise Exception("Unexpected command " + cmd)
         finally:
-            yield from [self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)]
+            yield from [self._message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)]
 
     def check(self, source_spec: ConnectorSpecification, config: TConfig) -> Iterable[AirbyteMessage]:
         self.set_up_secret_filter(config, source_spec.connectionSpecification)
@@ -165,6 +167,7 @@ class AirbyteEntrypoint(object):
         stream_message_counter: DefaultDict[HashableStreamDescriptor, float] = defaultdict(float)
         for message in self.source.read(self.logger, config, catalog, state):
             yield self.handle_record_counts(message, stream_message_counter)
+        self._log_private_network_check_counters()
         for message in self._emit_queued_messages(self.source):
             yield self.handle_record_counts(message, stream_message_counter)
 
@@ -223,21 +226,111 @@ class AirbyteEntrypoint(object):
             return parsed_args.config
         return None
 
+    def _log_private_network_check_counters(self) -> None:
+        if not is_cloud_environment() or not getattr(self.source, "message_repository", None):
+            return
+        counters = _PRIVATE_NETWORK_CHECK_CACHE.counters()
+        self.source.message_repository.log_message(  # type: ignore [attr-defined]
+            Level.INFO, lambda: {"message": "Private network check on outbound requests", **counters}
+        )
+
     def _emit_queued_messages(self, source: Source) -> Iterable[AirbyteMessage]:
         if hasattr(source, "message_repository") and source.message_repository:
             yield from source.message_repository.consume_queue()
         return
 
 
-def launch(source: Source, args: List[str]) -> None:
-    source_entrypoint = AirbyteEntrypoint(source)
+def launch(source: Source, args: List[str], fast_serialization: bool = False) -> None:
+    """
+    :param fast_serialization: serialize RECORD messages without pydantic and flush stdout by size or time instead of after every
+    message. The protocol output is the same byte for byte.
+    """
+    source_entrypoint = AirbyteEntrypoint(source, fast_serialization=fast_serialization)
     parsed_args = source_entrypoint.parse_args(args)
+    if fast_serialization:
+        writer = BufferedMessageWriter(sys.stdout)
+        try:
+            for message in source_entrypoint.run(parsed_args):
+                writer.write(message)
+        finally:
+            writer.flush()
+        return
+
     for message in source_entrypoint.run(parsed_args):
         # simply printing is creating issues for concurrent CDK as Python uses different two instructions to print: one for the message and
         # the other for the break line. Adding `\n` to the message ensure that both are printed at the same time
         print(f"{message}\n", end="", flush=True)
 
 
+class _PrivateNetworkCheckCache:
+    """
+    Remembers for `ttl_seconds` whether a (hostname, port) resolves to a private network so that the request filter does not do a DNS
+    lookup on every request. Expired entries are resolved again to keep following DNS changes. Resolution errors are never cached and
+    are raised to the caller so that a host which cannot be resolved is rejected every time.
+
+    Only one thread resolves a given host at a time: the other threads requesting the same host wait for its result instead of
+    triggering the same lookup.
+    """
+
+    _MAX_ENTRIES = 1024
+
+    def __init__(self, resolve: Callable[[str, int], bool], ttl_seconds: float = PRIVATE_NETWORK_CHECK_TTL_SECONDS) -> None:
+        self._resolve = resolve
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, int], Tuple[bool, float]] = {}
+        self._host_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._resolutions = 0
+        self._resolution_errors = 0
+
+    def is_private(self, hostname: str, port: int) -> bool:
+        key = (hostname, port)
+        is_private = self._get_unexpired(key)
+        if is_private is not None:
+            return is_private
+
+        with self._host_lock(key):
+            # another thread might have resolved the host while this one was waiting for the lock
+            is_private = self._get_unexpired(key)
+            if is_private is not None:
+                return is_private
+            try:
+                is_private = self._resolve(hostname, port)
+            except Exception:
+                with self._lock:
+                    self._resolution_errors += 1
+                raise
+            with self._lock:
+                self._resolutions += 1
+                if len(self._entries) >= self._MAX_ENTRIES:
+                    self._evict_expired()
+                self._entries[key] = (is_private, time.monotonic() + self._ttl_seconds)
+            return is_private
+
+    def counters(self) -> Dict[str, int]:
+        with self._lock:
+            return {"cache_hits": self._hits, "resolutions": self._resolutions, "resolution_errors": self._resolution_errors}
+
+    def _get_unexpired(self, key: Tuple[str, int]) -> Optional[bool]:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        with self._lock:
+            self._hits += 1
+        return entry[0]
+
+    def _host_lock(self, key: Tuple[str, int]) -> threading.Lock:
+        with self._lock:
+            return self._host_locks.setdefault(key, threading.Lock())
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+            self._host_locks.pop(key, None)
+
+
 def _init_internal_request_filter() -> None:
     """
     Wraps the Python requests library to prevent sending requests to internal URL endpoints.
@@ -258,7 +351,7 @@ def _init_internal_request_filter() -> None:
             raise requests.exceptions.InvalidURL("Invalid URL specified: The endpoint that data is being requested from is not a valid URL")
 
         try:
-            is_private = _is_private_url(parsed_url.hostname, parsed_url.port)  # type: ignore [arg-type]
+            is_private = _PRIVATE_NETWORK_CHECK_CACHE.is_private(parsed_url.hostname, parsed_url.port)  # type: ignore [arg-type]
             if is_private:
                 raise AirbyteTracedException(
                     internal_message=f"Invalid URL endpoint: `{parsed_url.hostname!r}` belongs to a private network",
@@ -291,6 +384,9 @@ def _is_private_url(hostname: str, port: int) -> bool:
     return False
 
 
+_PRIVATE_NETWORK_CHECK_CACHE = _PrivateNetworkCheckCache(_is_private_url)
+
+
 def main() -> None:
     impl_module = os.environ.get("AIRBYTE_IMPL_MODULE", Source.__module__)
     impl_class = os.environ.get("AIRBYTE_IMPL_PATH", Source.__name__)
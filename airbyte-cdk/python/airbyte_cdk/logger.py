@@ -6,7 +6,7 @@ import json
 import logging
 import logging.config
 import traceback
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage
 from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
@@ -31,6 +31,11 @@ LOGGING_CONFIG = {
 }
 
 
+# Values logged at the DEBUG level, such as request and response bodies, are truncated to this size as every log message is also scanned
+# for secrets
+DEBUG_LOG_VALUE_MAX_BYTES = 16 * 1024
+
+
 def init_logger(name: str = None):
     """Initial set up of logger"""
     logger = logging.getLogger(name)
@@ -75,6 +80,30 @@ class AirbyteLogFormatter(logging.Formatter):
         return {k: str(getattr(record, k)) for k in extra_keys if hasattr(record, k)}
 
 
+def truncated_log_extra(key: str, value: Any, encoding: Optional[str] = None, max_bytes: int = DEBUG_LOG_VALUE_MAX_BYTES) -> Dict[str, Any]:
+    """
+    Build the extra fields logging a value that can be large, such as the body of a request or a response. Only the first max_bytes of
+    bytes values are decoded, and strings are cut after max_bytes characters. The rest is replaced by a marker, and the number of bytes
+    left out is reported under `<key>_truncated_bytes`. Values of other types are logged as they are.
+
+    :param key: the name of the extra field holding the value
+    :param value: the value to log
+    :param encoding: the encoding bytes values are decoded with. Defaults to utf-8
+    """
+    truncated_bytes = 0
+    if isinstance(value, bytes):
+        if len(value) > max_bytes:
+            truncated_bytes = len(value) - max_bytes
+            value = value[:max_bytes]
+        value = value.decode(encoding or "utf-8", errors="replace")
+    elif isinstance(value, str) and len(value) > max_bytes:
+        truncated_bytes = len(value[max_bytes:].encode(encoding or "utf-8", errors="replace"))
+        value = value[:max_bytes]
+    if truncated_bytes:
+        value = f"{value}...[{truncated_bytes} bytes truncated]"
+    return {key: value, f"{key}_truncated_bytes": truncated_bytes}
+
+
 def log_by_prefix(msg: str, default_level: str) -> Tuple[int, str]:
     """Custom method, which takes log level from first word of message"""
     valid_log_types = ["FATAL", "ERROR", "WARN", "INFO", "DEBUG", "TRACE"]
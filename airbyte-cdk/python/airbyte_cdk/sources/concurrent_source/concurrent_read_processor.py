@@ -15,7 +15,7 @@ from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionE
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, RecordBatch
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 from airbyte_cdk.utils import AirbyteTracedException
@@ -88,7 +88,8 @@ class ConcurrentReadProcessor:
         self._streams_to_running_partitions[stream_name].add(partition)
         if self._slice_logger.should_log_slice_message(self._logger):
             self._message_repository.emit_message(self._slice_logger.create_slice_log_message(partition.to_slice()))
-        self._thread_pool_manager.submit(self._partition_reader.process_partition, partition)
+        # the partition enqueuer reserved a task before putting the partition in the queue
+        self._thread_pool_manager.submit(self._partition_reader.process_partition, partition, reserved=True)
 
     def on_partition_complete_sentinel(self, sentinel: PartitionCompleteSentinel) -> Iterable[AirbyteMessage]:
         """
@@ -124,20 +125,32 @@ class ConcurrentReadProcessor:
         4. Emit the message
         5. Emit messages that were added to the message repository
         """
-        # Do not pass a transformer or a schema
-        # AbstractStreams are expected to return data as they are expected.
-        # Any transformation on the data should be done before reaching this point
-        message = stream_data_to_airbyte_message(record.stream_name, record.data)
-        stream = self._stream_name_to_instance[record.stream_name]
-
-        if message.type == MessageType.RECORD:
-            if self._record_counter[stream.name] == 0:
-                self._logger.info(f"Marking stream {stream.name} as RUNNING")
-                yield stream_status_as_airbyte_message(stream.as_airbyte_stream(), AirbyteStreamStatus.RUNNING)
-            self._record_counter[stream.name] += 1
-        yield message
+        yield from self._records_to_messages(record.stream_name, [record])
         yield from self._message_repository.consume_queue()
 
+    def on_record_batch(self, batch: RecordBatch) -> Iterable[AirbyteMessage]:
+        """
+        This method is called when a batch of records is read from a partition.
+        The records are handled like in `on_record`, in the order of the batch, but the messages added to the message repository are
+        only emitted once the whole batch was emitted.
+        """
+        yield from self._records_to_messages(batch.stream_name, batch.records)
+        yield from self._message_repository.consume_queue()
+
+    def _records_to_messages(self, stream_name: str, records: List[Record]) -> Iterable[AirbyteMessage]:
+        stream = self._stream_name_to_instance[stream_name]
+        for record in records:
+            # Do not pass a transformer or a schema
+            # AbstractStreams are expected to return data as they are expected.
+            # Any transformation on the data should be done before reaching this point
+            message = stream_data_to_airbyte_message(stream_name, record.data)
+            if message.type == MessageType.RECORD:
+                if self._record_counter[stream.name] == 0:
+                    self._logger.info(f"Marking stream {stream.name} as RUNNING")
+                    yield stream_status_as_airbyte_message(stream.as_airbyte_stream(), AirbyteStreamStatus.RUNNING)
+                self._record_counter[stream.name] += 1
+            yield message
+
     def on_exception(self, exception: StreamThreadException) -> Iterable[AirbyteMessage]:
         """
         This method is called when an exception is raised.
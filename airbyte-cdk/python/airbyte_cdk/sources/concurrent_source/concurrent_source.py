@@ -4,7 +4,7 @@
 import concurrent
 import logging
 from queue import Queue
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator, List, Optional
 
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
@@ -17,7 +17,7 @@ from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionE
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem, RecordBatch
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
 
 
@@ -30,6 +30,11 @@ class ConcurrentSource:
     """
 
     DEFAULT_TIMEOUT_SECONDS = 900
+    # Queue items are mostly batches of records: the default bounds keep the number of records held in memory in the same range as
+    # when the records were queued one by one with a queue of 10_000 items
+    DEFAULT_MAX_QUEUE_SIZE = 100
+    DEFAULT_RECORD_BATCH_SIZE = 100
+    DEFAULT_RECORD_BATCH_BYTES = 1024 * 1024
 
     @staticmethod
     def create(
@@ -39,6 +44,9 @@ class ConcurrentSource:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+        record_batch_bytes: Optional[int] = DEFAULT_RECORD_BATCH_BYTES,
     ) -> "ConcurrentSource":
         is_single_threaded = initial_number_of_partitions_to_generate == 1 and num_workers == 1
         too_many_generator = not is_single_threaded and initial_number_of_partitions_to_generate >= num_workers
@@ -48,7 +56,15 @@ class ConcurrentSource:
             logger,
         )
         return ConcurrentSource(
-            threadpool, logger, slice_logger, message_repository, initial_number_of_partitions_to_generate, timeout_seconds
+            threadpool,
+            logger,
+            slice_logger,
+            message_repository,
+            initial_number_of_partitions_to_generate,
+            timeout_seconds,
+            max_queue_size,
+            record_batch_size,
+            record_batch_bytes,
         )
 
     def __init__(
@@ -59,6 +75,9 @@ class ConcurrentSource:
         message_repository: MessageRepository = InMemoryMessageRepository(),
         initial_number_partitions_to_generate: int = 1,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        record_batch_size: int = DEFAULT_RECORD_BATCH_SIZE,
+        record_batch_bytes: Optional[int] = DEFAULT_RECORD_BATCH_BYTES,
     ) -> None:
         """
         :param threadpool: The threadpool to submit tasks to
@@ -67,6 +86,9 @@ class ConcurrentSource:
         :param message_repository: The repository to emit messages to
         :param initial_number_partitions_to_generate: The initial number of concurrent partition generation tasks. Limiting this number ensures will limit the latency of the first records emitted. While the latency is not critical, emitting the records early allows the platform and the destination to process them as early as possible.
         :param timeout_seconds: The maximum number of seconds to wait for a record to be read from the queue. If no record is read within this time, the source will stop reading and return.
+        :param max_queue_size: The maximum number of items in the queue shared by the workers and the main thread. Once reached, the workers wait for the main thread to catch up. Together with the batch bounds, this bounds the memory used by records waiting to be emitted.
+        :param record_batch_size: The maximum number of records a worker hands over to the main thread in a single queue item. Batching reduces the contention on the queue. A value of 1 disables batching.
+        :param record_batch_bytes: If set, a batch is handed over as soon as the estimated size of its records reaches this number of bytes.
         """
         self._threadpool = threadpool
         self._logger = logger
@@ -74,6 +96,9 @@ class ConcurrentSource:
         self._message_repository = message_repository
         self._initial_number_partitions_to_generate = initial_number_partitions_to_generate
         self._timeout_seconds = timeout_seconds
+        self._max_queue_size = max_queue_size
+        self._record_batch_size = record_batch_size
+        self._record_batch_bytes = record_batch_bytes
 
     def read(
         self,
@@ -88,9 +113,8 @@ class ConcurrentSource:
 
         # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
         # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
-        # partitions which would fill the queue. This number is arbitrarily set to 10_000 but will probably need to be changed given more
-        # information and might even need to be configurable depending on the source
-        queue: Queue[QueueItem] = Queue(maxsize=10_000)
+        # partitions which would fill the queue.
+        queue: Queue[QueueItem] = Queue(maxsize=self._max_queue_size)
         concurrent_stream_processor = ConcurrentReadProcessor(
             stream_instances_to_read_from,
             PartitionEnqueuer(queue, self._threadpool),
@@ -98,7 +122,7 @@ class ConcurrentSource:
             self._logger,
             self._slice_logger,
             self._message_repository,
-            PartitionReader(queue),
+            PartitionReader(queue, self._record_batch_size, self._record_batch_bytes),
         )
 
         # Enqueue initial partition generation tasks
@@ -138,7 +162,10 @@ class ConcurrentSource:
         concurrent_stream_processor: ConcurrentReadProcessor,
     ) -> Iterable[AirbyteMessage]:
         # handle queue item and call the appropriate handler depending on the type of the queue item
-        if isinstance(queue_item, StreamThreadException):
+        # record batches are by far the most frequent items so they are checked first
+        if isinstance(queue_item, RecordBatch):
+            yield from concurrent_stream_processor.on_record_batch(queue_item)
+        elif isinstance(queue_item, StreamThreadException):
             yield from concurrent_stream_processor.on_exception(queue_item)
         elif isinstance(queue_item, PartitionGenerationCompletedSentinel):
             yield from concurrent_stream_processor.on_partition_generation_completed(queue_item)
@@ -4,7 +4,7 @@
 import logging
 import threading
 from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Optional, Set
 
 
 class ThreadPoolManager:
@@ -28,48 +28,69 @@ class ThreadPoolManager:
         self._threadpool = threadpool
         self._logger = logger
         self._max_concurrent_tasks = max_concurrent_tasks
-        self._futures: List[Future[Any]] = []
-        self._lock = threading.Lock()
+        # Futures are tracked through done callbacks rather than by scanning them: the futures not done yet are removed from this set
+        # as they complete and waiting threads are notified when the number of pending tasks goes below the limit
+        self._futures: Set[Future[Any]] = set()
+        # Tasks that threads waiting for the limit were allowed to create but that were not submitted yet
+        self._reserved_tasks = 0
+        self._condition = threading.Condition()
         self._most_recently_seen_exception: Optional[Exception] = None
 
         self._logging_threshold = max_concurrent_tasks * 2
 
     def prune_to_validate_has_reached_futures_limit(self) -> bool:
-        self._prune_futures(self._futures)
-        if len(self._futures) > self._logging_threshold:
-            self._logger.warning(f"ThreadPoolManager: The list of futures is getting bigger than expected ({len(self._futures)})")
-        return len(self._futures) >= self._max_concurrent_tasks
-
-    def submit(self, function: Callable[..., Any], *args: Any) -> None:
-        self._futures.append(self._threadpool.submit(function, *args))
-
-    def _prune_futures(self, futures: List[Future[Any]]) -> None:
         """
-        Take a list in input and remove the futures that are completed. If a future has an exception, it'll raise and kill the stream
-        operation.
-
-        We are using a lock here as without it, the algorithm would not be thread safe
+        Return whether the number of pending tasks reached the limit. Completed futures are already pruned by their done callback.
         """
-        with self._lock:
-            if len(futures) < self._max_concurrent_tasks:
-                return
+        return self._pending_tasks() >= self._max_concurrent_tasks
 
-            for index in reversed(range(len(futures))):
-                future = futures[index]
+    def wait_until_futures_limit_not_reached(self) -> None:
+        """
+        Block until the number of pending tasks is below the limit and reserve a task for the caller, which is expected to lead to the
+        submission of a task, e.g. by putting a partition in the queue consumed by the main thread. The calling thread is woken up as soon
+        as a task completes instead of polling. The reservation is released when that task is submitted with `reserved=True`.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending_tasks() < self._max_concurrent_tasks)
+            self._reserved_tasks += 1
 
-                if future.done():
-                    # Only call future.exception() if the future is known to be done because it will block until the future is done.
-                    # See https://docs.python.org/3/library/concurrent.futures.html#concurrent.futures.Future.exception
-                    optional_exception = future.exception()
-                    if optional_exception:
-                        # Exception handling should be done in the main thread. Hence, we only store the exception and expect the main
-                        # thread to call raise_if_exception
-                        # We do not expect this error to happen. The futures created during concurrent syncs should catch the exception and
-                        # push it to the queue. If this exception occurs, please review the futures and how they handle exceptions.
-                        self._most_recently_seen_exception = RuntimeError(
-                            f"Failed processing a future: {optional_exception}. Please contact the Airbyte team."
-                        )
-                    futures.pop(index)
+    def submit(self, function: Callable[..., Any], *args: Any, reserved: bool = False) -> None:
+        """
+        :param reserved: whether the task was reserved through wait_until_futures_limit_not_reached, in which case its reservation is
+        released
+        """
+        future = self._threadpool.submit(function, *args)
+        with self._condition:
+            self._futures.add(future)
+            if reserved:
+                self._reserved_tasks = max(self._reserved_tasks - 1, 0)
+            pending_futures = len(self._futures)
+        if pending_futures > self._logging_threshold:
+            self._logger.warning(f"ThreadPoolManager: The list of futures is getting bigger than expected ({pending_futures})")
+        # If the future is already done, the callback is called immediately
+        future.add_done_callback(self._on_future_done)
+
+    def _on_future_done(self, future: Future[Any]) -> None:
+        """
+        Remove the future from the pending ones. If the future has an exception, it'll be raised by check_for_errors_and_shutdown and kill
+        the stream operation.
+        """
+        optional_exception = None if future.cancelled() else future.exception()
+        with self._condition:
+            if optional_exception:
+                # Exception handling should be done in the main thread. Hence, we only store the exception and expect the main
+                # thread to call raise_if_exception
+                # We do not expect this error to happen. The futures created during concurrent syncs should catch the exception and
+                # push it to the queue. If this exception occurs, please review the futures and how they handle exceptions.
+                self._most_recently_seen_exception = RuntimeError(
+                    f"Failed processing a future: {optional_exception}. Please contact the Airbyte team."
+                )
+            self._futures.discard(future)
+            if not self._futures or self._pending_tasks() < self._max_concurrent_tasks:
+                self._condition.notify_all()
+
+    def _pending_tasks(self) -> int:
+        return len(self._futures) + self._reserved_tasks
 
     def _shutdown(self) -> None:
         # Without a way to stop the threads that have already started, this will not stop the Python application. We are fine today with
@@ -77,32 +98,23 @@ class ThreadPoolManager:
         self._threadpool.shutdown(wait=False, cancel_futures=True)
 
     def is_done(self) -> bool:
-        return all([f.done() for f in self._futures])
+        return not self._futures
 
     def check_for_errors_and_shutdown(self) -> None:
         """
-        Check if any of the futures have an exception, and raise it if so. If all futures are done, shutdown the threadpool.
-        If the futures are not done, raise an exception.
+        Wait for the pending futures to be done, then shutdown the threadpool and raise the exception of any future that failed. Tasks can
+        put their last item in the queue before returning, so some futures may still be running once the queue has been consumed.
         :return:
         """
+        with self._condition:
+            self._condition.wait_for(lambda: not self._futures)
         if self._most_recently_seen_exception:
             self._logger.exception(
                 "An unknown exception has occurred while reading concurrently",
                 exc_info=self._most_recently_seen_exception,
             )
             self._stop_and_raise_exception(self._most_recently_seen_exception)
-
-        exceptions_from_futures = [f for f in [future.exception() for future in self._futures] if f is not None]
-        if exceptions_from_futures:
-            exception = RuntimeError(f"Failed reading with errors: {exceptions_from_futures}")
-            self._stop_and_raise_exception(exception)
-        else:
-            futures_not_done = [f for f in self._futures if not f.done()]
-            if futures_not_done:
-                exception = RuntimeError(f"Failed reading with futures not done: {futures_not_done}")
-                self._stop_and_raise_exception(exception)
-            else:
-                self._shutdown()
+        self._shutdown()
 
     def _stop_and_raise_exception(self, exception: BaseException) -> None:
         self._shutdown()
@@ -0,0 +1,48 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+from dataclasses import InitVar, dataclass
+from typing import Any, Mapping, Optional, Union
+
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.types import Config
+
+
+@dataclass
+class ConcurrencyLevel:
+    """
+    Number of worker threads reading the streams of a declarative source concurrently
+
+    Attributes:
+        default_concurrency (Union[int, str]): the number of worker threads or an interpolated string evaluating to it
+        max_concurrency (Optional[int]): the maximum number of worker threads, required if default_concurrency depends on the config
+    """
+
+    default_concurrency: Union[int, str]
+    config: Config
+    parameters: InitVar[Mapping[str, Any]]
+    max_concurrency: Optional[int] = None
+
+    def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        if isinstance(self.default_concurrency, str):
+            if "config" in self.default_concurrency and not self.max_concurrency:
+                raise ValueError("max_concurrency must be defined when default_concurrency is interpolated from the config")
+            self._default_concurrency: Union[int, InterpolatedString] = InterpolatedString.create(
+                self.default_concurrency, parameters=parameters
+            )
+        else:
+            self._default_concurrency = self.default_concurrency
+
+    def get_concurrency_level(self) -> int:
+        if isinstance(self._default_concurrency, InterpolatedString):
+            concurrency_level = self._default_concurrency.eval(self.config)
+            if not isinstance(concurrency_level, int):
+                raise ValueError(f"default_concurrency should evaluate to an integer. Got {concurrency_level}")
+        else:
+            concurrency_level = self._default_concurrency
+        if self.max_concurrency:
+            concurrency_level = min(concurrency_level, self.max_concurrency)
+        if concurrency_level < 1:
+            raise ValueError(f"The concurrency level should be at least 1. Got {concurrency_level}")
+        return concurrency_level
@@ -3,7 +3,64 @@
 #
 
 import datetime
-from typing import Union
+import re
+from functools import lru_cache
+from typing import Callable, Optional, Union
+
+# Fixed-width regular expressions for the directives handled without strptime. Any string they do not match is parsed by strptime
+_FAST_DIRECTIVE_PATTERNS = {
+    "Y": r"(?P<Y>[0-9]{4})",
+    "m": r"(?P<m>[0-9]{2})",
+    "d": r"(?P<d>[0-9]{2})",
+    "H": r"(?P<H>[0-9]{2})",
+    "M": r"(?P<M>[0-9]{2})",
+    "S": r"(?P<S>[0-9]{2})",
+    "f": r"(?P<f>[0-9]{1,6})",
+    "z": r"(?P<z>Z|[+-][0-9]{2}:?[0-5][0-9])",
+}
+_FAST_LITERALS = frozenset("-T:. /_Z")
+
+
+@lru_cache(maxsize=None)
+def _fast_parser(format: str) -> Optional[Callable[[str], Optional[datetime.datetime]]]:
+    """
+    Builds a parser skipping strptime for formats made of numeric date and time directives, such as the ISO 8601 formats. It returns
+    None for strings strptime could parse differently (e.g. fields not zero padded) so that these are still parsed by strptime.
+    """
+    tokens = re.findall(r"%.|[^%]", format)
+    if any(token not in _FAST_LITERALS and token[1:] not in _FAST_DIRECTIVE_PATTERNS for token in tokens):
+        return None
+    directives = {token[1:] for token in tokens if token.startswith("%")}
+    if len(directives) != sum(token.startswith("%") for token in tokens) or not {"Y", "m", "d"} <= directives:
+        return None
+    pattern = re.compile("".join(_FAST_DIRECTIVE_PATTERNS[token[1:]] if token.startswith("%") else re.escape(token) for token in tokens))
+
+    def parse(date: str) -> Optional[datetime.datetime]:
+        match = pattern.fullmatch(date)
+        if not match:
+            return None
+        fields = match.groupdict()
+        tzinfo = None
+        offset = fields.get("z")
+        if offset:
+            if offset == "Z":
+                tzinfo = datetime.timezone.utc
+            else:
+                sign = -1 if offset[0] == "-" else 1
+                tzinfo = datetime.timezone(sign * datetime.timedelta(hours=int(offset[1:3]), minutes=int(offset[-2:])))
+        fraction = fields.get("f")
+        return datetime.datetime(
+            int(fields["Y"]),
+            int(fields["m"]),
+            int(fields["d"]),
+            int(fields.get("H") or 0),
+            int(fields.get("M") or 0),
+            int(fields.get("S") or 0),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            tzinfo=tzinfo,
+        )
+
+    return parse
 
 
 class DatetimeParser:
@@ -30,6 +87,16 @@ class DatetimeParser:
         elif format == "%ms":
             return self._UNIX_EPOCH + datetime.timedelta(milliseconds=int(date))
 
+        fast_parser = _fast_parser(format)
+        if fast_parser and isinstance(date, str):
+            try:
+                parsed_datetime = fast_parser(date)
+            except ValueError:
+                # out of range values are left to strptime which reports them as before
+                parsed_datetime = None
+            if parsed_datetime:
+                return parsed_datetime if parsed_datetime.tzinfo else parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+
         parsed_datetime = datetime.datetime.strptime(str(date), format)
         if self._is_naive(parsed_datetime):
             return parsed_datetime.replace(tzinfo=datetime.timezone.utc)
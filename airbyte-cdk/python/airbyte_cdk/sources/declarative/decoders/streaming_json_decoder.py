@@ -0,0 +1,200 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import json
+import re
+import threading
+from dataclasses import InitVar, dataclass
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
+from weakref import WeakKeyDictionary
+
+import requests
+from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _JsonStreamReader:
+    """
+    Reads JSON values one at a time from a stream of text chunks. Only the part of the document that was not consumed yet is kept in
+    memory, so the memory used is bounded by the size of the largest value read plus the size of a chunk.
+    """
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def peek(self) -> str:
+        """
+        Skip whitespaces and return the next character without consuming it, or an empty string if the document has been fully read
+        """
+        while True:
+            whitespaces = _WHITESPACE.match(self._buffer, self._position)
+            self._position = whitespaces.end() if whitespaces else self._position
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_until(1):
+                return ""
+
+    def consume(self, expected: str) -> None:
+        character = self.peek()
+        if character != expected:
+            raise ValueError(f"Expected '{expected}' but got '{character}' while streaming JSON document")
+        self._position += 1
+
+    def read_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._position)
+                # a value ending with the buffer might be truncated (e.g. a number) unless there is nothing more to read
+                if end < len(self._buffer) or self._exhausted:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            # the pending data is at least doubled before decoding again so that a value spanning many chunks is copied and decoded a
+            # number of times that is logarithmic in its size, for a total cost that is linear in its size
+            self._read_until(2 * (len(self._buffer) - self._position))
+
+    def _read_until(self, size: int) -> bool:
+        """
+        Read chunks until at least `size` characters are pending and join them to the pending data at once. Return False if there was
+        nothing left to read.
+        """
+        pending = [self._buffer[self._position :]]
+        pending_size = len(pending[0])
+        for chunk in self._chunks:
+            if chunk:
+                pending.append(chunk)
+                pending_size += len(chunk)
+                if pending_size >= size:
+                    break
+        else:
+            self._exhausted = True
+        if len(pending) == 1:
+            return False
+        self._buffer = "".join(pending)
+        self._position = 0
+        return True
+
+
+@dataclass
+class StreamingJsonDecoder(Decoder):
+    """
+    Decoder strategy that reads the json-encoded content of a response incrementally instead of decoding it as a whole.
+
+    When used by a DpathExtractor, the records are yielded one at a time as the response is read, so neither the decoded text of the
+    response nor the whole document tree is held in memory. The rest of the document (e.g. a pagination cursor) is kept and returned by
+    `decode` so that paginators using this decoder do not decode the response again. The records are not part of the document returned by
+    `decode` once they have been extracted.
+    """
+
+    parameters: InitVar[Mapping[str, Any]]
+    chunk_size: int = 64 * 1024
+
+    # Documents without their records, per response, shared by all the decoders as the extractor and the paginator have different instances
+    _documents_without_records: ClassVar["WeakKeyDictionary[requests.Response, Union[Mapping[str, Any], List[Any]]]"] = WeakKeyDictionary()
+    _documents_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def decode(self, response: requests.Response) -> Union[Mapping[str, Any], List[Any]]:
+        with self._documents_lock:
+            document = self._documents_without_records.get(response)
+        if document is not None:
+            return document
+        try:
+            return self._reader(response).read_value()  # type: ignore  # a JSON document is expected to be an object or an array
+        except ValueError:
+            return {}
+
+    def iterate_records(self, response: requests.Response, path: List[str]) -> Iterable[Mapping[str, Any]]:
+        """
+        Yield the records at `path` following the same rules as the DpathExtractor: if `path` contains `*`, every value it matches is a
+        record. Otherwise, the value at `path` is a list of records or a single record.
+        """
+        reader = self._reader(response)
+        document: Dict[str, Any] = {}
+        if not path and reader.peek() == "{":
+            # the record is the document itself
+            document = reader.read_value()
+            if document:
+                yield document
+        elif reader.peek():
+            yield from self._iterate(reader, path, "*" in path, document)
+        with self._documents_lock:
+            self._documents_without_records[response] = document
+
+    def _reader(self, response: requests.Response) -> _JsonStreamReader:
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        if response.raw is not None:
+            content_chunks = response.iter_content(chunk_size=self.chunk_size)
+        else:
+            # responses built without a connection (e.g. from cached content) can't be iterated by requests
+            content = response.content or b""
+            content_chunks = (content[index : index + self.chunk_size] for index in range(0, len(content), self.chunk_size))
+        return _JsonStreamReader(decoder.decode(chunk) for chunk in content_chunks)
+
+    def _iterate(
+        self, reader: _JsonStreamReader, path: List[str], has_wildcard: bool, document: Optional[MutableMapping[str, Any]]
+    ) -> Iterator[Any]:
+        """
+        Yield the values at `path` from the value the reader is positioned on. The values of the object keys that are not on `path` are
+        added to `document`.
+        """
+        character = reader.peek()
+        if not path:
+            if has_wildcard:
+                yield reader.read_value()
+            elif character == "[":
+                yield from self._iterate_array(reader)
+            else:
+                value = reader.read_value()
+                if value:
+                    yield value
+        elif character == "{":
+            reader.consume("{")
+            while reader.peek() != "}":
+                key = reader.read_value()
+                reader.consume(":")
+                if path[0] == "*" or key == path[0]:
+                    sub_document: Dict[str, Any] = {}
+                    is_object = reader.peek() == "{"
+                    yield from self._iterate(reader, path[1:], has_wildcard, sub_document)
+                    if document is not None and is_object and sub_document:
+                        document[key] = sub_document
+                else:
+                    value = reader.read_value()
+                    if document is not None:
+                        document[key] = value
+                if reader.peek() == ",":
+                    reader.consume(",")
+            reader.consume("}")
+        elif character == "[":
+            reader.consume("[")
+            index = 0
+            while reader.peek() != "]":
+                if path[0] == "*" or path[0] == str(index):
+                    yield from self._iterate(reader, path[1:], has_wildcard, None)
+                else:
+                    reader.read_value()
+                index += 1
+                if reader.peek() == ",":
+                    reader.consume(",")
+            reader.consume("]")
+        else:
+            reader.read_value()
+
+    @staticmethod
+    def _iterate_array(reader: _JsonStreamReader) -> Iterator[Any]:
+        reader.consume("[")
+        while reader.peek() != "]":
+            yield reader.read_value()
+            if reader.peek() == ",":
+                reader.consume(",")
+        reader.consume("]")
@@ -4,7 +4,7 @@
 
 import datetime
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Type
 from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimeParser
@@ -69,6 +69,8 @@ class DatetimeBasedCursor(Cursor):
     message_repository: Optional[MessageRepository] = None
     cursor_datetime_formats: List[str] = field(default_factory=lambda: [])
 
+    _MAX_PARSED_SLICE_BOUNDARIES = 1024
+
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         if (self.step and not self.cursor_granularity) or (not self.step and self.cursor_granularity):
             raise ValueError(
@@ -93,6 +95,19 @@ class DatetimeBasedCursor(Cursor):
         self._partition_field_end = InterpolatedString.create(self.partition_field_end or "end_time", parameters=parameters)
         self._parser = DatetimeParser()
 
+        # Field names that do not depend on the config are evaluated once instead of for every record
+        self._cursor_field_name = self._evaluate_if_constant(self._cursor_field)
+        self._partition_field_start_name = self._evaluate_if_constant(self._partition_field_start)
+        self._partition_field_end_name = self._evaluate_if_constant(self._partition_field_end)
+        self._highest_observed_cursor_datetime: Optional[Tuple[str, datetime.datetime]] = None
+        self._parsed_slice_boundaries: Dict[str, datetime.datetime] = {}
+        self._state_boundaries: Optional[Tuple[Any, datetime.datetime]] = None
+        # Boundaries that can depend on the current time or on the config (e.g. `{{ now_utc() }}`) are evaluated for every record
+        self._constant_sync_boundaries: Dict[str, Any] = {}
+        self._is_start_datetime_constant = self._is_constant_datetime(self._start_datetime)
+        self._is_end_datetime_constant = self._end_datetime is None or self._is_constant_datetime(self._end_datetime)
+        self._is_lookback_window_constant = self._lookback_window is None or self._lookback_window.is_constant
+
         # If datetime format is not specified then start/end datetime should inherit it from the stream slicer
         if not self._start_datetime.datetime_format:
             self._start_datetime.datetime_format = self.datetime_format
@@ -101,9 +116,11 @@ class DatetimeBasedCursor(Cursor):
 
         if not self.cursor_datetime_formats:
             self.cursor_datetime_formats = [self.datetime_format]
+        # Formats are tried in this order, moving the format that last matched first
+        self._datetime_formats = list(dict.fromkeys(self.cursor_datetime_formats + [self.datetime_format]))
 
     def get_stream_state(self) -> StreamState:
-        return {self._cursor_field.eval(self.config): self._cursor} if self._cursor else {}
+        return {self._get_cursor_field_name(): self._cursor} if self._cursor else {}
 
     def set_initial_state(self, stream_state: StreamState) -> None:
         """
@@ -112,7 +129,7 @@ class DatetimeBasedCursor(Cursor):
 
         :param stream_state: The state of the stream as returned by get_stream_state
         """
-        self._cursor = stream_state.get(self._cursor_field.eval(self.config)) if stream_state else None
+        self._cursor = stream_state.get(self._get_cursor_field_name()) if stream_state else None
 
     def observe(self, stream_slice: StreamSlice, record: Record) -> None:
         """
@@ -122,21 +139,29 @@ class DatetimeBasedCursor(Cursor):
         :param record: the most recently-read record, which the cursor can use to update the stream state. Outwardly-visible changes to the
           stream state may need to be deferred depending on whether the source reliably orders records by the cursor field.
         """
-        record_cursor_value = record.get(self._cursor_field.eval(self.config))
+        record_cursor_value = record.get(self._get_cursor_field_name())
         # if the current record has no cursor value, we cannot meaningfully update the state based on it, so there is nothing more to do
         if not record_cursor_value:
             return
 
-        start_field = self._partition_field_start.eval(self.config)
-        end_field = self._partition_field_end.eval(self.config)
-        is_highest_observed_cursor_value = not self._highest_observed_cursor_field_value or self.parse_date(
-            record_cursor_value
-        ) > self.parse_date(self._highest_observed_cursor_field_value)
-        if (
-            self._is_within_daterange_boundaries(record, stream_slice.get(start_field), stream_slice.get(end_field))  # type: ignore # we know that stream_slices for these cursors will use a string representing an unparsed date
-            and is_highest_observed_cursor_value
+        record_cursor_datetime = self.parse_date(record_cursor_value)
+        is_highest_observed_cursor_value = (
+            not self._highest_observed_cursor_field_value or record_cursor_datetime > self._get_highest_observed_cursor_datetime()
+        )
+        if is_highest_observed_cursor_value and self._is_cursor_datetime_within_boundaries(
+            record_cursor_datetime,
+            stream_slice.get(self._get_partition_field_start_name()),  # type: ignore # we know that stream_slices for these cursors will use a string representing an unparsed date
+            stream_slice.get(self._get_partition_field_end_name()),  # type: ignore # we know that stream_slices for these cursors will use a string representing an unparsed date
         ):
             self._highest_observed_cursor_field_value = record_cursor_value
+            self._highest_observed_cursor_datetime = (record_cursor_value, record_cursor_datetime)
+
+    def _get_highest_observed_cursor_datetime(self) -> datetime.datetime:
+        # the parsed value is only reused if the highest observed value was not modified since it was parsed
+        highest_observed_cursor_value: str = self._highest_observed_cursor_field_value  # type: ignore # only called once a value was observed
+        if not self._highest_observed_cursor_datetime or self._highest_observed_cursor_datetime[0] != highest_observed_cursor_value:
+            self._highest_observed_cursor_datetime = (highest_observed_cursor_value, self.parse_date(highest_observed_cursor_value))
+        return self._highest_observed_cursor_datetime[1]
 
     def close_slice(self, stream_slice: StreamSlice, *args: Any) -> None:
         if stream_slice.partition:
@@ -181,8 +206,8 @@ class DatetimeBasedCursor(Cursor):
         return min(self._end_datetime.get_datetime(self.config), now)
 
     def _calculate_cursor_datetime_from_state(self, stream_state: Mapping[str, Any]) -> datetime.datetime:
-        if self._cursor_field.eval(self.config, stream_state=stream_state) in stream_state:
-            return self.parse_date(stream_state[self._cursor_field.eval(self.config)])
+        if self._get_cursor_field_name(stream_state=stream_state) in stream_state:
+            return self.parse_date(stream_state[self._get_cursor_field_name()])
         return datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
 
     def _format_datetime(self, dt: datetime.datetime) -> str:
@@ -191,8 +216,8 @@ class DatetimeBasedCursor(Cursor):
     def _partition_daterange(
         self, start: datetime.datetime, end: datetime.datetime, step: Union[datetime.timedelta, Duration]
     ) -> List[StreamSlice]:
-        start_field = self._partition_field_start.eval(self.config)
-        end_field = self._partition_field_end.eval(self.config)
+        start_field = self._get_partition_field_start_name()
+        end_field = self._get_partition_field_end_name()
         dates = []
         while start <= end:
             next_start = self._evaluate_next_start_date_safely(start, step)
@@ -226,13 +251,36 @@ class DatetimeBasedCursor(Cursor):
         return comparator(cursor_date, default_date)
 
     def parse_date(self, date: str) -> datetime.datetime:
-        for datetime_format in self.cursor_datetime_formats + [self.datetime_format]:
+        datetime_formats = self._datetime_formats
+        for index, datetime_format in enumerate(datetime_formats):
             try:
-                return self._parser.parse(date, datetime_format)
+                parsed_date = self._parser.parse(date, datetime_format)
             except ValueError:
-                pass
+                continue
+            if index:
+                # records of a stream usually share a format so the one that matched is tried first for the next values
+                self._datetime_formats = [datetime_format] + datetime_formats[:index] + datetime_formats[index + 1 :]
+            return parsed_date
         raise ValueError(f"No format in {self.cursor_datetime_formats} matching {date}")
 
+    def _get_cursor_field_name(self, **kwargs: Any) -> Any:
+        if self._cursor_field_name is not None:
+            return self._cursor_field_name
+        return self._cursor_field.eval(self.config, **kwargs)
+
+    def _get_partition_field_start_name(self) -> Any:
+        if self._partition_field_start_name is not None:
+            return self._partition_field_start_name
+        return self._partition_field_start.eval(self.config)
+
+    def _get_partition_field_end_name(self) -> Any:
+        if self._partition_field_end_name is not None:
+            return self._partition_field_end_name
+        return self._partition_field_end.eval(self.config)
+
+    def _evaluate_if_constant(self, interpolated_string: InterpolatedString) -> Any:
+        return interpolated_string.eval(self.config) if interpolated_string.is_constant else None
+
     @classmethod
     def _parse_timedelta(cls, time_str: Optional[str]) -> Union[datetime.timedelta, Duration]:
         """
@@ -288,14 +336,14 @@ class DatetimeBasedCursor(Cursor):
             return options
         if self.start_time_option and self.start_time_option.inject_into == option_type:
             options[self.start_time_option.field_name.eval(config=self.config)] = stream_slice.get(  # type: ignore # field_name is always casted to an interpolated string
-                self._partition_field_start.eval(self.config)
+                self._get_partition_field_start_name()
             )
         if self.end_time_option and self.end_time_option.inject_into == option_type:
-            options[self.end_time_option.field_name.eval(config=self.config)] = stream_slice.get(self._partition_field_end.eval(self.config))  # type: ignore # field_name is always casted to an interpolated string
+            options[self.end_time_option.field_name.eval(config=self.config)] = stream_slice.get(self._get_partition_field_end_name())  # type: ignore # field_name is always casted to an interpolated string
         return options
 
     def should_be_synced(self, record: Record) -> bool:
-        cursor_field = self._cursor_field.eval(self.config)
+        cursor_field = self._get_cursor_field_name()
         record_cursor_value = record.get(cursor_field)
         if not record_cursor_value:
             self._send_log(
@@ -303,14 +351,54 @@ class DatetimeBasedCursor(Cursor):
                 f"Could not find cursor field `{cursor_field}` in record. The incremental sync will assume it needs to be synced",
             )
             return True
-        latest_possible_cursor_value = self._select_best_end_datetime()
-        earliest_possible_cursor_value = self._calculate_earliest_possible_value(latest_possible_cursor_value)
-        return self._is_within_daterange_boundaries(record, earliest_possible_cursor_value, latest_possible_cursor_value)
+        earliest_possible_cursor_value, latest_possible_cursor_value = self._get_sync_boundaries()
+        return earliest_possible_cursor_value <= self.parse_date(record_cursor_value) <= latest_possible_cursor_value
+
+    def _get_sync_boundaries(self) -> Tuple[datetime.datetime, datetime.datetime]:
+        """
+        Returns the same boundaries as _calculate_earliest_possible_value and _select_best_end_datetime. The datetime read from the state
+        is only parsed again when the state changes, and the start datetime, end datetime and lookback window are only evaluated once if
+        they are constant, rather than for every record.
+        """
+        if self._state_boundaries is None or self._state_boundaries[0] != self._cursor:
+            self._state_boundaries = (self._cursor, self._calculate_cursor_datetime_from_state(self.get_stream_state()))
+        cursor_datetime = self._state_boundaries[1]
+        start_datetime = self._evaluate_sync_boundary(
+            "start_datetime", self._is_start_datetime_constant, lambda: self._start_datetime.get_datetime(self.config)
+        )
+        end_datetime = self._evaluate_sync_boundary(
+            "end_datetime",
+            self._is_end_datetime_constant,
+            lambda: self._end_datetime.get_datetime(self.config) if self._end_datetime else None,
+        )
+        lookback_delta = self._evaluate_sync_boundary(
+            "lookback_delta",
+            self._is_lookback_window_constant,
+            lambda: self._parse_timedelta(self._lookback_window.eval(self.config) if self._lookback_window else "P0D"),
+        )
+        now = datetime.datetime.now(tz=self._timezone)
+        latest_possible_cursor_value = min(end_datetime, now) if end_datetime else now
+        earliest_possible_cursor_value = max(min(start_datetime, latest_possible_cursor_value), cursor_datetime) - lookback_delta
+        return earliest_possible_cursor_value, latest_possible_cursor_value
+
+    def _evaluate_sync_boundary(self, name: str, is_constant: bool, evaluate: Callable[[], Any]) -> Any:
+        if not is_constant:
+            return evaluate()
+        if name not in self._constant_sync_boundaries:
+            self._constant_sync_boundaries[name] = evaluate()
+        return self._constant_sync_boundaries[name]
+
+    @staticmethod
+    def _is_constant_datetime(min_max_datetime: MinMaxDatetime) -> bool:
+        return all(
+            not isinstance(value, InterpolatedString) or value.is_constant
+            for value in (min_max_datetime.datetime, min_max_datetime.min_datetime, min_max_datetime.max_datetime)
+        )
 
     def _is_within_daterange_boundaries(
         self, record: Record, start_datetime_boundary: Union[datetime.datetime, str], end_datetime_boundary: Union[datetime.datetime, str]
     ) -> bool:
-        cursor_field = self._cursor_field.eval(self.config)
+        cursor_field = self._get_cursor_field_name()
         record_cursor_value = record.get(cursor_field)
         if not record_cursor_value:
             self._send_log(
@@ -318,11 +406,30 @@ class DatetimeBasedCursor(Cursor):
                 f"Could not find cursor field `{cursor_field}` in record. The record will not be considered when emitting sync state",
             )
             return False
+        return self._is_cursor_datetime_within_boundaries(
+            self.parse_date(record_cursor_value), start_datetime_boundary, end_datetime_boundary
+        )
+
+    def _is_cursor_datetime_within_boundaries(
+        self,
+        cursor_datetime: datetime.datetime,
+        start_datetime_boundary: Union[datetime.datetime, str],
+        end_datetime_boundary: Union[datetime.datetime, str],
+    ) -> bool:
         if isinstance(start_datetime_boundary, str):
-            start_datetime_boundary = self.parse_date(start_datetime_boundary)
+            start_datetime_boundary = self._parse_slice_boundary(start_datetime_boundary)
         if isinstance(end_datetime_boundary, str):
-            end_datetime_boundary = self.parse_date(end_datetime_boundary)
-        return start_datetime_boundary <= self.parse_date(record_cursor_value) <= end_datetime_boundary
+            end_datetime_boundary = self._parse_slice_boundary(end_datetime_boundary)
+        return start_datetime_boundary <= cursor_datetime <= end_datetime_boundary
+
+    def _parse_slice_boundary(self, date: str) -> datetime.datetime:
+        # the boundaries are the same for all the records of a slice
+        parsed_date = self._parsed_slice_boundaries.get(date)
+        if parsed_date is None:
+            if len(self._parsed_slice_boundaries) >= self._MAX_PARSED_SLICE_BOUNDARIES:
+                self._parsed_slice_boundaries.clear()
+            parsed_date = self._parsed_slice_boundaries[date] = self.parse_date(date)
+        return parsed_date
 
     def _send_log(self, level: Level, message: str) -> None:
         if self.message_repository:
@@ -334,7 +441,7 @@ class DatetimeBasedCursor(Cursor):
             )
 
     def is_greater_than_or_equal(self, first: Record, second: Record) -> bool:
-        cursor_field = self._cursor_field.eval(self.config)
+        cursor_field = self._get_cursor_field_name()
         first_cursor_value = first.get(cursor_field)
         second_cursor_value = second.get(cursor_field)
         if first_cursor_value and second_cursor_value:
@@ -3,11 +3,15 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Mapping, Optional, Union
+from typing import Any, Dict, Mapping, Optional, Union
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.types import Config
 
+# Names a template can read while still evaluating to the same value for the whole lifetime of the component
+_CONSTANT_VARIABLES = frozenset({"parameters"})
+_CONSTANT_TYPES = (str, int, float, bool, type(None))
+
 
 @dataclass
 class InterpolatedString:
@@ -28,6 +32,8 @@ class InterpolatedString:
         self.default = self.default or self.string
         self._interpolation = JinjaInterpolation()
         self._parameters = parameters
+        self._is_constant = self._evaluates_to_constant()
+        self._constant_values: Dict[Any, Any] = {}
 
     def eval(self, config: Config, **kwargs):
         """
@@ -37,7 +43,37 @@ class InterpolatedString:
         :param kwargs: Optional parameters used for interpolation
         :return: The interpolated string
         """
-        return self._interpolation.eval(self.string, config, self.default, parameters=self._parameters, **kwargs)
+        if not self._is_constant:
+            return self._interpolation.eval(self.string, config, self.default, parameters=self._parameters, **kwargs)
+
+        # The interpolated value can still be converted differently depending on the types the caller accepts
+        valid_types = kwargs.get("valid_types")
+        if valid_types in self._constant_values:
+            return self._constant_values[valid_types]
+        value = self._interpolation.eval(self.string, config, self.default, parameters=self._parameters, **kwargs)
+        # Mutable values are not shared between calls as callers could modify them
+        if isinstance(value, _CONSTANT_TYPES):
+            self._constant_values[valid_types] = value
+        return value
+
+    @property
+    def is_constant(self) -> bool:
+        """True if the string evaluates to the same value for the whole lifetime of the component"""
+        return self._is_constant
+
+    def _evaluates_to_constant(self) -> bool:
+        """
+        Strings that are not templates, or whose templates only read the parameters, are only evaluated once. The config is not
+        considered constant because connectors can update it during a sync (e.g. refreshed OAuth tokens).
+        """
+        if not isinstance(self.string, str) or not isinstance(self.default, str):
+            return False
+        try:
+            referenced = self._interpolation.referenced_variables(self.string) | self._interpolation.referenced_variables(self.default)
+        except Exception:
+            # Invalid templates fail when evaluated, as they would without this optimization
+            return False
+        return referenced <= _CONSTANT_VARIABLES
 
     def __eq__(self, other):
         if not isinstance(other, InterpolatedString):
@@ -3,16 +3,21 @@
 #
 
 import ast
-from typing import Any, Mapping, Optional, Tuple, Type
+from functools import _CacheInfo, lru_cache
+from typing import Any, FrozenSet, Mapping, Optional, Tuple, Type
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import meta
+from jinja2 import Template, meta, nodes
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import Environment
 
+# Number of distinct template strings kept compiled. Templates are keyed by their string so identical templates used by different
+# components share the same entry.
+TEMPLATE_CACHE_SIZE = 4096
+
 
 class JinjaInterpolation(Interpolation):
     """
@@ -49,14 +54,7 @@ class JinjaInterpolation(Interpolation):
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
     def __init__(self) -> None:
-        self._environment = Environment()
-        self._environment.filters.update(**filters)
-        self._environment.globals.update(**macros)
-
-        for extension in self.RESTRICTED_EXTENSIONS:
-            self._environment.extensions.pop(extension, None)
-        for builtin in self.RESTRICTED_BUILTIN_FUNCTIONS:
-            self._environment.globals.pop(builtin, None)
+        self._environment = _environment()
 
     def eval(
         self,
@@ -99,15 +97,63 @@ class JinjaInterpolation(Interpolation):
             return evaluated
         return result
 
+    def referenced_variables(self, input_str: str) -> FrozenSet[str]:
+        """
+        Returns the names of every variable, macro included, read by the template. A string that is not a template references none.
+        """
+        if _is_static(input_str):
+            return frozenset()
+        return _compile(input_str)[2]
+
+    @staticmethod
+    def cache_info() -> _CacheInfo:
+        """
+        Hits and misses of the compiled template cache shared by all the JinjaInterpolation instances.
+        """
+        return _compile.cache_info()
+
     def _eval(self, s: Optional[str], context: Mapping[str, Any]) -> Optional[str]:
+        if not isinstance(s, str) or _is_static(s):
+            # The string is a static value, not a jinja template
+            # It can be returned as is
+            return s
         try:
-            ast = self._environment.parse(s)  # type: ignore # parse is able to handle None
-            undeclared = meta.find_undeclared_variables(ast)
+            template, undeclared, _ = _compile(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
             if undeclared_not_in_context:
                 raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)  # type: ignore # from_string is able to handle None
+            return template.render(context)  # type: ignore # render returns a string
         except TypeError:
-            # The string is a static value, not a jinja template
-            # It can be returned as is
             return s
+
+
+@lru_cache(maxsize=1)
+def _environment() -> Environment:
+    # Every JinjaInterpolation is configured the same way, so they share a single environment and the templates it compiles
+    environment = Environment()
+    environment.filters.update(**filters)
+    environment.globals.update(**macros)
+
+    for extension in JinjaInterpolation.RESTRICTED_EXTENSIONS:
+        environment.extensions.pop(extension, None)
+    for builtin in JinjaInterpolation.RESTRICTED_BUILTIN_FUNCTIONS:
+        environment.globals.pop(builtin, None)
+    return environment
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _compile(s: str) -> Tuple[Template, FrozenSet[str], FrozenSet[str]]:
+    """
+    Parses and compiles the template once. Returns the compiled template, the variables it expects from the context and every
+    variable it reads.
+    """
+    environment = _environment()
+    ast = environment.parse(s)
+    undeclared = frozenset(meta.find_undeclared_variables(ast))
+    referenced = frozenset(node.name for node in ast.find_all(nodes.Name) if node.ctx == "load")
+    return environment.from_string(ast), undeclared, referenced
+
+
+def _is_static(s: str) -> bool:
+    # Jinja drops a single trailing newline and normalizes line endings, so only strings free of both are rendered verbatim
+    return "{" not in s and "\r" not in s and not s.endswith("\n")
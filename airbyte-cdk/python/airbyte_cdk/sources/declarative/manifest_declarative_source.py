@@ -7,6 +7,7 @@ import logging
 import pkgutil
 import re
 from copy import deepcopy
+from functools import partial
 from importlib import metadata
 from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
@@ -17,18 +18,39 @@ from airbyte_cdk.models import (
     AirbyteStateMessage,
     ConfiguredAirbyteCatalog,
     ConnectorSpecification,
+    SyncMode,
 )
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.declarative.checks.connection_checker import ConnectionChecker
 from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
+from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
+from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import ConcurrencyLevel as ConcurrencyLevelModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import DatetimeBasedCursor as DatetimeBasedCursorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import HTTPAPIBudget as HTTPAPIBudgetModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
 from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import ManifestComponentTransformer
 from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
+from airbyte_cdk.sources.declarative.partition_routers import ListPartitionRouter, SinglePartitionRouter, SubstreamPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers.parent_partition_store import ParentPartitionStore
+from airbyte_cdk.sources.declarative.retrievers import SimpleRetriever
+from airbyte_cdk.sources.declarative.stream_slicers.declarative_partition_generator import (
+    DeclarativePartitionFactory,
+    StreamSlicerPartitionGenerator,
+)
 from airbyte_cdk.sources.declarative.types import ConnectionDefinition
 from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
+from airbyte_cdk.sources.streams.concurrent.adapters import StreamAvailabilityStrategy
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor, FinalStateCursor
+from airbyte_cdk.sources.streams.concurrent.default_stream import DefaultStream
+from airbyte_cdk.sources.streams.concurrent.helpers import get_cursor_field_from_stream, get_primary_key_from_stream
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.utils.schema_helpers import split_config
 from airbyte_cdk.sources.utils.slice_logger import AlwaysLogSliceLogger, DebugSliceLogger, SliceLogger
 from jsonschema.exceptions import ValidationError
 from jsonschema.validators import validate
@@ -37,7 +59,10 @@ from jsonschema.validators import validate
 class ManifestDeclarativeSource(DeclarativeSource):
     """Declarative source defined by a manifest of low-code components that define source connector behavior"""
 
-    VALID_TOP_LEVEL_FIELDS = {"check", "definitions", "schemas", "spec", "streams", "type", "version"}
+    VALID_TOP_LEVEL_FIELDS = {"api_budget", "check", "concurrency_level", "definitions", "schemas", "spec", "streams", "type", "version"}
+
+    # Stream slicers whose slices can be read in any order as they are not updated while the slices are read
+    _CONCURRENT_STREAM_SLICERS = (DatetimeBasedCursor, ListPartitionRouter, SinglePartitionRouter, SubstreamPartitionRouter)
 
     def __init__(
         self,
@@ -66,6 +91,8 @@ class ManifestDeclarativeSource(DeclarativeSource):
         self._constructor = component_factory if component_factory else ModelToComponentFactory(emit_connector_builder_messages)
         self._message_repository = self._constructor.get_message_repository()
         self._slice_logger: SliceLogger = AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
+        # the stream definitions prepared for the sync being read, see read()
+        self._sync_stream_configs: Optional[List[Dict[str, Any]]] = None
 
         self._validate_source()
 
@@ -92,19 +119,53 @@ class ManifestDeclarativeSource(DeclarativeSource):
 
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         self._emit_manifest_debug_message(extra_args={"source_name": self.name, "parsed_config": json.dumps(self._source_config)})
-        stream_configs = self._stream_configs(self._source_config)
+        return [self._create_stream(stream_config, config) for stream_config in self._get_stream_configs(config)]
 
-        source_streams = [
-            self._constructor.create_component(
-                DeclarativeStreamModel, stream_config, config, emit_connector_builder_messages=self._emit_connector_builder_messages
-            )
-            for stream_config in self._initialize_cache_for_parent_streams(deepcopy(stream_configs))
-        ]
+    def _get_stream_configs(self, config: Mapping[str, Any], prefetch_parent_partitions: bool = False) -> List[Dict[str, Any]]:
+        """
+        Return the stream definitions prepared for the sync being read, so that the streams read concurrently and sequentially share
+        the same components, or prepare new ones outside of a sync
+        """
+        if self._sync_stream_configs is not None:
+            return self._sync_stream_configs
+        return self._prepare_stream_configs(config, prefetch_parent_partitions)
+
+    def _prepare_stream_configs(self, config: Mapping[str, Any], prefetch_parent_partitions: bool = False) -> List[Dict[str, Any]]:
+        """
+        Set up the components shared by the streams of a sync and return the definitions of the streams to create
+
+        :param prefetch_parent_partitions: read the parent streams of partition routers ahead of their child streams
+        """
+        stream_configs = self._stream_configs(self._source_config)
+        # The connector builder reads parent streams for every child stream so that their requests are shown with each of them. Otherwise,
+        # the partitions read from a parent stream are shared by all the child streams of this call through a store that is replaced
+        # on every call so that they are never reused across syncs
+        share_parent_partitions = not self._emit_connector_builder_messages
+        self._constructor.set_parent_partition_store(
+            ParentPartitionStore(prefetch=prefetch_parent_partitions) if share_parent_partitions else None
+        )
+        # A single budget is shared by the requesters of all the streams, including parent streams, so that they are limited together
+        api_budget_definition = self._source_config.get("api_budget")
+        self._constructor.set_api_budget(
+            self._constructor.create_component(HTTPAPIBudgetModel, api_budget_definition, config) if api_budget_definition else None
+        )
+        return self._initialize_cache_for_parent_streams(
+            deepcopy(stream_configs), cache_partition_router_parents=not share_parent_partitions
+        )
 
-        return source_streams
+    def _create_stream(self, stream_config: Dict[str, Any], config: Mapping[str, Any]) -> Stream:
+        return self._constructor.create_component(  # type: ignore # the component created from a DeclarativeStreamModel is a Stream
+            DeclarativeStreamModel, stream_config, config, emit_connector_builder_messages=self._emit_connector_builder_messages
+        )
 
     @staticmethod
-    def _initialize_cache_for_parent_streams(stream_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _initialize_cache_for_parent_streams(
+        stream_configs: List[Dict[str, Any]], cache_partition_router_parents: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Enable the HTTP cache of parent streams. The parent streams of partition routers are only cached if
+        cache_partition_router_parents is set as their partitions are otherwise shared through a ParentPartitionStore.
+        """
         parent_streams = set()
 
         def update_with_cache_parent_configs(parent_configs: list[dict[str, Any]]) -> None:
@@ -117,7 +178,7 @@ class ManifestDeclarativeSource(DeclarativeSource):
                 parent_streams.add(stream_config["incremental_sync"]["parent_stream"]["name"])
                 stream_config["incremental_sync"]["parent_stream"]["retriever"]["requester"]["use_cache"] = True
 
-            elif stream_config.get("retriever", {}).get("partition_router", {}):
+            elif cache_partition_router_parents and stream_config.get("retriever", {}).get("partition_router", {}):
                 partition_router = stream_config["retriever"]["partition_router"]
 
                 if isinstance(partition_router, dict) and partition_router.get("parent_stream_configs"):
@@ -164,7 +225,135 @@ class ManifestDeclarativeSource(DeclarativeSource):
         state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
     ) -> Iterator[AirbyteMessage]:
         self._configure_logger_level(logger)
-        yield from super().read(logger, config, catalog, state)
+        # The budget and the parent partition store are created once for the sync so that they are shared by the streams read
+        # concurrently and by the streams read sequentially after them
+        self._sync_stream_configs = self._prepare_stream_configs(config, prefetch_parent_partitions=self._reads_concurrently())
+        try:
+            yield from self._read(logger, config, catalog, state)
+        finally:
+            # the partitions read from parent streams are only shared within a sync
+            self._sync_stream_configs = None
+            self._constructor.set_parent_partition_store(None)
+
+    def _reads_concurrently(self) -> bool:
+        # The connector builder reads the slices of a stream in order to show them as they are requested
+        return bool(self._source_config.get("concurrency_level")) and not self._emit_connector_builder_messages
+
+    def _read(
+        self,
+        logger: logging.Logger,
+        config: Mapping[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
+    ) -> Iterator[AirbyteMessage]:
+        if not self._reads_concurrently():
+            yield from super().read(logger, config, catalog, state)
+            return
+
+        concurrent_config, _ = split_config(config)
+        concurrency_level = self._constructor.create_component(
+            ConcurrencyLevelModel, self._source_config["concurrency_level"], concurrent_config
+        ).get_concurrency_level()
+        concurrent_streams = self._create_concurrent_streams(logger, concurrent_config, catalog, state)
+        concurrent_stream_names = {stream.name for stream in concurrent_streams}
+        sequential_catalog = ConfiguredAirbyteCatalog(
+            streams=[stream for stream in catalog.streams if stream.stream.name not in concurrent_stream_names]
+        )
+        if concurrent_streams:
+            concurrent_source = ConcurrentSource.create(
+                num_workers=concurrency_level,
+                # partitions are generated by fewer threads than there are workers so that workers are left to read them
+                initial_number_of_partitions_to_generate=max(concurrency_level // 2, 1),
+                logger=logger,
+                slice_logger=self._slice_logger,
+                message_repository=self._message_repository,
+            )
+            yield from concurrent_source.read(concurrent_streams)
+        if sequential_catalog.streams:
+            yield from super().read(logger, config, sequential_catalog, state)
+
+    def _create_concurrent_streams(
+        self,
+        logger: logging.Logger,
+        config: Mapping[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]],
+    ) -> List[AbstractStream]:
+        """
+        Wrap the configured streams that can be read concurrently into AbstractStreams. A stream is read concurrently if it is read with
+        a SimpleRetriever and its slices can be read in any order:
+        * in full refresh, the slices must come from a DatetimeBasedCursor or from a single list, substream or single partition router
+        * in incremental, the slices must come from a DatetimeBasedCursor alone so that its state can be kept by a ConcurrentCursor
+        merging the date ranges of the slices as they are completed
+        Any other stream is left to the sequential read.
+        """
+        stream_configs = self._get_stream_configs(config, prefetch_parent_partitions=True)
+        configured_streams = {configured_stream.stream.name: configured_stream for configured_stream in catalog.streams}
+        state_manager = ConnectorStateManager(stream_instance_map={s.stream.name: s.stream for s in catalog.streams}, state=state)
+
+        concurrent_streams: List[AbstractStream] = []
+        for stream_config in stream_configs:
+            configured_stream = configured_streams.get(stream_config["name"])
+            if not configured_stream:
+                continue
+            stream = self._create_stream(stream_config, config)
+            if not isinstance(stream, DeclarativeStream) or not isinstance(stream.retriever, SimpleRetriever):
+                continue
+            if type(stream.retriever.stream_slicer) not in self._CONCURRENT_STREAM_SLICERS:
+                continue
+            try:
+                primary_key = get_primary_key_from_stream(stream.primary_key or None)
+                cursor_field = get_cursor_field_from_stream(stream)
+            except ValueError:
+                # nested primary keys and cursor fields are not supported by concurrent streams
+                continue
+
+            cursor: Cursor
+            stream_state: MutableMapping[str, Any] = {}
+            if configured_stream.sync_mode == SyncMode.incremental and stream.supports_incremental:
+                if (
+                    type(stream.retriever.stream_slicer) is not DatetimeBasedCursor
+                    or stream.state_migrations
+                    or stream_config["incremental_sync"].get("is_data_feed")
+                ):
+                    continue
+                stream_state = state_manager.get_stream_state(stream.name, stream.namespace)
+                if self._stream_state_is_full_refresh(stream_state):
+                    stream_state = {}
+                cursor = self._constructor.create_concurrent_cursor_from_datetime_based_cursor(
+                    state_manager=state_manager,
+                    model_type=DatetimeBasedCursorModel,
+                    component_definition=stream_config["incremental_sync"],
+                    stream_name=stream.name,
+                    stream_namespace=stream.namespace,
+                    config=config,
+                    stream_state=stream_state,
+                )
+            else:
+                cursor = FinalStateCursor(stream.name, stream.namespace, self._message_repository)
+
+            stream.state = stream_state
+            partition_factory = DeclarativePartitionFactory(
+                stream.name,
+                partial(self._create_stream, stream_config, config),  # type: ignore # the streams created from the same config are DeclarativeStreams
+                stream_state,
+                self._message_repository,
+                cursor,
+            )
+            concurrent_streams.append(
+                DefaultStream(
+                    partition_generator=StreamSlicerPartitionGenerator(stream, partition_factory),
+                    name=stream.name,
+                    json_schema=stream.get_json_schema(),
+                    availability_strategy=StreamAvailabilityStrategy(stream, self),
+                    primary_key=primary_key,
+                    cursor_field=cursor_field,
+                    logger=logger,
+                    cursor=cursor,
+                    namespace=stream.namespace,
+                )
+            )
+        return concurrent_streams
 
     def _configure_logger_level(self, logger: logging.Logger) -> None:
         """
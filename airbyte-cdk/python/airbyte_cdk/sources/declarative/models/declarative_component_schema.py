@@ -53,6 +53,23 @@ class CheckStream(BaseModel):
     )
 
 
+class ConcurrencyLevel(BaseModel):
+    type: Literal['ConcurrencyLevel']
+    default_concurrency: Union[int, str] = Field(
+        ...,
+        description='The number of worker threads reading the streams. max_concurrency is required if the value is interpolated from the config.',
+        examples=[10, "{{ config['num_workers'] or 10 }}"],
+        title='Default Concurrency',
+    )
+    max_concurrency: Optional[int] = Field(
+        None,
+        description='The maximum number of worker threads, capping the value of default_concurrency.',
+        examples=[20, 100],
+        title='Max Concurrency',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class ConstantBackoffStrategy(BaseModel):
     type: Literal['ConstantBackoffStrategy']
     backoff_time_in_seconds: Union[float, str] = Field(
@@ -456,6 +473,37 @@ class HttpResponseFilter(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
+class HttpRequestRegexMatcher(BaseModel):
+    type: Literal['HttpRequestRegexMatcher']
+    method: Optional[str] = Field(
+        None,
+        description='The HTTP method of the request.',
+        examples=['GET', 'POST'],
+        title='Method',
+    )
+    url_base: Optional[str] = Field(
+        None,
+        description='The base URL the URL of the request starts with.',
+        examples=['https://api.sendgrid.com/v3/', "{{ config['base_url'] }}"],
+        title='URL Base',
+    )
+    url_path_pattern: Optional[str] = Field(
+        None,
+        description='A regular expression searched in the path of the URL of the request.',
+        examples=['/users/[0-9]+/orders'],
+        title='URL Path Pattern',
+    )
+    params: Optional[Dict[str, Any]] = Field(
+        None,
+        description='The query parameters the request must have.',
+        title='Query Parameters',
+    )
+    headers: Optional[Dict[str, Any]] = Field(
+        None, description='The headers the request must have.', title='Headers'
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class InlineSchemaLoader(BaseModel):
     type: Literal['InlineSchemaLoader']
     schema_: Optional[Dict[str, Any]] = Field(
@@ -626,6 +674,23 @@ class PrimaryKey(BaseModel):
     )
 
 
+class Rate(BaseModel):
+    type: Literal['Rate']
+    limit: int = Field(
+        ...,
+        description='The maximum number of calls allowed within the interval.',
+        examples=[100],
+        title='Limit',
+    )
+    interval: str = Field(
+        ...,
+        description='The length of the interval (ISO 8601 duration).',
+        examples=['PT1S', 'PT1M'],
+        title='Interval',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class RecordFilter(BaseModel):
     type: Literal['RecordFilter']
     condition: Optional[str] = Field(
@@ -745,6 +810,16 @@ class LegacySessionTokenAuthenticator(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal['StreamingJsonDecoder']
+    chunk_size: Optional[int] = Field(
+        65536,
+        description='Number of bytes read from the response at a time.',
+        title='Chunk Size',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class ValueType(Enum):
     string = 'string'
     number = 'number'
@@ -873,6 +948,87 @@ class AuthFlow(BaseModel):
     oauth_config_specification: Optional[OAuthConfigSpecification] = None
 
 
+class FixedWindowCallRatePolicy(BaseModel):
+    type: Literal['FixedWindowCallRatePolicy']
+    period: str = Field(
+        ...,
+        description='The length of a window (ISO 8601 duration).',
+        examples=['PT1M', 'PT1H'],
+        title='Period',
+    )
+    call_limit: int = Field(
+        ...,
+        description='The maximum number of calls allowed within a window.',
+        examples=[100],
+        title='Call Limit',
+    )
+    matchers: Optional[List[HttpRequestRegexMatcher]] = Field(
+        None,
+        description='List of matchers selecting the requests the policy applies to. The policy applies to every request if no matcher is defined.',
+        title='Matchers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
+class MovingWindowCallRatePolicy(BaseModel):
+    type: Literal['MovingWindowCallRatePolicy']
+    rates: List[Rate] = Field(
+        ...,
+        description='List of rates, in ascending order of their intervals, that the calls must all respect.',
+        title='Rates',
+    )
+    matchers: Optional[List[HttpRequestRegexMatcher]] = Field(
+        None,
+        description='List of matchers selecting the requests the policy applies to. The policy applies to every request if no matcher is defined.',
+        title='Matchers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
+class UnlimitedCallRatePolicy(BaseModel):
+    type: Literal['UnlimitedCallRatePolicy']
+    matchers: Optional[List[HttpRequestRegexMatcher]] = Field(
+        None,
+        description='List of matchers selecting the requests the policy applies to. The policy applies to every request if no matcher is defined.',
+        title='Matchers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
+class HTTPAPIBudget(BaseModel):
+    type: Literal['HTTPAPIBudget']
+    policies: List[
+        Union[
+            FixedWindowCallRatePolicy,
+            MovingWindowCallRatePolicy,
+            UnlimitedCallRatePolicy,
+        ]
+    ] = Field(
+        ...,
+        description='List of call rate policies. A request is limited by the first policy matching it.',
+        title='Policies',
+    )
+    ratelimit_reset_header: Optional[str] = Field(
+        'ratelimit-reset',
+        description='The name of the response header holding the timestamp at which the call limit of the API is reset.',
+        examples=['X-RateLimit-Reset'],
+        title='Rate Limit Reset Header',
+    )
+    ratelimit_remaining_header: Optional[str] = Field(
+        'ratelimit-remaining',
+        description='The name of the response header holding the number of calls left before the call limit of the API is reached.',
+        examples=['X-RateLimit-Remaining'],
+        title='Rate Limit Remaining Header',
+    )
+    status_codes_for_ratelimit_hit: Optional[List[int]] = Field(
+        [429],
+        description='List of HTTP status codes returned by the API when the call limit is reached.',
+        examples=[[429, 420]],
+        title='Status Codes For Rate Limit Hit',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class CursorPagination(BaseModel):
     type: Literal['CursorPagination']
     cursor_value: str = Field(
@@ -900,7 +1056,7 @@ class CursorPagination(BaseModel):
         ],
         title='Stop Condition',
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
@@ -1027,7 +1183,7 @@ class DefaultPaginator(BaseModel):
         description='Strategy defining how records are paginated.',
         title='Pagination Strategy',
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
@@ -1050,7 +1206,7 @@ class DpathExtractor(BaseModel):
         ],
         title='Field Path',
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
@@ -1146,6 +1302,16 @@ class DeclarativeSource(BaseModel):
     schemas: Optional[Schemas] = None
     definitions: Optional[Dict[str, Any]] = None
     spec: Optional[Spec] = None
+    api_budget: Optional[HTTPAPIBudget] = Field(
+        None,
+        description='Defines how many requests can be sent to the API in a given time frame. The budget is shared by every requester of the source.',
+        title='API Budget',
+    )
+    concurrency_level: Optional[ConcurrencyLevel] = Field(
+        None,
+        description='Reads the streams concurrently with the number of worker threads defined. Streams whose slices cannot be read out of order are read sequentially once the concurrent streams are done.',
+        title='Concurrency Level',
+    )
     metadata: Optional[Dict[str, Any]] = Field(
         None,
         description='For internal Airbyte use only - DO NOT modify manually. Used by consumers of declarative manifests for storing related metadata.',
@@ -4,12 +4,15 @@
 
 from __future__ import annotations
 
+import datetime
+import hashlib
 import importlib
 import inspect
 import re
-from typing import Any, Callable, List, Mapping, Optional, Type, Union, get_args, get_origin, get_type_hints
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional, Type, Union, cast, get_args, get_origin, get_type_hints
 
 from airbyte_cdk.models import Level
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.declarative.auth import DeclarativeOauth2Authenticator
 from airbyte_cdk.sources.declarative.auth.declarative_authenticator import DeclarativeAuthenticator, NoAuth
 from airbyte_cdk.sources.declarative.auth.oauth import DeclarativeSingleUseRefreshTokenOauth2Authenticator
@@ -22,9 +25,10 @@ from airbyte_cdk.sources.declarative.auth.token import (
 )
 from airbyte_cdk.sources.declarative.auth.token_provider import InterpolatedStringTokenProvider, SessionTokenProvider, TokenProvider
 from airbyte_cdk.sources.declarative.checks import CheckStream
+from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.extractors.record_selector import SCHEMA_TRANSFORMER_TYPE_MAPPING
 from airbyte_cdk.sources.declarative.incremental import Cursor, CursorFactory, DatetimeBasedCursor, PerPartitionCursor
@@ -39,6 +43,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import BearerAuthenticator as BearerAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CompositeErrorHandler as CompositeErrorHandlerModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import ConcurrencyLevel as ConcurrencyLevelModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ConstantBackoffStrategy as ConstantBackoffStrategyModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CursorPagination as CursorPaginationModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CustomAuthenticator as CustomAuthenticatorModel
@@ -61,7 +66,10 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     ExponentialBackoffStrategy as ExponentialBackoffStrategyModel,
 )
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import FixedWindowCallRatePolicy as FixedWindowCallRatePolicyModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import HTTPAPIBudget as HTTPAPIBudgetModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import HttpRequester as HttpRequesterModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import HttpRequestRegexMatcher as HttpRequestRegexMatcherModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import HttpResponseFilter as HttpResponseFilterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import InlineSchemaLoader as InlineSchemaLoaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import JsonDecoder as JsonDecoderModel
@@ -74,12 +82,16 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 )
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ListPartitionRouter as ListPartitionRouterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import MinMaxDatetime as MinMaxDatetimeModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
+    MovingWindowCallRatePolicy as MovingWindowCallRatePolicyModel,
+)
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import NoAuth as NoAuthModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import NoPagination as NoPaginationModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import OAuthAuthenticator as OAuthAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import OffsetIncrement as OffsetIncrementModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import PageIncrement as PageIncrementModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ParentStreamConfig as ParentStreamConfigModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import Rate as RateModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RecordFilter as RecordFilterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RecordSelector as RecordSelectorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RemoveFields as RemoveFieldsModel
@@ -89,11 +101,14 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SessionTokenAuthenticator as SessionTokenAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SimpleRetriever as SimpleRetrieverModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import StreamingJsonDecoder as StreamingJsonDecoderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SubstreamPartitionRouter as SubstreamPartitionRouterModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import UnlimitedCallRatePolicy as UnlimitedCallRatePolicyModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ValueType
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitTimeFromHeader as WaitTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitUntilTimeFromHeader as WaitUntilTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.partition_routers import ListPartitionRouter, SinglePartitionRouter, SubstreamPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers.parent_partition_store import ParentPartitionStore
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig
 from airbyte_cdk.sources.declarative.requesters import HttpRequester, RequestOption
 from airbyte_cdk.sources.declarative.requesters.error_handlers import CompositeErrorHandler, DefaultErrorHandler, HttpResponseFilter
@@ -124,6 +139,19 @@ from airbyte_cdk.sources.declarative.transformations import AddFields, RecordTra
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.types import Config
 from airbyte_cdk.sources.message import InMemoryMessageRepository, LogAppenderMessageRepositoryDecorator, MessageRepository
+from airbyte_cdk.sources.streams.call_rate import (
+    APIBudget,
+    FixedWindowCallRatePolicy,
+    HttpAPIBudget,
+    HttpRequestRegexMatcher,
+    MovingWindowCallRatePolicy,
+    Rate,
+    UnlimitedCallRatePolicy,
+)
+from airbyte_cdk.sources.streams.concurrent.cursor import ConcurrentCursor, CursorField, CursorValueType
+from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import (
+    CustomFormatConcurrentStreamStateConverter,
+)
 from airbyte_cdk.sources.utils.transform import TypeTransformer
 from isodate import parse_duration
 from pydantic import BaseModel
@@ -142,6 +170,8 @@ class ModelToComponentFactory:
         emit_connector_builder_messages: bool = False,
         disable_retries: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        parent_partition_store: Optional[ParentPartitionStore] = None,
+        api_budget: Optional[APIBudget] = None,
     ):
         self._init_mappings()
         self._limit_pages_fetched_per_slice = limit_pages_fetched_per_slice
@@ -151,6 +181,8 @@ class ModelToComponentFactory:
         self._message_repository = message_repository or InMemoryMessageRepository(  # type: ignore
             self._evaluate_log_level(emit_connector_builder_messages)
         )
+        self._parent_partition_store = parent_partition_store
+        self._api_budget = api_budget
 
     def _init_mappings(self) -> None:
         self.PYDANTIC_MODEL_TO_CONSTRUCTOR: Mapping[Type[BaseModel], Callable[..., Any]] = {
@@ -161,6 +193,7 @@ class ModelToComponentFactory:
             BearerAuthenticatorModel: self.create_bearer_authenticator,
             CheckStreamModel: self.create_check_stream,
             CompositeErrorHandlerModel: self.create_composite_error_handler,
+            ConcurrencyLevelModel: self.create_concurrency_level,
             ConstantBackoffStrategyModel: self.create_constant_backoff_strategy,
             CursorPaginationModel: self.create_cursor_pagination,
             CustomAuthenticatorModel: self.create_custom_component,
@@ -182,8 +215,11 @@ class ModelToComponentFactory:
             DefaultPaginatorModel: self.create_default_paginator,
             DpathExtractorModel: self.create_dpath_extractor,
             ExponentialBackoffStrategyModel: self.create_exponential_backoff_strategy,
+            FixedWindowCallRatePolicyModel: self.create_fixed_window_call_rate_policy,
             SessionTokenAuthenticatorModel: self.create_session_token_authenticator,
+            HTTPAPIBudgetModel: self.create_http_api_budget,
             HttpRequesterModel: self.create_http_requester,
+            HttpRequestRegexMatcherModel: self.create_http_request_regex_matcher,
             HttpResponseFilterModel: self.create_http_response_filter,
             InlineSchemaLoaderModel: self.create_inline_schema_loader,
             JsonDecoderModel: self.create_json_decoder,
@@ -191,12 +227,14 @@ class ModelToComponentFactory:
             LegacyToPerPartitionStateMigrationModel: self.create_legacy_to_per_partition_state_migration,
             ListPartitionRouterModel: self.create_list_partition_router,
             MinMaxDatetimeModel: self.create_min_max_datetime,
+            MovingWindowCallRatePolicyModel: self.create_moving_window_call_rate_policy,
             NoAuthModel: self.create_no_auth,
             NoPaginationModel: self.create_no_pagination,
             OAuthAuthenticatorModel: self.create_oauth_authenticator,
             OffsetIncrementModel: self.create_offset_increment,
             PageIncrementModel: self.create_page_increment,
             ParentStreamConfigModel: self.create_parent_stream_config,
+            RateModel: self.create_rate,
             RecordFilterModel: self.create_record_filter,
             RecordSelectorModel: self.create_record_selector,
             RemoveFieldsModel: self.create_remove_fields,
@@ -206,7 +244,9 @@ class ModelToComponentFactory:
             SelectiveAuthenticatorModel: self.create_selective_authenticator,
             SimpleRetrieverModel: self.create_simple_retriever,
             SpecModel: self.create_spec,
+            StreamingJsonDecoderModel: self.create_streaming_json_decoder,
             SubstreamPartitionRouterModel: self.create_substream_partition_router,
+            UnlimitedCallRatePolicyModel: self.create_unlimited_call_rate_policy,
             WaitTimeFromHeaderModel: self.create_wait_time_from_header,
             WaitUntilTimeFromHeaderModel: self.create_wait_until_time_from_header,
         }
@@ -391,6 +431,67 @@ class ModelToComponentFactory:
         ]
         return CompositeErrorHandler(error_handlers=error_handlers, parameters=model.parameters or {})
 
+    @staticmethod
+    def create_concurrency_level(model: ConcurrencyLevelModel, config: Config, **kwargs: Any) -> ConcurrencyLevel:
+        return ConcurrencyLevel(
+            default_concurrency=model.default_concurrency,
+            max_concurrency=model.max_concurrency,
+            config=config,
+            parameters=model.parameters or {},
+        )
+
+    def create_concurrent_cursor_from_datetime_based_cursor(
+        self,
+        state_manager: ConnectorStateManager,
+        model_type: Type[BaseModel],
+        component_definition: ComponentDefinition,
+        stream_name: str,
+        stream_namespace: Optional[str],
+        config: Config,
+        stream_state: MutableMapping[str, Any],
+    ) -> ConcurrentCursor:
+        """
+        Creates the ConcurrentCursor keeping the state of a stream read concurrently from the definition of its DatetimeBasedCursor. The
+        slices are still computed by the DatetimeBasedCursor of the stream, the ConcurrentCursor merges the date ranges of the slices as
+        they are completed, in any order, and emits the state in the format of the DatetimeBasedCursor.
+        """
+        component_type = component_definition.get("type")
+        if component_type != model_type.__name__:
+            raise ValueError(f"Expected manifest component of type {model_type.__name__}, but received {component_type} instead")
+        model = model_type.parse_obj(component_definition)
+        if not isinstance(model, DatetimeBasedCursorModel):
+            raise ValueError(f"Expected {DatetimeBasedCursorModel.__name__} component, but received {model.__class__.__name__}")
+
+        parameters = model.parameters or {}
+        cursor_field = CursorField(InterpolatedString.create(model.cursor_field, parameters=parameters).eval(config=config))
+        slice_boundary_fields = (
+            InterpolatedString.create(model.partition_field_start or "start_time", parameters=parameters).eval(config=config),
+            InterpolatedString.create(model.partition_field_end or "end_time", parameters=parameters).eval(config=config),
+        )
+        start_datetime = MinMaxDatetime.create(
+            model.start_datetime if isinstance(model.start_datetime, str) else self.create_min_max_datetime(model.start_datetime, config),
+            parameters,
+        )
+        if not start_datetime.datetime_format:
+            start_datetime.datetime_format = model.datetime_format
+        connector_state_converter = CustomFormatConcurrentStreamStateConverter(
+            datetime_format=model.datetime_format,
+            input_datetime_formats=model.cursor_datetime_formats,
+            cursor_granularity=parse_duration(model.cursor_granularity) if model.cursor_granularity else None,
+        )
+        return ConcurrentCursor(
+            stream_name=stream_name,
+            stream_namespace=stream_namespace,
+            stream_state=stream_state,
+            message_repository=self._message_repository,
+            connector_state_manager=state_manager,
+            connector_state_converter=connector_state_converter,
+            cursor_field=cursor_field,
+            slice_boundary_fields=slice_boundary_fields,
+            start=cast(CursorValueType, start_datetime.get_datetime(config)),
+            end_provider=cast(Callable[[], CursorValueType], connector_state_converter.get_end_provider()),
+        )
+
     @staticmethod
     def create_constant_backoff_strategy(model: ConstantBackoffStrategyModel, config: Config, **kwargs: Any) -> ConstantBackoffStrategy:
         return ConstantBackoffStrategy(
@@ -737,7 +838,34 @@ class ModelToComponentFactory:
     def create_exponential_backoff_strategy(model: ExponentialBackoffStrategyModel, config: Config) -> ExponentialBackoffStrategy:
         return ExponentialBackoffStrategy(factor=model.factor or 5, parameters=model.parameters or {}, config=config)
 
-    def create_http_requester(self, model: HttpRequesterModel, config: Config, *, name: str) -> HttpRequester:
+    def create_fixed_window_call_rate_policy(
+        self, model: FixedWindowCallRatePolicyModel, config: Config, **kwargs: Any
+    ) -> FixedWindowCallRatePolicy:
+        matchers = [self._create_component_from_model(model=matcher, config=config) for matcher in model.matchers or []]
+        period = parse_duration(model.period)
+        # The first window starts with the sync. Windows are then aligned on the reset times sent by the API, if any
+        return FixedWindowCallRatePolicy(
+            next_reset_ts=datetime.datetime.now() + period, period=period, call_limit=model.call_limit, matchers=matchers
+        )
+
+    def create_http_api_budget(self, model: HTTPAPIBudgetModel, config: Config, **kwargs: Any) -> HttpAPIBudget:
+        return HttpAPIBudget(
+            policies=[self._create_component_from_model(model=policy, config=config) for policy in model.policies],
+            ratelimit_reset_header=model.ratelimit_reset_header or "ratelimit-reset",
+            ratelimit_remaining_header=model.ratelimit_remaining_header or "ratelimit-remaining",
+            status_codes_for_ratelimit_hit=tuple(model.status_codes_for_ratelimit_hit or (429,)),
+        )
+
+    @staticmethod
+    def create_http_request_regex_matcher(model: HttpRequestRegexMatcherModel, config: Config, **kwargs: Any) -> HttpRequestRegexMatcher:
+        url_base = InterpolatedString.create(model.url_base, parameters=model.parameters or {}).eval(config) if model.url_base else None
+        return HttpRequestRegexMatcher(
+            method=model.method, url_base=url_base, url_path_pattern=model.url_path_pattern, params=model.params, headers=model.headers
+        )
+
+    def create_http_requester(
+        self, model: HttpRequesterModel, config: Config, *, name: str, stream_response: bool = False
+    ) -> HttpRequester:
         authenticator = (
             self._create_component_from_model(model=model.authenticator, config=config, url_base=model.url_base, name=name)
             if model.authenticator
@@ -776,6 +904,8 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
             message_repository=self._message_repository,
             use_cache=model.use_cache,
+            api_budget=self._api_budget,
+            stream_response=stream_response,
         )
 
     @staticmethod
@@ -836,6 +966,13 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
+    def create_moving_window_call_rate_policy(
+        self, model: MovingWindowCallRatePolicyModel, config: Config, **kwargs: Any
+    ) -> MovingWindowCallRatePolicy:
+        rates = [self._create_component_from_model(model=rate, config=config) for rate in model.rates]
+        matchers = [self._create_component_from_model(model=matcher, config=config) for matcher in model.matchers or []]
+        return MovingWindowCallRatePolicy(rates=rates, matchers=matchers)
+
     @staticmethod
     def create_no_auth(model: NoAuthModel, config: Config, **kwargs: Any) -> NoAuth:
         return NoAuth(parameters=model.parameters or {})
@@ -919,8 +1056,20 @@ class ModelToComponentFactory:
             partition_field=model.partition_field,
             config=config,
             parameters=model.parameters or {},
+            partition_store=self._parent_partition_store,
+            # parent streams are only shared through the store when their definitions are identical
+            partition_store_key=hashlib.sha256(model.stream.json(sort_keys=True).encode()).hexdigest()
+            if self._parent_partition_store
+            else None,
         )
 
+    @staticmethod
+    def create_rate(model: RateModel, config: Config, **kwargs: Any) -> Rate:
+        interval = parse_duration(model.interval)
+        if not isinstance(interval, datetime.timedelta):
+            raise ValueError(f"Rate interval {model.interval} must not be defined in months or years")
+        return Rate(limit=model.limit, interval=interval)
+
     @staticmethod
     def create_record_filter(model: RecordFilterModel, config: Config, **kwargs: Any) -> RecordFilter:
         return RecordFilter(condition=model.condition or "", config=config, parameters=model.parameters or {})
@@ -998,7 +1147,10 @@ class ModelToComponentFactory:
         stop_condition_on_cursor: bool = False,
         transformations: List[RecordTransformation],
     ) -> SimpleRetriever:
-        requester = self._create_component_from_model(model=model.requester, config=config, name=name)
+        requester_kwargs: Dict[str, Any] = {"name": name}
+        if isinstance(model.requester, HttpRequesterModel) and self._can_stream_responses(model):
+            requester_kwargs["stream_response"] = True
+        requester = self._create_component_from_model(model=model.requester, config=config, **requester_kwargs)
         record_selector = self._create_component_from_model(model=model.record_selector, config=config, transformations=transformations)
         url_base = model.requester.url_base if hasattr(model.requester, "url_base") else requester.get_url_base()
         stream_slicer = stream_slicer or SinglePartitionRouter(parameters={})
@@ -1045,6 +1197,26 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
+    def _can_stream_responses(self, model: SimpleRetrieverModel) -> bool:
+        """
+        The content of a streamed response is only read once, by the StreamingJsonDecoder extracting the records. It keeps the rest of the
+        document for the pagination strategies decoding the response with a StreamingJsonDecoder, so the responses can only be streamed
+        if the paginator does not decode them with another decoder. The connector builder reads the content of the responses to show it.
+        """
+        extractor = model.record_selector.extractor
+        if self._emit_connector_builder_messages or not isinstance(extractor, DpathExtractorModel):
+            return False
+        if not isinstance(extractor.decoder, StreamingJsonDecoderModel):
+            return False
+        if not isinstance(model.paginator, DefaultPaginatorModel):
+            return True
+        pagination_strategy = model.paginator.pagination_strategy
+        if isinstance(pagination_strategy, CursorPaginationModel):
+            return isinstance(pagination_strategy.decoder, StreamingJsonDecoderModel)
+        if isinstance(pagination_strategy, OffsetIncrementModel):
+            return not pagination_strategy.page_size
+        return isinstance(pagination_strategy, PageIncrementModel)
+
     @staticmethod
     def create_spec(model: SpecModel, config: Config, **kwargs: Any) -> Spec:
         return Spec(
@@ -1054,6 +1226,12 @@ class ModelToComponentFactory:
             parameters={},
         )
 
+    @staticmethod
+    def create_streaming_json_decoder(model: StreamingJsonDecoderModel, config: Config, **kwargs: Any) -> StreamingJsonDecoder:
+        if model.chunk_size is not None:
+            return StreamingJsonDecoder(chunk_size=model.chunk_size, parameters=model.parameters or {})
+        return StreamingJsonDecoder(parameters=model.parameters or {})
+
     def create_substream_partition_router(
         self, model: SubstreamPartitionRouterModel, config: Config, **kwargs: Any
     ) -> SubstreamPartitionRouter:
@@ -1079,9 +1257,17 @@ class ModelToComponentFactory:
                 self._message_repository,
                 self._evaluate_log_level(self._emit_connector_builder_messages),
             ),
+            parent_partition_store=self._parent_partition_store,
+            api_budget=self._api_budget,
         )
         return substream_factory._create_component_from_model(model=model, config=config)
 
+    def create_unlimited_call_rate_policy(
+        self, model: UnlimitedCallRatePolicyModel, config: Config, **kwargs: Any
+    ) -> UnlimitedCallRatePolicy:
+        matchers = [self._create_component_from_model(model=matcher, config=config) for matcher in model.matchers or []]
+        return UnlimitedCallRatePolicy(matchers=matchers)
+
     @staticmethod
     def create_wait_time_from_header(model: WaitTimeFromHeaderModel, config: Config, **kwargs: Any) -> WaitTimeFromHeaderBackoffStrategy:
         return WaitTimeFromHeaderBackoffStrategy(header=model.header, parameters=model.parameters or {}, config=config, regex=model.regex)
@@ -1097,5 +1283,20 @@ class ModelToComponentFactory:
     def get_message_repository(self) -> MessageRepository:
         return self._message_repository
 
+    def set_parent_partition_store(self, parent_partition_store: Optional[ParentPartitionStore]) -> None:
+        """
+        Set the store shared by the SubstreamPartitionRouters created from now on. Parent streams are read again by routers created with
+        a different store. The store being replaced is closed.
+        """
+        if self._parent_partition_store is not None and self._parent_partition_store is not parent_partition_store:
+            self._parent_partition_store.close()
+        self._parent_partition_store = parent_partition_store
+
+    def set_api_budget(self, api_budget: Optional[APIBudget]) -> None:
+        """
+        Set the budget shared by the HttpRequesters created from now on so that all the requests of a source are limited together
+        """
+        self._api_budget = api_budget
+
     def _evaluate_log_level(self, emit_connector_builder_messages: bool) -> Level:
         return Level.DEBUG if emit_connector_builder_messages else Level.INFO
@@ -0,0 +1,206 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import itertools
+import os
+import pickle
+import tempfile
+import threading
+from typing import IO, Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+# A partition value read from a parent record along with the partition of the parent slice the record belongs to
+ParentPartition = Tuple[Any, Mapping[str, Any]]
+
+
+class _StoredPartitions:
+    """
+    Partitions of one parent stream appended to a file by a single writer. Keys are written in pickled chunks so that readers following
+    the writer only ever load chunks that were fully flushed. The partitions of the parent slices are kept in memory as they are few
+    compared to the parent records and each key only references one of them by index.
+    """
+
+    _CHUNK_SIZE = 1000
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.parent_partitions: List[Mapping[str, Any]] = []
+        self.chunks = 0
+        self.complete = False
+        self.error: Optional[Exception] = None
+        self.readers = 0
+        self.waiting_readers = 0
+        self.cancelled = False
+        self.condition = threading.Condition()
+        self._file: IO[bytes] = open(path, "wb")
+        self._pending: List[Tuple[Any, int]] = []
+
+    def append(self, partition_value: Any, parent_partition: Mapping[str, Any]) -> None:
+        if not self.parent_partitions or (
+            self.parent_partitions[-1] is not parent_partition and self.parent_partitions[-1] != parent_partition
+        ):
+            with self.condition:
+                self.parent_partitions.append(parent_partition)
+        self._pending.append((partition_value, len(self.parent_partitions) - 1))
+        # readers waiting for keys get them as soon as they are read instead of waiting for a full chunk
+        if len(self._pending) >= self._CHUNK_SIZE or self.waiting_readers:
+            self._flush()
+
+    def close(self, complete: bool = False, error: Optional[Exception] = None) -> None:
+        try:
+            self._flush()
+        finally:
+            self._file.close()
+            with self.condition:
+                self.complete = complete
+                self.error = error
+                self.condition.notify_all()
+
+    def read(self, file: IO[bytes]) -> Iterable[ParentPartition]:
+        with file:
+            chunks_read = 0
+            while True:
+                with self.condition:
+                    while chunks_read == self.chunks and not self.complete and self.error is None:
+                        self.waiting_readers += 1
+                        self.condition.wait()
+                        self.waiting_readers -= 1
+                    chunks, complete, error = self.chunks, self.complete, self.error
+                    parent_partitions = list(self.parent_partitions)
+                for _ in range(chunks - chunks_read):
+                    for partition_value, index in pickle.load(file):
+                        yield partition_value, parent_partitions[index]
+                chunks_read = chunks
+                if error is not None:
+                    raise error
+                if complete:
+                    return
+
+    def _flush(self) -> None:
+        if self._pending:
+            pickle.dump(self._pending, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._file.flush()
+            self._pending = []
+            with self.condition:
+                self.chunks += 1
+                self.condition.notify_all()
+
+
+class ParentPartitionStore:
+    """
+    Append-only store of the partition keys read from parent streams, shared by the SubstreamPartitionRouters of a sync so that a
+    parent stream read to slice a child stream is not read again for the other child streams using the same parent. Only the partition
+    values and the partitions of the parent slices are stored, on disk, rather than the parent responses.
+
+    The first router reading a parent stream fills the store while emitting its slices. Once filled, the keys are replayed from disk. With
+    prefetch enabled, which is meant for child streams read concurrently, the parent stream is read in a background thread ahead of the
+    child streams consuming its keys and every router reading the same parent in the meantime follows that thread instead of reading the
+    parent stream again. Without prefetch, a router asking for a parent stream that is still being read reads it directly.
+
+    A parent stream that was not read to the end, because it failed or because all the routers reading it stopped early, is dropped from
+    the store and will be read again by the next router needing it.
+    """
+
+    def __init__(self, prefetch: bool = False, directory: Optional[str] = None) -> None:
+        """
+        :param prefetch: read parent streams in a background thread ahead of the child streams
+        :param directory: the directory in which the keys are written. Defaults to a temporary directory deleted with the store
+        """
+        self._prefetch = prefetch
+        self._directory = directory
+        self._temporary_directory: Optional[tempfile.TemporaryDirectory[str]] = None
+        self._file_ids = itertools.count()
+        self._partitions_by_key: Dict[Hashable, _StoredPartitions] = {}
+        self._lock = threading.Lock()
+
+    def read(self, key: Hashable, read_parent_partitions: Callable[[], Iterable[ParentPartition]]) -> Iterable[ParentPartition]:
+        """
+        Yield the partitions stored under the key, reading them with read_parent_partitions if they are not stored yet
+
+        :param key: identifies the parent stream and the field of the parent records the partition values are read from
+        :param read_parent_partitions: reads the partitions from the parent stream
+        """
+        with self._lock:
+            partitions = self._partitions_by_key.get(key)
+            is_writer = partitions is None
+            if partitions is None:
+                partitions = _StoredPartitions(self._create_file())
+                self._partitions_by_key[key] = partitions
+            elif not partitions.complete and not self._prefetch:
+                partitions = None
+            if partitions is not None and (self._prefetch or not is_writer):
+                # the file is opened while the partitions are known to the store so that it can't be discarded in the meantime
+                file = open(partitions.path, "rb")
+                partitions.readers += 1
+
+        if partitions is None:
+            yield from read_parent_partitions()
+        elif is_writer and not self._prefetch:
+            yield from self._write(key, partitions, read_parent_partitions)
+        else:
+            if is_writer:
+                threading.Thread(target=self._prefetch_partitions, args=(key, partitions, read_parent_partitions), daemon=True).start()
+            try:
+                yield from partitions.read(file)
+            finally:
+                self._release(key, partitions)
+
+    def close(self) -> None:
+        with self._lock:
+            for partitions in self._partitions_by_key.values():
+                partitions.cancelled = True
+            self._partitions_by_key.clear()
+            if self._temporary_directory:
+                self._temporary_directory.cleanup()
+                self._temporary_directory = None
+
+    def _write(
+        self, key: Hashable, partitions: _StoredPartitions, read_parent_partitions: Callable[[], Iterable[ParentPartition]]
+    ) -> Iterable[ParentPartition]:
+        try:
+            for partition_value, parent_partition in read_parent_partitions():
+                partitions.append(partition_value, parent_partition)
+                yield partition_value, parent_partition
+        except BaseException:
+            # includes GeneratorExit for routers that stop before the end of the parent stream
+            partitions.close()
+            self._discard(key, partitions)
+            raise
+        partitions.close(complete=True)
+
+    def _prefetch_partitions(
+        self, key: Hashable, partitions: _StoredPartitions, read_parent_partitions: Callable[[], Iterable[ParentPartition]]
+    ) -> None:
+        try:
+            for partition_value, parent_partition in read_parent_partitions():
+                if partitions.cancelled:
+                    partitions.close()
+                    return
+                partitions.append(partition_value, parent_partition)
+        except Exception as error:
+            partitions.close(error=error)
+            self._discard(key, partitions)
+            return
+        partitions.close(complete=True)
+
+    def _release(self, key: Hashable, partitions: _StoredPartitions) -> None:
+        with self._lock:
+            partitions.readers -= 1
+            if partitions.readers > 0 or partitions.complete:
+                return
+            partitions.cancelled = True
+        self._discard(key, partitions)
+
+    def _discard(self, key: Hashable, partitions: _StoredPartitions) -> None:
+        with self._lock:
+            if self._partitions_by_key.get(key) is partitions:
+                del self._partitions_by_key[key]
+        try:
+            os.remove(partitions.path)
+        except OSError:
+            pass
+
+    def _create_file(self) -> str:
+        if self._temporary_directory is None:
+            self._temporary_directory = tempfile.TemporaryDirectory(prefix="airbyte-parent-partitions-", dir=self._directory)
+        return os.path.join(self._temporary_directory.name, f"{next(self._file_ids)}.pickle")
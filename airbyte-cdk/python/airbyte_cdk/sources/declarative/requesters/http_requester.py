@@ -13,6 +13,7 @@ from urllib.parse import urljoin
 
 import requests
 import requests_cache
+from airbyte_cdk.logger import truncated_log_extra
 from airbyte_cdk.models import Level
 from airbyte_cdk.sources.declarative.auth.declarative_authenticator import DeclarativeAuthenticator, NoAuth
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
@@ -28,6 +29,7 @@ from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod, Req
 from airbyte_cdk.sources.declarative.types import Config, StreamSlice, StreamState
 from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
 from airbyte_cdk.sources.message import MessageRepository, NoopMessageRepository
+from airbyte_cdk.sources.streams.call_rate import APIBudget, CachedLimiterSession, LimiterSession
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.http import BODY_REQUEST_METHODS
 from airbyte_cdk.sources.streams.http.rate_limiting import default_backoff_handler, user_defined_backoff_handler
@@ -51,6 +53,8 @@ class HttpRequester(Requester):
         error_handler (Optional[ErrorHandler]): Error handler defining how to detect and handle errors
         config (Config): The user-provided configuration as specified by the source's spec
         use_cache (bool): Indicates that data should be cached for this stream
+        api_budget (Optional[APIBudget]): Budget limiting the rate of the requests, shared with the other requesters of the source
+        stream_response (bool): Indicates that the content of the responses is downloaded as it is read instead of when they are received
     """
 
     name: str
@@ -65,6 +69,8 @@ class HttpRequester(Requester):
     disable_retries: bool = False
     message_repository: MessageRepository = NoopMessageRepository()
     use_cache: bool = False
+    api_budget: Optional[APIBudget] = None
+    stream_response: bool = False
 
     _DEFAULT_MAX_RETRY = 5
     _DEFAULT_RETRY_FACTOR = 5
@@ -114,7 +120,11 @@ class HttpRequester(Requester):
                 sqlite_path = str(Path(cache_dir) / self.cache_filename)
             else:
                 sqlite_path = "file::memory:?cache=shared"
+            if self.api_budget:
+                return CachedLimiterSession(sqlite_path, backend="sqlite", api_budget=self.api_budget)  # type: ignore # there are no typeshed stubs for requests_cache
             return requests_cache.CachedSession(sqlite_path, backend="sqlite")  # type: ignore # there are no typeshed stubs for requests_cache
+        elif self.api_budget:
+            return LimiterSession(api_budget=self.api_budget)
         else:
             return requests.Session()
 
@@ -122,7 +132,7 @@ class HttpRequester(Requester):
         """
         Clear cached requests for current session, can be called any time
         """
-        if isinstance(self._session, requests_cache.CachedSession):
+        if isinstance(self._session, requests_cache.CacheMixin):
             self._session.cache.clear()  # type: ignore # cache.clear is not typed
 
     def get_authenticator(self) -> DeclarativeAuthenticator:
@@ -528,11 +538,24 @@ class HttpRequester(Requester):
         Unexpected transient exceptions use the default backoff parameters.
         Unexpected persistent exceptions are not handled and will cause the sync to fail.
         """
-        self.logger.debug(
-            "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
-        )
-        response: requests.Response = self._session.send(request)
-        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text})
+        # The bodies are only decoded, up to a limited size, if they are logged
+        is_debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if is_debug_enabled:
+            self.logger.debug(
+                "Making outbound API request",
+                extra={"headers": request.headers, "url": request.url, **truncated_log_extra("request_body", request.body)},
+            )
+        response: requests.Response = self._session.send(request, stream=self.stream_response)
+        if is_debug_enabled:
+            self.logger.debug(
+                "Receiving response",
+                extra={
+                    "headers": response.headers,
+                    "status": response.status_code,
+                    # the content of streamed responses can only be read once, by the records extractor
+                    **truncated_log_extra("body", None if self.stream_response else response.content, response.encoding),
+                },
+            )
         if log_formatter:
             formatter = log_formatter
             self.message_repository.log_message(
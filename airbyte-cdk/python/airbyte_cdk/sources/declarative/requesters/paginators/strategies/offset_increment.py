@@ -57,10 +57,10 @@ class OffsetIncrement(PaginationStrategy):
         return None
 
     def next_page_token(self, response: requests.Response, last_records: List[Mapping[str, Any]]) -> Optional[Any]:
-        decoded_response = self.decoder.decode(response)
-
         # Stop paginating when there are fewer records than the page size or the current page has no records
-        if (self._page_size and len(last_records) < self._page_size.eval(self.config, response=decoded_response)) or len(last_records) == 0:
+        if (self._page_size and len(last_records) < self._page_size.eval(self.config, response=self.decoder.decode(response))) or len(
+            last_records
+        ) == 0:
             return None
         else:
             self._offset += len(last_records)
@@ -4,7 +4,7 @@
 
 import logging
 from dataclasses import InitVar, dataclass
-from typing import Any, Mapping
+from typing import Any, Mapping, Optional
 
 from airbyte_cdk.sources.declarative.schema.json_file_schema_loader import JsonFileSchemaLoader
 from airbyte_cdk.sources.declarative.schema.schema_loader import SchemaLoader
@@ -27,19 +27,28 @@ class DefaultSchemaLoader(SchemaLoader):
     def __post_init__(self, parameters: Mapping[str, Any]):
         self._parameters = parameters
         self.default_loader = JsonFileSchemaLoader(parameters=parameters, config=self.config)
+        self._schema: Optional[Mapping[str, Any]] = None
 
     def get_json_schema(self) -> Mapping[str, Any]:
         """
-        Attempts to retrieve a schema from the default filepath location or returns the empty schema if a schema cannot be found.
+        Attempts to retrieve a schema from the default filepath location or returns the empty schema if a schema cannot be found. The
+        outcome is cached so the lookup only happens once.
 
         :return: The empty schema
         """
+        if self._schema is not None:
+            return self._schema
 
         try:
-            return self.default_loader.get_json_schema()
+            self._schema = self.default_loader.get_json_schema()
         except OSError:
             # A slight hack since we don't directly have the stream name. However, when building the default filepath we assume the
             # runtime options stores stream name 'name' so we'll do the same here
             stream_name = self._parameters.get("name", "")
             logging.info(f"Could not find schema for stream {stream_name}, defaulting to the empty schema")
-            return {}
+            self._schema = {}
+        return self._schema
+
+    def invalidate_cache(self) -> None:
+        self._schema = None
+        self.default_loader.invalidate_cache()
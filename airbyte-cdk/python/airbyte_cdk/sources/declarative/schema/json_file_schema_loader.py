@@ -6,7 +6,7 @@ import json
 import pkgutil
 import sys
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Mapping, Union
+from typing import Any, Mapping, Optional, Union
 
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.schema.schema_loader import SchemaLoader
@@ -49,8 +49,20 @@ class JsonFileSchemaLoader(ResourceSchemaLoader, SchemaLoader):
         if not self.file_path:
             self.file_path = _default_file_path()
         self.file_path = InterpolatedString.create(self.file_path, parameters=parameters)
+        self._schema: Optional[Mapping[str, Any]] = None
 
     def get_json_schema(self) -> Mapping[str, Any]:
+        """
+        The schema file is read and its references resolved on the first call only, the same schema is returned afterwards.
+        """
+        if self._schema is None:
+            self._schema = self._load_json_schema()
+        return self._schema
+
+    def invalidate_cache(self) -> None:
+        self._schema = None
+
+    def _load_json_schema(self) -> Mapping[str, Any]:
         # todo: It is worth revisiting if we can replace file_path with just file_name if every schema is in the /schemas directory
         # this would require that we find a creative solution to store or retrieve source_name in here since the files are mounted there
         json_schema_path = self._get_json_filepath()
@@ -15,3 +15,10 @@ class SchemaLoader:
     def get_json_schema(self) -> Mapping[str, Any]:
         """Returns a mapping describing the stream's schema"""
         pass
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops the schema cached by the loader, if any, so that the next call to `get_json_schema` loads it again. Loaders whose schema
+        can change during a sync should override `get_json_schema` to not cache or call this method when the schema changes.
+        """
+        pass
@@ -0,0 +1,136 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import threading
+from copy import deepcopy
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
+from airbyte_cdk.sources.declarative.types import StreamSlice
+from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
+from airbyte_cdk.sources.streams.concurrent.exceptions import ExceptionWithDisplayMessage
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+
+
+class DeclarativePartitionFactory:
+    """
+    Creates the partitions of a declarative stream read concurrently. Retrievers and cursors of declarative streams keep state while
+    reading a slice, so each worker thread reads its partitions with its own instance of the stream created by stream_factory. The
+    state of that instance is reset before every partition so that the records of a slice are filtered the same way regardless of the
+    slices the thread read before.
+    """
+
+    def __init__(
+        self,
+        stream_name: str,
+        stream_factory: Callable[[], DeclarativeStream],
+        stream_state: Mapping[str, Any],
+        message_repository: MessageRepository,
+        cursor: Cursor,
+    ) -> None:
+        """
+        :param stream_name: The name of the stream the partitions belong to
+        :param stream_factory: Creates a new instance of the stream
+        :param stream_state: The state of the stream at the beginning of the sync
+        :param message_repository: The message repository to use to emit non-record messages
+        :param cursor: The concurrent cursor observing the records and closing the partitions
+        """
+        self._stream_name = stream_name
+        self._stream_factory = stream_factory
+        self._stream_state = stream_state
+        self._message_repository = message_repository
+        self._cursor = cursor
+        self._thread_local = threading.local()
+        self._lock = threading.Lock()
+
+    def create(self, stream_slice: StreamSlice) -> "DeclarativePartition":
+        return DeclarativePartition(self._stream_name, stream_slice, self, self._cursor)
+
+    def read(self, stream_slice: StreamSlice) -> Iterable[Record]:
+        """
+        Read the records of the slice with the stream instance of the current thread. Non-record messages are emitted on the message
+        repository.
+        """
+        stream = self._stream_for_current_thread()
+        stream.state = deepcopy(self._stream_state)  # type: ignore  # state is always a MutableMapping once deep copied
+        try:
+            for stream_data in stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice):
+                if isinstance(stream_data, Mapping):
+                    data = dict(stream_data)
+                    stream.transformer.transform(data, stream.get_json_schema())
+                    record = Record(data, self._stream_name)
+                    self._cursor.observe(record)
+                    yield record
+                else:
+                    self._message_repository.emit_message(stream_data)
+        except Exception as exception:
+            display_message = stream.get_error_display_message(exception)
+            if display_message:
+                raise ExceptionWithDisplayMessage(display_message) from exception
+            raise
+
+    def _stream_for_current_thread(self) -> DeclarativeStream:
+        stream: Optional[DeclarativeStream] = getattr(self._thread_local, "stream", None)
+        if stream is None:
+            # the component factory is shared by all the streams of the source
+            with self._lock:
+                stream = self._stream_factory()
+            self._thread_local.stream = stream
+        return stream
+
+
+class DeclarativePartition(Partition):
+    def __init__(self, stream_name: str, stream_slice: StreamSlice, partition_factory: DeclarativePartitionFactory, cursor: Cursor):
+        self._stream_name = stream_name
+        self._stream_slice = stream_slice
+        self._partition_factory = partition_factory
+        self._cursor = cursor
+        self._is_closed = False
+
+    def read(self) -> Iterable[Record]:
+        yield from self._partition_factory.read(self._stream_slice)
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return self._stream_slice
+
+    def stream_name(self) -> str:
+        return self._stream_name
+
+    def close(self) -> None:
+        self._cursor.close_partition(self)
+        self._is_closed = True
+
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    def __hash__(self) -> int:
+        # Convert the slice to a string so that it can be hashed
+        return hash((self._stream_name, json.dumps(dict(self._stream_slice), sort_keys=True, default=str)))
+
+    def __repr__(self) -> str:
+        return f"DeclarativePartition({self._stream_name}, {self._stream_slice})"
+
+
+class StreamSlicerPartitionGenerator(PartitionGenerator):
+    """
+    Generates a partition for every slice of a declarative stream. The slices are computed by the stream's own stream slicer, i.e. its
+    DatetimeBasedCursor or partition router.
+    """
+
+    def __init__(self, stream: DeclarativeStream, partition_factory: DeclarativePartitionFactory) -> None:
+        """
+        :param stream: The stream instance computing the slices. Its state must be set beforehand
+        :param partition_factory: Creates the partitions reading the slices
+        """
+        self._stream = stream
+        self._partition_factory = partition_factory
+
+    def generate(self) -> Iterable[Partition]:
+        for stream_slice in self._stream.stream_slices(sync_mode=SyncMode.full_refresh):
+            yield self._partition_factory.create(stream_slice or StreamSlice(partition={}, cursor_slice={}))
@@ -15,6 +15,11 @@ class InferenceType(Enum):
     PRIMITIVE_TYPES_ONLY = "Primitive Types Only"
 
 
+class CsvParsingEngine(Enum):
+    PYTHON = "Python"
+    PYARROW = "PyArrow"
+
+
 class CsvHeaderDefinitionType(Enum):
     FROM_CSV = "From CSV"
     AUTOGENERATED = "Autogenerated"
@@ -75,6 +80,7 @@ class CsvHeaderUserProvided(BaseModel):
 
 DEFAULT_TRUE_VALUES = ["y", "yes", "t", "true", "on", "1"]
 DEFAULT_FALSE_VALUES = ["n", "no", "f", "false", "off", "0"]
+DEFAULT_BLOCK_SIZE = 1024 * 1024
 
 
 class CsvFormat(BaseModel):
@@ -152,6 +158,17 @@ class CsvFormat(BaseModel):
         default=False,
         description="Whether to ignore errors that occur when the number of fields in the CSV does not match the number of columns in the schema.",
     )
+    parsing_engine: CsvParsingEngine = Field(
+        title="Parsing Engine",
+        default=CsvParsingEngine.PYTHON,
+        description="The library used to parse the CSV data. PyArrow parses the data in blocks and casts the values column by column, which is significantly faster on large files. It emits the same records as the Python engine and falls back to it for the files it cannot parse.",
+    )
+    block_size: int = Field(
+        title="Block Size",
+        default=DEFAULT_BLOCK_SIZE,
+        description="The number of bytes parsed at once by the PyArrow engine. It must be larger than the largest row of the files.",
+        airbyte_hidden=True,
+    )
 
     @validator("delimiter")
     def validate_delimiter(cls, v: str) -> str:
@@ -175,6 +192,12 @@ class CsvFormat(BaseModel):
             raise ValueError("escape_char should only be one character")
         return v
 
+    @validator("block_size")
+    def validate_block_size(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("block_size should be positive")
+        return v
+
     @validator("encoding")
     def validate_encoding(cls, v: str) -> str:
         try:
@@ -2,18 +2,29 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
+import itertools
 import json
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from functools import partial
+from functools import partial, reduce
 from io import IOBase
 from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
 from uuid import uuid4
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from airbyte_cdk.models import FailureType
-from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvHeaderAutogenerated, CsvHeaderUserProvided, InferenceType
+from airbyte_cdk.sources.file_based.config.csv_format import (
+    CsvFormat,
+    CsvHeaderAutogenerated,
+    CsvHeaderUserProvided,
+    CsvParsingEngine,
+    InferenceType,
+)
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
@@ -37,28 +48,12 @@ class _CsvReader:
         config_format = _extract_format(config)
         lineno = 0
 
-        # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
         # We don't unregister the dialect because we are lazily parsing each csv file to generate records
-        # Give each stream's dialect a unique name; otherwise, when we are doing a concurrent sync we can end up
-        # with a race condition where a thread attempts to use a dialect before a separate thread has finished
-        # registering it.
-        dialect_name = f"{config.name}_{str(uuid4())}_{DIALECT_NAME}"
-        csv.register_dialect(
-            dialect_name,
-            delimiter=config_format.delimiter,
-            quotechar=config_format.quote_char,
-            escapechar=config_format.escape_char,
-            doublequote=config_format.double_quote,
-            quoting=csv.QUOTE_MINIMAL,
-        )
+        dialect_name = self._register_dialect(config, config_format)
         with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
             headers = self._get_headers(fp, config_format, dialect_name)
 
-            rows_to_skip = (
-                config_format.skip_rows_before_header
-                + (1 if config_format.header_definition.has_header_row() else 0)
-                + config_format.skip_rows_after_header
-            )
+            rows_to_skip = _rows_to_skip(config_format)
             self._skip_rows(fp, rows_to_skip)
             lineno += rows_to_skip
 
@@ -90,6 +85,42 @@ class _CsvReader:
                 # due to RecordParseError or GeneratorExit
                 csv.unregister_dialect(dialect_name)
 
+    def read_headers(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        file_read_mode: FileReadMode,
+    ) -> List[str]:
+        """
+        Returns the field names of the rows generated by read_data for this file.
+        """
+        config_format = _extract_format(config)
+        dialect_name = self._register_dialect(config, config_format)
+        try:
+            with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
+                return self._get_headers(fp, config_format, dialect_name)
+        finally:
+            csv.unregister_dialect(dialect_name)
+
+    @staticmethod
+    def _register_dialect(config: FileBasedStreamConfig, config_format: CsvFormat) -> str:
+        # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
+        # Give each stream's dialect a unique name; otherwise, when we are doing a concurrent sync we can end up
+        # with a race condition where a thread attempts to use a dialect before a separate thread has finished
+        # registering it.
+        dialect_name = f"{config.name}_{str(uuid4())}_{DIALECT_NAME}"
+        csv.register_dialect(
+            dialect_name,
+            delimiter=config_format.delimiter,
+            quotechar=config_format.quote_char,
+            escapechar=config_format.escape_char,
+            doublequote=config_format.double_quote,
+            quoting=csv.QUOTE_MINIMAL,
+        )
+        return dialect_name
+
     def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect_name: str) -> List[str]:
         """
         Assumes the fp is pointing to the beginning of the files and will reset it as such
@@ -128,11 +159,78 @@ class _CsvReader:
             fp.readline()
 
 
+class _ArrowCsvReader:
+    """
+    Reads CSV files in blocks with pyarrow. Values are read as the same strings csv.reader returns so that casting and null values are
+    handled the same way for both engines. pyarrow.ArrowInvalid is raised when a block cannot be parsed that way, for example because a
+    row doesn't have as many fields as there are headers: the caller is expected to fall back on _CsvReader.
+    """
+
+    def __init__(self, csv_reader: _CsvReader) -> None:
+        self._csv_reader = csv_reader
+
+    @staticmethod
+    def supports(config_format: CsvFormat) -> bool:
+        return _ArrowCsvReader._parse_options(config_format) is not None and config_format.encoding is not None
+
+    def read_blocks(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+    ) -> Generator[Dict[str, pa.Array], None, None]:
+        """
+        Generates the string columns of each block by header. As with csv.DictReader, the last column wins if headers are duplicated.
+        """
+        config_format = _extract_format(config)
+        parse_options = self._parse_options(config_format)
+        if parse_options is None or config_format.encoding is None:
+            raise ValueError(f"The CSV format of stream {config.name} is not supported by pyarrow")
+
+        # headers are read by the csv module to get them exactly as the python engine does, including for the rows skipped before them
+        headers = self._csv_reader.read_headers(config, file, stream_reader, logger, FileReadMode.READ)
+        read_options = pa_csv.ReadOptions(
+            column_names=headers,
+            skip_rows=_rows_to_skip(config_format),
+            block_size=config_format.block_size,
+            encoding="utf8" if codecs.lookup(config_format.encoding).name == "utf-8" else config_format.encoding,
+        )
+        convert_options = pa_csv.ConvertOptions(
+            column_types={header: pa.string() for header in headers}, strings_can_be_null=False, quoted_strings_can_be_null=False
+        )
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+            reader = pa_csv.open_csv(fp, read_options=read_options, parse_options=parse_options, convert_options=convert_options)
+            for batch in reader:
+                if batch.num_rows:
+                    yield {header: _to_universal_newlines(batch.column(index)) for index, header in enumerate(headers)}
+
+    @staticmethod
+    def _parse_options(config_format: CsvFormat) -> Optional[pa_csv.ParseOptions]:
+        special_characters = [config_format.delimiter, config_format.quote_char]
+        if config_format.escape_char:
+            special_characters.append(config_format.escape_char)
+        # pyarrow only supports single-byte special characters
+        if len(set(special_characters)) != len(special_characters) or not all(character.isascii() for character in special_characters):
+            return None
+        try:
+            return pa_csv.ParseOptions(
+                delimiter=config_format.delimiter,
+                quote_char=config_format.quote_char,
+                escape_char=config_format.escape_char or False,
+                double_quote=config_format.double_quote,
+                newlines_in_values=True,
+            )
+        except (ValueError, pa.ArrowInvalid):
+            return None
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
-    def __init__(self, csv_reader: Optional[_CsvReader] = None):
+    def __init__(self, csv_reader: Optional[_CsvReader] = None, arrow_csv_reader: Optional[_ArrowCsvReader] = None):
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._arrow_csv_reader = arrow_csv_reader if arrow_csv_reader else _ArrowCsvReader(self._csv_reader)
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -159,6 +257,33 @@ class CsvParser(FileTypeParser):
             if config_format.inference_type != InferenceType.NONE
             else _DisabledTypeInferrer()
         )
+        if self._use_arrow(config_format, file, logger):
+            try:
+                self._add_values_by_column(config, file, stream_reader, logger, type_inferrer_by_field)
+            except pa.ArrowInvalid as exception:
+                logger.info(f"Inferring the schema of {file.uri} with the Python CSV engine as pyarrow could not parse it: {exception}")
+                type_inferrer_by_field.clear()
+                self._add_values_by_row(config, file, stream_reader, logger, type_inferrer_by_field)
+        else:
+            self._add_values_by_row(config, file, stream_reader, logger, type_inferrer_by_field)
+
+        if not type_inferrer_by_field:
+            raise AirbyteTracedException(
+                message=f"Could not infer schema as there are no rows in {file.uri}. If having an empty CSV file is expected, ignore this. "
+                f"Else, please contact Airbyte.",
+                failure_type=FailureType.config_error,
+            )
+        schema = {header.strip(): {"type": type_inferred.infer()} for header, type_inferred in type_inferrer_by_field.items()}
+        return schema
+
+    def _add_values_by_row(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        type_inferrer_by_field: Dict[str, "_TypeInferrer"],
+    ) -> None:
         data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
         read_bytes = 0
         for row in data_generator:
@@ -169,17 +294,36 @@ class CsvParser(FileTypeParser):
                 read_bytes += len(value)
             read_bytes += len(row) - 1  # for separators
             if read_bytes >= self._MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE:
+                data_generator.close()
                 break
 
-        if not type_inferrer_by_field:
-            raise AirbyteTracedException(
-                message=f"Could not infer schema as there are no rows in {file.uri}. If having an empty CSV file is expected, ignore this. "
-                f"Else, please contact Airbyte.",
-                failure_type=FailureType.config_error,
-            )
-        schema = {header.strip(): {"type": type_inferred.infer()} for header, type_inferred in type_inferrer_by_field.items()}
-        data_generator.close()
-        return schema
+    def _add_values_by_column(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        type_inferrer_by_field: Dict[str, "_TypeInferrer"],
+    ) -> None:
+        """
+        Adds the same values as _add_values_by_row: the rows are counted the same way to stop at the same row once enough bytes were read.
+        """
+        blocks = self._arrow_csv_reader.read_blocks(config, file, stream_reader, logger)
+        read_bytes = 0
+        for columns in blocks:
+            value_bytes = reduce(pc.add, [pc.cast(pc.utf8_length(column), pa.int64()) for column in columns.values()])
+            row_bytes = pc.add(value_bytes, len(columns) - 1)  # for separators
+            read_bytes_by_row = pc.add(pc.cumulative_sum(row_bytes), read_bytes)
+            last_rows = pc.indices_nonzero(pc.greater_equal(read_bytes_by_row, self._MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE))
+            if len(last_rows):
+                columns = {header: column.slice(0, last_rows[0].as_py() + 1) for header, column in columns.items()}
+            for header, column in columns.items():
+                for value in _to_python_list(pc.unique(column)):
+                    type_inferrer_by_field[header].add_value(value)
+            if len(last_rows):
+                break
+            read_bytes = read_bytes_by_row[-1].as_py()
+        blocks.close()
 
     def parse_records(
         self,
@@ -190,6 +334,7 @@ class CsvParser(FileTypeParser):
         discovered_schema: Optional[Mapping[str, SchemaType]],
     ) -> Iterable[Dict[str, Any]]:
         line_no = 0
+        data_generator: Optional[Generator[Dict[str, Any], None, None]] = None
         try:
             config_format = _extract_format(config)
             if discovered_schema:
@@ -197,9 +342,20 @@ class CsvParser(FileTypeParser):
                 deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
             else:
                 deduped_property_types = {}
+            if self._use_arrow(config_format, file, logger):
+                try:
+                    for row_count, records in self._parse_blocks_by_column(config, file, stream_reader, logger, deduped_property_types):
+                        yield from records
+                        line_no += row_count
+                    return
+                except pa.ArrowInvalid as exception:
+                    logger.info(
+                        f"Reading {file.uri} with the Python CSV engine from record {line_no + 1} as pyarrow could not parse it: {exception}"
+                    )
             cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
             data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
-            for row in data_generator:
+            # the rows already emitted by the pyarrow engine are skipped
+            for row in itertools.islice(data_generator, line_no, None):
                 line_no += 1
                 yield CsvParser._to_nullable(
                     cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null
@@ -207,7 +363,62 @@ class CsvParser(FileTypeParser):
         except RecordParseError as parse_err:
             raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no) from parse_err
         finally:
-            data_generator.close()
+            if data_generator:
+                data_generator.close()
+
+    def _use_arrow(self, config_format: CsvFormat, file: RemoteFile, logger: logging.Logger) -> bool:
+        if config_format.parsing_engine != CsvParsingEngine.PYARROW:
+            return False
+        if not self._arrow_csv_reader.supports(config_format):
+            logger.info(f"Reading {file.uri} with the Python CSV engine as pyarrow does not support its format")
+            return False
+        return True
+
+    def _parse_blocks_by_column(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        deduped_property_types: Mapping[str, str],
+    ) -> Generator[Tuple[int, Iterable[Dict[str, Any]]], None, None]:
+        """
+        Generates the number of rows of each block along with an iterable of the same records as the Python engine would emit for them.
+        The values of a block are cast and nulled one column at a time.
+        """
+        config_format = _extract_format(config)
+        cast = bool(deduped_property_types) and not config.schemaless
+        null_values = pa.array(config_format.null_values, pa.string())
+        blocks = self._arrow_csv_reader.read_blocks(config, file, stream_reader, logger)
+        try:
+            for columns in blocks:
+                warnings_by_row: Dict[int, List[str]] = defaultdict(list)
+                values_by_header: Dict[str, List[Any]] = {}
+                for header, column in columns.items():
+                    prop_type = deduped_property_types.get(header)
+                    if cast and prop_type not in TYPE_PYTHON_MAPPING:
+                        # as with _cast_types, the values of the columns which are not in the schema are not emitted
+                        continue
+                    can_be_null = bool(config_format.null_values) and (config_format.strings_can_be_null or prop_type != "string")
+                    if not cast or TYPE_PYTHON_MAPPING[prop_type][1] == str:  # type: ignore [index]  # prop_type is in TYPE_PYTHON_MAPPING
+                        values = _to_python_list(
+                            pc.if_else(pc.is_in(column, value_set=null_values), None, column) if can_be_null else column
+                        )
+                    else:
+                        values, failed_indexes = CsvParser._cast_column(column, prop_type, config_format)  # type: ignore [arg-type]  # prop_type is in TYPE_PYTHON_MAPPING
+                        # only the values which could not be cast are still strings that can be null values
+                        for index in failed_indexes:
+                            warnings_by_row[index].append(_format_warning(header, values[index], prop_type))
+                            if can_be_null and values[index] in config_format.null_values:
+                                values[index] = None
+                    values_by_header[header] = values
+
+                row_count = len(next(iter(columns.values())))
+                rows = zip(*values_by_header.values()) if values_by_header else itertools.repeat((), row_count)
+                records = map(dict, map(zip, itertools.repeat(list(values_by_header.keys())), rows))
+                yield row_count, _log_warnings_by_row(records, warnings_by_row, logger) if warnings_by_row else records
+        finally:
+            blocks.close()
 
     @property
     def file_read_mode(self) -> FileReadMode:
@@ -328,6 +539,30 @@ class CsvParser(FileTypeParser):
             )
         return result
 
+    @staticmethod
+    def _cast_column(column: pa.Array, prop_type: str, config_format: CsvFormat) -> Tuple[List[Any], List[int]]:
+        """
+        Column-wise equivalent of _cast_types. Returns the cast values along with the indexes of the ones which could not be cast and were
+        kept as strings.
+        """
+        _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+        if python_type in (int, float):
+            cast_numbers = _cast_numbers(column, python_type, config_format.null_values)  # type: ignore [arg-type]  # python_type is a type
+            if cast_numbers:
+                return cast_numbers
+        elif python_type == bool:
+            return _cast_booleans(column, config_format.true_values, config_format.false_values)
+
+        if python_type is None:
+            cast_value: Callable[[str], Any] = _value_to_null
+        elif python_type == dict:
+            cast_value = json.loads
+        elif python_type == list:
+            cast_value = _value_to_list
+        else:
+            cast_value = python_type
+        return _cast_values(_to_python_list(column), cast_value)
+
 
 class _TypeInferrer(ABC):
     @abstractmethod
@@ -438,6 +673,101 @@ def _value_to_python_type(value: str, python_type: type) -> Any:
     return python_type(value)
 
 
+def _log_warnings_by_row(
+    records: Iterable[Dict[str, Any]], warnings_by_row: Mapping[int, List[str]], logger: logging.Logger
+) -> Generator[Dict[str, Any], None, None]:
+    # the warnings are logged right before their record as _cast_types does
+    for index, record in enumerate(records):
+        if index in warnings_by_row:
+            logger.warning(f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join(warnings_by_row[index])}")
+        yield record
+
+
+def _value_to_null(value: str) -> None:
+    if value != "":
+        raise ValueError(f"Value {value} is not a valid null value")
+
+
+def _cast_values(values: List[str], cast_value: Callable[[str], Any]) -> Tuple[List[Any], List[int]]:
+    """
+    Returns the cast values along with the indexes of the ones which could not be cast and were kept as they were.
+    """
+    cast_values = []
+    failed_indexes = []
+    for index, value in enumerate(values):
+        try:
+            cast_values.append(cast_value(value))
+        except ValueError:  # json.JSONDecodeError is a ValueError
+            cast_values.append(value)
+            failed_indexes.append(index)
+    return cast_values, failed_indexes
+
+
+def _cast_numbers(column: pa.Array, python_type: type, null_values: Set[str]) -> Optional[Tuple[List[Any], List[int]]]:
+    """
+    Casts a column of strings to int or float with pyarrow, with the same result as python_type(value). Returns None if the column has
+    values that pyarrow can't cast or would cast differently, in which case they have to be cast one by one.
+    """
+    if python_type is int and pc.any(pc.match_substring(column, "x", ignore_case=True)).as_py():
+        # unlike int(), pyarrow parses hexadecimal integers
+        return None
+
+    # empty strings and null values are common in numeric columns: they are set aside to be kept as strings like any value int() or
+    # float() would not cast, instead of having pyarrow fail on the whole column
+    uncastable_values = [""] + [value for value in null_values if not _can_cast(value, python_type)]
+    is_uncastable = pc.is_in(column, value_set=pa.array(uncastable_values, pa.string()))
+    try:
+        cast_column = pc.cast(pc.if_else(is_uncastable, None, column), pa.int64() if python_type is int else pa.float64())
+    except pa.ArrowInvalid:
+        return None
+    return _set_aside(_to_python_list(pc.fill_null(cast_column, 0)), column, is_uncastable)
+
+
+def _cast_booleans(column: pa.Array, true_values: Set[str], false_values: Set[str]) -> Tuple[List[Any], List[int]]:
+    # as in _value_to_bool, a value which is both a true and a false value is true
+    is_true = pc.is_in(column, value_set=pa.array(true_values, pa.string()))
+    is_false = pc.is_in(column, value_set=pa.array(false_values, pa.string()))
+    return _set_aside(_to_python_list(is_true), column, pc.invert(pc.or_(is_true, is_false)))
+
+
+def _set_aside(values: List[Any], column: pa.Array, is_uncastable: pa.Array) -> Tuple[List[Any], List[int]]:
+    """
+    Replaces the values which could not be cast by their original string and returns their indexes.
+    """
+    failed_indexes = pc.indices_nonzero(is_uncastable).to_pylist()
+    for index in failed_indexes:
+        values[index] = column[index].as_py()
+    return values, failed_indexes
+
+
+def _to_python_list(array: pa.Array) -> List[Any]:
+    # going through numpy is several times faster than Array.to_pylist which creates a pyarrow scalar for each value
+    return array.to_numpy(zero_copy_only=False).tolist()  # type: ignore [no-any-return]  # pyarrow is not typed
+
+
+def _can_cast(value: str, python_type: type) -> bool:
+    try:
+        python_type(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _to_universal_newlines(column: pa.Array) -> pa.Array:
+    # _CsvReader reads files opened in text mode, where "\r\n" and "\r" are translated to "\n", including within quoted values
+    if pc.any(pc.match_substring(column, "\r")).as_py():
+        return pc.replace_substring_regex(column, pattern="\r\n?", replacement="\n")
+    return column
+
+
+def _rows_to_skip(config_format: CsvFormat) -> int:
+    return (
+        config_format.skip_rows_before_header
+        + (1 if config_format.header_definition.has_header_row() else 0)
+        + config_format.skip_rows_after_header
+    )
+
+
 def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
@@ -4,7 +4,8 @@
 
 import json
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
@@ -13,6 +14,11 @@ from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeP
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import PYTHON_TYPE_MAPPING, SchemaType, merge_schemas
 
+_JSON_DECODER = json.JSONDecoder()
+# escaped characters are matched as a single token so that an escaped quote does not end a string
+_JSON_STRUCTURE_TOKENS = re.compile(r'\\.|["{}\[\]]', re.DOTALL)
+_WHITESPACES = re.compile(r"\s*")
+
 
 class JsonlParser(FileTypeParser):
 
@@ -55,7 +61,6 @@ class JsonlParser(FileTypeParser):
         """
         This code supports parsing json objects over multiple lines even though this does not align with the JSONL format. This is for
         backward compatibility reasons i.e. the previous source-s3 parser did support this. The drawback is:
-        * performance as the way we support json over multiple lines is very brute forced
         * given that we don't have `newlines_in_values` config to scope the possible inputs, we might parse the whole file before knowing if
           the input is improperly formatted or if the json is over multiple lines
 
@@ -86,44 +91,102 @@ class JsonlParser(FileTypeParser):
         logger: logging.Logger,
         read_limit: bool = False,
     ) -> Iterable[Dict[str, Any]]:
+        """
+        Lines holding a whole JSON document are parsed as is. Otherwise, lines are accumulated while tracking the nesting of the JSON
+        structure, each character being scanned once, and the accumulated documents are only decoded once they are complete. This keeps
+        the parsing linear for JSON objects over multiple lines as well as for lines holding many concatenated JSON documents.
+        """
         with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
             read_bytes = 0
+            line_no = 0
 
             had_json_parsing_error = False
             has_warned_for_multiline_json_object = False
             yielded_at_least_once = False
 
-            accumulator = None
-            for line in fp:
-                if not accumulator:
-                    accumulator = self._instantiate_accumulator(line)
-                read_bytes += len(line)
-                accumulator += line  # type: ignore [operator]  # In reality, it's either bytes or string and we add the same type
-                try:
-                    record = json.loads(accumulator)
-                    if had_json_parsing_error and not has_warned_for_multiline_json_object:
+            encoding: Optional[str] = None
+            pending_lines: List[str] = []
+            depth = 0
+            in_string = False
+            for raw_line in fp:
+                line_no += 1
+                read_bytes += len(raw_line)
+                line: str
+                if isinstance(raw_line, bytes):
+                    encoding = encoding or json.detect_encoding(raw_line)
+                    line = raw_line.decode(encoding)
+                else:
+                    line = raw_line
+
+                if not pending_lines:
+                    try:
+                        yield json.loads(line)
+                        yielded_at_least_once = True
+                    except json.JSONDecodeError:
+                        pending_lines.append(line)
+                        depth, in_string = self._scan_json_structure(line, 0, False)
+                else:
+                    pending_lines.append(line)
+                    depth, in_string = self._scan_json_structure(line, depth, in_string)
+
+                if pending_lines and depth <= 0 and not in_string:
+                    try:
+                        records = self._decode_documents("".join(pending_lines))
+                    except json.JSONDecodeError:
+                        # Like any content that can't be parsed, the rest of the file is ignored and an error is only raised if no records
+                        # were read from the file
+                        had_json_parsing_error = True
+                        pending_lines = []
+                        break
+                    if records and len(pending_lines) > 1 and not has_warned_for_multiline_json_object:
                         logger.warning(f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced")
                         has_warned_for_multiline_json_object = True
-
-                    yield record
-                    yielded_at_least_once = True
-                    accumulator = self._instantiate_accumulator(line)
-                except json.JSONDecodeError:
-                    had_json_parsing_error = True
+                    pending_lines = []
+                    if records:
+                        yield from records
+                        yielded_at_least_once = True
 
                 if read_limit and yielded_at_least_once and read_bytes >= self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE:
                     logger.warning(
                         f"Exceeded the maximum number of bytes per file for schema inference ({self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE}). "
                         f"Inferring schema from an incomplete set of records."
                     )
+                    pending_lines = []
                     break
 
+            if pending_lines:
+                # the file ended in the middle of a JSON document
+                had_json_parsing_error = True
+
             if had_json_parsing_error and not yielded_at_least_once:
-                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line)
+                raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no)
 
     @staticmethod
-    def _instantiate_accumulator(line: Union[bytes, str]) -> Union[bytes, str]:
-        if isinstance(line, bytes):
-            return bytes("", json.detect_encoding(line))
-        elif isinstance(line, str):
-            return ""
+    def _scan_json_structure(line: str, depth: int, in_string: bool) -> Tuple[int, bool]:
+        """
+        Update the nesting depth and whether the position is within a JSON string after reading `line`.
+        """
+        for token in _JSON_STRUCTURE_TOKENS.findall(line):
+            if in_string:
+                if token == '"':
+                    in_string = False
+            elif token == '"':
+                in_string = True
+            elif token == "{" or token == "[":
+                depth += 1
+            elif token == "}" or token == "]":
+                depth -= 1
+        return depth, in_string
+
+    @staticmethod
+    def _decode_documents(content: str) -> List[Any]:
+        """
+        Decode all the JSON documents concatenated in `content`.
+        """
+        documents = []
+        position = _WHITESPACES.match(content, 0).end()  # type: ignore[union-attr]  # the pattern matches the empty string
+        while position < len(content):
+            document, position = _JSON_DECODER.raw_decode(content, position)
+            documents.append(document)
+            position = _WHITESPACES.match(content, position).end()  # type: ignore[union-attr]  # the pattern matches the empty string
+        return documents
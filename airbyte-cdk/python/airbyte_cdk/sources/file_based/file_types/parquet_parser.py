@@ -5,12 +5,13 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union, cast
 from urllib.parse import unquote
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
-from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ParquetFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ParquetFormat, ValidationPolicy
 from airbyte_cdk.sources.file_based.exceptions import ConfigValidationError, FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
@@ -22,6 +23,14 @@ from pyarrow import DictionaryArray, Scalar
 class ParquetParser(FileTypeParser):
 
     ENCODING = None
+    DEFAULT_BATCH_SIZE = 10_000
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        :param batch_size: The maximum number of rows read from the file at once. Records are converted one batch at a time so this bounds
+        the memory used while parsing a file regardless of the size of its row groups.
+        """
+        self._batch_size = batch_size
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -66,26 +75,40 @@ class ParquetParser(FileTypeParser):
             raise ConfigValidationError(FileBasedSourceError.CONFIG_VALIDATION_ERROR)
 
         line_no = 0
+        batch_index = 0
         try:
             with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
                 reader = pq.ParquetFile(fp)
                 partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
-                for row_group in range(reader.num_row_groups):
-                    batch = reader.read_row_group(row_group)
-                    for row in range(batch.num_rows):
+                columns = self._columns_to_read(config, reader.schema_arrow, discovered_schema)
+                for batch_index, batch in enumerate(reader.iter_batches(batch_size=self._batch_size, columns=columns)):
+                    column_names = batch.schema.names
+                    column_values = [ParquetParser._to_output_values(column, parquet_format) for column in batch.columns]
+                    for row_values in zip(*column_values):
                         line_no += 1
-                        yield {
-                            **{
-                                column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                                for column in batch.column_names
-                            },
-                            **partition_columns,
-                        }
+                        yield {**dict(zip(column_names, row_values)), **partition_columns}
         except Exception as exc:
             raise RecordParseError(
-                FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=f"{row_group=}, {line_no=}"
+                FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=f"{batch_index=}, {line_no=}"
             ) from exc
 
+    @staticmethod
+    def _columns_to_read(
+        config: FileBasedStreamConfig, parquet_schema: pa.Schema, catalog_schema: Optional[Mapping[str, SchemaType]]
+    ) -> Optional[List[str]]:
+        """
+        Only the columns which are part of the configured catalog are read. Every column is read if the catalog does not describe the
+        properties of the stream, if none of them matches a column of the file, or if the stream has to see the columns missing from the
+        catalog: schemaless streams wrap the whole row and the other validation policies rely on them to detect schema changes.
+        """
+        if config.schemaless or config.validation_policy != ValidationPolicy.emit_record:
+            return None
+        properties = catalog_schema.get("properties") if catalog_schema else None
+        if not properties or not isinstance(properties, Mapping):
+            return None
+        columns = [name for name in parquet_schema.names if name in properties]
+        return columns or None
+
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
         return [unquote(partition) for partition in filepath.split(os.sep) if "=" in partition]
@@ -94,6 +117,37 @@ class ParquetParser(FileTypeParser):
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ_BINARY
 
+    @staticmethod
+    def _to_output_values(parquet_column: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a whole pyarrow column to values that can be output by the source. The result is the same as calling `_to_output_value`
+        on every entry of the column but avoids creating a pyarrow scalar per value. Types without a column-wise conversion fall back to
+        `_to_output_value`.
+        """
+        parquet_type = parquet_column.type
+        if pa.types.is_dictionary(parquet_type) or pa.types.is_null(parquet_type):
+            return cast(List[Any], parquet_column.to_pylist())
+
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return [None if value is None else value.isoformat() for value in parquet_column.to_pylist()]
+
+        if pa.types.is_binary(parquet_type) or pa.types.is_large_binary(parquet_type):
+            # the cast validates utf-8
+            return cast(List[Any], pc.cast(parquet_column, pa.large_string()).to_pylist())
+
+        if pa.types.is_decimal(parquet_type):
+            if parquet_format.decimal_as_float:
+                return cast(List[Any], parquet_column.to_pylist())
+            return [None if value is None else str(value) for value in parquet_column.to_pylist()]
+
+        if pa.types.is_map(parquet_type):
+            return [None if value is None else {k: v for k, v in value} for value in parquet_column.to_pylist()]
+
+        if parquet_type == pa.month_day_nano_interval() or pa.types.is_duration(parquet_type) or ParquetParser._is_binary(parquet_type):
+            return [ParquetParser._to_output_value(value, parquet_format) for value in parquet_column]
+
+        return cast(List[Any], parquet_column.to_pylist())
+
     @staticmethod
     def _to_output_value(parquet_value: Union[Scalar, DictionaryArray], parquet_format: ParquetFormat) -> Any:
         """
@@ -6,6 +6,7 @@ import abc
 import dataclasses
 import datetime
 import logging
+import re
 import time
 from datetime import timedelta
 from threading import RLock
@@ -159,6 +160,65 @@ class HttpRequestMatcher(RequestMatcher):
         return True
 
 
+class HttpRequestRegexMatcher(RequestMatcher):
+    """Implementation of RequestMatcher for http requests matching the url path with a regular expression, so that requests to
+    paths with variable segments, i.e. /users/{id}/orders, can be matched
+    """
+
+    def __init__(
+        self,
+        method: Optional[str] = None,
+        url_base: Optional[str] = None,
+        url_path_pattern: Optional[str] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+    ):
+        """Constructor
+
+        :param method: HTTP method of the request
+        :param url_base: base url the url of the request starts with
+        :param url_path_pattern: regular expression searched in the path of the url of the request
+        :param params: query parameters the request must have
+        :param headers: headers the request must have, names are case-insensitive
+        """
+        self._method = method.upper() if method else None
+        self._url_base = url_base.rstrip("/") if url_base else None
+        self._url_path_pattern = re.compile(url_path_pattern) if url_path_pattern else None
+        self._params = {str(k): str(v) for k, v in (params or {}).items()}
+        self._headers = {str(k): str(v) for k, v in (headers or {}).items()}
+
+    def __call__(self, request: Any) -> bool:
+        """
+
+        :param request:
+        :return: True if matches the provided request object, False - otherwise
+        """
+        if isinstance(request, requests.Request):
+            prepared_request = request.prepare()
+        elif isinstance(request, requests.PreparedRequest):
+            prepared_request = request
+        else:
+            return False
+
+        if self._method is not None and prepared_request.method != self._method:
+            return False
+        parsed_url = parse.urlsplit(str(prepared_request.url))
+        if self._url_base is not None:
+            url_without_params = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
+            if url_without_params != self._url_base and not url_without_params.startswith(self._url_base + "/"):
+                return False
+        if self._url_path_pattern is not None and not self._url_path_pattern.search(parsed_url.path):
+            return False
+        if self._params:
+            params = dict(parse.parse_qsl(str(parsed_url.query)))
+            if not HttpRequestMatcher._match_dict(params, self._params):
+                return False
+        if self._headers:
+            if any(prepared_request.headers.get(name) != value for name, value in self._headers.items()):
+                return False
+        return True
+
+
 class BaseCallRatePolicy(AbstractCallRatePolicy, abc.ABC):
     def __init__(self, matchers: list[RequestMatcher]):
         self._matchers = matchers
@@ -330,7 +390,7 @@ class MovingWindowCallRatePolicy(BaseCallRatePolicy):
         if available_calls is not None and call_reset_ts is None:  # we do our best to sync buckets with API
             if available_calls == 0:
                 with self._limiter.lock:
-                    items_to_add = self._bucket.count() < self._bucket.rates[0].limit
+                    items_to_add = self._bucket.rates[0].limit - self._bucket.count()
                     if items_to_add > 0:
                         now: int = TimeClock().now()  # type: ignore[no-untyped-call]
                         self._bucket.put(RateItem(name="dummy", timestamp=now, weight=items_to_add))
@@ -457,7 +517,7 @@ class HttpAPIBudget(APIBudget):
         self,
         ratelimit_reset_header: str = "ratelimit-reset",
         ratelimit_remaining_header: str = "ratelimit-remaining",
-        status_codes_for_ratelimit_hit: tuple[int] = (429,),
+        status_codes_for_ratelimit_hit: tuple[int, ...] = (429,),
         **kwargs: Any,
     ):
         """Constructor
@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 import functools
+import time
 from abc import ABC, abstractmethod
+from datetime import timedelta
 from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Protocol, Tuple
 
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
@@ -143,7 +145,15 @@ class ConcurrentCursor(Cursor):
         end_provider: Callable[[], CursorValueType],
         lookback_window: Optional[GapType] = None,
         slice_range: Optional[GapType] = None,
+        state_emission_partition_count: Optional[int] = None,
+        state_emission_interval: Optional[timedelta] = None,
     ) -> None:
+        """
+        By default, a state message is emitted every time a partition is closed. For streams with many small partitions, the state
+        messages can be coalesced by setting state_emission_partition_count and/or state_emission_interval: a state message is then
+        emitted once either that many partitions were closed or that much time elapsed since the previous state message. The latest state
+        is always emitted at the end of the stream by `ensure_at_least_one_state_emitted`.
+        """
         self._stream_name = stream_name
         self._stream_namespace = stream_namespace
         self._message_repository = message_repository
@@ -159,6 +169,12 @@ class ConcurrentCursor(Cursor):
         self.start, self._concurrent_state = self._get_concurrent_state(stream_state)
         self._lookback_window = lookback_window
         self._slice_range = slice_range
+        self._state_emission_partition_count = state_emission_partition_count
+        self._state_emission_interval = state_emission_interval.total_seconds() if state_emission_interval is not None else None
+        self._partitions_closed_since_state_emission = 0
+        self._last_state_emission_time = time.monotonic()
+        # Slices of the incoming state may not be merged. Once they are, closed slices are inserted in place instead of merging them all
+        self._are_slices_merged = False
 
     @property
     def state(self) -> MutableMapping[str, Any]:
@@ -183,25 +199,28 @@ class ConcurrentCursor(Cursor):
         return self._connector_state_converter.parse_value(self._cursor_field.extract_value(record))
 
     def close_partition(self, partition: Partition) -> None:
-        slice_count_before = len(self.state.get("slices", []))
-        self._add_slice_to_state(partition)
-        if slice_count_before < len(self.state["slices"]):  # only emit if at least one slice has been processed
-            self._merge_partitions()
-            self._emit_state_message()
+        if self._add_slice_to_state(partition):  # only emit if at least one slice has been processed
+            self._partitions_closed_since_state_emission += 1
+            if self._should_emit_state_message():
+                self._emit_state_message()
         self._has_closed_at_least_one_slice = True
 
-    def _add_slice_to_state(self, partition: Partition) -> None:
+    def _add_slice_to_state(self, partition: Partition) -> bool:
+        """
+        Add the slice of the partition to the merged slices of the state. Return whether a slice was added.
+        """
         if self._slice_boundary_fields:
             if "slices" not in self.state:
                 raise RuntimeError(
                     f"The state for stream {self._stream_name} should have at least one slice to delineate the sync start time, but no slices are present. This is unexpected. Please contact Support."
                 )
-            self.state["slices"].append(
+            self._insert_slice(
                 {
                     "start": self._extract_from_slice(partition, self._slice_boundary_fields[self._START_BOUNDARY]),
                     "end": self._extract_from_slice(partition, self._slice_boundary_fields[self._END_BOUNDARY]),
                 }
             )
+            return True
         elif self._most_recent_record:
             if self._has_closed_at_least_one_slice:
                 # If we track state value using records cursor field, we can only do that if there is one partition. This is because we save
@@ -219,14 +238,34 @@ class ConcurrentCursor(Cursor):
                     "expected. Please contact the Airbyte team."
                 )
 
-            self.state["slices"].append(
+            self._insert_slice(
                 {
                     self._connector_state_converter.START_KEY: self.start,
                     self._connector_state_converter.END_KEY: self._extract_cursor_value(self._most_recent_record),
                 }
             )
+            return True
+        return False
+
+    def _insert_slice(self, stream_slice: MutableMapping[str, Any]) -> None:
+        if not self._are_slices_merged:
+            self._merge_partitions()
+        self._connector_state_converter.insert_interval(self.state["slices"], stream_slice)
+
+    def _should_emit_state_message(self) -> bool:
+        if self._state_emission_partition_count is None and self._state_emission_interval is None:
+            return True
+        if self._state_emission_partition_count is not None and (
+            self._partitions_closed_since_state_emission >= self._state_emission_partition_count
+        ):
+            return True
+        return (
+            self._state_emission_interval is not None and time.monotonic() - self._last_state_emission_time >= self._state_emission_interval
+        )
 
     def _emit_state_message(self) -> None:
+        self._partitions_closed_since_state_emission = 0
+        self._last_state_emission_time = time.monotonic()
         self._connector_state_manager.update_state_for_stream(
             self._stream_name,
             self._stream_namespace,
@@ -237,6 +276,7 @@ class ConcurrentCursor(Cursor):
 
     def _merge_partitions(self) -> None:
         self.state["slices"] = self._connector_state_converter.merge_intervals(self.state["slices"])
+        self._are_slices_merged = True
 
     def _extract_from_slice(self, partition: Partition, key: str) -> CursorValueType:
         try:
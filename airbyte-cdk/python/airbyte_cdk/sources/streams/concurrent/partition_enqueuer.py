@@ -1,7 +1,6 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
-import time
 from queue import Queue
 
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import PartitionGenerationCompletedSentinel
@@ -16,14 +15,13 @@ class PartitionEnqueuer:
     Generates partitions from a partition generator and puts them in a queue.
     """
 
-    def __init__(self, queue: Queue[QueueItem], thread_pool_manager: ThreadPoolManager, sleep_time_in_seconds: float = 0.1) -> None:
+    def __init__(self, queue: Queue[QueueItem], thread_pool_manager: ThreadPoolManager) -> None:
         """
         :param queue:  The queue to put the partitions in.
-        :param throttler: The throttler to use to throttle the partition generation.
+        :param thread_pool_manager: The thread pool manager to use to throttle the partition generation.
         """
         self._queue = queue
         self._thread_pool_manager = thread_pool_manager
-        self._sleep_time_in_seconds = sleep_time_in_seconds
 
     def generate_partitions(self, stream: AbstractStream) -> None:
         """
@@ -46,10 +44,8 @@ class PartitionEnqueuer:
                 # Also note that we do not expect this to create deadlocks where all worker threads wait because we have less
                 # PartitionEnqueuer threads than worker threads.
                 #
-                # Also note that prune_to_validate_has_reached_futures_limit has a lock while pruning which might create a bottleneck in
-                # terms of performance.
-                while self._thread_pool_manager.prune_to_validate_has_reached_futures_limit():
-                    time.sleep(self._sleep_time_in_seconds)
+                # Also note that the thread is woken up by the ThreadPoolManager as soon as a future completes rather than polling it.
+                self._thread_pool_manager.wait_until_futures_limit_not_reached()
                 self._queue.put(partition)
             self._queue.put(PartitionGenerationCompletedSentinel(stream))
         except Exception as e:
@@ -1,11 +1,23 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import sys
 from queue import Queue
+from typing import List, Optional
 
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem, RecordBatch
+
+
+def _estimate_record_size(record: Record) -> int:
+    """
+    Cheap approximation of the memory held by a record: only the top level values are measured so that sizing a record never costs
+    more than iterating over its fields once.
+    """
+    data = record.data
+    return sys.getsizeof(data) + sum(sys.getsizeof(value) for value in data.values())
 
 
 class PartitionReader:
@@ -13,11 +25,19 @@ class PartitionReader:
     Generates records from a partition and puts them in a queue.
     """
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    def __init__(self, queue: Queue[QueueItem], max_batch_size: int = 1, max_batch_bytes: Optional[int] = None) -> None:
         """
         :param queue: The queue to put the records in.
+        :param max_batch_size: The maximum number of records put in the queue as a single RecordBatch. With a value of 1, records are
+        put in the queue one by one.
+        :param max_batch_bytes: If set, a batch is put in the queue as soon as the estimated size of its records reaches this number of
+        bytes, even if it holds less than max_batch_size records.
         """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
         self._queue = queue
+        self._max_batch_size = max_batch_size
+        self._max_batch_bytes = max_batch_bytes
 
     def process_partition(self, partition: Partition) -> None:
         """
@@ -31,10 +51,30 @@ class PartitionReader:
         :param partition: The partition to read data from
         :return: None
         """
+        batch: List[Record] = []
         try:
-            for record in partition.read():
-                self._queue.put(record)
+            if self._max_batch_size == 1:
+                for record in partition.read():
+                    self._queue.put(record)
+            else:
+                batch_bytes = 0
+                for record in partition.read():
+                    batch.append(record)
+                    if self._max_batch_bytes is not None:
+                        batch_bytes += _estimate_record_size(record)
+                    if len(batch) >= self._max_batch_size or (self._max_batch_bytes is not None and batch_bytes >= self._max_batch_bytes):
+                        self._queue.put(RecordBatch(batch, partition.stream_name()))
+                        batch = []
+                        batch_bytes = 0
+                self._flush(batch, partition)
+                batch = []
             self._queue.put(PartitionCompleteSentinel(partition))
         except Exception as e:
+            # records read before the failure are still emitted so that they are not lost
+            self._flush(batch, partition)
             self._queue.put(StreamThreadException(e, partition.stream_name()))
             self._queue.put(PartitionCompleteSentinel(partition))
+
+    def _flush(self, batch: List[Record], partition: Partition) -> None:
+        if batch:
+            self._queue.put(RecordBatch(batch, partition.stream_name()))
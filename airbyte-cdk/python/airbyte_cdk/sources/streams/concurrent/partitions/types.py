@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, Union
+from typing import Any, List, Union
 
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import PartitionGenerationCompletedSentinel
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
@@ -27,7 +27,30 @@ class PartitionCompleteSentinel:
         return False
 
 
+class RecordBatch:
+    """
+    Records read from a single partition, handed over to the main thread as one queue item.
+    The records are kept in the order the partition produced them.
+    """
+
+    def __init__(self, records: List[Record], stream_name: str):
+        """
+        :param records: The records, in the order they were read
+        :param stream_name: The name of the stream all the records belong to
+        """
+        self.records = records
+        self.stream_name = stream_name
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RecordBatch):
+            return self.records == other.records and self.stream_name == other.stream_name
+        return False
+
+    def __repr__(self) -> str:
+        return f"RecordBatch(stream_name={self.stream_name}, records={self.records})"
+
+
 """
 Typedef representing the items that can be added to the ThreadBasedConcurrentStream
 """
-QueueItem = Union[Record, Partition, PartitionCompleteSentinel, PartitionGenerationCompletedSentinel, Exception]
+QueueItem = Union[Record, RecordBatch, Partition, PartitionCompleteSentinel, PartitionGenerationCompletedSentinel, Exception]
@@ -4,7 +4,7 @@
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import TYPE_CHECKING, Any, List, MutableMapping, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, MutableMapping, Optional, Tuple
 
 if TYPE_CHECKING:
     from airbyte_cdk.sources.streams.concurrent.cursor import CursorField
@@ -28,6 +28,7 @@ class AbstractStreamStateConverter(ABC):
 
     def __init__(self, is_sequential_state: bool = True):
         self._is_sequential_state = is_sequential_state
+        self._serialized_slices: Dict[int, Tuple[Any, Any, Mapping[str, Any], Mapping[str, Any]]] = {}
 
     def convert_to_state_message(self, cursor_field: "CursorField", stream_state: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
         """
@@ -69,14 +70,21 @@ class AbstractStreamStateConverter(ABC):
         """
         Perform any transformations needed for compatibility with the converter.
         """
+        # The state is serialized every time a partition is closed while most of its slices did not change since the previous time, so
+        # slices whose boundaries are the same objects as the previous time are not serialized again. Only the current slices are kept,
+        # along with their boundaries so that their ids can't be reused
+        previously_serialized_slices = self._serialized_slices
+        self._serialized_slices = {}
         serialized_slices = []
         for stream_slice in state.get("slices", []):
-            serialized_slices.append(
-                {
-                    self.START_KEY: self._to_state_message(stream_slice[self.START_KEY]),
-                    self.END_KEY: self._to_state_message(stream_slice[self.END_KEY]),
-                }
-            )
+            start, end = stream_slice[self.START_KEY], stream_slice[self.END_KEY]
+            previously_serialized_slice = previously_serialized_slices.get(id(stream_slice))
+            if previously_serialized_slice and previously_serialized_slice[0] is start and previously_serialized_slice[1] is end:
+                serialized_slice = previously_serialized_slice[2]
+            else:
+                serialized_slice = {self.START_KEY: self._to_state_message(start), self.END_KEY: self._to_state_message(end)}
+            self._serialized_slices[id(stream_slice)] = (start, end, serialized_slice, stream_slice)
+            serialized_slices.append(serialized_slice)
         return {"slices": serialized_slices, "state_type": state_type.value}
 
     @staticmethod
@@ -134,6 +142,36 @@ class AbstractStreamStateConverter(ABC):
 
         return merged_intervals
 
+    def insert_interval(self, merged_intervals: List[MutableMapping[str, Any]], interval: MutableMapping[str, Any]) -> None:
+        """
+        Insert an interval in a list of intervals already merged by `merge_intervals`, merging it with its neighbours, so that the list
+        is the same as if `merge_intervals` had been called on all the intervals.
+
+        The position of the interval is found with a binary search and only the intervals it overlaps are merged so that closing a slice
+        does not sort and merge all the intervals again.
+        """
+        start, end = interval[self.START_KEY], interval[self.END_KEY]
+        lower, upper = 0, len(merged_intervals)
+        while lower < upper:
+            middle = (lower + upper) // 2
+            if (start, end) < (merged_intervals[middle][self.START_KEY], merged_intervals[middle][self.END_KEY]):
+                upper = middle
+            else:
+                lower = middle + 1
+
+        if lower > 0 and bool(self.increment(merged_intervals[lower - 1][self.END_KEY]) >= start):
+            index = lower - 1
+            merged_intervals[index][self.END_KEY] = max(merged_intervals[index][self.END_KEY], end)
+        else:
+            index = lower
+            merged_intervals.insert(index, interval)
+
+        current = merged_intervals[index]
+        while index + 1 < len(merged_intervals) and bool(
+            self.increment(current[self.END_KEY]) >= merged_intervals[index + 1][self.START_KEY]
+        ):
+            current[self.END_KEY] = max(current[self.END_KEY], merged_intervals.pop(index + 1)[self.END_KEY])
+
     @abstractmethod
     def parse_value(self, value: Any) -> Any:
         """
@@ -4,9 +4,10 @@
 
 from abc import abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, MutableMapping, Optional, Tuple
+from typing import Any, Callable, List, MutableMapping, Optional, Tuple
 
 import pendulum
+from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimeParser
 from airbyte_cdk.sources.streams.concurrent.cursor import CursorField
 from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_state_converter import (
     AbstractStreamStateConverter,
@@ -153,3 +154,63 @@ class IsoMillisConcurrentStreamStateConverter(DateTimeStreamStateConverter):
         if not isinstance(dt_object, DateTime):
             raise ValueError(f"DateTime object was expected but got {type(dt_object)} from pendulum.parse({timestamp})")
         return dt_object  # type: ignore  # we are manually type checking because pendulum.parse may return different types
+
+
+class CustomFormatConcurrentStreamStateConverter(DateTimeStreamStateConverter):
+    """
+    Converts the state of streams whose cursor values are formatted with strftime formats, such as the streams of declarative sources
+    using a DatetimeBasedCursor. Consecutive slices are merged if the start of a slice is at most one cursor_granularity after the end of
+    the previous slice.
+
+    e.g. with datetime_format "%Y-%m-%d"
+    { "created": "2021-01-18" }
+    =>
+    {
+        "state_type": "date-range",
+        "metadata": { … },
+        "slices": [
+            {starts: "0001-01-01", end: "2021-01-18", finished_processing: true}
+        ]
+    }
+    """
+
+    _zero_value = datetime.min.replace(tzinfo=timezone.utc)
+
+    def __init__(
+        self,
+        datetime_format: str,
+        input_datetime_formats: Optional[List[str]] = None,
+        is_sequential_state: bool = True,
+        cursor_granularity: Optional[timedelta] = None,
+    ):
+        """
+        :param datetime_format: The format of the values written in the state
+        :param input_datetime_formats: The formats the values read from the state, the slices and the records are parsed with, in addition
+          to datetime_format
+        :param cursor_granularity: The smallest increment between two cursor values
+        """
+        super().__init__(is_sequential_state=is_sequential_state)
+        self._datetime_format = datetime_format
+        self._input_datetime_formats = list(dict.fromkeys((input_datetime_formats or []) + [datetime_format]))
+        self._cursor_granularity = cursor_granularity or timedelta(0)
+        self._parser = DatetimeParser()
+
+    @property
+    def zero_value(self) -> datetime:
+        return self._zero_value
+
+    def increment(self, timestamp: datetime) -> datetime:
+        return timestamp + self._cursor_granularity
+
+    def output_format(self, timestamp: datetime) -> str:
+        return self._parser.format(timestamp, self._datetime_format)
+
+    def parse_timestamp(self, timestamp: Any) -> datetime:
+        if isinstance(timestamp, datetime):
+            return timestamp
+        for datetime_format in self._input_datetime_formats:
+            try:
+                return self._parser.parse(timestamp, datetime_format)
+            except ValueError:
+                continue
+        raise ValueError(f"No format in {self._input_datetime_formats} matching {timestamp}")
@@ -11,6 +11,7 @@ from functools import lru_cache
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import airbyte_cdk.sources.utils.casing as casing
+from airbyte_cdk.logger import truncated_log_extra
 from airbyte_cdk.models import AirbyteMessage, AirbyteStream, ConfiguredAirbyteStream, SyncMode
 from airbyte_cdk.models import Type as MessageType
 
@@ -128,7 +129,11 @@ class Stream(ABC):
             sync_mode=sync_mode,  # todo: change this interface to no longer rely on sync_mode for behavior
             stream_state=stream_state,
         )
-        logger.debug(f"Processing stream slices for {self.name} (sync_mode: {sync_mode.name})", extra={"stream_slices": slices})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Processing stream slices for {self.name} (sync_mode: {sync_mode.name})",
+                extra=truncated_log_extra("stream_slices", str(slices)),
+            )
 
         has_slices = False
         record_counter = 0
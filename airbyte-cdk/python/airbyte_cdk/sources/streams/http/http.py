@@ -13,6 +13,7 @@ from urllib.parse import urljoin
 
 import requests
 import requests_cache
+from airbyte_cdk.logger import truncated_log_extra
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.http_config import MAX_CONNECTION_POOL_SIZE
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
@@ -352,16 +353,24 @@ class HttpStream(Stream, ABC):
         Unexpected transient exceptions use the default backoff parameters.
         Unexpected persistent exceptions are not handled and will cause the sync to fail.
         """
-        self.logger.debug(
-            "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
-        )
+        # Decoding the bodies can be heavy, for example, if streaming a large response
+        # Do it only in debug mode and up to a limited size
+        is_debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if is_debug_enabled:
+            self.logger.debug(
+                "Making outbound API request",
+                extra={"headers": request.headers, "url": request.url, **truncated_log_extra("request_body", request.body)},
+            )
         response: requests.Response = self._session.send(request, **request_kwargs)
 
-        # Evaluation of response.text can be heavy, for example, if streaming a large response
-        # Do it only in debug mode
-        if self.logger.isEnabledFor(logging.DEBUG):
+        if is_debug_enabled:
             self.logger.debug(
-                "Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text}
+                "Receiving response",
+                extra={
+                    "headers": response.headers,
+                    "status": response.status_code,
+                    **truncated_log_extra("body", response.content, response.encoding),
+                },
             )
         if self.should_retry(response):
             custom_backoff_time = self.backoff_time(response)
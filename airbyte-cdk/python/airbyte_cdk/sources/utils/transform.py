@@ -3,11 +3,13 @@
 #
 
 import logging
+import numbers
+import threading
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolutionError, RefResolver, ValidationError, validators
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
@@ -15,6 +17,24 @@ python_to_json = {v: k for k, v in json_to_python.items()}
 
 logger = logging.getLogger("airbyte")
 
+# Maximum number of schemas a TypeTransformer keeps compiled. Streams pass the same schema for every record so this is only reached
+# when a transformer is shared by many streams or given a new schema object every time.
+_MAX_COMPILED_SCHEMAS = 64
+
+# Same checks as the jsonschema Draft 7 type checker
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": lambda instance: isinstance(instance, int) and not isinstance(instance, bool),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: isinstance(instance, numbers.Number) and not isinstance(instance, bool),
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, str),
+}
+
+# A compiled schema normalizes the record in place and returns the type errors found, if any
+CompiledSchema = Callable[[Any], Optional[List[ValidationError]]]
+
 
 class TransformConfig(Flag):
     """
@@ -57,6 +77,9 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        self._compiled_schemas: Dict[int, Tuple[Mapping[str, Any], Optional[CompiledSchema]]] = {}
+        # Validators keep their $ref resolution scope while traversing a record so they are reused per thread, not shared
+        self._validators = threading.local()
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -70,6 +93,7 @@ class TypeTransformer:
         if TransformConfig.CustomSchemaNormalization not in self._config:
             raise Exception("Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer")
         self._custom_normalizer = normalization_callback
+        self._compiled_schemas = {}
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -180,17 +204,283 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
-        normalizer = self._normalizer(schema)
-        for e in normalizer.iter_errors(record):
+        compiled_schema = self._get_compiled_schema(schema)
+        if compiled_schema:
+            errors = compiled_schema(record) or []
+        else:
             """
             just calling normalizer.validate() would throw an exception on
             first validation occurences and stop processing rest of schema.
             """
+            errors = self._get_normalizer(schema).iter_errors(record)
+        for e in errors:
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[CompiledSchema]:
+        """
+        Streams return the same schema object for every record, so the schema is compiled once and reused as long as the same object is
+        passed. Returns None for schemas using constructs the compiler does not support, which are then traversed with jsonschema.
+        """
+        cached = self._compiled_schemas.get(id(schema))
+        if cached and cached[0] is schema:
+            return cached[1]
+
+        try:
+            compiled_schema: Optional[CompiledSchema] = _SchemaCompiler(self, self._normalizer(schema).resolver).compile(schema)
+        except _UnsupportedSchema:
+            compiled_schema = None
+        if len(self._compiled_schemas) >= _MAX_COMPILED_SCHEMAS:
+            self._compiled_schemas = {}
+        self._compiled_schemas[id(schema)] = (schema, compiled_schema)
+        return compiled_schema
+
+    def _get_normalizer(self, schema: Mapping[str, Any]) -> Any:
+        validators = self._validators
+        if getattr(validators, "schema", None) is not schema:
+            validators.normalizer = self._normalizer(schema)
+            validators.schema = schema
+        return validators.normalizer
+
+    def _get_conversion(self, subschema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Returns the function normalizing the values described by `subschema` according to the config, or None if values are kept as is.
+        """
+        conversions: List[Callable[[Any], Any]] = []
+        if TransformConfig.DefaultSchemaNormalization in self._config:
+            if type(self).default_convert is TypeTransformer.default_convert:
+                conversions.append(_compile_default_conversion(subschema))
+            else:
+                conversions.append(lambda value: self.default_convert(value, subschema))
+        custom_normalizer = self._custom_normalizer
+        if custom_normalizer:
+            conversions.append(lambda value: custom_normalizer(value, subschema))  # type: ignore  # custom_normalizer is not None
+
+        if not conversions:
+            return None
+        if len(conversions) == 1:
+            return conversions[0]
+        default_conversion, custom_conversion = conversions
+        return lambda value: custom_conversion(default_conversion(value))
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
         return (
             f"Failed to transform value {repr(e.instance)} of type '{instance_json_type}' to '{e.validator_value}', key path: '{key_path}'"
         )
+
+
+class _UnsupportedSchema(Exception):
+    """
+    Raised while compiling a schema the jsonschema traversal handles differently than the compiled one would (boolean schemas, tuple
+    items, unknown types...).
+    """
+
+
+class _SchemaCompiler:
+    """
+    Compiles a json schema into a tree of closures mirroring the traversal TypeTransformer does with jsonschema: only the "type",
+    "properties", "items" and "$ref" keywords are considered, properties and items are normalized before being descended into, and
+    "$ref"s are resolved once here instead of for every record.
+    """
+
+    def __init__(self, transformer: TypeTransformer, resolver: RefResolver):
+        self._transformer = transformer
+        self._resolver = resolver
+        self._compiled: Dict[Tuple[int, str], CompiledSchema] = {}
+
+    def compile(self, schema: Any) -> CompiledSchema:
+        if not isinstance(schema, dict):
+            raise _UnsupportedSchema(f"Schema {schema} is not an object")
+
+        key = (id(schema), self._resolver.resolution_scope)
+        if key in self._compiled:
+            # Recursive schemas reference a node that is still being compiled
+            return self._compiled[key]
+
+        steps: List[CompiledSchema] = []
+
+        def compiled_schema(instance: Any) -> Optional[List[ValidationError]]:
+            errors = None
+            for step in steps:
+                step_errors = step(instance)
+                if step_errors:
+                    errors = step_errors if errors is None else errors + step_errors
+            return errors
+
+        self._compiled[key] = compiled_schema
+
+        scope = schema.get("$id")
+        if scope:
+            self._resolver.push_scope(scope)
+        try:
+            if "$ref" in schema:
+                steps.append(self._compile_ref(schema["$ref"]))
+            else:
+                for keyword, value in schema.items():
+                    if keyword == "type":
+                        steps.append(self._compile_type(value))
+                    elif keyword == "properties":
+                        steps.append(self._compile_properties(value))
+                    elif keyword == "items":
+                        steps.append(self._compile_items(value))
+        finally:
+            if scope:
+                self._resolver.pop_scope()
+        return compiled_schema
+
+    def _compile_ref(self, ref: str) -> CompiledSchema:
+        try:
+            url, resolved = self._resolver.resolve(ref)
+        except RefResolutionError as error:
+            return _raise_when_called(error)
+        self._resolver.push_scope(url)
+        try:
+            return self.compile(resolved)
+        finally:
+            self._resolver.pop_scope()
+
+    def _resolve(self, subschema: Any) -> Any:
+        # Only one level of "$ref" is resolved to find the schema used to normalize a value, as TypeTransformer does
+        if isinstance(subschema, dict) and "$ref" in subschema:
+            return self._resolver.resolve(subschema["$ref"])[1]
+        return subschema
+
+    def _get_conversion(self, subschema: Any) -> Optional[Callable[[Any], Any]]:
+        try:
+            resolved = self._resolve(subschema)
+        except RefResolutionError as error:
+            return _raise_when_called(error)
+        if not isinstance(resolved, dict):
+            raise _UnsupportedSchema(f"Schema {resolved} is not an object")
+        return self._transformer._get_conversion(resolved)
+
+    @staticmethod
+    def _compile_type(types: Any) -> CompiledSchema:
+        type_names = [types] if isinstance(types, str) else types
+        if not isinstance(type_names, list) or any(type_name not in _TYPE_CHECKS for type_name in type_names):
+            raise _UnsupportedSchema(f"Unsupported type {types}")
+        checks = [_TYPE_CHECKS[type_name] for type_name in type_names]
+
+        def check_type(instance: Any) -> Optional[List[ValidationError]]:
+            for check in checks:
+                if check(instance):
+                    return None
+            return [ValidationError("type", validator="type", validator_value=types, instance=instance)]
+
+        return check_type
+
+    def _compile_properties(self, properties: Any) -> CompiledSchema:
+        if not isinstance(properties, dict):
+            raise _UnsupportedSchema(f"Properties {properties} are not an object")
+        compiled_properties = {name: (self._get_conversion(subschema), self.compile(subschema)) for name, subschema in properties.items()}
+
+        def normalize_properties(instance: Any) -> Optional[List[ValidationError]]:
+            if not isinstance(instance, dict):
+                return None
+            errors = None
+            # Only walk the fields present in the record, going through whichever of the record and the schema is the smallest
+            names = instance if len(instance) < len(compiled_properties) else compiled_properties
+            for name in names:
+                if name not in instance or name not in compiled_properties:
+                    continue
+                convert, compiled_property = compiled_properties[name]
+                value = instance[name]
+                if convert:
+                    value = instance[name] = convert(value)
+                property_errors = compiled_property(value)
+                if property_errors:
+                    for error in property_errors:
+                        error.path.appendleft(name)
+                    errors = property_errors if errors is None else errors + property_errors
+            return errors
+
+        return normalize_properties
+
+    def _compile_items(self, items: Any) -> CompiledSchema:
+        if not isinstance(items, dict):
+            raise _UnsupportedSchema(f"Items {items} are not described by a single schema")
+        convert = self._get_conversion(items)
+        compiled_items = self.compile(items)
+
+        def normalize_items(instance: Any) -> Optional[List[ValidationError]]:
+            if not isinstance(instance, list):
+                return None
+            errors = None
+            for index, item in enumerate(instance):
+                if convert:
+                    item = instance[index] = convert(item)
+                item_errors = compiled_items(item)
+                if item_errors:
+                    for error in item_errors:
+                        error.path.appendleft(index)
+                    errors = item_errors if errors is None else errors + item_errors
+            return errors
+
+        return normalize_items
+
+
+def _compile_default_conversion(subschema: Dict[str, Any]) -> Callable[[Any], Any]:
+    """
+    Specializes TypeTransformer.default_convert for the given subschema so that the type lookups are done once.
+    """
+    target_type = subschema.get("type", [])
+    try:
+        nullable = "null" in target_type
+    except TypeError:
+        raise _UnsupportedSchema(f"Unsupported type {target_type}")
+    if isinstance(target_type, list):
+        target_type = [t for t in target_type if t != "null"]
+        if len(target_type) != 1:
+            return _keep_value
+        target_type = target_type[0]
+
+    if target_type == "string":
+        cast: Callable[[Any], Any] = str
+    elif target_type == "number":
+        cast = float
+    elif target_type == "integer":
+        cast = int
+    elif target_type == "boolean":
+
+        def cast(value: Any) -> Any:
+            if isinstance(value, str):
+                return strtobool(value) == 1
+            return bool(value)
+
+    elif target_type == "array":
+        try:
+            item_types = set(subschema.get("items", {}).get("type", set()))
+        except (AttributeError, TypeError):
+            raise _UnsupportedSchema(f"Unsupported items {subschema.get('items')}")
+        if not item_types.issubset(json_to_python_simple):
+            return _keep_value
+        simple_types = set(json_to_python_simple.values())
+
+        def cast(value: Any) -> Any:
+            return [value] if type(value) in simple_types else value
+
+    else:
+        return _keep_value
+
+    def convert(value: Any) -> Any:
+        if value is None and nullable:
+            return None
+        try:
+            return cast(value)
+        except (ValueError, TypeError):
+            return value
+
+    return convert
+
+
+def _keep_value(value: Any) -> Any:
+    return value
+
+
+def _raise_when_called(error: Exception) -> Callable[[Any], Any]:
+    # Unresolvable references only fail the transformation of records that have a value for them
+    def raise_error(value: Any) -> Any:
+        raise error.with_traceback(None)
+
+    return raise_error
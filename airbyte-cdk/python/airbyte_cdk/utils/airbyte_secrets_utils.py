@@ -2,7 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+import re
+from typing import Any, FrozenSet, List, Mapping, Optional, Pattern, Tuple
 
 import dpath.util
 
@@ -54,25 +55,41 @@ def get_secrets(connection_specification: Mapping[str, Any], config: Mapping[str
 
 
 __SECRETS_FROM_CONFIG: List[str] = []
+# The characters the secrets start with, to skip strings containing none of them, and a pattern matching any of the secrets. Both are
+# compiled again whenever the secrets change rather than for every filtered string
+__SECRETS_MATCHER: Tuple[FrozenSet[str], Optional[Pattern[str]]] = (frozenset(), None)
+
+
+def _compile_secrets_matcher() -> None:
+    global __SECRETS_MATCHER
+    # The longest secrets are tried first so that a secret containing another one is masked entirely
+    secrets = sorted({str(secret) for secret in __SECRETS_FROM_CONFIG if secret}, key=len, reverse=True)
+    __SECRETS_MATCHER = (
+        frozenset(secret[0] for secret in secrets),
+        re.compile("|".join(re.escape(secret) for secret in secrets)) if secrets else None,
+    )
 
 
 def update_secrets(secrets: List[str]) -> None:
     """Update the list of secrets to be replaced"""
     global __SECRETS_FROM_CONFIG
     __SECRETS_FROM_CONFIG = secrets
+    _compile_secrets_matcher()
 
 
 def add_to_secrets(secret: str) -> None:
     """Add to the list of secrets to be replaced"""
     global __SECRETS_FROM_CONFIG
     __SECRETS_FROM_CONFIG.append(secret)
+    _compile_secrets_matcher()
 
 
 def filter_secrets(string: str) -> str:
-    """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
-    return string
+    """
+    Filter secrets from a string by replacing them with ****. The string is scanned once: at each position, the longest secret starting
+    there is masked, so that overlapping secrets are masked regardless of the order in which they were added.
+    """
+    first_characters, secrets_pattern = __SECRETS_MATCHER
+    if secrets_pattern is None or first_characters.isdisjoint(string):
+        return string
+    return secrets_pattern.sub("****", string)
@@ -0,0 +1,114 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+from typing import Any, BinaryIO, Iterable, List, Mapping, Optional, Union
+
+from airbyte_cdk.models import AirbyteMessage, Type
+from pydantic import ValidationError
+
+logger = logging.getLogger("airbyte")
+
+_RECORD_TYPE = Type.RECORD.value
+
+
+class RecordView:
+    """
+    Lightweight stand-in for AirbyteRecordMessage exposing the fields destinations use, without pydantic validation.
+    """
+
+    __slots__ = ("stream", "namespace", "data", "emitted_at")
+
+    def __init__(self, stream: str, namespace: Optional[str], data: Mapping[str, Any], emitted_at: int) -> None:
+        self.stream = stream
+        self.namespace = namespace
+        self.data = data
+        self.emitted_at = emitted_at
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RecordView):
+            return False
+        return (self.stream, self.namespace, self.data, self.emitted_at) == (other.stream, other.namespace, other.data, other.emitted_at)
+
+    def __repr__(self) -> str:
+        return f"RecordView(stream={self.stream!r}, namespace={self.namespace!r}, data={self.data!r}, emitted_at={self.emitted_at!r})"
+
+
+class RecordMessageView:
+    """
+    Lightweight stand-in for a RECORD AirbyteMessage: `message.type` and `message.record` behave like the model's attributes.
+    """
+
+    __slots__ = ("record",)
+
+    type = Type.RECORD
+
+    def __init__(self, record: RecordView) -> None:
+        self.record = record
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RecordMessageView) and self.record == other.record
+
+    def __repr__(self) -> str:
+        return f"RecordMessageView(record={self.record!r})"
+
+
+class AirbyteMessageReader:
+    """
+    Reads newline delimited Airbyte messages from a binary stream.
+
+    The stream is read in large chunks which are split into lines by `bytes.split`. Each line is decoded by the C accelerated json decoder.
+    RECORD messages are returned as RecordMessageView without going through pydantic. Every other message (STATE, TRACE, CONTROL, ...)
+    as well as records that do not look like valid records are validated into AirbyteMessage. Lines that can't be deserialized as Airbyte
+    messages are logged and skipped.
+    """
+
+    def __init__(self, chunk_size: int = 1024 * 1024) -> None:
+        self._chunk_size = chunk_size
+
+    def read(self, input_stream: BinaryIO) -> Iterable[Union[AirbyteMessage, RecordMessageView]]:
+        # a line spanning several chunks is kept as a list of pieces so that it is joined only once
+        pending: List[bytes] = []
+        while True:
+            chunk = input_stream.read(self._chunk_size)
+            if not chunk:
+                break
+            lines = chunk.split(b"\n")
+            if len(lines) == 1:
+                pending.append(chunk)
+                continue
+            if pending:
+                pending.append(lines[0])
+                lines[0] = b"".join(pending)
+            pending = [lines.pop()]
+            for line in lines:
+                message = self._parse_line(line)
+                if message is not None:
+                    yield message
+        if pending:
+            message = self._parse_line(b"".join(pending))
+            if message is not None:
+                yield message
+
+    @staticmethod
+    def _parse_line(line: bytes) -> Optional[Union[AirbyteMessage, RecordMessageView]]:
+        if not line.strip():
+            return None
+        try:
+            message = json.loads(line)
+            if isinstance(message, dict) and message.get("type") == _RECORD_TYPE:
+                record = message.get("record")
+                if (
+                    isinstance(record, dict)
+                    and isinstance(record.get("stream"), str)
+                    and isinstance(record.get("data"), dict)
+                    and isinstance(record.get("emitted_at"), int)
+                ):
+                    return RecordMessageView(RecordView(record["stream"], record.get("namespace"), record["data"], record["emitted_at"]))
+            return AirbyteMessage.parse_obj(message)
+        except (ValueError, ValidationError):
+            # ValueError covers json.JSONDecodeError and UnicodeDecodeError
+            logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line!r}")
+            return None
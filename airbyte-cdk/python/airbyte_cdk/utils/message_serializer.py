@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import time
+from typing import Any, Dict, FrozenSet, Optional, TextIO, Tuple
+
+from airbyte_cdk.models import AirbyteMessage, Type
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+
+_RECORD_MESSAGE_FIELDS = frozenset({"type", "record"})
+_ENVELOPE_RECORD_FIELDS = frozenset({"namespace", "stream", "data", "emitted_at"})
+_RECORD_PREFIX = '{"type": "RECORD"'
+
+
+def _encode_default(obj: Any) -> Any:
+    # pydantic propagates `exclude_unset` to models nested in the record data, `pydantic_encoder` alone would not
+    if isinstance(obj, BaseModel):
+        return obj.dict(exclude_unset=True)
+    return pydantic_encoder(obj)
+
+
+class AirbyteMessageSerializer:
+    """
+    Serializes AirbyteMessages into the exact same strings as `AirbyteMessage.json(exclude_unset=True)`.
+
+    RECORD messages skip pydantic's recursive `dict()` conversion: the envelope around `data` is rendered once per stream and the
+    record data is encoded directly by the C accelerated json encoder. Every other message, as well as records carrying fields the
+    envelope does not cover (`meta`, extra properties), is serialized by pydantic.
+    """
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(default=_encode_default)
+        self._envelopes: Dict[Tuple[Optional[str], str, FrozenSet[str]], str] = {}
+
+    def serialize(self, message: AirbyteMessage) -> str:
+        record = message.record
+        if (
+            message.type != Type.RECORD
+            or record is None
+            or message.__fields_set__ != _RECORD_MESSAGE_FIELDS
+            or not record.__fields_set__ <= _ENVELOPE_RECORD_FIELDS
+        ):
+            serialized_message: str = message.json(exclude_unset=True)
+            return serialized_message
+
+        envelope_key = (record.namespace, record.stream, frozenset(record.__fields_set__))
+        envelope = self._envelopes.get(envelope_key)
+        if envelope is None:
+            envelope = self._build_envelope(record.namespace, record.stream, "namespace" in record.__fields_set__)
+            self._envelopes[envelope_key] = envelope
+        return f'{envelope}{self._encoder.encode(record.data)}, "emitted_at": {self._encoder.encode(record.emitted_at)}}}}}'
+
+    def _build_envelope(self, namespace: Optional[str], stream: str, is_namespace_set: bool) -> str:
+        namespace_entry = f'"namespace": {self._encoder.encode(namespace)}, ' if is_namespace_set else ""
+        return f'{_RECORD_PREFIX}, "record": {{{namespace_entry}"stream": {self._encoder.encode(stream)}, "data": '
+
+
+class BufferedMessageWriter:
+    """
+    Writes serialized messages to a text stream, one per line, flushing once `max_buffer_size` characters are pending or
+    `flush_interval` seconds have passed since the last flush instead of after every message.
+
+    Lines are written straight to the stream so their order relative to what the logging handlers write to the same stream is kept;
+    only the flushes are batched. Any message that is not a RECORD (state, trace, control...) is flushed right away so checkpoints
+    are never held back behind a quiet stream.
+    """
+
+    def __init__(self, stream: TextIO, max_buffer_size: int = 1024 * 1024, flush_interval: float = 1.0) -> None:
+        self._stream = stream
+        self._max_buffer_size = max_buffer_size
+        self._flush_interval = flush_interval
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, message: str) -> None:
+        self._stream.write(f"{message}\n")
+        self._pending_size += len(message) + 1
+        if (
+            self._pending_size >= self._max_buffer_size
+            or not message.startswith(_RECORD_PREFIX)
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        self._stream.flush()
+        self._pending_size = 0
+        self._last_flush = time.monotonic()
@@ -0,0 +1,123 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares partitions/sec of `ConcurrentCursor.close_partition`, which inserts the slice of the partition in the merged slices of the state,
+reuses the serialized slice boundaries and can coalesce state messages, against the previous implementation appending the slice, merging
+and serializing all the slices again for every partition, on one-day partitions closed in a shuffled order as concurrent workers would.
+
+Usage: python benchmarks/benchmark_concurrent_cursor.py [--records 5000] [--state-emission-partition-count 100]
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, MutableMapping, Optional
+
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import ConcurrentCursor, CursorField
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_state_converter import ConcurrencyCompatibleStateType
+from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import EpochValueConcurrentStreamStateConverter
+
+_DAY = 24 * 60 * 60
+
+
+class _PreviousStateConverter(EpochValueConcurrentStreamStateConverter):
+    def serialize(self, state: MutableMapping[str, Any], state_type: ConcurrencyCompatibleStateType) -> MutableMapping[str, Any]:
+        serialized_slices = []
+        for stream_slice in state.get("slices", []):
+            serialized_slices.append(
+                {
+                    self.START_KEY: self._to_state_message(stream_slice[self.START_KEY]),
+                    self.END_KEY: self._to_state_message(stream_slice[self.END_KEY]),
+                }
+            )
+        return {"slices": serialized_slices, "state_type": state_type.value}
+
+
+class _PreviousConcurrentCursor(ConcurrentCursor):
+    def close_partition(self, partition: Partition) -> None:
+        self.state["slices"].append(
+            {
+                "start": self._extract_from_slice(partition, "start_time"),
+                "end": self._extract_from_slice(partition, "end_time"),
+            }
+        )
+        self._merge_partitions()
+        self._emit_state_message()
+
+
+class _Partition(Partition):
+    def __init__(self, stream_slice: Dict[str, Any]) -> None:
+        self._stream_slice = stream_slice
+
+    def read(self) -> Any:
+        return []
+
+    def to_slice(self) -> Optional[Dict[str, Any]]:
+        return self._stream_slice
+
+    def stream_name(self) -> str:
+        return "benchmark"
+
+    def close(self) -> None:
+        pass
+
+    def is_closed(self) -> bool:
+        return True
+
+    def __hash__(self) -> int:
+        return hash(self._stream_slice["start_time"])
+
+
+def _cursor(cursor_class: Any, state_converter_class: Any, state_emission_partition_count: Optional[int]) -> ConcurrentCursor:
+    kwargs = {"state_emission_partition_count": state_emission_partition_count} if state_emission_partition_count else {}
+    return cursor_class(  # type: ignore  # the previous cursor has the same constructor
+        "benchmark",
+        None,
+        {},
+        InMemoryMessageRepository(),
+        ConnectorStateManager({}),
+        state_converter_class(is_sequential_state=False),
+        CursorField("updated_at"),
+        ("start_time", "end_time"),
+        None,
+        EpochValueConcurrentStreamStateConverter.get_end_provider(),
+        **kwargs,
+    )
+
+
+def _partitions(partitions: int) -> List[_Partition]:
+    shuffled = [_Partition({"start_time": i * _DAY, "end_time": (i + 1) * _DAY - 1}) for i in range(partitions)]
+    random.Random(0).shuffle(shuffled)
+    return shuffled
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=5_000, help="number of partitions closed")
+    parser.add_argument("--state-emission-partition-count", type=int, default=100)
+    args = parser.parse_args()
+
+    partitions = _partitions(args.records)
+    rates = {}
+    for name, cursor_class, state_converter_class, state_emission_partition_count in (
+        ("previous", _PreviousConcurrentCursor, _PreviousStateConverter, None),
+        ("current", ConcurrentCursor, EpochValueConcurrentStreamStateConverter, None),
+        ("coalesced", ConcurrentCursor, EpochValueConcurrentStreamStateConverter, args.state_emission_partition_count),
+    ):
+        cursor = _cursor(cursor_class, state_converter_class, state_emission_partition_count)
+        start = time.perf_counter()
+        for partition in partitions:
+            cursor.close_partition(partition)
+        cursor.ensure_at_least_one_state_emitted()
+        rates[name] = args.records / (time.perf_counter() - start)
+        print(f"{name:<10} {rates[name]:>12,.0f} partitions/sec   final slices: {cursor.state['slices']}")
+    print(f"speedup: {rates['current'] / rates['previous']:.1f}x, coalesced: {rates['coalesced'] / rates['previous']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares records/sec of CsvParser with the PyArrow engine, which parses blocks and casts values column by column, against the Python
+engine built on csv.DictReader, on a file mixing integers, numbers, booleans, strings and empty values.
+
+Usage: python benchmarks/benchmark_csv_parser.py [--records 200000]
+"""
+
+import argparse
+import asyncio
+import datetime
+import io
+import time
+from typing import Any, Dict, Mapping
+from unittest.mock import MagicMock
+
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvParsingEngine, InferenceType
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
+from airbyte_cdk.sources.file_based.file_based_stream_reader import FileReadMode
+from airbyte_cdk.sources.file_based.file_types import CsvParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+_COLUMN_GROUPS = 4
+
+
+def _csv_file(rows: int) -> str:
+    header = ",".join(f"id_{g},amount_{g},is_active_{g},name_{g},comment_{g}" for g in range(_COLUMN_GROUPS))
+    lines = [header]
+    for i in range(rows):
+        lines.append(
+            ",".join(f'{i},{i * 1.5},{"true" if i % 2 else "false"},name {i},{"" if i % 3 else "NA"}' for _ in range(_COLUMN_GROUPS))
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _schema() -> Mapping[str, Any]:
+    properties: Dict[str, Any] = {}
+    for g in range(_COLUMN_GROUPS):
+        properties[f"id_{g}"] = {"type": "integer"}
+        properties[f"amount_{g}"] = {"type": "number"}
+        properties[f"is_active_{g}"] = {"type": "boolean"}
+        properties[f"name_{g}"] = {"type": "string"}
+        properties[f"comment_{g}"] = {"type": ["null", "string"]}
+    return {"type": "object", "properties": properties}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    data = _csv_file(args.records)
+    file = RemoteFile(uri="benchmark.csv", last_modified=datetime.datetime.now())
+    stream_reader = MagicMock()
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(data.encode("utf8")) if mode == FileReadMode.READ_BINARY else io.StringIO(data)
+    )
+
+    rates = {}
+    for engine in (CsvParsingEngine.PYTHON, CsvParsingEngine.PYARROW):
+        config_format = CsvFormat(
+            filetype="csv", parsing_engine=engine, null_values={"NA"}, inference_type=InferenceType.PRIMITIVE_TYPES_ONLY
+        )
+        config = FileBasedStreamConfig(
+            name="benchmark",
+            validation_policy=ValidationPolicy.emit_record,
+            format=config_format,
+            legacy_prefix=None,
+            input_schema=None,
+            primary_key=None,
+        )
+
+        start = time.perf_counter()
+        for _ in CsvParser().parse_records(config, file, stream_reader, MagicMock(), _schema()):
+            pass
+        rates[engine] = args.records / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        asyncio.new_event_loop().run_until_complete(CsvParser().infer_schema(config, file, stream_reader, MagicMock()))
+        inference_time = time.perf_counter() - start
+        print(f"{engine.value:<8} {rates[engine]:>12,.0f} records/sec, schema inferred in {inference_time * 1000:,.0f} ms")
+    print(f"speedup: {rates[CsvParsingEngine.PYARROW] / rates[CsvParsingEngine.PYTHON]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the per-record cost of DatetimeBasedCursor in an incremental low-code stream, i.e. `should_be_synced` followed by `observe` for
+every record, against the previous implementation evaluating the cursor fields for every record and parsing every datetime with
+strptime, on records whose cursor values use the second of the cursor datetime formats.
+
+Usage: python benchmarks/benchmark_datetime_based_cursor.py [--records 200000]
+"""
+
+import argparse
+import datetime
+import time
+from typing import Any, List, Union
+
+from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
+from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
+from airbyte_cdk.sources.declarative.types import Record, StreamSlice
+
+_CONFIG = {"start_date": "2020-01-01T00:00:00Z"}
+_CURSOR_DATETIME_FORMATS = ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S.%f%z"]
+
+
+class _PreviousDatetimeBasedCursor(DatetimeBasedCursor):
+    def observe(self, stream_slice: StreamSlice, record: Record) -> None:
+        record_cursor_value = record.get(self._cursor_field.eval(self.config))
+        if not record_cursor_value:
+            return
+        start_field = self._partition_field_start.eval(self.config)
+        end_field = self._partition_field_end.eval(self.config)
+        is_highest_observed_cursor_value = not self._highest_observed_cursor_field_value or self.parse_date(
+            record_cursor_value
+        ) > self.parse_date(self._highest_observed_cursor_field_value)
+        if (
+            self._is_within_daterange_boundaries(record, stream_slice.get(start_field), stream_slice.get(end_field))  # type: ignore
+            and is_highest_observed_cursor_value
+        ):
+            self._highest_observed_cursor_field_value = record_cursor_value
+
+    def should_be_synced(self, record: Record) -> bool:
+        if not record.get(self._cursor_field.eval(self.config)):
+            return True
+        latest_possible_cursor_value = self._select_best_end_datetime()
+        earliest_possible_cursor_value = self._calculate_earliest_possible_value(latest_possible_cursor_value)
+        return self._is_within_daterange_boundaries(record, earliest_possible_cursor_value, latest_possible_cursor_value)
+
+    def _is_within_daterange_boundaries(
+        self, record: Record, start_datetime_boundary: Union[datetime.datetime, str], end_datetime_boundary: Union[datetime.datetime, str]
+    ) -> bool:
+        record_cursor_value = record.get(self._cursor_field.eval(self.config))
+        if not record_cursor_value:
+            return False
+        if isinstance(start_datetime_boundary, str):
+            start_datetime_boundary = self.parse_date(start_datetime_boundary)
+        if isinstance(end_datetime_boundary, str):
+            end_datetime_boundary = self.parse_date(end_datetime_boundary)
+        return start_datetime_boundary <= self.parse_date(record_cursor_value) <= end_datetime_boundary
+
+    def parse_date(self, date: str) -> datetime.datetime:
+        for datetime_format in self.cursor_datetime_formats + [self.datetime_format]:
+            try:
+                parsed_datetime = datetime.datetime.strptime(date, datetime_format)
+            except ValueError:
+                continue
+            return parsed_datetime if parsed_datetime.tzinfo else parsed_datetime.replace(tzinfo=datetime.timezone.utc)
+        raise ValueError(f"No format in {self.cursor_datetime_formats} matching {date}")
+
+
+def _records(records: int, stream_slice: StreamSlice) -> List[Record]:
+    start = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        Record({"id": i, "updated_at": (start + datetime.timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%S.%f+0000")}, stream_slice)
+        for i in range(records)
+    ]
+
+
+def _cursor(cursor_class: Any) -> DatetimeBasedCursor:
+    cursor: DatetimeBasedCursor = cursor_class(
+        start_datetime=MinMaxDatetime(datetime="{{ config['start_date'] }}", datetime_format="%Y-%m-%dT%H:%M:%SZ", parameters={}),
+        cursor_field="{{ parameters['cursor_field'] }}",
+        datetime_format="%Y-%m-%dT%H:%M:%SZ",
+        cursor_datetime_formats=_CURSOR_DATETIME_FORMATS,
+        lookback_window="P1D",
+        config=_CONFIG,
+        parameters={"cursor_field": "updated_at"},
+    )
+    cursor.set_initial_state({"updated_at": "2020-06-01T00:00:00Z"})
+    return cursor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    stream_slice = StreamSlice(partition={}, cursor_slice={"start_time": "2020-06-01T00:00:00Z", "end_time": "2030-01-01T00:00:00Z"})
+    records = _records(args.records, stream_slice)
+
+    costs = {}
+    for name, cursor_class in (("previous", _PreviousDatetimeBasedCursor), ("current", DatetimeBasedCursor)):
+        cursor = _cursor(cursor_class)
+        start = time.perf_counter()
+        for record in records:
+            if cursor.should_be_synced(record):
+                cursor.observe(stream_slice, record)
+        cursor.close_slice(stream_slice)
+        costs[name] = (time.perf_counter() - start) / args.records
+        print(f"{name:<10} {costs[name] * 1_000_000:>8.2f} µs/record   state: {cursor.get_stream_state()}")
+    print(f"speedup: {costs['previous'] / costs['current']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares messages/sec of the default `Destination` input path (TextIOWrapper lines + `AirbyteMessage.parse_raw`) against the
+`fast_input_parsing` path (AirbyteMessageReader), on an input made of RECORD messages with a STATE message every 1000 records.
+
+Usage: python benchmarks/benchmark_destination_input.py [--records 200000]
+"""
+
+import argparse
+import io
+import time
+from typing import Any, Callable, Iterable
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, Type
+from airbyte_cdk.utils.message_reader import AirbyteMessageReader
+
+
+def _generate_input(count: int) -> bytes:
+    lines = []
+    for i in range(count):
+        record = AirbyteMessage(
+            type=Type.RECORD,
+            record=AirbyteRecordMessage(
+                stream=f"stream_{i % 4}",
+                data={
+                    "id": i,
+                    "name": f"name {i}",
+                    "email": f"user{i}@example.com",
+                    "amount": i * 1.5,
+                    "active": i % 2 == 0,
+                    "tags": ["a", "b", "c"],
+                    "address": {"street": "Main St", "number": i, "city": "Montréal"},
+                    "updated_at": "2024-01-01T00:00:00Z",
+                },
+                emitted_at=1704067200000,
+            ),
+        )
+        lines.append(record.json(exclude_unset=True))
+        if i % 1000 == 999:
+            lines.append(AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": i})).json(exclude_unset=True))
+    return "\n".join(lines).encode("utf-8")
+
+
+def _measure(name: str, content: bytes, read: Callable[[io.BytesIO], Iterable[Any]]) -> float:
+    start = time.perf_counter()
+    count = sum(1 for _ in read(io.BytesIO(content)))
+    elapsed = time.perf_counter() - start
+    messages_per_second = count / elapsed
+    print(f"{name:<40} {messages_per_second:>12,.0f} messages/sec")
+    return messages_per_second
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+    content = _generate_input(args.records)
+
+    def default_path(input_stream: io.BytesIO) -> Iterable[AirbyteMessage]:
+        for line in io.TextIOWrapper(input_stream, encoding="utf-8"):
+            yield AirbyteMessage.parse_raw(line)
+
+    default_rate = _measure("TextIOWrapper + parse_raw", content, default_path)
+    fast_rate = _measure("AirbyteMessageReader", content, AirbyteMessageReader().read)
+
+    print(f"speedup: {fast_rate / default_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares records/sec of the default `launch` output path (pydantic serialization + flushed print per message) against the
+`fast_serialization` path (AirbyteMessageSerializer + BufferedMessageWriter).
+
+Usage: python benchmarks/benchmark_message_serialization.py [--records 200000]
+"""
+
+import argparse
+import os
+import time
+from typing import Callable, List
+
+from airbyte_cdk.entrypoint import AirbyteEntrypoint
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+from airbyte_cdk.utils.message_serializer import AirbyteMessageSerializer, BufferedMessageWriter
+
+
+def _generate_messages(count: int) -> List[AirbyteMessage]:
+    return [
+        AirbyteMessage(
+            type=Type.RECORD,
+            record=AirbyteRecordMessage(
+                stream=f"stream_{i % 4}",
+                data={
+                    "id": i,
+                    "name": f"name {i}",
+                    "email": f"user{i}@example.com",
+                    "amount": i * 1.5,
+                    "active": i % 2 == 0,
+                    "tags": ["a", "b", "c"],
+                    "address": {"street": "Main St", "number": i, "city": "Montréal"},
+                    "updated_at": "2024-01-01T00:00:00Z",
+                },
+                emitted_at=1704067200000,
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _measure(name: str, messages: List[AirbyteMessage], run: Callable[[List[AirbyteMessage]], None]) -> float:
+    start = time.perf_counter()
+    run(messages)
+    elapsed = time.perf_counter() - start
+    records_per_second = len(messages) / elapsed
+    print(f"{name:<40} {records_per_second:>12,.0f} records/sec")
+    return records_per_second
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+    messages = _generate_messages(args.records)
+
+    with open(os.devnull, "w") as output:
+
+        def default_path(batch: List[AirbyteMessage]) -> None:
+            for message in batch:
+                print(f"{AirbyteEntrypoint.airbyte_message_to_string(message)}\n", end="", flush=True, file=output)
+
+        def fast_path(batch: List[AirbyteMessage]) -> None:
+            serializer = AirbyteMessageSerializer()
+            writer = BufferedMessageWriter(output)
+            for message in batch:
+                writer.write(serializer.serialize(message))
+            writer.flush()
+
+        default_rate = _measure("pydantic + print(flush=True)", messages, default_path)
+        fast_rate = _measure("fast serializer + buffered writer", messages, fast_path)
+
+    print(f"speedup: {fast_rate / default_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
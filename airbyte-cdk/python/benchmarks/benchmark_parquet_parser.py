@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares records/sec of the column-wise ParquetParser against the per-cell scalar conversion it replaced, on a wide file mixing
+integers, strings, timestamps, decimals and binary columns.
+
+Usage: python benchmarks/benchmark_parquet_parser.py [--records 50000]
+"""
+
+import argparse
+import datetime
+import io
+import time
+from decimal import Decimal
+from typing import Any, Dict, Iterable
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.config.parquet_format import ParquetFormat
+from airbyte_cdk.sources.file_based.file_types import ParquetParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+_COLUMN_GROUPS = 10
+
+
+def _parquet_file(rows: int) -> bytes:
+    columns: Dict[str, pa.Array] = {}
+    for group in range(_COLUMN_GROUPS):
+        columns[f"id_{group}"] = pa.array(range(rows), type=pa.int64())
+        columns[f"name_{group}"] = pa.array([f"name {i}" for i in range(rows)], type=pa.string())
+        columns[f"updated_at_{group}"] = pa.array(
+            [datetime.datetime(2024, 1, 1) + datetime.timedelta(seconds=i) for i in range(rows)], type=pa.timestamp("us")
+        )
+        columns[f"amount_{group}"] = pa.array([Decimal(i) / 100 for i in range(rows)], type=pa.decimal128(12, 2))
+        columns[f"payload_{group}"] = pa.array([f"payload {i}".encode("utf-8") for i in range(rows)], type=pa.binary())
+    buffer = io.BytesIO()
+    pq.write_table(pa.table(columns), buffer, row_group_size=100_000)
+    return buffer.getvalue()
+
+
+def _per_cell_records(data: bytes, parquet_format: ParquetFormat) -> Iterable[Dict[str, Any]]:
+    reader = pq.ParquetFile(io.BytesIO(data))
+    for row_group in range(reader.num_row_groups):
+        batch = reader.read_row_group(row_group)
+        for row in range(batch.num_rows):
+            yield {column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format) for column in batch.column_names}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=50_000)
+    args = parser.parse_args()
+
+    data = _parquet_file(args.records)
+    parquet_format = ParquetFormat(filetype="parquet")
+    config = FileBasedStreamConfig(name="benchmark", format=parquet_format, legacy_prefix=None, input_schema=None, primary_key=None)
+    file = RemoteFile(uri="benchmark.parquet", last_modified=datetime.datetime.now())
+    stream_reader = MagicMock()
+    stream_reader.open_file.side_effect = lambda *args, **kwargs: io.BytesIO(data)
+
+    start = time.perf_counter()
+    for _ in _per_cell_records(data, parquet_format):
+        pass
+    per_cell_rate = args.records / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in ParquetParser().parse_records(config, file, stream_reader, MagicMock(), None):
+        pass
+    columnar_rate = args.records / (time.perf_counter() - start)
+
+    print(f"{'per-cell scalars':<20} {per_cell_rate:>12,.0f} records/sec")
+    print(f"{'column-wise':<20} {columnar_rate:>12,.0f} records/sec")
+    print(f"speedup: {columnar_rate / per_cell_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares partitions/sec of a partition generator throttled by `ThreadPoolManager`, which tracks futures through done callbacks and wakes up
+the generator as soon as a task completes, against the previous implementation pruning the list of futures under a lock and polling it
+every 100 ms, with the main thread submitting a short task per partition as `ConcurrentReadProcessor` does.
+
+Usage: python benchmarks/benchmark_thread_pool_manager.py [--records 20000] [--max-concurrent-tasks 100] [--workers 4]
+"""
+
+import argparse
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Queue
+from typing import Any, Callable, List, Optional
+
+from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
+
+_DONE = object()
+
+
+class _PreviousThreadPoolManager:
+    def __init__(self, threadpool: ThreadPoolExecutor, max_concurrent_tasks: int) -> None:
+        self._threadpool = threadpool
+        self._max_concurrent_tasks = max_concurrent_tasks
+        self._futures: List[Future[Any]] = []
+        self._lock = threading.Lock()
+        self._most_recently_seen_exception: Optional[Exception] = None
+
+    def wait_until_futures_limit_not_reached(self) -> None:
+        while self._prune_to_validate_has_reached_futures_limit():
+            time.sleep(0.1)
+
+    def _prune_to_validate_has_reached_futures_limit(self) -> bool:
+        with self._lock:
+            if len(self._futures) >= self._max_concurrent_tasks:
+                for index in reversed(range(len(self._futures))):
+                    if self._futures[index].done():
+                        self._futures.pop(index)
+        return len(self._futures) >= self._max_concurrent_tasks
+
+    def submit(self, function: Callable[..., Any], *args: Any, reserved: bool = False) -> None:
+        # tasks were not reserved by the previous implementation
+        self._futures.append(self._threadpool.submit(function, *args))
+
+    def is_done(self) -> bool:
+        return all([f.done() for f in self._futures])
+
+
+def _read(thread_pool_manager: Any, threadpool: ThreadPoolExecutor, partitions: int) -> None:
+    queue: Queue[Any] = Queue()
+
+    def generate_partitions() -> None:
+        for partition in range(partitions):
+            thread_pool_manager.wait_until_futures_limit_not_reached()
+            queue.put(partition)
+        queue.put(_DONE)
+
+    threadpool.submit(generate_partitions)
+    while queue.get() is not _DONE:
+        thread_pool_manager.submit(time.sleep, 0.0005, reserved=True)
+    while not thread_pool_manager.is_done():
+        time.sleep(0.001)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=20_000, help="number of partitions")
+    parser.add_argument("--max-concurrent-tasks", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    rates = {}
+    for name in ("previous", "current"):
+        with ThreadPoolExecutor(max_workers=args.workers + 1) as threadpool:
+            thread_pool_manager = (
+                _PreviousThreadPoolManager(threadpool, args.max_concurrent_tasks)
+                if name == "previous"
+                else ThreadPoolManager(threadpool, logging.getLogger("benchmark"), args.max_concurrent_tasks)
+            )
+            start = time.perf_counter()
+            _read(thread_pool_manager, threadpool, args.records)
+            rates[name] = args.records / (time.perf_counter() - start)
+        print(f"{name:<10} {rates[name]:>12,.0f} partitions/sec")
+    print(f"speedup: {rates['current'] / rates['previous']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares records/sec of TypeTransformer with compiled schemas against the jsonschema traversal it falls back to, for wide and deeply
+nested schemas, with default and custom normalization.
+
+Usage: python benchmarks/benchmark_type_transformer.py [--records 20000]
+"""
+
+import argparse
+import copy
+import time
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+
+_FIELD_TYPES = [("string", 1), ("integer", "1"), ("number", "1.5"), ("boolean", "true"), (["null", "string"], None)]
+
+
+def _wide_schema_and_record(width: int) -> Tuple[Mapping[str, Any], Dict[str, Any]]:
+    properties: Dict[str, Any] = {}
+    record: Dict[str, Any] = {}
+    for i in range(width):
+        field_type, value = _FIELD_TYPES[i % len(_FIELD_TYPES)]
+        properties[f"field_{i}"] = {"type": field_type}
+        record[f"field_{i}"] = value
+    properties["tags"] = {"type": "array", "items": {"$ref": "#/definitions/tag"}}
+    record["tags"] = [1, 2, 3]
+    return {"type": "object", "properties": properties, "definitions": {"tag": {"type": "string"}}}, record
+
+
+def _nested_schema_and_record(depth: int) -> Tuple[Mapping[str, Any], Dict[str, Any]]:
+    schema: Dict[str, Any] = {"type": "object", "properties": {"id": {"type": "integer"}, "name": {"type": "string"}}}
+    record: Dict[str, Any] = {"id": "1", "name": 1}
+    for _ in range(depth):
+        schema = {
+            "type": ["null", "object"],
+            "properties": {
+                "id": {"type": "integer"},
+                "child": schema,
+                "items": {"type": "array", "items": {"type": "object", "properties": {"value": {"type": "number"}}}},
+            },
+        }
+        record = {"id": "1", "child": record, "items": [{"value": "1.5"}, {"value": 2}]}
+    return schema, record
+
+
+def _custom_normalizer(value: Any, subschema: Mapping[str, Any]) -> Any:
+    if subschema.get("format") == "date-time" and isinstance(value, str):
+        return value.replace(" ", "T")
+    return value
+
+
+def _transformer(config: TransformConfig, compiled: bool) -> TypeTransformer:
+    transformer = TypeTransformer(config)
+    if TransformConfig.CustomSchemaNormalization in config:
+        transformer.registerCustomTransform(_custom_normalizer)
+    if not compiled:
+        setattr(transformer, "_get_compiled_schema", lambda schema: None)
+    return transformer
+
+
+def _measure(transformer: TypeTransformer, schema: Mapping[str, Any], records: List[Dict[str, Any]]) -> float:
+    start = time.perf_counter()
+    for record in records:
+        transformer.transform(record, schema)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=20_000)
+    args = parser.parse_args()
+
+    scenarios: Dict[str, Tuple[Mapping[str, Any], Dict[str, Any]]] = {
+        "wide (200 fields)": _wide_schema_and_record(200),
+        "nested (10 levels)": _nested_schema_and_record(10),
+    }
+    configs: Dict[str, TransformConfig] = {
+        "default": TransformConfig.DefaultSchemaNormalization,
+        "custom": TransformConfig.CustomSchemaNormalization,
+        "default+custom": TransformConfig.DefaultSchemaNormalization | TransformConfig.CustomSchemaNormalization,
+    }
+    record_count: Callable[[str], int] = lambda scenario: args.records if "nested" in scenario else args.records // 10
+
+    print(f"{'scenario':<22} {'config':<16} {'jsonschema':>14} {'compiled':>14} {'speedup':>8}")
+    for scenario, (schema, record) in scenarios.items():
+        for config_name, config in configs.items():
+            rates = [
+                _measure(_transformer(config, compiled), schema, [copy.deepcopy(record) for _ in range(record_count(scenario))])
+                for compiled in (False, True)
+            ]
+            print(f"{scenario:<22} {config_name:<16} {rates[0]:>10,.0f} r/s {rates[1]:>10,.0f} r/s {rates[1] / rates[0]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
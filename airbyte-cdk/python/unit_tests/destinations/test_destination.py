@@ -27,6 +27,7 @@ from airbyte_cdk.models import (
     SyncMode,
     Type,
 )
+from airbyte_cdk.utils.message_reader import RecordMessageView, RecordView
 
 
 @pytest.fixture(name="destination")
@@ -237,6 +238,61 @@ class TestRun:
         # verify output was correct
         assert returned_write_result == expected_write_result
 
+    def test_given_fast_input_parsing_when_parse_input_stream_then_return_record_views(self, destination: Destination):
+        destination.fast_input_parsing = True
+        state_message = _wrapped(_state({"k1": "v1"}))
+        input_messages = [_wrapped(_record("s1", {"k1": "v1"})), state_message]
+        input_stream = io.TextIOWrapper(
+            io.BytesIO(bytes("\n".join(message.json(exclude_unset=True) for message in input_messages), "utf-8"))
+        )
+
+        parsed_messages = list(destination._parse_input_stream(input_stream))
+
+        assert parsed_messages == [RecordMessageView(RecordView("s1", None, {"k1": "v1"}, 0)), state_message]
+
+    def test_given_fast_input_parsing_when_run_write_then_write_record_views(self, mocker, destination: Destination, tmp_path, monkeypatch):
+        destination.fast_input_parsing = True
+        config_path, dummy_config = tmp_path / "config.json", {"user": "sherif"}
+        write_file(config_path, dummy_config)
+        dummy_catalog = ConfiguredAirbyteCatalog(
+            streams=[
+                ConfiguredAirbyteStream(
+                    stream=AirbyteStream(name="s1", json_schema={"type": "object"}, supported_sync_modes=[SyncMode.full_refresh]),
+                    sync_mode=SyncMode.full_refresh,
+                    destination_sync_mode=DestinationSyncMode.append,
+                )
+            ]
+        )
+        catalog_path = tmp_path / "catalog.json"
+        write_file(catalog_path, dummy_catalog.json(exclude_unset=True))
+        parsed_args = argparse.Namespace(**{"command": "write", "config": config_path, "catalog": catalog_path})
+        mocker.patch.object(destination, "spec", return_value=ConnectorSpecification(connectionSpecification={}))
+        mocker.patch("airbyte_cdk.destinations.destination.check_config_against_spec_or_exit")
+
+        written_messages: List[Any] = []
+
+        def _write(config, configured_catalog, input_messages):
+            for message in input_messages:
+                written_messages.append(message)
+                if message.type == Type.STATE:
+                    yield message
+
+        mocker.patch.object(destination, "write", side_effect=_write, autospec=True)
+        state_message = _wrapped(_state({"k1": "v1"}))
+        mocked_input = [_wrapped(_record("s1", {"k1": "v1"})), _wrapped(_record("s1", {"k1": "v2"})), state_message]
+        mocked_stdin_string = "\n".join([message.json(exclude_unset=True) for message in mocked_input])
+        mocked_stdin_string += "\n add this non-serializable string to verify the destination does not break on malformed input"
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(bytes(mocked_stdin_string, "utf-8"))))
+
+        returned_write_result = list(destination.run_cmd(parsed_args))
+
+        assert written_messages == [
+            RecordMessageView(RecordView("s1", None, {"k1": "v1"}, 0)),
+            RecordMessageView(RecordView("s1", None, {"k1": "v2"}, 0)),
+            state_message,
+        ]
+        assert returned_write_result == [state_message]
+
     @pytest.mark.parametrize("args", [{}, {"command": "fake"}])
     def test_run_cmd_with_incorrect_args_fails(self, args, destination: Destination):
         with pytest.raises(Exception):
@@ -78,6 +78,11 @@ def test_embedder(embedder_class, args, dimensions):
     assert embedder.check() is None
 
     assert embedder.embedding_dimensions == dimensions
+    if embedder_class is FakeEmbedder:
+        # fake embeddings are random so they are not cached
+        assert embedder.identity is None
+    else:
+        assert embedder.identity.startswith(embedder_class.__name__)
 
     mock_embedding_instance.embed_documents.return_value = [[0] * dimensions] * 2
 
@@ -103,6 +108,8 @@ def test_embedder(embedder_class, args, dimensions):
 def test_from_field_embedder(field_name, dimensions, metadata, expected_embedding, expected_error):
     embedder = FromFieldEmbedder(FromFieldEmbeddingConfigModel(mode="from_field", dimensions=dimensions, field_name=field_name))
     chunks = [Document(page_content="a", record=AirbyteRecordMessage(stream="mystream", data=metadata, emitted_at=0))]
+    # embeddings read from the records can't be cached by text
+    assert embedder.identity is None
     if expected_error:
         with pytest.raises(AirbyteTracedException):
             embedder.embed_documents(chunks)
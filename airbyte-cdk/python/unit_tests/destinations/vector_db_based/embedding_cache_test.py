@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+
+from airbyte_cdk.destinations.vector_db_based.embedding_cache import EmbeddingCache
+
+# size of a cached embedding of 4 floats: 32 bytes of key and 32 bytes of embedding
+_ENTRY_SIZE = 64
+
+
+def test_given_cached_embeddings_when_get_many_then_return_embeddings_and_none_for_misses(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    cache.put_many("model", ["a", "b", "c"], [[1.0, 2.0, 3.0, 4.0], None, [0.5] * 4])
+
+    assert cache.get_many("model", ["a", "b", "c", "a"]) == [[1.0, 2.0, 3.0, 4.0], None, [0.5] * 4, [1.0, 2.0, 3.0, 4.0]]
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_given_other_model_when_get_many_then_miss(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    cache.put_many("model", ["a"], [[1.0]])
+
+    assert cache.get_many("other_model", ["a"]) == [None]
+
+
+def test_given_reopened_cache_when_get_many_then_return_embeddings_from_previous_sync(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    cache.put_many("model", ["a"], [[1.0, 2.0]])
+    cache.close()
+
+    assert EmbeddingCache(str(tmp_path / "cache.db")).get_many("model", ["a"]) == [[1.0, 2.0]]
+
+
+def test_given_cache_over_max_size_when_put_many_then_evict_least_recently_used(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"), max_size_bytes=10 * _ENTRY_SIZE)
+    texts = [f"text {i}" for i in range(10)]
+    cache.put_many("model", texts, [[float(i)] * 4 for i in range(10)])
+    # reading the first text makes it the most recently used one
+    cache.get_many("model", texts[:1])
+
+    cache.put_many("model", ["new text"], [[10.0] * 4])
+
+    assert cache.get_many("model", texts[:1] + ["new text"]) == [[0.0] * 4, [10.0] * 4]
+    assert cache.get_many("model", texts[1:3]) == [None, None]
+    assert sum(1 for embedding in cache.get_many("model", texts) if embedding is not None) == 8
+
+
+def test_log_statistics(tmp_path, caplog):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    cache.put_many("model", ["a"], [[1.0]])
+    cache.get_many("model", ["a", "b"])
+
+    with caplog.at_level(logging.INFO, logger="airbyte"):
+        cache.log_statistics()
+
+    assert "1 hits, 1 misses (50.0% hit rate)" in caplog.text
@@ -2,11 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Optional
+import time
+from typing import List, Optional
 from unittest.mock import ANY, MagicMock, call
 
 import pytest
-from airbyte_cdk.destinations.vector_db_based import ProcessingConfigModel, Writer
+from airbyte_cdk.destinations.vector_db_based import EmbeddingCache, ProcessingConfigModel, Writer
 from airbyte_cdk.models.airbyte_protocol import (
     AirbyteLogMessage,
     AirbyteMessage,
@@ -115,7 +116,8 @@ def test_write(omit_raw_text: bool):
     mock_indexer.post_sync.assert_called()
 
 
-def test_write_stream_namespace_split():
+@pytest.mark.parametrize("max_pending_batches", [0, 2])
+def test_write_stream_namespace_split(max_pending_batches: int):
     """
     Test separate handling of streams and namespaces in the writer
 
@@ -148,7 +150,7 @@ def test_write_stream_namespace_split():
     mock_indexer.post_sync.return_value = []
 
     # Create the DestinationLangchain instance
-    writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False)
+    writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False, max_pending_batches=max_pending_batches)
 
     output_messages = writer.write(configured_catalog, input_messages)
     next(output_messages)
@@ -170,3 +172,72 @@ def test_write_stream_namespace_split():
         ]
     )
     assert mock_embedder.embed_documents.call_count == 4
+
+
+def test_write_pipelined_emits_state_after_previous_batches_are_indexed():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    # the first batch is embedded slower than the following ones, the batches must still be indexed in order
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 3)]
+    state_message = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage())
+    input_messages.append(state_message)
+    input_messages.extend([_generate_record_message(i) for i in range(BATCH_SIZE * 3, BATCH_SIZE * 3 + 5)])
+
+    def embed_documents(documents):
+        if documents[0].record.data["id"] == 0:
+            time.sleep(0.2)
+        return [[0] * 1536] * len(documents)
+
+    mock_embedder = MagicMock()
+    mock_embedder.embed_documents.side_effect = embed_documents
+    indexed_ids: List[int] = []
+    mock_indexer = MagicMock()
+    mock_indexer.index.side_effect = lambda chunks, namespace, stream: indexed_ids.extend(chunk.record.data["id"] for chunk in chunks)
+    mock_indexer.post_sync.return_value = []
+
+    writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False, max_pending_batches=3, embedding_workers=3)
+
+    output_messages = writer.write(configured_catalog, input_messages)
+
+    assert next(output_messages) == state_message
+    assert indexed_ids[: BATCH_SIZE * 3] == list(range(BATCH_SIZE * 3))
+    assert list(output_messages) == []
+    assert indexed_ids == list(range(BATCH_SIZE * 3 + 5))
+    assert mock_indexer.delete.call_count == 4
+
+
+def test_write_pipelined_raises_indexing_errors():
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    input_messages = [_generate_record_message(i) for i in range(BATCH_SIZE * 2)]
+    input_messages.append(AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage()))
+
+    mock_indexer = MagicMock()
+    mock_indexer.index.side_effect = ValueError("indexing failed")
+
+    writer = Writer(config_model, mock_indexer, generate_mock_embedder(), BATCH_SIZE, False, max_pending_batches=2)
+
+    with pytest.raises(ValueError):
+        list(writer.write(configured_catalog, input_messages))
+    mock_indexer.post_sync.assert_not_called()
+
+
+def test_write_with_embedding_cache_only_embeds_misses(tmp_path):
+    config_model = ProcessingConfigModel(chunk_overlap=0, chunk_size=1000, metadata_fields=None, text_fields=["column_name"])
+    configured_catalog: ConfiguredAirbyteCatalog = ConfiguredAirbyteCatalog.parse_obj({"streams": [generate_stream()]})
+    embedding_cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    mock_embedder = MagicMock()
+    mock_embedder.identity = "model"
+    mock_embedder.embed_documents.side_effect = lambda documents: [[float(len(document.page_content))] for document in documents]
+    mock_indexer = MagicMock()
+    mock_indexer.post_sync.return_value = []
+
+    first_sync_writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False, embedding_cache=embedding_cache)
+    list(first_sync_writer.write(configured_catalog, [_generate_record_message(i) for i in range(5)]))
+    second_sync_writer = Writer(config_model, mock_indexer, mock_embedder, BATCH_SIZE, False, embedding_cache=embedding_cache)
+    list(second_sync_writer.write(configured_catalog, [_generate_record_message(i) for i in range(3, 8)]))
+
+    assert [len(call_args[0][0]) for call_args in mock_embedder.embed_documents.call_args_list] == [5, 3]
+    indexed_chunks = mock_indexer.index.call_args_list[-1][0][0]
+    assert [chunk.embedding for chunk in indexed_chunks] == [[float(len(chunk.page_content))] for chunk in indexed_chunks]
+    assert (embedding_cache.hits, embedding_cache.misses) == (2, 8)
@@ -0,0 +1,46 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel
+
+
+@pytest.mark.parametrize(
+    "default_concurrency, max_concurrency, config, expected_concurrency_level",
+    [
+        pytest.param(10, None, {}, 10, id="test_given_integer_then_return_integer"),
+        pytest.param(10, 5, {}, 5, id="test_given_integer_above_max_concurrency_then_return_max_concurrency"),
+        pytest.param("{{ config['num_workers'] }}", 20, {"num_workers": 8}, 8, id="test_given_interpolated_value_then_evaluate"),
+        pytest.param(
+            "{{ config['num_workers'] or 10 }}", 20, {}, 10, id="test_given_interpolated_value_with_default_then_evaluate_default"
+        ),
+        pytest.param(
+            "{{ config['num_workers'] }}", 20, {"num_workers": 50}, 20, id="test_given_interpolated_value_above_max_then_return_max"
+        ),
+    ],
+)
+def test_get_concurrency_level(default_concurrency, max_concurrency, config, expected_concurrency_level):
+    concurrency_level = ConcurrencyLevel(
+        default_concurrency=default_concurrency, max_concurrency=max_concurrency, config=config, parameters={}
+    )
+    assert concurrency_level.get_concurrency_level() == expected_concurrency_level
+
+
+def test_given_interpolated_value_without_max_concurrency_when_create_then_raise_error():
+    with pytest.raises(ValueError):
+        ConcurrencyLevel(default_concurrency="{{ config['num_workers'] }}", config={"num_workers": 8}, parameters={})
+
+
+@pytest.mark.parametrize(
+    "default_concurrency, config",
+    [
+        pytest.param(
+            "{{ config['num_workers'] }}", {"num_workers": "many"}, id="test_given_value_not_evaluated_to_integer_then_raise_error"
+        ),
+        pytest.param(0, {}, id="test_given_no_worker_then_raise_error"),
+    ],
+)
+def test_get_invalid_concurrency_level(default_concurrency, config):
+    with pytest.raises(ValueError):
+        ConcurrencyLevel(default_concurrency=default_concurrency, max_concurrency=10, config=config, parameters={}).get_concurrency_level()
@@ -44,6 +44,35 @@ def test_parse_date(test_name, input_date, date_format, expected_output_date):
     assert output_date == expected_output_date
 
 
+@pytest.mark.parametrize(
+    "input_date, date_format",
+    [
+        pytest.param("2021-01-01T10:20:30.123456+0000", "%Y-%m-%dT%H:%M:%S.%f%z", id="test_iso_with_microseconds_and_offset"),
+        pytest.param("2021-01-01T10:20:30.1-05:30", "%Y-%m-%dT%H:%M:%S.%f%z", id="test_iso_with_short_fraction_and_negative_offset"),
+        pytest.param("2021-01-01T10:20:30Z", "%Y-%m-%dT%H:%M:%S%z", id="test_iso_with_z_offset"),
+        pytest.param("2021-01-01T10:20:30Z", "%Y-%m-%dT%H:%M:%SZ", id="test_iso_with_literal_z"),
+        pytest.param("2021-01-01 10:20:30", "%Y-%m-%d %H:%M:%S", id="test_space_separated"),
+        pytest.param("2021-1-1", "%Y-%m-%d", id="test_fields_not_zero_padded_are_parsed_by_strptime"),
+        pytest.param("20211301", "%Y%m%d", id="test_out_of_range_month_is_parsed_by_strptime"),
+        pytest.param("2021-01-01T10:20:30+01", "%Y-%m-%dT%H:%M:%S%z", id="test_offset_without_minutes_is_parsed_by_strptime"),
+        pytest.param("2021-01-01t10:20:30Z", "%Y-%m-%dT%H:%M:%SZ", id="test_lowercase_literal_is_parsed_by_strptime"),
+        pytest.param("Jan 01 2021", "%b %d %Y", id="test_format_without_fast_parser"),
+    ],
+)
+def test_given_format_when_parse_then_same_result_as_strptime(input_date, date_format):
+    try:
+        expected_date = datetime.datetime.strptime(input_date, date_format)
+    except ValueError:
+        with pytest.raises(ValueError):
+            DatetimeParser().parse(input_date, date_format)
+        return
+
+    output_date = DatetimeParser().parse(input_date, date_format)
+
+    assert output_date == expected_date.replace(tzinfo=expected_date.tzinfo or datetime.timezone.utc)
+    assert output_date.utcoffset() == (expected_date.utcoffset() or datetime.timedelta(0))
+
+
 @pytest.mark.parametrize(
     "test_name, input_dt, datetimeformat, expected_output",
     [
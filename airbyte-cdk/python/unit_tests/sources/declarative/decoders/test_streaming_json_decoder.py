@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
+
+
+@pytest.mark.parametrize(
+    "response_body, expected_json", (("", {}), ('{"healthcheck": {"status": "ok"}}', {"healthcheck": {"status": "ok"}}))
+)
+def test_streaming_json_decoder(requests_mock, response_body, expected_json):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text=response_body)
+    response = requests.get("https://airbyte.io/")
+    assert StreamingJsonDecoder(parameters={}).decode(response) == expected_json
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64 * 1024])
+def test_given_records_extracted_when_decode_then_return_document_without_records(chunk_size):
+    body = {"meta": {"next": "a_cursor"}, "data": {"records": [{"id": 1234567890}, {"id": 2}], "total": 2}, "has_more": True}
+    decoder = StreamingJsonDecoder(parameters={}, chunk_size=chunk_size)
+    response = _create_response(body)
+
+    records = list(decoder.iterate_records(response, ["data", "records"]))
+
+    assert records == [{"id": 1234567890}, {"id": 2}]
+    assert decoder.decode(response) == {"meta": {"next": "a_cursor"}, "data": {"total": 2}, "has_more": True}
+    assert StreamingJsonDecoder(parameters={}).decode(response) == decoder.decode(response)
+
+
+def test_given_records_not_extracted_when_decode_then_return_whole_document():
+    body = {"data": [{"id": 1}], "next": "a_cursor"}
+
+    assert StreamingJsonDecoder(parameters={}).decode(_create_response(body)) == body
+
+
+def test_given_truncated_document_when_iterate_records_then_raise():
+    response = requests.Response()
+    response._content = b'{"data": [{"id": 1}, {"id": '
+
+    with pytest.raises(ValueError):
+        list(StreamingJsonDecoder(parameters={}, chunk_size=4).iterate_records(response, ["data"]))
+
+
+def test_given_record_spanning_many_chunks_when_iterate_records_then_read_whole_record():
+    body = {"data": [{"id": 1, "text": "a" * 100000}, {"id": 2}], "next": "a_cursor"}
+    decoder = StreamingJsonDecoder(parameters={}, chunk_size=7)
+    response = _create_response(body)
+
+    assert list(decoder.iterate_records(response, ["data"])) == body["data"]
+    assert decoder.decode(response) == {"next": "a_cursor"}
+
+
+def _create_response(body):
+    response = requests.Response()
+    response._content = json.dumps(body).encode("utf-8")
+    return response
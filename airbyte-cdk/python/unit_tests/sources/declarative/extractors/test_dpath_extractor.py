@@ -7,12 +7,14 @@ import json
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 
 config = {"field": "record_array"}
 parameters = {"parameters_field": "record_array"}
 
 decoder = JsonDecoder(parameters={})
+streaming_decoder = StreamingJsonDecoder(parameters={}, chunk_size=4)
 
 
 @pytest.mark.parametrize(
@@ -48,6 +50,12 @@ def test_dpath_extractor(test_name, field_path, body, expected_records):
 
     assert actual_records == expected_records
 
+    streaming_extractor = DpathExtractor(field_path=field_path, config=config, decoder=streaming_decoder, parameters=parameters)
+
+    streamed_records = streaming_extractor.extract_records(create_response(body))
+
+    assert list(streamed_records) == expected_records
+
 
 def create_response(body):
     response = requests.Response()
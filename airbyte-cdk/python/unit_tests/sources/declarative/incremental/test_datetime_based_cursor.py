@@ -4,7 +4,9 @@
 
 import datetime
 import unittest
+from unittest.mock import Mock
 
+import freezegun
 import pytest
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
@@ -855,5 +857,97 @@ def test_given_no_cursor_value_for_first_than_second_then_return_false():
     assert not cursor.is_greater_than_or_equal(Record({}, {}), Record({"cursor_field": "2021-01-01"}, {}))
 
 
+def test_given_format_matched_when_parse_date_then_matching_format_is_tried_first():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("2021-01-01", parameters={}),
+        cursor_field=InterpolatedString(cursor_field, parameters={}),
+        datetime_format="%Y-%m-%d",
+        cursor_datetime_formats=["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"],
+        config=config,
+        parameters={},
+    )
+    cursor._parser = Mock(wraps=cursor._parser)
+
+    assert cursor.parse_date("2021-01-01T10:00:00") == datetime.datetime(2021, 1, 1, 10, tzinfo=timezone)
+    assert cursor.parse_date("2021-01-02T10:00:00") == datetime.datetime(2021, 1, 2, 10, tzinfo=timezone)
+    assert cursor.parse_date("2021-01-03") == datetime.datetime(2021, 1, 3, tzinfo=timezone)
+
+    assert [call.args for call in cursor._parser.parse.call_args_list] == [
+        ("2021-01-01T10:00:00", "%Y-%m-%d"),
+        ("2021-01-01T10:00:00", "%Y-%m-%dT%H:%M:%S"),
+        ("2021-01-02T10:00:00", "%Y-%m-%dT%H:%M:%S"),
+        ("2021-01-03", "%Y-%m-%dT%H:%M:%S"),
+        ("2021-01-03", "%Y-%m-%d"),
+    ]
+
+
+def test_given_cursor_field_interpolating_config_when_observe_then_cursor_field_is_evaluated_with_current_config():
+    cursor_config = {"cursor_field": "created"}
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("2021-01-01", parameters={}),
+        cursor_field=InterpolatedString("{{ config['cursor_field'] }}", parameters={}),
+        datetime_format="%Y-%m-%d",
+        config=cursor_config,
+        parameters={},
+    )
+    _slice = StreamSlice(partition={}, cursor_slice={"start_time": "2021-01-01", "end_time": "2021-12-31"})
+
+    cursor_config["cursor_field"] = "updated"
+    cursor.observe(_slice, Record({"created": "2021-06-01", "updated": "2021-03-01"}, _slice))
+    cursor.close_slice(_slice)
+
+    assert cursor.get_stream_state() == {"updated": "2021-03-01"}
+
+
+def test_given_highest_observed_value_replaced_when_observe_then_compare_with_replaced_value():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("2021-01-01", parameters={}),
+        cursor_field=cursor_field,
+        datetime_format="%Y-%m-%d",
+        config=config,
+        parameters={},
+    )
+    _slice = StreamSlice(partition={}, cursor_slice={"start_time": "2021-01-01", "end_time": "2021-12-31"})
+    cursor.observe(_slice, Record({cursor_field: "2021-03-01"}, _slice))
+
+    cursor._highest_observed_cursor_field_value = "2021-05-01"
+    cursor.observe(_slice, Record({cursor_field: "2021-04-01"}, _slice))
+    cursor.close_slice(_slice)
+
+    assert cursor.get_stream_state() == {cursor_field: "2021-05-01"}
+
+
+def test_given_state_updated_when_should_be_synced_then_use_new_state_as_earliest_boundary():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("2021-01-01", parameters={}),
+        cursor_field=cursor_field,
+        datetime_format="%Y-%m-%d",
+        config=config,
+        parameters={},
+    )
+    assert cursor.should_be_synced(Record({cursor_field: "2021-03-01"}, ANY_SLICE))
+
+    cursor.set_initial_state({cursor_field: "2021-04-01"})
+
+    assert not cursor.should_be_synced(Record({cursor_field: "2021-03-01"}, ANY_SLICE))
+    assert cursor.should_be_synced(Record({cursor_field: "2021-04-02"}, ANY_SLICE))
+
+
+def test_given_end_datetime_interpolating_now_when_should_be_synced_then_end_datetime_is_evaluated_for_every_record():
+    cursor = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime("2021-01-01T00:00:00", parameters={}),
+        end_datetime=MinMaxDatetime("{{ now_utc().strftime('%Y-%m-%dT%H:%M:%S') }}", parameters={}),
+        cursor_field=cursor_field,
+        datetime_format="%Y-%m-%dT%H:%M:%S",
+        config=config,
+        parameters={},
+    )
+
+    with freezegun.freeze_time("2021-02-01T00:00:00"):
+        assert not cursor.should_be_synced(Record({cursor_field: "2021-03-01T00:00:00"}, ANY_SLICE))
+    with freezegun.freeze_time("2021-04-01T00:00:00"):
+        assert cursor.should_be_synced(Record({cursor_field: "2021-03-01T00:00:00"}, ANY_SLICE))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -23,3 +23,42 @@ kwargs = {"c": "airbyte"}
 def test_interpolated_string(test_name, input_string, expected_value):
     s = InterpolatedString.create(input_string, parameters=parameters)
     assert s.eval(config, **{"kwargs": kwargs}) == expected_value
+
+
+@pytest.mark.parametrize(
+    "input_string, expected_value",
+    [
+        pytest.param("HELLO WORLD", "HELLO WORLD", id="test_static_value"),
+        pytest.param("{{ parameters['hello'] }}", "world", id="test_eval_from_parameters"),
+    ],
+)
+def test_given_constant_string_when_eval_then_interpolate_once(mocker, input_string, expected_value):
+    s = InterpolatedString.create(input_string, parameters=parameters)
+    jinja_eval = mocker.spy(s._interpolation, "eval")
+
+    assert s.eval(config) == expected_value
+    assert s.eval(config, **{"kwargs": kwargs}) == expected_value
+    assert jinja_eval.call_count == 1
+
+
+def test_given_template_reading_config_when_eval_then_interpolate_every_time():
+    s = InterpolatedString.create("{{ config['field'] }}", parameters=parameters)
+
+    assert s.eval({"field": "first"}) == "first"
+    assert s.eval({"field": "second"}) == "second"
+
+
+def test_given_constant_string_when_eval_with_valid_types_then_respect_valid_types():
+    s = InterpolatedString.create("{{ parameters['number'] }}", parameters={"number": "1"})
+
+    assert s.eval(config) == 1
+    assert s.eval(config, valid_types=(str,)) == "1"
+
+
+def test_given_constant_mutable_value_when_eval_then_do_not_share_value():
+    s = InterpolatedString.create("{{ parameters['list'] }}", parameters={"list": [1, 2]})
+
+    first = s.eval(config)
+    first.append(3)
+
+    assert s.eval(config) == [1, 2]
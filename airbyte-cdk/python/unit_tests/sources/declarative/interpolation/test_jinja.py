@@ -261,3 +261,47 @@ def test_macros_examples(template_string, expected_value):
     # If you change the expected output, you must also change the expected output in declarative_component_schema.yaml
     now_utc = interpolation.eval(template_string, {})
     assert now_utc == expected_value
+
+
+@pytest.mark.parametrize(
+    "template_string, expected_value",
+    [
+        pytest.param("a static string", "a static string", id="test_static_string"),
+        pytest.param("trailing newline\n", "trailing newline", id="test_trailing_newline_is_dropped_like_jinja"),
+        pytest.param("windows\r\nline", "windows\nline", id="test_line_endings_are_normalized_like_jinja"),
+        pytest.param("a } brace", "a } brace", id="test_closing_brace_only"),
+    ],
+)
+def test_static_strings(template_string, expected_value):
+    assert interpolation.eval(template_string, {}) == expected_value
+
+
+def test_given_same_template_when_eval_then_compile_once():
+    template_string = "{{ config['cache_test'] }} compiled once"
+    JinjaInterpolation().eval(template_string, {"cache_test": "first"})
+    cache_info = JinjaInterpolation.cache_info()
+
+    assert JinjaInterpolation().eval(template_string, {"cache_test": "second"}) == "second compiled once"
+    assert JinjaInterpolation.cache_info().hits == cache_info.hits + 1
+    assert JinjaInterpolation.cache_info().misses == cache_info.misses
+
+
+def test_given_static_string_when_eval_then_cache_is_not_used():
+    cache_info = JinjaInterpolation.cache_info()
+
+    interpolation.eval("not a template", {})
+
+    assert JinjaInterpolation.cache_info() == cache_info
+
+
+@pytest.mark.parametrize(
+    "template_string, expected_variables",
+    [
+        pytest.param("no template", set(), id="test_static_string"),
+        pytest.param("{{ parameters['name'] }}", {"parameters"}, id="test_parameters"),
+        pytest.param("{{ config['a'] ~ stream_slice['b'] }}", {"config", "stream_slice"}, id="test_many_variables"),
+        pytest.param("{{ now_utc() }}", {"now_utc"}, id="test_macros_are_referenced"),
+    ],
+)
+def test_referenced_variables(template_string, expected_variables):
+    assert interpolation.referenced_variables(template_string) == expected_variables
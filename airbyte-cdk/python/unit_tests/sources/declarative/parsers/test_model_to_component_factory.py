@@ -20,7 +20,7 @@ from airbyte_cdk.sources.declarative.auth.token_provider import SessionTokenProv
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor, PerPartitionCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -32,6 +32,7 @@ from airbyte_cdk.sources.declarative.models import CustomSchemaLoader as CustomS
 from airbyte_cdk.sources.declarative.models import DatetimeBasedCursor as DatetimeBasedCursorModel
 from airbyte_cdk.sources.declarative.models import DeclarativeStream as DeclarativeStreamModel
 from airbyte_cdk.sources.declarative.models import DefaultPaginator as DefaultPaginatorModel
+from airbyte_cdk.sources.declarative.models import HTTPAPIBudget as HTTPAPIBudgetModel
 from airbyte_cdk.sources.declarative.models import HttpRequester as HttpRequesterModel
 from airbyte_cdk.sources.declarative.models import ListPartitionRouter as ListPartitionRouterModel
 from airbyte_cdk.sources.declarative.models import OAuthAuthenticator as OAuthAuthenticatorModel
@@ -74,7 +75,15 @@ from airbyte_cdk.sources.declarative.stream_slicers import CartesianProductStrea
 from airbyte_cdk.sources.declarative.transformations import AddFields, RemoveFields
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
+from airbyte_cdk.sources.streams.call_rate import (
+    FixedWindowCallRatePolicy,
+    HttpAPIBudget,
+    LimiterSession,
+    MovingWindowCallRatePolicy,
+    UnlimitedCallRatePolicy,
+)
 from airbyte_cdk.sources.streams.http.requests_native_auth.oauth import SingleUseRefreshTokenOauth2Authenticator
+from requests import Request
 from unit_tests.sources.declarative.parsers.testing_components import TestingCustomSubstreamPartitionRouter, TestingSomeComponent
 
 factory = ModelToComponentFactory()
@@ -856,6 +865,185 @@ requester:
     assert selector._request_options_provider._headers_interpolator._interpolator.mapping["header"] == "header_value"
 
 
+def test_create_record_selector_with_streaming_json_decoder():
+    content = """
+    selector:
+      type: RecordSelector
+      extractor:
+        type: DpathExtractor
+        field_path: ["data"]
+        decoder:
+          type: StreamingJsonDecoder
+          chunk_size: 1024
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    selector_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["selector"], {})
+
+    selector = factory.create_component(
+        model_type=RecordSelectorModel, component_definition=selector_manifest, transformations=[], config=input_config
+    )
+
+    assert isinstance(selector.extractor.decoder, StreamingJsonDecoder)
+    assert selector.extractor.decoder.chunk_size == 1024
+
+
+@pytest.mark.parametrize(
+    "extractor_decoder, paginator, expected_stream_response",
+    [
+        pytest.param("StreamingJsonDecoder", {"type": "NoPagination"}, True, id="test_given_streaming_extractor_without_pagination"),
+        pytest.param("JsonDecoder", {"type": "NoPagination"}, False, id="test_given_json_extractor"),
+        pytest.param(
+            "StreamingJsonDecoder",
+            {
+                "type": "DefaultPaginator",
+                "pagination_strategy": {
+                    "type": "CursorPagination",
+                    "cursor_value": "{{ response.next }}",
+                    "decoder": {"type": "StreamingJsonDecoder"},
+                },
+            },
+            True,
+            id="test_given_cursor_pagination_with_streaming_decoder",
+        ),
+        pytest.param(
+            "StreamingJsonDecoder",
+            {"type": "DefaultPaginator", "pagination_strategy": {"type": "CursorPagination", "cursor_value": "{{ response.next }}"}},
+            False,
+            id="test_given_cursor_pagination_with_json_decoder",
+        ),
+        pytest.param(
+            "StreamingJsonDecoder",
+            {"type": "DefaultPaginator", "pagination_strategy": {"type": "OffsetIncrement", "page_size": 10}},
+            False,
+            id="test_given_offset_increment_decoding_page_size",
+        ),
+    ],
+)
+def test_create_simple_retriever_streams_responses_only_if_they_are_decoded_by_streaming_json_decoders(
+    extractor_decoder, paginator, expected_stream_response
+):
+    retriever_manifest = {
+        "type": "SimpleRetriever",
+        "requester": {"type": "HttpRequester", "url_base": "https://api.example.com", "path": "/items"},
+        "record_selector": {
+            "type": "RecordSelector",
+            "extractor": {"type": "DpathExtractor", "field_path": ["data"], "decoder": {"type": extractor_decoder}},
+        },
+        "paginator": paginator,
+    }
+
+    retriever = factory.create_component(
+        model_type=SimpleRetrieverModel,
+        component_definition=retriever_manifest,
+        config=input_config,
+        name="items",
+        primary_key="id",
+        stream_slicer=None,
+        transformations=[],
+    )
+
+    assert retriever.requester.stream_response == expected_stream_response
+
+
+def test_create_http_api_budget_shared_by_requesters():
+    content = """
+api_budget:
+  type: HTTPAPIBudget
+  ratelimit_reset_header: "X-RateLimit-Reset"
+  ratelimit_remaining_header: "X-RateLimit-Remaining"
+  status_codes_for_ratelimit_hit: [429, 420]
+  policies:
+    - type: UnlimitedCallRatePolicy
+      matchers:
+        - type: HttpRequestRegexMatcher
+          url_base: "{{ config['base_url'] }}"
+          headers:
+            sandbox: "true"
+    - type: MovingWindowCallRatePolicy
+      rates:
+        - type: Rate
+          limit: 10
+          interval: PT1S
+        - type: Rate
+          limit: 1000
+          interval: PT1H
+      matchers:
+        - type: HttpRequestRegexMatcher
+          method: GET
+          url_path_pattern: "/users/[0-9]+/orders"
+    - type: FixedWindowCallRatePolicy
+      period: PT1M
+      call_limit: 100
+requester:
+  type: HttpRequester
+  path: "/v3/marketing/lists"
+  url_base: "{{ config['base_url'] }}"
+    """
+    config = {"base_url": "https://api.sendgrid.com"}
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    api_budget_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["api_budget"], {})
+    requester_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["requester"], {})
+    factory_with_budget = ModelToComponentFactory()
+
+    api_budget = factory_with_budget.create_component(
+        model_type=HTTPAPIBudgetModel, component_definition=api_budget_manifest, config=config
+    )
+    factory_with_budget.set_api_budget(api_budget)
+    requesters = [
+        factory_with_budget.create_component(
+            model_type=HttpRequesterModel, component_definition=requester_manifest, config=config, name=name
+        )
+        for name in ("lists", "contacts")
+    ]
+
+    assert isinstance(api_budget, HttpAPIBudget)
+    assert api_budget._ratelimit_reset_header == "X-RateLimit-Reset"
+    assert api_budget._ratelimit_remaining_header == "X-RateLimit-Remaining"
+    assert api_budget._status_codes_for_ratelimit_hit == (429, 420)
+    assert [type(policy) for policy in api_budget._policies] == [
+        UnlimitedCallRatePolicy,
+        MovingWindowCallRatePolicy,
+        FixedWindowCallRatePolicy,
+    ]
+    assert isinstance(
+        api_budget.get_matching_policy(Request("GET", "https://api.sendgrid.com/v3/users/1", headers={"sandbox": "true"})),
+        UnlimitedCallRatePolicy,
+    )
+    assert isinstance(
+        api_budget.get_matching_policy(Request("GET", "https://api.sendgrid.com/v3/users/1/orders")), MovingWindowCallRatePolicy
+    )
+    assert isinstance(
+        api_budget.get_matching_policy(Request("POST", "https://api.sendgrid.com/v3/users/1/orders")), FixedWindowCallRatePolicy
+    )
+    for requester in requesters:
+        assert requester.api_budget is api_budget
+        assert isinstance(requester._session, LimiterSession)
+
+
+def test_create_requester_without_api_budget():
+    requester = factory.create_component(
+        model_type=HttpRequesterModel,
+        component_definition={"type": "HttpRequester", "url_base": "https://api.sendgrid.com", "path": "/v3/marketing/lists"},
+        config=input_config,
+        name="lists",
+    )
+
+    assert requester.api_budget is None
+    assert not isinstance(requester._session, LimiterSession)
+
+
+def test_given_rate_interval_in_months_when_create_api_budget_then_raise_error():
+    definition = {
+        "type": "HTTPAPIBudget",
+        "policies": [{"type": "MovingWindowCallRatePolicy", "rates": [{"type": "Rate", "limit": 10, "interval": "P1M"}]}],
+    }
+
+    with pytest.raises(ValueError):
+        factory.create_component(model_type=HTTPAPIBudgetModel, component_definition=definition, config=input_config)
+
+
 def test_create_request_with_leacy_session_authenticator():
     content = """
 requester:
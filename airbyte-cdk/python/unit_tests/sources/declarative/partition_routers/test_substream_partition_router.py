@@ -8,6 +8,7 @@ import pytest as pytest
 from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, SyncMode, Type
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.incremental.per_partition_cursor import StreamSlice
+from airbyte_cdk.sources.declarative.partition_routers.parent_partition_store import ParentPartitionStore
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig, SubstreamPartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.types import Record
@@ -402,3 +403,109 @@ def test_given_record_is_record_object_when_stream_slices_then_use_record_data()
 
     slices = list(partition_router.stream_slices())
     assert slices == [{"partition_field": "record value", "parent_slice": parent_slice}]
+
+
+class CountingMockStream(MockStream):
+    def __init__(self, slices, records, name, error: Optional[Exception] = None):
+        super().__init__(slices, records, name)
+        self.read_records_calls = 0
+        self._error = error
+
+    def read_records(self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None):
+        self.read_records_calls += 1
+        yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+        if self._error:
+            raise self._error
+
+
+def _router_sharing_store(parent_stream: MockStream, store: ParentPartitionStore, partition_field: str = "first_stream_id"):
+    return SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(
+                stream=parent_stream,
+                parent_key="id",
+                partition_field=partition_field,
+                parameters={},
+                config={},
+                partition_store=store,
+                partition_store_key="first_stream",
+            )
+        ],
+        parameters={},
+        config={},
+    )
+
+
+_EXPECTED_PARENT_SLICES = [
+    {"parent_slice": {"slice": "first"}, "first_stream_id": 0},
+    {"parent_slice": {"slice": "first"}, "first_stream_id": 1},
+    {"parent_slice": {"slice": "second"}, "first_stream_id": 2},
+]
+
+
+@pytest.mark.parametrize("prefetch", [pytest.param(False, id="inline"), pytest.param(True, id="prefetch")])
+def test_given_routers_sharing_a_store_when_stream_slices_then_parent_stream_is_read_once(prefetch):
+    parent_stream = CountingMockStream(parent_slices, all_parent_data, "first_stream")
+    store = ParentPartitionStore(prefetch=prefetch)
+
+    assert list(_router_sharing_store(parent_stream, store).stream_slices()) == _EXPECTED_PARENT_SLICES
+    assert list(_router_sharing_store(parent_stream, store, "other_id").stream_slices()) == [
+        {"parent_slice": expected["parent_slice"], "other_id": expected["first_stream_id"]} for expected in _EXPECTED_PARENT_SLICES
+    ]
+    assert parent_stream.read_records_calls == len(parent_slices)
+    store.close()
+
+
+def test_given_routers_interleaved_with_prefetch_when_stream_slices_then_second_router_follows_the_first():
+    parent_stream = CountingMockStream(parent_slices, all_parent_data, "first_stream")
+    store = ParentPartitionStore(prefetch=True)
+    first_slices = iter(_router_sharing_store(parent_stream, store).stream_slices())
+    second_slices = iter(_router_sharing_store(parent_stream, store).stream_slices())
+
+    slices = [(next(first_slices), next(second_slices)) for _ in _EXPECTED_PARENT_SLICES]
+
+    assert slices == [(expected, expected) for expected in _EXPECTED_PARENT_SLICES]
+    assert next(first_slices, None) is None and next(second_slices, None) is None
+    assert parent_stream.read_records_calls == len(parent_slices)
+    store.close()
+
+
+def test_given_router_stopped_before_the_end_of_parent_when_stream_slices_then_next_router_reads_parent_again():
+    parent_stream = CountingMockStream(parent_slices, all_parent_data, "first_stream")
+    store = ParentPartitionStore()
+    slices = iter(_router_sharing_store(parent_stream, store).stream_slices())
+    next(slices)
+    slices.close()
+
+    assert list(_router_sharing_store(parent_stream, store).stream_slices()) == _EXPECTED_PARENT_SLICES
+    assert parent_stream.read_records_calls == 1 + len(parent_slices)
+    store.close()
+
+
+@pytest.mark.parametrize("prefetch", [pytest.param(False, id="inline"), pytest.param(True, id="prefetch")])
+def test_given_parent_stream_fails_when_stream_slices_then_error_is_raised_and_parent_is_read_again(prefetch):
+    failing_parent_stream = CountingMockStream([{"slice": "first"}], data_first_parent_slice, "first_stream", ValueError("parent failure"))
+    store = ParentPartitionStore(prefetch=prefetch)
+    slices = []
+
+    with pytest.raises(ValueError):
+        for stream_slice in _router_sharing_store(failing_parent_stream, store).stream_slices():
+            slices.append(stream_slice)
+
+    assert slices == _EXPECTED_PARENT_SLICES[:2]
+    parent_stream = CountingMockStream(parent_slices, all_parent_data, "first_stream")
+    assert list(_router_sharing_store(parent_stream, store).stream_slices()) == _EXPECTED_PARENT_SLICES
+    store.close()
+
+
+def test_given_parent_being_read_without_prefetch_when_stream_slices_then_parent_is_read_directly():
+    parent_stream = CountingMockStream(parent_slices, all_parent_data, "first_stream")
+    store = ParentPartitionStore()
+    first_slices = iter(_router_sharing_store(parent_stream, store).stream_slices())
+    next(first_slices)
+
+    assert list(_router_sharing_store(parent_stream, store).stream_slices()) == _EXPECTED_PARENT_SLICES
+    assert list(first_slices) == _EXPECTED_PARENT_SLICES[1:]
+    assert list(_router_sharing_store(parent_stream, store).stream_slices()) == _EXPECTED_PARENT_SLICES
+    assert parent_stream.read_records_calls == 2 * len(parent_slices)
+    store.close()
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
 from http import HTTPStatus
 from typing import Any, Mapping, Optional
 from unittest import mock
@@ -201,6 +202,48 @@ def test_basic_send_request():
     assert sent_request.body is None
 
 
+@pytest.mark.parametrize(
+    "log_level, expect_body_read",
+    [
+        pytest.param(logging.INFO, False, id="test_given_debug_disabled_then_do_not_read_response_body"),
+        pytest.param(logging.DEBUG, True, id="test_given_debug_enabled_then_log_response_body"),
+    ],
+)
+def test_send_request_logs_response_body_only_if_debug_is_enabled(log_level, expect_body_read, caplog):
+    requester = create_requester()
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = MagicMock()
+    response.raw.stream.return_value = iter([b'{"id": 1}'])
+    requester._session.send.return_value = response
+    requester.logger.setLevel(log_level)
+    caplog.set_level(log_level)
+
+    requester.send_request()
+
+    assert response.raw.stream.called == expect_body_read
+    response_records = [record for record in caplog.records if record.getMessage() == "Receiving response"]
+    assert [record.body for record in response_records] == (['{"id": 1}'] if expect_body_read else [])
+
+
+def test_given_stream_response_when_send_request_then_stream_response_and_do_not_log_its_body(caplog):
+    requester = create_requester()
+    requester.stream_response = True
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = MagicMock()
+    response.raw.stream.return_value = iter([b'{"id": 1}'])
+    requester._session.send.return_value = response
+    requester.logger.setLevel(logging.DEBUG)
+    caplog.set_level(logging.DEBUG)
+
+    requester.send_request()
+
+    assert requester._session.send.call_args.kwargs["stream"] is True
+    assert not response.raw.stream.called
+    assert [record.body for record in caplog.records if record.getMessage() == "Receiving response"] == [None]
+
+
 @pytest.mark.parametrize(
     "provider_data, provider_json, param_data, param_json, authenticator_data, authenticator_json, expected_exception, expected_body",
     [
@@ -421,7 +464,7 @@ def test_send_request_params(provider_params, param_params, authenticator_params
             {"k": [1, 2]},
             "%5B%22a%22%2C+%22b%22%5D=1&%5B%22a%22%2C+%22b%22%5D=2",
             id="test-key-with-list-to-be-interpolated",
-        )
+        ),
     ],
 )
 def test_request_param_interpolation(request_parameters, config, expected_query_params):
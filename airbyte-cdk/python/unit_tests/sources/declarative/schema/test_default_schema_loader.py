@@ -30,3 +30,25 @@ def test_get_json_schema(found_schema, found_error, expected_schema):
 
     actual_schema = default_schema_loader.get_json_schema()
     assert actual_schema == expected_schema
+
+
+def test_given_schema_not_found_when_get_json_schema_multiple_times_then_look_up_once():
+    default_schema_loader = DefaultSchemaLoader({}, {})
+    default_schema_loader.default_loader = MagicMock()
+    default_schema_loader.default_loader.get_json_schema.side_effect = FileNotFoundError
+
+    assert default_schema_loader.get_json_schema() == {}
+    assert default_schema_loader.get_json_schema() == {}
+    assert default_schema_loader.default_loader.get_json_schema.call_count == 1
+
+
+def test_given_cache_invalidated_when_get_json_schema_then_load_again():
+    default_schema_loader = DefaultSchemaLoader({}, {})
+    default_schema_loader.default_loader = MagicMock()
+    default_schema_loader.default_loader.get_json_schema.side_effect = [{"type": "object"}, {"type": "object", "properties": {}}]
+
+    assert default_schema_loader.get_json_schema() == {"type": "object"}
+    default_schema_loader.invalidate_cache()
+
+    assert default_schema_loader.get_json_schema() == {"type": "object", "properties": {}}
+    default_schema_loader.default_loader.invalidate_cache.assert_called_once()
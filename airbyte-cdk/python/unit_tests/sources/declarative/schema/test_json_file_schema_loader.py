@@ -24,3 +24,26 @@ def test_extract_resource_and_schema_path(test_name, input_path, expected_resour
 
     assert actual_resource == expected_resource
     assert actual_path == expected_path
+
+
+def test_given_schema_loaded_when_get_json_schema_then_read_and_parse_file_once(mocker):
+    get_data = mocker.patch("pkgutil.get_data", return_value=b'{"type": "object", "properties": {"id": {"type": "string"}}}')
+    json_schema = JsonFileSchemaLoader({}, {}, "./unit_tests/schemas/lists.json")
+
+    first = json_schema.get_json_schema()
+    second = json_schema.get_json_schema()
+
+    assert first == {"type": "object", "properties": {"id": {"type": "string"}}}
+    assert second is first
+    get_data.assert_called_once_with("unit_tests", "schemas/lists.json")
+
+
+def test_given_cache_invalidated_when_get_json_schema_then_read_file_again(mocker):
+    get_data = mocker.patch("pkgutil.get_data", side_effect=[b'{"type": "object"}', b'{"type": "object", "properties": {}}'])
+    json_schema = JsonFileSchemaLoader({}, {}, "./unit_tests/schemas/lists.json")
+
+    json_schema.get_json_schema()
+    json_schema.invalidate_cache()
+
+    assert json_schema.get_json_schema() == {"type": "object", "properties": {}}
+    assert get_data.call_count == 2
@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from unittest.mock import Mock
+
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Type
+from airbyte_cdk.sources.declarative.stream_slicers.declarative_partition_generator import (
+    DeclarativePartitionFactory,
+    StreamSlicerPartitionGenerator,
+)
+from airbyte_cdk.sources.declarative.types import StreamSlice
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+
+_STREAM_NAME = "a_stream"
+_STREAM_STATE = {"updated_at": "2024-01-01"}
+_A_SLICE = StreamSlice(partition={"parent_id": 1}, cursor_slice={})
+_ANOTHER_SLICE = StreamSlice(partition={"parent_id": 2}, cursor_slice={})
+
+
+def _stream(records):
+    stream = Mock()
+    stream.read_records.side_effect = lambda sync_mode, stream_slice: iter(records)
+    stream.get_json_schema.return_value = {}
+    return stream
+
+
+def test_given_records_and_messages_when_read_then_yield_records_and_emit_messages():
+    log_message = AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="a log"))
+    message_repository = Mock()
+    cursor = Mock()
+    partition = DeclarativePartitionFactory(
+        _STREAM_NAME, lambda: _stream([{"id": 1}, log_message]), _STREAM_STATE, message_repository, cursor
+    ).create(_A_SLICE)
+
+    records = list(partition.read())
+
+    assert records == [Record({"id": 1}, _STREAM_NAME)]
+    cursor.observe.assert_called_once_with(Record({"id": 1}, _STREAM_NAME))
+    message_repository.emit_message.assert_called_once_with(log_message)
+
+
+def test_given_partitions_read_by_the_same_thread_then_reuse_stream_and_reset_its_state_before_each_partition():
+    streams = []
+
+    def _create_stream():
+        stream = _stream([{"id": 1}])
+        streams.append(stream)
+        return stream
+
+    partition_factory = DeclarativePartitionFactory(_STREAM_NAME, _create_stream, _STREAM_STATE, Mock(), Mock())
+    list(partition_factory.create(_A_SLICE).read())
+    streams[0].state = {"updated_at": "2024-02-01"}
+    list(partition_factory.create(_ANOTHER_SLICE).read())
+
+    assert len(streams) == 1
+    assert streams[0].state == _STREAM_STATE
+
+
+def test_given_partitions_read_by_different_threads_then_each_thread_uses_its_own_stream():
+    streams = []
+    partition_factory = DeclarativePartitionFactory(
+        _STREAM_NAME, lambda: streams.append(_stream([{"id": 1}])) or streams[-1], _STREAM_STATE, Mock(), Mock()
+    )
+
+    threads = [threading.Thread(target=lambda: list(partition_factory.create(_A_SLICE).read())) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(streams) == 3
+
+
+def test_when_close_partition_then_close_on_cursor():
+    cursor = Mock()
+    partition = DeclarativePartitionFactory(_STREAM_NAME, Mock(), _STREAM_STATE, Mock(), cursor).create(_A_SLICE)
+
+    partition.close()
+
+    cursor.close_partition.assert_called_once_with(partition)
+    assert partition.is_closed()
+
+
+def test_given_slices_when_generate_then_create_a_partition_per_slice():
+    stream = Mock()
+    stream.stream_slices.return_value = [_A_SLICE, _ANOTHER_SLICE]
+    partition_factory = DeclarativePartitionFactory(_STREAM_NAME, Mock(), _STREAM_STATE, Mock(), Mock())
+
+    partitions = list(StreamSlicerPartitionGenerator(stream, partition_factory).generate())
+
+    assert [partition.to_slice() for partition in partitions] == [_A_SLICE, _ANOTHER_SLICE]
+    assert hash(partitions[0]) != hash(partitions[1])
@@ -16,6 +16,7 @@ import yaml
 from airbyte_cdk.models import (
     AirbyteLogMessage,
     AirbyteMessage,
+    AirbyteStateMessage,
     AirbyteStream,
     ConfiguredAirbyteCatalog,
     ConfiguredAirbyteStream,
@@ -26,6 +27,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.partition_routers.parent_partition_store import ParentPartitionStore
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
 from jsonschema.exceptions import ValidationError
 
@@ -1127,7 +1129,7 @@ def test_read_manifest_declarative_source(test_name, manifest, pages, expected_r
         mock_retriever.assert_has_calls(expected_calls)
 
 
-def test_only_parent_streams_use_cache():
+def _parent_and_substream_manifest():
     applications_stream = {
         "type": "DeclarativeStream",
         "$parameters": {"name": "applications", "primary_key": "id", "url_base": "https://harvest.greenhouse.io/v1/"},
@@ -1224,7 +1226,12 @@ def test_only_parent_streams_use_cache():
         ],
         "check": {"type": "CheckStream", "stream_names": ["applications"]},
     }
-    source = ManifestDeclarativeSource(source_config=manifest)
+    return manifest
+
+
+def test_only_parent_streams_use_cache():
+    manifest = _parent_and_substream_manifest()
+    source = ManifestDeclarativeSource(source_config=manifest, emit_connector_builder_messages=True)
 
     streams = source.streams({})
     assert len(streams) == 3
@@ -1246,6 +1253,47 @@ def test_only_parent_streams_use_cache():
     assert not streams[2].retriever.requester.use_cache
 
 
+def test_substream_parent_streams_share_partition_store_instead_of_cache():
+    source = ManifestDeclarativeSource(source_config=_parent_and_substream_manifest())
+
+    streams = source.streams({})
+    parent_stream_config = streams[1].retriever.stream_slicer.parent_stream_configs[0]
+    assert not streams[0].retriever.requester.use_cache
+    assert not parent_stream_config.stream.retriever.requester.use_cache
+    assert parent_stream_config.partition_store is not None
+    assert parent_stream_config.partition_store_key
+
+    assert (
+        source.streams({})[1].retriever.stream_slicer.parent_stream_configs[0].partition_store is not parent_stream_config.partition_store
+    )
+
+
+def test_parent_partition_store_is_closed_when_replaced():
+    source = ManifestDeclarativeSource(source_config=_parent_and_substream_manifest())
+    partition_store = source.streams({})[1].retriever.stream_slicer.parent_stream_configs[0].partition_store
+
+    with patch.object(ParentPartitionStore, "close", autospec=True) as close:
+        source.streams({})
+
+    close.assert_called_once_with(partition_store)
+
+
+def test_api_budget_shared_by_all_requesters():
+    manifest = _parent_and_substream_manifest()
+    manifest["api_budget"] = {
+        "type": "HTTPAPIBudget",
+        "policies": [{"type": "MovingWindowCallRatePolicy", "rates": [{"type": "Rate", "limit": 10, "interval": "PT1S"}]}],
+    }
+    source = ManifestDeclarativeSource(source_config=manifest)
+
+    streams = source.streams({})
+    api_budget = streams[0].retriever.requester.api_budget
+    assert api_budget is not None
+    assert streams[1].retriever.requester.api_budget is api_budget
+    assert streams[1].retriever.stream_slicer.parent_stream_configs[0].stream.retriever.requester.api_budget is api_budget
+    assert source.streams({})[0].retriever.requester.api_budget is not api_budget
+
+
 def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMessage]:
     source = ManifestDeclarativeSource(source_config=manifest)
     catalog = ConfiguredAirbyteCatalog(
@@ -1258,3 +1306,171 @@ def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMess
         ]
     )
     return list(source.read(logger, {}, catalog, {}))
+
+
+def _concurrent_manifest(streams: List[Mapping[str, Any]]) -> Mapping[str, Any]:
+    return {
+        "version": "0.34.2",
+        "type": "DeclarativeSource",
+        "check": {"type": "CheckStream", "stream_names": [streams[0]["name"]]},
+        "concurrency_level": {"type": "ConcurrencyLevel", "default_concurrency": 4},
+        "streams": streams,
+    }
+
+
+def _concurrent_stream(name: str, partition_router: Any = None, incremental_sync: Any = None) -> Mapping[str, Any]:
+    stream = {
+        "type": "DeclarativeStream",
+        "name": name,
+        "primary_key": "id",
+        "schema_loader": {"type": "InlineSchemaLoader", "schema": {"type": "object", "properties": {"id": {"type": "string"}}}},
+        "retriever": {
+            "type": "SimpleRetriever",
+            "requester": {"type": "HttpRequester", "url_base": "https://api.example.com", "path": f"/{name}", "http_method": "GET"},
+            "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["data"]}},
+            "paginator": {"type": "NoPagination"},
+        },
+    }
+    if partition_router:
+        stream["retriever"]["partition_router"] = partition_router
+    if incremental_sync:
+        stream["incremental_sync"] = incremental_sync
+    return stream
+
+
+def _fetch_slice_records(stream_state, stream_slice, next_page_token):
+    # pages are built from the slice as the slices of concurrent streams are read in any order
+    slice_id = "-".join(str(value) for value in stream_slice.values())
+    return _create_page({"data": [{"id": slice_id, "updated_at": stream_slice.get("start_time")}]})
+
+
+def _catalog(*streams: ConfiguredAirbyteStream) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(streams=list(streams))
+
+
+def _configured_stream(name: str, sync_mode: SyncMode) -> ConfiguredAirbyteStream:
+    return ConfiguredAirbyteStream(
+        stream=AirbyteStream(name=name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh, SyncMode.incremental]),
+        sync_mode=sync_mode,
+        destination_sync_mode=DestinationSyncMode.append,
+    )
+
+
+_INCREMENTAL_SYNC = {
+    "type": "DatetimeBasedCursor",
+    "cursor_field": "updated_at",
+    "datetime_format": "%Y-%m-%d",
+    "start_datetime": "2024-01-01",
+    "end_datetime": "2024-01-05",
+    "step": "P1D",
+    "cursor_granularity": "P1D",
+}
+
+
+def test_read_partition_router_streams_concurrently():
+    manifest = _concurrent_manifest(
+        [
+            _concurrent_stream("list", partition_router={"type": "ListPartitionRouter", "values": ["a", "b", "c"], "cursor_field": "key"}),
+            _concurrent_stream("single"),
+        ]
+    )
+    source = ManifestDeclarativeSource(source_config=manifest)
+    catalog = _catalog(_configured_stream("list", SyncMode.full_refresh), _configured_stream("single", SyncMode.full_refresh))
+
+    assert {stream.name for stream in source._create_concurrent_streams(logger, {}, catalog, None)} == {"list", "single"}
+    with patch.object(SimpleRetriever, "_fetch_next_page", side_effect=_fetch_slice_records):
+        messages = list(source.read(logger, {}, catalog, None))
+
+    records = sorted((message.record.stream, message.record.data["id"]) for message in messages if message.type == Type.RECORD)
+    assert records == [("list", "a"), ("list", "b"), ("list", "c"), ("single", "")]
+    assert {message.state.stream.stream_descriptor.name for message in messages if message.type == Type.STATE} == {"list", "single"}
+
+
+def test_read_datetime_based_cursor_stream_concurrently_emits_state_of_completed_slices():
+    manifest = _concurrent_manifest([_concurrent_stream("incremental", incremental_sync=_INCREMENTAL_SYNC)])
+    source = ManifestDeclarativeSource(source_config=manifest)
+    catalog = _catalog(_configured_stream("incremental", SyncMode.incremental))
+    state = [
+        AirbyteStateMessage.parse_obj(
+            {"type": "STREAM", "stream": {"stream_descriptor": {"name": "incremental"}, "stream_state": {"updated_at": "2024-01-02"}}}
+        )
+    ]
+
+    with patch.object(SimpleRetriever, "_fetch_next_page", side_effect=_fetch_slice_records):
+        messages = list(source.read(logger, {}, catalog, state))
+
+    records = sorted(message.record.data["updated_at"] for message in messages if message.type == Type.RECORD)
+    assert records == ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]
+    states = [message.state.stream.stream_state.dict() for message in messages if message.type == Type.STATE]
+    assert states[-1] == {"updated_at": "2024-01-05"}
+
+
+def test_read_closes_the_parent_partition_store_of_the_sync():
+    source = ManifestDeclarativeSource(source_config=_concurrent_manifest([_concurrent_stream("single")]))
+    catalog = _catalog(_configured_stream("single", SyncMode.full_refresh))
+
+    with patch.object(ParentPartitionStore, "close", autospec=True) as close, patch.object(
+        SimpleRetriever, "_fetch_next_page", side_effect=_fetch_slice_records
+    ):
+        list(source.read(logger, {}, catalog, None))
+
+    close.assert_called_once()
+    assert source._constructor._parent_partition_store is None
+
+
+def test_streams_whose_slices_cannot_be_read_out_of_order_are_read_sequentially():
+    per_partition_stream = _concurrent_stream(
+        "per_partition",
+        partition_router={"type": "ListPartitionRouter", "values": ["a", "b"], "cursor_field": "key"},
+        incremental_sync=_INCREMENTAL_SYNC,
+    )
+    manifest = _concurrent_manifest([per_partition_stream, _concurrent_stream("incremental", incremental_sync=_INCREMENTAL_SYNC)])
+    source = ManifestDeclarativeSource(source_config=manifest)
+    catalog = _catalog(_configured_stream("per_partition", SyncMode.incremental), _configured_stream("incremental", SyncMode.incremental))
+
+    assert [stream.name for stream in source._create_concurrent_streams(logger, {}, catalog, None)] == ["incremental"]
+    with patch.object(SimpleRetriever, "_fetch_next_page", side_effect=_fetch_slice_records):
+        messages = list(source.read(logger, {}, catalog, None))
+
+    assert len([message for message in messages if message.type == Type.RECORD and message.record.stream == "per_partition"]) == 10
+    assert len([message for message in messages if message.type == Type.RECORD and message.record.stream == "incremental"]) == 5
+
+
+def test_streams_read_concurrently_and_sequentially_share_the_budget_and_parent_partitions_of_the_sync():
+    partition_router = {
+        "type": "SubstreamPartitionRouter",
+        "parent_stream_configs": [
+            {"type": "ParentStreamConfig", "parent_key": "id", "partition_field": "parent_id", "stream": _concurrent_stream("parent")}
+        ],
+    }
+    manifest = _concurrent_manifest(
+        [
+            _concurrent_stream("concurrent_child", partition_router=partition_router),
+            _concurrent_stream("sequential_child", partition_router=partition_router, incremental_sync=_INCREMENTAL_SYNC),
+        ]
+    )
+    manifest["api_budget"] = {
+        "type": "HTTPAPIBudget",
+        "policies": [{"type": "MovingWindowCallRatePolicy", "rates": [{"type": "Rate", "limit": 100, "interval": "PT1S"}]}],
+    }
+    source = ManifestDeclarativeSource(source_config=manifest)
+    catalog = _catalog(
+        _configured_stream("concurrent_child", SyncMode.full_refresh), _configured_stream("sequential_child", SyncMode.incremental)
+    )
+    requested_streams = []
+    api_budgets = set()
+
+    def _fetch_next_page(retriever, stream_state, stream_slice, next_page_token=None):
+        requested_streams.append(retriever.name)
+        api_budgets.add(retriever.requester.api_budget)
+        if retriever.name == "parent":
+            return _create_page({"data": [{"id": "1"}, {"id": "2"}]})
+        return _fetch_slice_records(stream_state, stream_slice, next_page_token)
+
+    with patch.object(SimpleRetriever, "_fetch_next_page", autospec=True, side_effect=_fetch_next_page):
+        messages = list(source.read(logger, {}, catalog, None))
+
+    assert len([message for message in messages if message.type == Type.RECORD and message.record.stream == "concurrent_child"]) == 2
+    assert len([message for message in messages if message.type == Type.RECORD and message.record.stream == "sequential_child"]) == 10
+    assert requested_streams.count("parent") == 1
+    assert len(api_budgets) == 1 and None not in api_budgets
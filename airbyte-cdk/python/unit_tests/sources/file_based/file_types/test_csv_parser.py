@@ -7,8 +7,9 @@ import csv
 import io
 import logging
 import unittest
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Set
+from typing import Any, Dict, Generator, List, Mapping, Optional, Set, Tuple
 from unittest import TestCase, mock
 from unittest.mock import Mock
 
@@ -20,6 +21,7 @@ from airbyte_cdk.sources.file_based.config.csv_format import (
     CsvFormat,
     CsvHeaderAutogenerated,
     CsvHeaderUserProvided,
+    CsvParsingEngine,
     InferenceType,
 )
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
@@ -613,3 +615,165 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+_SCHEMA = {
+    "properties": {
+        "id": {"type": "integer"},
+        "amount": {"type": ["null", "number"]},
+        "name": {"type": "string"},
+        "is_active": {"type": "boolean"},
+        "payload": {"type": "object"},
+        "tags": {"type": "array"},
+    }
+}
+_ROWS = [
+    "id,amount,name,is_active,payload,tags",
+    '1,1.5,john,true,"{""a"": 1}","[1, 2]"',
+    '2,,NA,no,"{}","[]"',
+    "0x3,NA,,maybe,not an object,not an array",
+    '99999999999999999999,1e3,"multi\nline",1,"{""b"": [1]}","[""x""]"',
+    "five,-inf,NA,0,,",
+]
+# the python engine fails to compare the objects and arrays it casts to null values
+_PRIMITIVE_ROWS = [
+    "id,amount,name,is_active",
+    "1,1.5,john,true",
+    "2,,NA,no",
+    "0x3,NA,,maybe",
+    '99999999999999999999,1e3,"multi\nline",1',
+    "five,-inf,NA,0",
+]
+
+
+def _stream_reader_for(contents: str) -> Mock:
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(contents.encode(encoding or "utf8")) if mode == FileReadMode.READ_BINARY else io.StringIO(contents)
+    )
+    return stream_reader
+
+
+def _parse_with_both_engines(config_format: CsvFormat, contents: str, schema: Optional[Mapping[str, Any]] = _SCHEMA) -> Tuple[Any, Any]:
+    results = []
+    for engine in (CsvParsingEngine.PYTHON, CsvParsingEngine.PYARROW):
+        config = FileBasedStreamConfig(
+            name="test", validation_policy="Emit Record", format=config_format.copy(update={"parsing_engine": engine})
+        )
+        engine_logger = Mock(spec=logging.Logger)
+        try:
+            records = list(
+                CsvParser().parse_records(
+                    config, RemoteFile(uri="a uri", last_modified=datetime.now()), _stream_reader_for(contents), engine_logger, schema
+                )
+            )
+        except RecordParseError as exception:
+            records = [str(exception)]
+        results.append((records, engine_logger.warning.call_args_list))
+    return results[0], results[1]
+
+
+@pytest.mark.parametrize(
+    "config_format, rows",
+    [
+        pytest.param(CsvFormat(), _ROWS, id="test_given_default_format_then_cast_the_same_values"),
+        pytest.param(
+            CsvFormat(null_values={"NA", ""}, strings_can_be_null=False),
+            _PRIMITIVE_ROWS,
+            id="test_given_null_values_then_null_the_same_values",
+        ),
+        pytest.param(
+            CsvFormat(null_values={"NA"}, strings_can_be_null=True), _PRIMITIVE_ROWS, id="test_given_strings_can_be_null_then_null_strings"
+        ),
+        pytest.param(CsvFormat(null_values={"1"}), ["id,amount", "1,1", "1,NA"], id="test_given_castable_null_value_then_cast_it"),
+        pytest.param(
+            CsvFormat(delimiter=";", quote_char="'", escape_char="\\", double_quote=False),
+            ["id;name", "1;'a;b'", r"2;c\;d"],
+            id="test_given_custom_dialect_then_parse_the_same_values",
+        ),
+        pytest.param(CsvFormat(delimiter="§"), ["id§name", "1§a"], id="test_given_multibyte_delimiter_then_fall_back_on_python_engine"),
+        pytest.param(
+            CsvFormat(skip_rows_before_header=1, skip_rows_after_header=1),
+            ["skipped", "id,name,id", "skipped", "1,a,2"],
+            id="test_given_skipped_rows_and_duplicated_header_then_parse_the_same_values",
+        ),
+        pytest.param(
+            CsvFormat(header_definition=CsvHeaderAutogenerated()),
+            ["1,a", "2,b"],
+            id="test_given_autogenerated_headers_then_parse_the_same_values",
+        ),
+        pytest.param(
+            CsvFormat(header_definition=CsvHeaderUserProvided(column_names=["id", "name"])),
+            ["1,a", "2,b"],
+            id="test_given_user_provided_headers_then_parse_the_same_values",
+        ),
+        pytest.param(
+            CsvFormat(block_size=16),
+            ["id,name"] + [f"{i},a" for i in range(20)] + ["21,a,extra"],
+            id="test_given_mismatched_row_in_later_block_then_fall_back_on_python_engine",
+        ),
+        pytest.param(
+            CsvFormat(ignore_errors_on_fields_mismatch=True),
+            ["id,name", "1,a", "2", "3,c"],
+            id="test_given_ignored_mismatched_row_then_fall_back_on_python_engine",
+        ),
+    ],
+)
+def test_given_pyarrow_engine_when_parse_records_then_emit_same_records_and_warnings_as_python_engine(config_format, rows) -> None:
+    python_result, pyarrow_result = _parse_with_both_engines(config_format, "\n".join(rows))
+    assert pyarrow_result == python_result
+
+
+def test_given_pyarrow_engine_and_no_schema_when_parse_records_then_emit_same_records_as_python_engine() -> None:
+    python_result, pyarrow_result = _parse_with_both_engines(CsvFormat(null_values={"NA"}), "\n".join(_PRIMITIVE_ROWS), schema=None)
+    assert pyarrow_result == python_result
+
+
+@pytest.mark.parametrize(
+    "inference_type, rows",
+    [
+        pytest.param(InferenceType.PRIMITIVE_TYPES_ONLY, _ROWS, id="test_given_primitive_types_inference_then_infer_the_same_types"),
+        pytest.param(InferenceType.NONE, _ROWS, id="test_given_no_inference_then_infer_the_same_types"),
+        pytest.param(
+            InferenceType.PRIMITIVE_TYPES_ONLY,
+            ["header"] + ["1" * 1000] * 1000 + ["a string"],
+            id="test_given_big_file_then_stop_at_the_same_row",
+        ),
+    ],
+)
+def test_given_pyarrow_engine_when_infer_schema_then_infer_same_schema_as_python_engine(inference_type, rows) -> None:
+    schemas = []
+    for engine in (CsvParsingEngine.PYTHON, CsvParsingEngine.PYARROW):
+        config_format = CsvFormat(inference_type=inference_type, parsing_engine=engine, block_size=4096)
+        config = FileBasedStreamConfig(name="test", validation_policy="Emit Record", format=config_format)
+        loop = asyncio.new_event_loop()
+        schemas.append(
+            loop.run_until_complete(
+                CsvParser().infer_schema(
+                    config, RemoteFile(uri="a uri", last_modified=datetime.now()), _stream_reader_for("\n".join(rows)), logger
+                )
+            )
+        )
+    assert schemas[1] == schemas[0]
+
+
+@pytest.mark.parametrize(
+    "rows, expected_python_engine_reads",
+    [
+        pytest.param(_ROWS, 0, id="test_given_valid_rows_then_only_read_headers_with_csv_module"),
+        pytest.param(["id,name", "1,a", "2"], 1, id="test_given_mismatched_row_then_read_data_with_csv_module"),
+    ],
+)
+def test_given_pyarrow_engine_when_parse_records_then_fall_back_on_python_engine_only_on_error(rows, expected_python_engine_reads) -> None:
+    csv_reader = Mock(wraps=_CsvReader())
+    config = FileBasedStreamConfig(name="test", validation_policy="Emit Record", format=CsvFormat(parsing_engine=CsvParsingEngine.PYARROW))
+
+    with pytest.raises(RecordParseError) if expected_python_engine_reads else nullcontext():
+        list(
+            CsvParser(csv_reader).parse_records(
+                config, RemoteFile(uri="a uri", last_modified=datetime.now()), _stream_reader_for("\n".join(rows)), logger, _SCHEMA
+            )
+        )
+
+    assert csv_reader.read_headers.call_count == 1
+    assert csv_reader.read_data.call_count == expected_python_engine_reads
@@ -156,3 +156,43 @@ def test_given_unparsable_json_when_parse_records_then_raise_error(stream_reader
     with pytest.raises(RecordParseError):
         list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
     assert logger.warning.call_count == 0
+
+
+def test_given_concatenated_json_objects_on_one_line_when_parse_records_then_return_all_records(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO('{"a": 1} {"a": 2}{"a": 3}\n{"a": 4}\n')
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert records == [{"a": 1}, {"a": 2}, {"a": 3}, {"a": 4}]
+
+
+def test_given_multiline_json_object_with_structure_characters_in_strings_when_parse_records_then_return_records(
+    stream_reader: MagicMock,
+) -> None:
+    content = [
+        {"a": '{"not": ["an", "object"}', "b": 'an \\" escaped quote and a \\\\', "c": [{"nested": [1, 2]}, "}]"]},
+        {"a": 2, "b": "é", "c": []},
+    ]
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO(
+        "".join(json.dumps(record, indent=2) + "\n" for record in content)
+    )
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert records == content
+
+
+def test_given_pretty_printed_and_single_line_records_when_parse_records_then_return_records_in_order(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO('{"a": 1}\n\n{\n  "a": [\n    2\n  ]\n}\n{"a": 3}\n')
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert records == [{"a": 1}, {"a": [2]}, {"a": 3}]
+
+
+def test_given_unparsable_json_after_records_when_parse_records_then_stop_without_error(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO('{"a": 1}\n{"a": 2,}\n{"a": 3}\n')
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert records == [{"a": 1}]
+
+
+def test_given_truncated_multiline_json_object_when_parse_records_then_raise_error(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO('{\n  "a": 1,\n  "b": "}\n')
+    with pytest.raises(RecordParseError):
+        list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
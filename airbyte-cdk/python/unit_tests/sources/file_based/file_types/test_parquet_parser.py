@@ -4,16 +4,20 @@
 
 import asyncio
 import datetime
+import io
 import math
-from typing import Any, Mapping, Union
+from decimal import Decimal
+from typing import Any, List, Mapping, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
 from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
 from airbyte_cdk.sources.file_based.config.parquet_format import ParquetFormat
+from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_types import ParquetParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from pyarrow import Scalar
@@ -272,3 +276,114 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
     logger = Mock()
     with pytest.raises(ValueError):
         asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
+
+
+@pytest.mark.parametrize(
+    "pyarrow_type, parquet_format, values",
+    [
+        pytest.param(pa.int64(), _default_parquet_format, [1, None, 3], id="test_int64"),
+        pytest.param(pa.string(), _default_parquet_format, ["a", None, "é"], id="test_string"),
+        pytest.param(pa.time64("ns"), _default_parquet_format, [datetime.time(9, 10, 11), None], id="test_time64ns"),
+        pytest.param(
+            pa.timestamp("us"), _default_parquet_format, [datetime.datetime(2023, 7, 7, 10, 11, 12, 13), None], id="test_timestamp_us"
+        ),
+        pytest.param(
+            pa.timestamp("ns", "utc"),
+            _default_parquet_format,
+            [datetime.datetime(2020, 1, 1, 1, 1, 1, tzinfo=datetime.timezone.utc), None],
+            id="test_timestamp_ns_with_tz",
+        ),
+        pytest.param(pa.date32(), _default_parquet_format, [datetime.date(2023, 7, 7), None], id="test_date32"),
+        pytest.param(pa.duration("ns"), _default_parquet_format, [12345, None], id="test_duration_ns"),
+        pytest.param(pa.duration("ms"), _default_parquet_format, [12345, None], id="test_duration_ms"),
+        pytest.param(pa.month_day_nano_interval(), _default_parquet_format, [datetime.timedelta(days=3), None], id="test_interval"),
+        pytest.param(pa.binary(), _default_parquet_format, [b"binary", None, "é".encode("utf-8")], id="test_binary"),
+        pytest.param(pa.large_binary(), _default_parquet_format, [b"large binary", None], id="test_large_binary"),
+        pytest.param(pa.binary(2), _default_parquet_format, [b"t1", None], id="test_fixed_size_binary"),
+        pytest.param(pa.decimal128(5, 3), _default_parquet_format, [Decimal("12.345"), None], id="test_decimal"),
+        pytest.param(pa.decimal256(8, 2), _decimal_as_float_parquet_format, [Decimal("13.1"), None], id="test_decimal_as_float"),
+        pytest.param(pa.map_(pa.string(), pa.int32()), _default_parquet_format, [{"hello": 1}, None], id="test_map"),
+        pytest.param(pa.struct([pa.field("field", pa.int32())]), _default_parquet_format, [{"field": 1}, None], id="test_struct"),
+        pytest.param(pa.list_(pa.int32()), _default_parquet_format, [[1, 2], None], id="test_list"),
+        pytest.param(pa.dictionary(pa.int32(), pa.string()), _default_parquet_format, ["apple", None, "apple"], id="test_dictionary"),
+        pytest.param(pa.null(), _default_parquet_format, [None, None], id="test_null"),
+    ],
+)
+def test_column_transformation_is_identical_to_value_transformation(
+    pyarrow_type: pa.DataType, parquet_format: ParquetFormat, values: List[Any]
+) -> None:
+    column = pa.array(values, type=pyarrow_type)
+    assert ParquetParser._to_output_values(column, parquet_format) == [
+        ParquetParser._to_output_value(value, parquet_format) for value in column
+    ]
+
+
+def _parquet_stream_reader(table: pa.Table, row_group_size: int) -> Mock:
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, row_group_size=row_group_size)
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=io.BytesIO(buffer.getvalue()))
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    return stream_reader
+
+
+def _parquet_config(validation_policy: ValidationPolicy = ValidationPolicy.emit_record) -> FileBasedStreamConfig:
+    return FileBasedStreamConfig(name="test", format=ParquetFormat(), validation_policy=validation_policy)
+
+
+_TABLE = pa.table(
+    {
+        "id": pa.array(range(5), type=pa.int64()),
+        "created_at": pa.array([datetime.datetime(2024, 1, 1, i) for i in range(5)], type=pa.timestamp("us")),
+        "payload": pa.array([f"payload {i}".encode("utf-8") for i in range(5)], type=pa.binary()),
+    }
+)
+
+
+def test_given_batch_size_smaller_than_row_groups_when_parse_records_then_records_are_in_order() -> None:
+    file = RemoteFile(uri="s3://mybucket/year=2024/test.parquet", last_modified=datetime.datetime.now())
+
+    records = list(ParquetParser(batch_size=2).parse_records(_parquet_config(), file, _parquet_stream_reader(_TABLE, 3), Mock(), None))
+
+    assert records == [{"id": i, "created_at": f"2024-01-01T0{i}:00:00", "payload": f"payload {i}", "year": "2024"} for i in range(5)]
+
+
+def test_given_catalog_schema_when_parse_records_then_only_read_catalog_columns() -> None:
+    file = RemoteFile(uri="s3://mybucket/test.parquet", last_modified=datetime.datetime.now())
+    catalog_schema = {"type": "object", "properties": {"id": {"type": "integer"}, "_ab_source_file_url": {"type": "string"}}}
+
+    records = list(ParquetParser().parse_records(_parquet_config(), file, _parquet_stream_reader(_TABLE, 3), Mock(), catalog_schema))
+
+    assert records == [{"id": i} for i in range(5)]
+
+
+@pytest.mark.parametrize(
+    "catalog_schema, validation_policy",
+    [
+        pytest.param(
+            {"type": "object", "properties": {"unknown": {"type": "string"}}}, ValidationPolicy.emit_record, id="test_no_matching_column"
+        ),
+        pytest.param({"type": "object"}, ValidationPolicy.emit_record, id="test_no_properties"),
+        pytest.param(
+            {"type": "object", "properties": {"id": {"type": "integer"}}}, ValidationPolicy.wait_for_discover, id="test_wait_for_discover"
+        ),
+    ],
+)
+def test_given_catalog_schema_cannot_be_used_for_projection_when_parse_records_then_read_all_columns(
+    catalog_schema, validation_policy
+) -> None:
+    file = RemoteFile(uri="s3://mybucket/test.parquet", last_modified=datetime.datetime.now())
+
+    records = list(
+        ParquetParser().parse_records(_parquet_config(validation_policy), file, _parquet_stream_reader(_TABLE, 3), Mock(), catalog_schema)
+    )
+
+    assert [set(record.keys()) for record in records] == [{"id", "created_at", "payload"}] * 5
+
+
+def test_given_invalid_utf8_binary_when_parse_records_then_raise_record_parse_error() -> None:
+    file = RemoteFile(uri="s3://mybucket/test.parquet", last_modified=datetime.datetime.now())
+    table = pa.table({"payload": pa.array([b"\xff\xfe"], type=pa.binary())})
+
+    with pytest.raises(RecordParseError):
+        list(ParquetParser().parse_records(_parquet_config(), file, _parquet_stream_reader(table, 3), Mock(), None))
@@ -112,7 +112,10 @@ class InMemoryFilesStreamReader(AbstractFileBasedStreamReader):
 
     def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
         if self.file_type == "csv":
-            return self._make_csv_file_contents(file.uri)
+            csv_file = self._make_csv_file_contents(file.uri)
+            if mode == FileReadMode.READ_BINARY:
+                return io.BytesIO(csv_file.getvalue().encode(encoding or "utf8"))
+            return csv_file
         elif self.file_type == "jsonl":
             return self._make_jsonl_file_contents(file.uri)
         elif self.file_type == "unstructured":
@@ -120,7 +123,7 @@ class InMemoryFilesStreamReader(AbstractFileBasedStreamReader):
         else:
             raise NotImplementedError(f"No implementation for file type: {self.file_type}")
 
-    def _make_csv_file_contents(self, file_name: str) -> IOBase:
+    def _make_csv_file_contents(self, file_name: str) -> io.StringIO:
 
         # Some tests define the csv as an array of strings to make it easier to validate the handling
         # of quotes, delimiter, and escpare chars.
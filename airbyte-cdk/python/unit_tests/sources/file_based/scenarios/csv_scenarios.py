@@ -271,6 +271,19 @@ single_csv_scenario: TestScenario[InMemoryFilesSource] = (
                                                     "default": False,
                                                     "description": "Whether to ignore errors that occur when the number of fields in the CSV does not match the number of columns in the schema.",
                                                 },
+                                                "parsing_engine": {
+                                                    "title": "Parsing Engine",
+                                                    "description": "The library used to parse the CSV data. PyArrow parses the data in blocks and casts the values column by column, which is significantly faster on large files. It emits the same records as the Python engine and falls back to it for the files it cannot parse.",
+                                                    "default": "Python",
+                                                    "enum": ["Python", "PyArrow"],
+                                                },
+                                                "block_size": {
+                                                    "title": "Block Size",
+                                                    "description": "The number of bytes parsed at once by the PyArrow engine. It must be larger than the largest row of the files.",
+                                                    "default": 1048576,
+                                                    "airbyte_hidden": True,
+                                                    "type": "integer",
+                                                },
                                             },
                                             "required": ["filetype"],
                                         },
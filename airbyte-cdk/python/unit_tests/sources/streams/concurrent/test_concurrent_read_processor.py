@@ -28,7 +28,7 @@ from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionE
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, RecordBatch
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 
 _STREAM_NAME = "stream"
@@ -166,7 +166,9 @@ class TestConcurrentReadProcessor(unittest.TestCase):
 
         handler.on_partition(self._a_closed_partition)
 
-        self._thread_pool_manager.submit.assert_called_with(self._partition_reader.process_partition, self._a_closed_partition)
+        self._thread_pool_manager.submit.assert_called_with(
+            self._partition_reader.process_partition, self._a_closed_partition, reserved=True
+        )
         assert self._a_closed_partition in handler._streams_to_running_partitions[_ANOTHER_STREAM_NAME]
 
     def test_handle_partition_emits_log_message_if_it_should_be_logged(self):
@@ -187,7 +189,9 @@ class TestConcurrentReadProcessor(unittest.TestCase):
 
         handler.on_partition(self._an_open_partition)
 
-        self._thread_pool_manager.submit.assert_called_with(self._partition_reader.process_partition, self._an_open_partition)
+        self._thread_pool_manager.submit.assert_called_with(
+            self._partition_reader.process_partition, self._an_open_partition, reserved=True
+        )
         self._message_repository.emit_message.assert_called_with(self._log_message)
 
         assert self._an_open_partition in handler._streams_to_running_partitions[_STREAM_NAME]
@@ -514,6 +518,47 @@ class TestConcurrentReadProcessor(unittest.TestCase):
         ]
         assert messages == expected_messages
 
+    @freezegun.freeze_time("2020-01-01T00:00:00")
+    def test_on_record_batch_emits_records_in_order_then_repository_messages(self):
+        repository_message = AirbyteMessage(
+            type=MessageType.LOG, log=AirbyteLogMessage(level=LogLevel.INFO, message="message emitted from the repository")
+        )
+        self._message_repository.consume_queue.return_value = [repository_message]
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        records_data = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+        messages = list(handler.on_record_batch(RecordBatch([Record(data, _STREAM_NAME) for data in records_data], _STREAM_NAME)))
+
+        assert messages == [
+            AirbyteMessage(
+                type=MessageType.TRACE,
+                trace=AirbyteTraceMessage(
+                    type=TraceType.STREAM_STATUS,
+                    emitted_at=1577836800000.0,
+                    stream_status=AirbyteStreamStatusTraceMessage(
+                        stream_descriptor=StreamDescriptor(name=_STREAM_NAME), status=AirbyteStreamStatus(AirbyteStreamStatus.RUNNING)
+                    ),
+                ),
+            ),
+        ] + [
+            AirbyteMessage(
+                type=MessageType.RECORD,
+                record=AirbyteRecordMessage(stream=_STREAM_NAME, data=data, emitted_at=1577836800000),
+            )
+            for data in records_data
+        ] + [
+            repository_message
+        ]
+        assert handler._record_counter[_STREAM_NAME] == 3
+
     @freezegun.freeze_time("2020-01-01T00:00:00")
     def test_on_exception_return_trace_message_and_on_stream_complete_return_stream_status(self):
         stream_instances_to_read_from = [self._stream, self._another_stream]
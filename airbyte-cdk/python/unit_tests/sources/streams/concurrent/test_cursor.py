@@ -164,6 +164,67 @@ class ConcurrentCursorStateTest(TestCase):
         with pytest.raises(KeyError):
             cursor.close_partition(_partition({"not_matching_key": "value"}))
 
+    def test_given_partitions_closed_out_of_order_when_close_partition_then_emit_merged_state(self) -> None:
+        cursor = self._cursor_with_slice_boundary_fields(is_sequential_state=False)
+        cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 20, _UPPER_SLICE_BOUNDARY_FIELD: 30}))
+        cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 1, _UPPER_SLICE_BOUNDARY_FIELD: 10}))
+        cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 10, _UPPER_SLICE_BOUNDARY_FIELD: 20}))
+
+        assert [call.args[2]["slices"] for call in self._state_manager.update_state_for_stream.call_args_list] == [
+            [{"start": 0, "end": 0}, {"start": 20, "end": 30}],
+            [{"start": 0, "end": 10}, {"start": 20, "end": 30}],
+            [{"start": 0, "end": 30}],
+        ]
+
+    def test_given_state_emission_partition_count_when_close_partition_then_emit_state_once_per_count(self) -> None:
+        cursor = ConcurrentCursor(
+            _A_STREAM_NAME,
+            _A_STREAM_NAMESPACE,
+            {},
+            self._message_repository,
+            self._state_manager,
+            EpochValueConcurrentStreamStateConverter(is_sequential_state=True),
+            CursorField(_A_CURSOR_FIELD_KEY),
+            _SLICE_BOUNDARY_FIELDS,
+            None,
+            EpochValueConcurrentStreamStateConverter.get_end_provider(),
+            _NO_LOOKBACK_WINDOW,
+            state_emission_partition_count=3,
+        )
+        for lower_boundary in range(0, 50, 10):
+            cursor.close_partition(
+                _partition({_LOWER_SLICE_BOUNDARY_FIELD: lower_boundary, _UPPER_SLICE_BOUNDARY_FIELD: lower_boundary + 10})
+            )
+
+        assert [call.args[2] for call in self._state_manager.update_state_for_stream.call_args_list] == [{_A_CURSOR_FIELD_KEY: 30}]
+
+        cursor.ensure_at_least_one_state_emitted()
+
+        assert self._state_manager.update_state_for_stream.call_args_list[-1].args[2] == {_A_CURSOR_FIELD_KEY: 50}
+
+    def test_given_state_emission_interval_when_close_partition_then_emit_state_once_interval_elapsed(self) -> None:
+        with freezegun.freeze_time("2024-01-01T00:00:00Z") as frozen_time:
+            cursor = ConcurrentCursor(
+                _A_STREAM_NAME,
+                _A_STREAM_NAMESPACE,
+                {},
+                self._message_repository,
+                self._state_manager,
+                EpochValueConcurrentStreamStateConverter(is_sequential_state=True),
+                CursorField(_A_CURSOR_FIELD_KEY),
+                _SLICE_BOUNDARY_FIELDS,
+                None,
+                EpochValueConcurrentStreamStateConverter.get_end_provider(),
+                _NO_LOOKBACK_WINDOW,
+                state_emission_interval=timedelta(seconds=60),
+            )
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 0, _UPPER_SLICE_BOUNDARY_FIELD: 10}))
+            frozen_time.tick(timedelta(seconds=61))
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 10, _UPPER_SLICE_BOUNDARY_FIELD: 20}))
+            cursor.close_partition(_partition({_LOWER_SLICE_BOUNDARY_FIELD: 20, _UPPER_SLICE_BOUNDARY_FIELD: 30}))
+
+        assert [call.args[2] for call in self._state_manager.update_state_for_stream.call_args_list] == [{_A_CURSOR_FIELD_KEY: 20}]
+
     @freezegun.freeze_time(time_to_freeze=datetime.fromtimestamp(50, timezone.utc))
     def test_given_no_state_when_generate_slices_then_create_slice_from_start_to_end(self):
         start = datetime.fromtimestamp(10, timezone.utc)
@@ -2,12 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from airbyte_cdk.sources.streams.concurrent.cursor import CursorField
 from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_state_converter import ConcurrencyCompatibleStateType
 from airbyte_cdk.sources.streams.concurrent.state_converters.datetime_stream_state_converter import (
+    CustomFormatConcurrentStreamStateConverter,
     EpochValueConcurrentStreamStateConverter,
     IsoMillisConcurrentStreamStateConverter,
 )
@@ -335,6 +336,30 @@ def test_convert_from_sequential_state(converter, start, sequential_state, expec
             {"created": "2021-03-29T15:06:43.000Z"},
             id="isomillis-multiple-slices",
         ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d", cursor_granularity=timedelta(days=1)),
+            {
+                "state_type": "date-range",
+                "slices": [
+                    {"start": datetime(2021, 1, 1, tzinfo=timezone.utc), "end": datetime(2021, 1, 31, tzinfo=timezone.utc)},
+                    {"start": datetime(2021, 2, 1, tzinfo=timezone.utc), "end": datetime(2021, 2, 28, tzinfo=timezone.utc)},
+                ],
+            },
+            {"created": "2021-02-28"},
+            id="custom-format-consecutive-slices-within-granularity",
+        ),
+        pytest.param(
+            CustomFormatConcurrentStreamStateConverter("%Y-%m-%d"),
+            {
+                "state_type": "date-range",
+                "slices": [
+                    {"start": datetime(2021, 1, 1, tzinfo=timezone.utc), "end": datetime(2021, 1, 31, tzinfo=timezone.utc)},
+                    {"start": datetime(2021, 2, 1, tzinfo=timezone.utc), "end": datetime(2021, 2, 28, tzinfo=timezone.utc)},
+                ],
+            },
+            {"created": "2021-01-31"},
+            id="custom-format-slices-with-gap",
+        ),
     ],
 )
 def test_convert_to_sequential_state(converter, concurrent_state, expected_output_state):
@@ -367,3 +392,60 @@ def test_convert_to_sequential_state(converter, concurrent_state, expected_outpu
 def test_convert_to_sequential_state_no_slices_returns_legacy_state(converter, concurrent_state, expected_output_state):
     with pytest.raises(RuntimeError):
         converter.convert_to_state_message(CursorField("created"), concurrent_state)
+
+
+@pytest.mark.parametrize(
+    "input_datetime_formats, value, expected_datetime",
+    [
+        pytest.param(None, "2021-01-18", datetime(2021, 1, 18, tzinfo=timezone.utc), id="test_given_datetime_format_then_parse"),
+        pytest.param(
+            ["%Y-%m-%dT%H:%M:%SZ"],
+            "2021-01-18T21:18:20Z",
+            datetime(2021, 1, 18, 21, 18, 20, tzinfo=timezone.utc),
+            id="test_given_input_datetime_format_then_parse",
+        ),
+    ],
+)
+def test_custom_format_converter_parse_timestamp(input_datetime_formats, value, expected_datetime):
+    converter = CustomFormatConcurrentStreamStateConverter("%Y-%m-%d", input_datetime_formats)
+    assert converter.parse_timestamp(value) == expected_datetime
+
+
+def test_custom_format_converter_raises_error_on_unknown_format():
+    with pytest.raises(ValueError):
+        CustomFormatConcurrentStreamStateConverter("%Y-%m-%d").parse_timestamp("18/01/2021")
+
+
+@pytest.mark.parametrize(
+    "intervals",
+    [
+        pytest.param([(0, 10), (11, 20), (21, 30)], id="test_given_consecutive_intervals_then_merged"),
+        pytest.param([(21, 30), (0, 10), (11, 20)], id="test_given_interval_filling_gap_then_merged_with_both_neighbours"),
+        pytest.param([(0, 10), (20, 30), (40, 50), (5, 45)], id="test_given_interval_overlapping_many_then_merged"),
+        pytest.param([(0, 10), (20, 30), (15, 16), (40, 50)], id="test_given_disjoint_intervals_then_kept_sorted"),
+        pytest.param([(10, 20), (10, 15), (5, 9), (30, 30)], id="test_given_intervals_with_same_start_then_merged"),
+        pytest.param([(7, 8), (3, 4), (13, 20), (1, 2), (9, 12), (0, 0)], id="test_given_out_of_order_intervals_then_merged"),
+    ],
+)
+def test_insert_interval_is_equivalent_to_merge_intervals(intervals):
+    converter = EpochValueConcurrentStreamStateConverter()
+    intervals = [{"start": converter.parse_value(start), "end": converter.parse_value(end)} for start, end in intervals]
+    merged_intervals = []
+    for interval in intervals:
+        converter.insert_interval(merged_intervals, dict(interval))
+
+    assert merged_intervals == converter.merge_intervals([dict(interval) for interval in intervals])
+
+
+def test_given_slice_updated_since_previous_serialization_when_serialize_then_serialize_updated_slice():
+    converter = EpochValueConcurrentStreamStateConverter()
+    state = {"slices": [{"start": converter.parse_value(0), "end": converter.parse_value(10)}]}
+    assert converter.serialize(state, ConcurrencyCompatibleStateType.date_range)["slices"] == [{"start": 0, "end": 10}]
+
+    state["slices"][0]["end"] = converter.parse_value(20)
+    state["slices"].append({"start": converter.parse_value(30), "end": converter.parse_value(40)})
+
+    assert converter.serialize(state, ConcurrencyCompatibleStateType.date_range)["slices"] == [
+        {"start": 0, "end": 20},
+        {"start": 30, "end": 40},
+    ]
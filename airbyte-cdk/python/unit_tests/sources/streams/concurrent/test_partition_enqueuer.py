@@ -4,7 +4,7 @@
 import unittest
 from queue import Queue
 from typing import Callable, Iterable, List
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import PartitionGenerationCompletedSentinel
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
@@ -22,20 +22,16 @@ class PartitionEnqueuerTest(unittest.TestCase):
     def setUp(self) -> None:
         self._queue: Queue[QueueItem] = Queue()
         self._thread_pool_manager = Mock(spec=ThreadPoolManager)
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.return_value = False
         self._partition_generator = PartitionEnqueuer(self._queue, self._thread_pool_manager)
 
-    @patch("airbyte_cdk.sources.streams.concurrent.partition_enqueuer.time.sleep")
-    def test_given_no_partitions_when_generate_partitions_then_do_not_wait(self, mocked_sleep):
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.return_value = True  # shouldn't be called but just in case
+    def test_given_no_partitions_when_generate_partitions_then_do_not_wait(self):
         stream = self._a_stream([])
 
         self._partition_generator.generate_partitions(stream)
 
-        assert mocked_sleep.call_count == 0
+        assert self._thread_pool_manager.wait_until_futures_limit_not_reached.call_count == 0
 
     def test_given_no_partitions_when_generate_partitions_then_only_push_sentinel(self):
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.return_value = True
         stream = self._a_stream([])
 
         self._partition_generator.generate_partitions(stream)
@@ -43,21 +39,18 @@ class PartitionEnqueuerTest(unittest.TestCase):
         assert self._consume_queue() == [PartitionGenerationCompletedSentinel(stream)]
 
     def test_given_partitions_when_generate_partitions_then_return_partitions_before_sentinel(self):
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.return_value = False
         stream = self._a_stream(_SOME_PARTITIONS)
 
         self._partition_generator.generate_partitions(stream)
 
         assert self._consume_queue() == _SOME_PARTITIONS + [PartitionGenerationCompletedSentinel(stream)]
 
-    @patch("airbyte_cdk.sources.streams.concurrent.partition_enqueuer.time.sleep")
-    def test_given_partition_but_limit_reached_when_generate_partitions_then_wait_until_not_hitting_limit(self, mocked_sleep):
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit.side_effect = [True, True, False]
-        stream = self._a_stream([Mock(spec=Partition)])
+    def test_given_partitions_when_generate_partitions_then_wait_until_not_hitting_limit_before_each_partition(self):
+        stream = self._a_stream(_SOME_PARTITIONS)
 
         self._partition_generator.generate_partitions(stream)
 
-        assert mocked_sleep.call_count == 2
+        assert self._thread_pool_manager.wait_until_futures_limit_not_reached.call_count == len(_SOME_PARTITIONS)
 
     def test_given_exception_when_generate_partitions_then_return_exception_and_sentinel(self):
         stream = Mock(spec=AbstractStream)
@@ -68,7 +61,10 @@ class PartitionEnqueuerTest(unittest.TestCase):
         self._partition_generator.generate_partitions(stream)
 
         queue_content = self._consume_queue()
-        assert queue_content == _SOME_PARTITIONS + [StreamThreadException(exception, _A_STREAM_NAME), PartitionGenerationCompletedSentinel(stream)]
+        assert queue_content == _SOME_PARTITIONS + [
+            StreamThreadException(exception, _A_STREAM_NAME),
+            PartitionGenerationCompletedSentinel(stream),
+        ]
 
     def _partitions_before_raising(self, partitions: List[Partition], exception: Exception) -> Callable[[], Iterable[Partition]]:
         def inner_function() -> Iterable[Partition]:
@@ -11,7 +11,7 @@ from airbyte_cdk.sources.concurrent_source.stream_thread_exception import Stream
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
-from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem, RecordBatch
 
 _RECORDS = [
     Record({"id": 1, "name": "Jack"}, "stream"),
@@ -50,6 +50,51 @@ class PartitionReaderTest(unittest.TestCase):
 
         assert queue_content == _RECORDS + [StreamThreadException(exception, partition.stream_name()), PartitionCompleteSentinel(partition)]
 
+    def test_given_batch_size_when_process_partition_then_queue_records_in_ordered_batches(self):
+        records = [Record({"id": i}, "stream") for i in range(5)]
+        partition = self._a_partition(records)
+        partition.stream_name.return_value = "stream"
+
+        PartitionReader(self._queue, max_batch_size=2).process_partition(partition)
+
+        assert self._consume_queue() == [
+            RecordBatch(records[0:2], "stream"),
+            RecordBatch(records[2:4], "stream"),
+            RecordBatch(records[4:5], "stream"),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_batch_bytes_reached_when_process_partition_then_queue_batch_before_batch_size(self):
+        records = [Record({"id": i, "payload": "x" * 1000}, "stream") for i in range(3)]
+        partition = self._a_partition(records)
+        partition.stream_name.return_value = "stream"
+
+        PartitionReader(self._queue, max_batch_size=100, max_batch_bytes=1000).process_partition(partition)
+
+        assert self._consume_queue() == [
+            RecordBatch(records[0:1], "stream"),
+            RecordBatch(records[1:2], "stream"),
+            RecordBatch(records[2:3], "stream"),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_exception_when_process_partition_with_batches_then_queue_pending_batch_before_exception(self):
+        partition = Mock()
+        exception = ValueError()
+        partition.read.side_effect = self._read_with_exception(_RECORDS, exception)
+
+        PartitionReader(self._queue, max_batch_size=100).process_partition(partition)
+
+        assert self._consume_queue() == [
+            RecordBatch(_RECORDS, partition.stream_name()),
+            StreamThreadException(exception, partition.stream_name()),
+            PartitionCompleteSentinel(partition),
+        ]
+
+    def test_given_batch_size_lower_than_one_when_init_then_raise(self):
+        with pytest.raises(ValueError):
+            PartitionReader(self._queue, max_batch_size=0)
+
     def _a_partition(self, records: List[Record]) -> Partition:
         partition = Mock(spec=Partition)
         partition.read.return_value = iter(records)
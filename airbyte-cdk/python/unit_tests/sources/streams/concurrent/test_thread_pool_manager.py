@@ -1,7 +1,9 @@
 #
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
+import threading
 from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List
 from unittest import TestCase
 from unittest.mock import Mock
 
@@ -11,71 +13,110 @@ from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPool
 class ThreadPoolManagerTest(TestCase):
     def setUp(self):
         self._threadpool = Mock(spec=ThreadPoolExecutor)
+        self._submitted_futures: List[Future] = []
+        self._threadpool.submit.side_effect = self._create_future
         self._thread_pool_manager = ThreadPoolManager(self._threadpool, Mock(), max_concurrent_tasks=1)
         self._fn = lambda x: x
         self._arg = "arg"
 
+    def _create_future(self, *args: Any) -> Future:
+        future: Future = Future()
+        self._submitted_futures.append(future)
+        return future
+
+    def _submit(self) -> Future:
+        self._thread_pool_manager.submit(self._fn, self._arg)
+        return self._submitted_futures[-1]
+
     def test_submit_calls_underlying_thread_pool(self):
         self._thread_pool_manager.submit(self._fn, self._arg)
         self._threadpool.submit.assert_called_with(self._fn, self._arg)
 
         assert len(self._thread_pool_manager._futures) == 1
 
-    def test_given_exception_during_pruning_when_check_for_errors_and_shutdown_then_shutdown_and_raise(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = RuntimeError
-        future.done.side_effect = [True, True]
-
-        self._thread_pool_manager._futures = [future]
-        self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
+    def test_given_exception_in_future_when_check_for_errors_and_shutdown_then_shutdown_and_raise(self):
+        self._submit().set_exception(ValueError())
 
         with self.assertRaises(RuntimeError):
             self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
 
     def test_is_done_is_false_if_not_all_futures_are_done(self):
-        future = Mock(spec=Future)
-        future.done.return_value = False
-
-        self._thread_pool_manager._futures = [future]
+        self._submit().set_result(None)
+        self._submit()
 
         assert not self._thread_pool_manager.is_done()
 
     def test_is_done_is_true_if_all_futures_are_done(self):
-        future = Mock(spec=Future)
-        future.done.return_value = True
-
-        self._thread_pool_manager._futures = [future]
+        self._submit().set_result(None)
+        self._submit().set_result(None)
 
         assert self._thread_pool_manager.is_done()
 
-    def test_threadpool_shutdown_if_errors(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = RuntimeError
-
-        self._thread_pool_manager._futures = [future]
+    def test_given_cancelled_future_when_is_done_then_future_is_done(self):
+        self._submit().cancel()
 
-        with self.assertRaises(RuntimeError):
-            self._thread_pool_manager.check_for_errors_and_shutdown()
-        self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+        assert self._thread_pool_manager.is_done()
 
-    def test_check_for_errors_and_shutdown_raises_error_if_futures_are_not_done(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = None
-        future.done.return_value = False
+    def test_given_future_not_done_when_check_for_errors_and_shutdown_then_wait_for_future_before_shutdown(self):
+        future = self._submit()
+        checking_thread = threading.Thread(target=self._thread_pool_manager.check_for_errors_and_shutdown)
+        checking_thread.start()
+        checking_thread.join(timeout=0.1)
+        assert checking_thread.is_alive()
+        self._threadpool.shutdown.assert_not_called()
 
-        self._thread_pool_manager._futures = [future]
+        future.set_result(None)
 
-        with self.assertRaises(RuntimeError):
-            self._thread_pool_manager.check_for_errors_and_shutdown()
+        checking_thread.join(timeout=5)
+        assert not checking_thread.is_alive()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
 
     def test_check_for_errors_and_shutdown_does_not_raise_error_if_futures_are_done(self):
-        future = Mock(spec=Future)
-        future.exception.return_value = None
-        future.done.return_value = True
-
-        self._thread_pool_manager._futures = [future]
+        self._submit().set_result(None)
 
         self._thread_pool_manager.check_for_errors_and_shutdown()
         self._threadpool.shutdown.assert_called_with(wait=False, cancel_futures=True)
+
+    def test_given_pending_future_when_prune_to_validate_has_reached_futures_limit_then_limit_reached_until_future_done(self):
+        future = self._submit()
+        assert self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
+
+        future.set_result(None)
+
+        assert not self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
+
+    def test_given_limit_reached_when_wait_until_futures_limit_not_reached_then_wake_up_once_future_done(self):
+        future = self._submit()
+        waiting_thread = threading.Thread(target=self._thread_pool_manager.wait_until_futures_limit_not_reached)
+        waiting_thread.start()
+        waiting_thread.join(timeout=0.1)
+        assert waiting_thread.is_alive()
+
+        future.set_result(None)
+
+        waiting_thread.join(timeout=5)
+        assert not waiting_thread.is_alive()
+
+    def test_given_task_reserved_when_prune_to_validate_has_reached_futures_limit_then_limit_reached_until_submitted_task_done(self):
+        self._thread_pool_manager.wait_until_futures_limit_not_reached()
+        assert self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
+
+        self._thread_pool_manager.submit(self._fn, self._arg, reserved=True)
+        future = self._submitted_futures[-1]
+        assert self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
+
+        future.set_result(None)
+        assert not self._thread_pool_manager.prune_to_validate_has_reached_futures_limit()
+
+    def test_given_task_submitted_without_reservation_when_submit_then_reservations_are_kept(self):
+        self._thread_pool_manager = ThreadPoolManager(self._threadpool, Mock(), max_concurrent_tasks=2)
+        self._thread_pool_manager.wait_until_futures_limit_not_reached()
+
+        self._submit().set_result(None)
+        assert self._thread_pool_manager._pending_tasks() == 1
+
+        self._thread_pool_manager.submit(self._fn, self._arg, reserved=True)
+        assert self._thread_pool_manager._pending_tasks() == 1
+        self._submitted_futures[-1].set_result(None)
+        assert self._thread_pool_manager._pending_tasks() == 0
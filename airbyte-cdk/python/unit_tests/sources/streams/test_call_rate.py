@@ -4,6 +4,7 @@
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Iterable, Mapping
 
@@ -14,6 +15,7 @@ from airbyte_cdk.sources.streams.call_rate import (
     CallRateLimitHit,
     FixedWindowCallRatePolicy,
     HttpRequestMatcher,
+    HttpRequestRegexMatcher,
     MovingWindowCallRatePolicy,
     Rate,
     UnlimitedCallRatePolicy,
@@ -97,6 +99,36 @@ class TestHttpRequestMatcher:
         assert not matcher(request_factory(url="http://some_url"))
 
 
+class TestHttpRequestRegexMatcher:
+    try_all_types_of_requests = pytest.mark.parametrize(
+        "request_factory",
+        [Request, lambda *args, **kwargs: Request(*args, **kwargs).prepare()],
+    )
+
+    @try_all_types_of_requests
+    def test_url_base(self, request_factory):
+        matcher = HttpRequestRegexMatcher(url_base="http://some_url/api/")
+        assert matcher(request_factory(url="http://some_url/api"))
+        assert matcher(request_factory(url="http://some_url/api/users", params={"page": 2}))
+        assert not matcher(request_factory(url="http://some_url/api_v2/users"))
+        assert not matcher(request_factory(url="http://some_wrong_url/api/users"))
+
+    @try_all_types_of_requests
+    def test_url_path_pattern(self, request_factory):
+        matcher = HttpRequestRegexMatcher(method="get", url_path_pattern=r"/users/\d+/orders$")
+        assert matcher(request_factory(method="GET", url="http://some_url/api/users/42/orders", params={"page": 2}))
+        assert not matcher(request_factory(method="POST", url="http://some_url/api/users/42/orders"))
+        assert not matcher(request_factory(method="GET", url="http://some_url/api/users/42/orders/1"))
+        assert not matcher(request_factory(method="GET", url="http://some_url/api/users/me/orders"))
+
+    @try_all_types_of_requests
+    def test_params_and_headers(self, request_factory):
+        matcher = HttpRequestRegexMatcher(params={"param1": 10}, headers={"X-Header": "value"})
+        assert matcher(request_factory(url="http://some_url", params={"param1": 10, "param2": 15}, headers={"x-header": "value"}))
+        assert not matcher(request_factory(url="http://some_url", params={"param1": 10}, headers={"X-Header": "other"}))
+        assert not matcher(request_factory(url="http://some_url", params={"param1": 15}, headers={"X-Header": "value"}))
+
+
 def test_http_request_matching(mocker):
     """Test policy lookup based on matchers."""
     users_policy = mocker.Mock(spec=MovingWindowCallRatePolicy)
@@ -245,6 +277,50 @@ class TestMovingWindowCallRatePolicy:
         assert excinfo.value.time_to_wait.total_seconds() == pytest.approx(3600, 0.1)
         assert str(excinfo.value) == "Bucket for item=call with Rate limit=2/1.0h is already full"
 
+    def test_update_with_no_available_calls_fills_the_window(self):
+        """update must use up the calls left in the window when the API reports that no call is available."""
+        policy = MovingWindowCallRatePolicy(rates=[Rate(10, timedelta(minutes=1))], matchers=[])
+        policy.try_acquire("call", weight=2)
+
+        policy.update(available_calls=0, call_reset_ts=None)
+
+        with pytest.raises(CallRateLimitHit):
+            policy.try_acquire("call", weight=1)
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        pytest.param(
+            FixedWindowCallRatePolicy(
+                next_reset_ts=datetime.now() + timedelta(hours=1), period=timedelta(hours=1), call_limit=50, matchers=[]
+            ),
+            id="test_given_fixed_window_when_acquire_from_threads_then_calls_within_limit",
+        ),
+        pytest.param(
+            MovingWindowCallRatePolicy(rates=[Rate(50, timedelta(hours=1))], matchers=[]),
+            id="test_given_moving_window_when_acquire_from_threads_then_calls_within_limit",
+        ),
+    ],
+)
+def test_api_budget_shared_between_threads(policy):
+    api_budget = APIBudget(policies=[policy])
+
+    def acquire_calls() -> int:
+        acquired = 0
+        for _ in range(20):
+            try:
+                api_budget.acquire_call(Request("GET", url="http://domain/api/users"), block=False)
+                acquired += 1
+            except CallRateLimitHit:
+                pass
+        return acquired
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        acquired_calls = sum(executor.map(lambda _: acquire_calls(), range(8)))
+
+    assert acquired_calls == 50
+
 
 class TestHttpStreamIntegration:
     def test_without_cache(self, mocker, requests_mock):
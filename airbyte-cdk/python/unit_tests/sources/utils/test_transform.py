@@ -205,8 +205,11 @@ VERY_NESTED_SCHEMA = {
         ),
     ],
 )
-def test_transform(schema, actual, expected, expected_warns, caplog):
+@pytest.mark.parametrize("use_compiled_schema", [True, False], ids=["compiled_schema", "jsonschema_traversal"])
+def test_transform(schema, actual, expected, expected_warns, use_compiled_schema, caplog, mocker):
     t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    if not use_compiled_schema:
+        mocker.patch.object(t, "_get_compiled_schema", return_value=None)
     t.transform(actual, schema)
     assert json.dumps(actual) == json.dumps(expected)
     if expected_warns:
@@ -264,3 +267,102 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+def test_given_same_schema_when_transform_then_compile_schema_once(mocker):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    compile_schema = mocker.spy(t, "_normalizer")
+
+    first, second = {"value": 12}, {"value": 13}
+    t.transform(first, SIMPLE_SCHEMA)
+    t.transform(second, SIMPLE_SCHEMA)
+
+    assert (first, second) == ({"value": "12"}, {"value": "13"})
+    assert compile_schema.call_count == 1
+
+
+def test_given_different_schema_when_transform_then_compile_new_normalizer():
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    first, second = {"value": 12}, {"value": "13"}
+    t.transform(first, SIMPLE_SCHEMA)
+    t.transform(second, {"type": "object", "properties": {"value": {"type": "integer"}}})
+
+    assert (first, second) == ({"value": "12"}, {"value": 13})
+
+
+RECURSIVE_SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "children": {"type": "array", "items": {"$ref": "#"}}},
+}
+SCOPED_SCHEMA = {
+    "$id": "http://example.com/root.json",
+    "type": "object",
+    "properties": {"value": {"$ref": "#/definitions/number"}, "nested": {"$ref": "#/definitions/nested"}},
+    "definitions": {
+        "number": {"type": ["null", "number"]},
+        "nested": {"$id": "root.json", "type": "object", "properties": {"a": {"$ref": "#/definitions/number"}}},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "schema, record",
+    [
+        pytest.param(
+            RECURSIVE_SCHEMA,
+            {"id": "1", "children": [{"id": "2", "children": [{"id": "x"}]}, {"id": 3, "children": "not an array"}]},
+            id="test_recursive_schema",
+        ),
+        pytest.param(SCOPED_SCHEMA, {"value": "1.5", "nested": {"a": "1"}}, id="test_refs_resolved_in_scope"),
+        pytest.param(SCOPED_SCHEMA, {"value": "not a number", "nested": None}, id="test_refs_resolved_in_scope_with_errors"),
+        pytest.param(
+            {"type": "object", "properties": {"tuple": {"type": "array", "items": [{"type": "string"}]}}},
+            {"other": [1, 2]},
+            id="test_tuple_items_are_not_compiled",
+        ),
+        pytest.param(
+            {"type": "object", "properties": {"anything": True}},
+            {"other": 1},
+            id="test_boolean_schemas_are_not_compiled",
+        ),
+        pytest.param(
+            {"type": "object", "properties": {f"field_{i}": {"type": "string"} for i in range(10)}},
+            {"field_3": 3, "unknown": 4},
+            id="test_record_smaller_than_schema",
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    "config",
+    [TransformConfig.DefaultSchemaNormalization, TransformConfig.DefaultSchemaNormalization | TransformConfig.CustomSchemaNormalization],
+)
+def test_compiled_schema_transforms_like_jsonschema_traversal(schema, record, config, caplog, mocker):
+    def custom_transform(value, subschema):
+        return value if subschema.get("type") != "integer" else f"custom {value}"
+
+    compiled, traversed = TypeTransformer(config), TypeTransformer(config)
+    if TransformConfig.CustomSchemaNormalization in config:
+        compiled.registerCustomTransform(custom_transform)
+        traversed.registerCustomTransform(custom_transform)
+    mocker.patch.object(traversed, "_get_compiled_schema", return_value=None)
+    compiled_record, traversed_record = json.loads(json.dumps(record)), json.loads(json.dumps(record))
+
+    compiled.transform(compiled_record, schema)
+    compiled_warnings = sorted(r.message for r in caplog.records)
+    caplog.clear()
+    traversed.transform(traversed_record, schema)
+
+    assert compiled_record == traversed_record
+    assert compiled_warnings == sorted(r.message for r in caplog.records)
+
+
+def test_given_custom_transform_registered_after_transform_when_transform_then_apply_custom_transform():
+    t = TypeTransformer(TransformConfig.CustomSchemaNormalization)
+    t.transform({"value": 12}, SIMPLE_SCHEMA)
+
+    t.registerCustomTransform(lambda value, subschema: "transformed")
+    obj = {"value": 12}
+    t.transform(obj, SIMPLE_SCHEMA)
+
+    assert obj == {"value": "transformed"}
@@ -3,6 +3,8 @@
 #
 
 import os
+import socket
+import threading
 from argparse import Namespace
 from collections import defaultdict
 from copy import deepcopy
@@ -30,6 +32,7 @@ from airbyte_cdk.models import (
     AirbyteStreamStatusTraceMessage,
     AirbyteTraceMessage,
     ConnectorSpecification,
+    Level,
     OrchestratorType,
     Status,
     StreamDescriptor,
@@ -259,6 +262,35 @@ def test_run_read(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock)
     assert spec_mock.called
 
 
+def test_given_fast_serialization_when_run_read_then_output_is_identical(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock):
+    parsed_args = Namespace(command="read", config="config_path", state="statepath", catalog="catalogpath")
+    record = AirbyteMessage(record=AirbyteRecordMessage(stream="stream", data={"data": "stüff"}, emitted_at=1), type=Type.RECORD)
+    state = AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="stream"), stream_state=AirbyteStateBlob(cursor=1)),
+        ),
+    )
+    mocker.patch.object(MockSource, "read_state", return_value={})
+    mocker.patch.object(MockSource, "read_catalog", return_value={})
+    mocker.patch.object(MockSource, "read", return_value=[record, state])
+    fast_entrypoint = AirbyteEntrypoint(entrypoint.source, fast_serialization=True)
+
+    messages = list(fast_entrypoint.run(parsed_args))
+
+    assert messages == [MESSAGE_FROM_REPOSITORY.json(exclude_unset=True), record.json(exclude_unset=True), state.json(exclude_unset=True)]
+
+
+def test_given_fast_serialization_when_launch_then_print_messages(entrypoint: AirbyteEntrypoint, mocker, capsys):
+    mocker.patch.object(MockSource, "spec", return_value=ConnectorSpecification(connectionSpecification={}))
+
+    entrypoint_module.launch(entrypoint.source, ["spec"], fast_serialization=True)
+
+    expected_spec = AirbyteMessage(type=Type.SPEC, spec=ConnectorSpecification(connectionSpecification={}))
+    assert capsys.readouterr().out == f"{MESSAGE_FROM_REPOSITORY.json(exclude_unset=True)}\n{expected_spec.json(exclude_unset=True)}\n"
+
+
 def test_given_message_emitted_during_config_when_read_then_emit_message_before_next_steps(
         entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock
 ):
@@ -323,6 +355,95 @@ def test_filter_internal_requests(deployment_mode, url, expected_error):
             assert isinstance(actual_response, requests.Response)
 
 
+def test_given_host_checked_within_ttl_when_is_private_then_do_not_resolve_again():
+    resolve = MagicMock(return_value=False)
+    cache = entrypoint_module._PrivateNetworkCheckCache(resolve, ttl_seconds=60)
+
+    assert cache.is_private("airbyte.com", 443) is False
+    assert cache.is_private("airbyte.com", 443) is False
+
+    resolve.assert_called_once_with("airbyte.com", 443)
+    assert cache.counters() == {"cache_hits": 1, "resolutions": 1, "resolution_errors": 0}
+
+
+def test_given_ttl_expired_when_is_private_then_resolve_again():
+    resolve = MagicMock(side_effect=[False, True])
+    cache = entrypoint_module._PrivateNetworkCheckCache(resolve, ttl_seconds=60)
+
+    with patch.object(entrypoint_module.time, "monotonic", return_value=0):
+        assert cache.is_private("rebinding.example.com", 443) is False
+    with patch.object(entrypoint_module.time, "monotonic", return_value=59):
+        assert cache.is_private("rebinding.example.com", 443) is False
+    with patch.object(entrypoint_module.time, "monotonic", return_value=61):
+        assert cache.is_private("rebinding.example.com", 443) is True
+
+    assert resolve.call_count == 2
+
+
+def test_given_different_ports_when_is_private_then_resolve_each_port():
+    resolve = MagicMock(return_value=False)
+    cache = entrypoint_module._PrivateNetworkCheckCache(resolve, ttl_seconds=60)
+
+    cache.is_private("airbyte.com", 443)
+    cache.is_private("airbyte.com", 8443)
+
+    assert resolve.call_count == 2
+
+
+def test_given_resolution_error_when_is_private_then_raise_and_do_not_cache():
+    resolve = MagicMock(side_effect=[socket.gaierror("resolution failed"), socket.gaierror("resolution failed")])
+    cache = entrypoint_module._PrivateNetworkCheckCache(resolve, ttl_seconds=60)
+
+    for _ in range(2):
+        with pytest.raises(socket.gaierror):
+            cache.is_private("unknown.example.com", 443)
+
+    assert resolve.call_count == 2
+    assert cache.counters() == {"cache_hits": 0, "resolutions": 0, "resolution_errors": 2}
+
+
+def test_given_concurrent_requests_to_same_host_when_is_private_then_resolve_once():
+    resolution_started = threading.Event()
+    release_resolution = threading.Event()
+
+    def _slow_resolve(hostname, port):
+        resolution_started.set()
+        release_resolution.wait(timeout=5)
+        return False
+
+    resolve = MagicMock(side_effect=_slow_resolve)
+    cache = entrypoint_module._PrivateNetworkCheckCache(resolve, ttl_seconds=60)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.is_private("airbyte.com", 443))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    resolution_started.wait(timeout=5)
+    release_resolution.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == [False] * 8
+    resolve.assert_called_once()
+
+
+def test_given_private_network_checks_when_read_then_log_counters_through_message_repository(entrypoint: AirbyteEntrypoint, mocker):
+    mocker.patch.object(MockSource, "read", return_value=[])
+    mocker.patch.object(AirbyteEntrypoint, "set_up_secret_filter")
+    mocker.patch.object(AirbyteEntrypoint, "validate_connection")
+    mocker.patch.object(
+        entrypoint_module._PRIVATE_NETWORK_CHECK_CACHE,
+        "counters",
+        return_value={"cache_hits": 49_999, "resolutions": 1, "resolution_errors": 0},
+    )
+
+    with mock.patch.dict(os.environ, {"DEPLOYMENT_MODE": "CLOUD"}, clear=False):
+        list(entrypoint.read(MagicMock(), {}, {}, {}))
+
+    level, message_provider = entrypoint.source.message_repository.log_message.call_args.args
+    assert level == Level.INFO
+    assert message_provider()["cache_hits"] == 49_999
+
+
 @pytest.mark.parametrize(
     "incoming_message, stream_message_count, expected_message, expected_records_by_stream",
     [
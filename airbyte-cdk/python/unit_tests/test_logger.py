@@ -7,7 +7,7 @@ import logging
 from typing import Dict
 
 import pytest
-from airbyte_cdk.logger import AirbyteLogFormatter
+from airbyte_cdk.logger import AirbyteLogFormatter, truncated_log_extra
 
 
 @pytest.fixture(scope="session")
@@ -92,3 +92,40 @@ def test_fatal(logger, caplog):
     record = caplog.records[0]
     assert record.levelname == "CRITICAL"
     assert record.message == "Test fatal 1"
+
+
+@pytest.mark.parametrize(
+    "value, expected_extra",
+    [
+        pytest.param(None, {"body": None, "body_truncated_bytes": 0}, id="test_given_no_value_then_log_none"),
+        pytest.param(b'{"id": 1}', {"body": '{"id": 1}', "body_truncated_bytes": 0}, id="test_given_small_bytes_then_decode"),
+        pytest.param("short", {"body": "short", "body_truncated_bytes": 0}, id="test_given_small_string_then_log_as_is"),
+        pytest.param(
+            b"0123456789abcdef",
+            {"body": "0123456789...[6 bytes truncated]", "body_truncated_bytes": 6},
+            id="test_given_large_bytes_then_truncate",
+        ),
+        pytest.param(
+            "0123456789é",
+            {"body": "0123456789...[2 bytes truncated]", "body_truncated_bytes": 2},
+            id="test_given_large_string_then_truncate",
+        ),
+        pytest.param(
+            {"id": "0123456789abcdef"},
+            {"body": {"id": "0123456789abcdef"}, "body_truncated_bytes": 0},
+            id="test_given_other_type_then_log_as_is",
+        ),
+    ],
+)
+def test_truncated_log_extra(value, expected_extra):
+    assert truncated_log_extra("body", value, max_bytes=10) == expected_extra
+
+
+def test_truncated_log_extra_is_formatted_in_debug_message(caplog):
+    debug_logger = logging.getLogger("airbyte.Debuglogger")
+    debug_logger.setLevel(logging.DEBUG)
+    debug_logger.debug("Receiving response", extra=truncated_log_extra("body", b"x" * 20, max_bytes=10))
+
+    formatted_record_data = json.loads(AirbyteLogFormatter().format(caplog.records[0]))
+    assert formatted_record_data["data"]["body"] == "xxxxxxxxxx...[10 bytes truncated]"
+    assert formatted_record_data["data"]["body_truncated_bytes"] == "10"
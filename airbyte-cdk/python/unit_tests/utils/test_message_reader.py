@@ -0,0 +1,61 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import io
+
+import pytest
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, Type
+from airbyte_cdk.utils.message_reader import AirbyteMessageReader, RecordMessageView, RecordView
+
+_STATE_MESSAGE = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": 1}))
+
+
+def _read(content: bytes, chunk_size: int = 1024 * 1024):
+    return list(AirbyteMessageReader(chunk_size=chunk_size).read(io.BytesIO(content)))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024 * 1024])
+def test_given_record_messages_when_read_then_return_record_views(chunk_size):
+    records = [
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": i, "name": "ü ✓"}, emitted_at=i))
+        for i in range(3)
+    ]
+    records.append(
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(namespace="public", stream="users", data={"id": 3}, emitted_at=3))
+    )
+    content = "\n".join(record.json(exclude_unset=True) for record in records).encode("utf-8")
+
+    messages = _read(content, chunk_size)
+
+    assert messages == [
+        RecordMessageView(RecordView(record.record.stream, record.record.namespace, record.record.data, record.record.emitted_at))
+        for record in records
+    ]
+    assert all(message.type == Type.RECORD for message in messages)
+
+
+def test_given_non_record_messages_when_read_then_return_validated_airbyte_messages():
+    content = f"{_STATE_MESSAGE.json(exclude_unset=True)}\n".encode("utf-8")
+
+    assert _read(content) == [_STATE_MESSAGE]
+
+
+def test_given_record_missing_required_fields_when_read_then_ignore_it():
+    content = b'{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}}}\n'
+
+    assert _read(content) == []
+
+
+@pytest.mark.parametrize(
+    "invalid_line",
+    [
+        pytest.param(b"not a json", id="test_not_a_json"),
+        pytest.param(b'{"type": "NOT_A_TYPE"}', id="test_unknown_type"),
+        pytest.param(b"\xff\xfe", id="test_not_utf8"),
+    ],
+)
+def test_given_invalid_lines_when_read_then_skip_them(invalid_line):
+    content = b"\n".join([invalid_line, b"", _STATE_MESSAGE.json(exclude_unset=True).encode("utf-8"), invalid_line])
+
+    assert _read(content, chunk_size=5) == [_STATE_MESSAGE]
@@ -0,0 +1,152 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import io
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteLogMessage,
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateBlob,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    Level,
+    StreamDescriptor,
+    Type,
+)
+from airbyte_cdk.utils.message_serializer import AirbyteMessageSerializer, BufferedMessageWriter
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1, "name": "a"}, emitted_at=1)),
+            id="test_record",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(namespace="public", stream="users", data={"id": 1}, emitted_at=1)),
+            id="test_record_with_namespace",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(namespace=None, stream="users", data={"id": 1}, emitted_at=1)),
+            id="test_record_with_explicit_null_namespace",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(
+                    stream='us"ér\ns',
+                    data={
+                        "unicode": "ü ✓ 🚀",
+                        "float": 1.5,
+                        "decimal": Decimal("1.25"),
+                        "datetime": datetime.datetime(2024, 1, 2, 3, 4, 5),
+                        "date": datetime.date(2024, 1, 2),
+                        "nested": {"list": [1, None, True, {"a": [{}]}], "tuple": (1, 2)},
+                        "set": {1},
+                    },
+                    emitted_at=1704164645000,
+                ),
+            ),
+            id="test_record_with_non_json_native_values",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=1, meta={"changes": []})
+            ),
+            id="test_record_with_meta_falls_back_to_pydantic",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=1, extra="value")),
+            id="test_record_with_extra_field_falls_back_to_pydantic",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="a log")),
+            id="test_log",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.STATE,
+                state=AirbyteStateMessage(
+                    type=AirbyteStateType.STREAM,
+                    stream=AirbyteStreamState(
+                        stream_descriptor=StreamDescriptor(name="users"), stream_state=AirbyteStateBlob.parse_obj({"updated_at": 1})
+                    ),
+                ),
+            ),
+            id="test_state",
+        ),
+    ],
+)
+def test_serialize_is_identical_to_pydantic(message):
+    assert AirbyteMessageSerializer().serialize(message) == message.json(exclude_unset=True)
+
+
+def test_given_many_streams_when_serialize_then_envelopes_are_not_mixed_up():
+    serializer = AirbyteMessageSerializer()
+    messages = [
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=1)),
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", namespace="ns", data={"id": 2}, emitted_at=2)),
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="orders", data={"id": 3}, emitted_at=3)),
+    ]
+
+    for _ in range(2):
+        for message in messages:
+            assert serializer.serialize(message) == message.json(exclude_unset=True)
+
+
+def test_given_records_under_thresholds_when_write_then_do_not_flush():
+    stream = MagicMock()
+    writer = BufferedMessageWriter(stream, max_buffer_size=1000, flush_interval=3600)
+
+    writer.write('{"type": "RECORD", "record": {}}')
+
+    stream.write.assert_called_once_with('{"type": "RECORD", "record": {}}\n')
+    stream.flush.assert_not_called()
+
+
+def test_given_buffer_size_reached_when_write_then_flush():
+    stream = MagicMock()
+    writer = BufferedMessageWriter(stream, max_buffer_size=40, flush_interval=3600)
+
+    writer.write('{"type": "RECORD", "record": {}}')
+    stream.flush.assert_not_called()
+    writer.write('{"type": "RECORD", "record": {}}')
+    stream.flush.assert_called_once()
+
+
+def test_given_flush_interval_elapsed_when_write_then_flush():
+    stream = MagicMock()
+    writer = BufferedMessageWriter(stream, max_buffer_size=1000, flush_interval=0)
+
+    writer.write('{"type": "RECORD", "record": {}}')
+
+    stream.flush.assert_called_once()
+
+
+def test_given_non_record_message_when_write_then_flush_immediately():
+    stream = MagicMock()
+    writer = BufferedMessageWriter(stream, max_buffer_size=1000, flush_interval=3600)
+
+    writer.write('{"type": "STATE", "state": {}}')
+
+    stream.flush.assert_called_once()
+
+
+def test_written_lines_are_kept_in_order():
+    stream = io.StringIO()
+    writer = BufferedMessageWriter(stream)
+
+    writer.write('{"type": "RECORD", "record": 1}')
+    writer.write('{"type": "LOG", "log": 2}')
+    writer.write('{"type": "RECORD", "record": 3}')
+    writer.flush()
+
+    assert stream.getvalue() == '{"type": "RECORD", "record": 1}\n{"type": "LOG", "log": 2}\n{"type": "RECORD", "record": 3}\n'
@@ -133,3 +133,26 @@ def test_secrets_added_are_filtered():
     add_to_secrets(ADDED_SECRET)
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE}"
+
+
+@pytest.mark.parametrize(
+    "secrets, string, expected",
+    [
+        pytest.param(["key", "keychain"], "keychain key", "**** ****", id="test_given_secret_prefix_of_another_then_longest_masked"),
+        pytest.param(["keychain", "key"], "keychain key", "**** ****", id="test_given_secrets_in_any_order_then_longest_masked"),
+        pytest.param(["abc", "bcd"], "abcd", "****d", id="test_given_overlapping_secrets_then_leftmost_masked"),
+        pytest.param(["a.b", "[x]"], "acb a.b [x] x", "acb **** **** x", id="test_given_regex_characters_then_matched_literally"),
+        pytest.param([SECRET_INT_VALUE], f"value {SECRET_INT_VALUE}", "value ****", id="test_given_non_string_secret_then_masked"),
+        pytest.param(["secret"], "nothing to hide", "nothing to hide", id="test_given_no_secret_first_character_then_unchanged"),
+    ],
+)
+def test_filter_secrets_masks_each_position_once(secrets, string, expected):
+    update_secrets(secrets)
+    assert filter_secrets(string) == expected
+
+
+def test_given_secret_added_after_update_when_filter_secrets_then_both_masked():
+    update_secrets(["first_secret"])
+    add_to_secrets("first_secret_extended")
+
+    assert filter_secrets("first_secret_extended first_secret") == "**** ****"
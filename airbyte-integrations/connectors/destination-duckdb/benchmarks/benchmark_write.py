@@ -0,0 +1,105 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares records/sec of `DestinationDuckdb.write`, which flushes bounded per-stream column buffers with one
+`INSERT ... SELECT unnest(?), ...` statement each, against the previous `executemany` insert of per-row tuples, on a local DuckDB file.
+
+Usage: python benchmarks/benchmark_write.py [--records 100000] [--state-every 50000]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import tempfile
+import time
+import uuid
+from typing import Iterable, List
+
+import duckdb
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from destination_duckdb.destination import DestinationDuckdb
+
+_STREAM = "benchmark"
+_CREATE_TABLE = f"""
+CREATE TABLE IF NOT EXISTS main._airbyte_raw_{_STREAM} (
+    _airbyte_ab_id TEXT PRIMARY KEY,
+    _airbyte_emitted_at DATETIME,
+    _airbyte_data JSON
+)
+"""
+
+
+def _messages(records: int, state_every: int) -> List[AirbyteMessage]:
+    messages = []
+    for i in range(records):
+        data = {"id": i, "name": f"name {i}", "email": f"user{i}@example.com", "amount": i * 1.5, "tags": ["a", "b"]}
+        messages.append(AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=_STREAM, data=data, emitted_at=0)))
+        if (i + 1) % state_every == 0:
+            messages.append(AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": i})))
+    return messages
+
+
+def _executemany_write(path: str, messages: Iterable[AirbyteMessage]) -> None:
+    con = duckdb.connect(database=path, read_only=False)
+    con.execute(_CREATE_TABLE)
+    buffer = []
+    for message in messages:
+        if message.type == Type.STATE:
+            con.executemany(f"INSERT INTO main._airbyte_raw_{_STREAM} VALUES (?,?,?)", buffer)
+            con.commit()
+            buffer = []
+        elif message.type == Type.RECORD:
+            buffer.append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(message.record.data)))
+    if buffer:
+        con.executemany(f"INSERT INTO main._airbyte_raw_{_STREAM} VALUES (?,?,?)", buffer)
+        con.commit()
+
+
+def _destination_write(path: str, messages: Iterable[AirbyteMessage]) -> None:
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=_STREAM, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+    for _ in DestinationDuckdb().write({"destination_path": path}, catalog, messages):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--state-every", type=int, default=50_000)
+    args = parser.parse_args()
+    messages = _messages(args.records, args.state_every)
+    # the benchmark writes to a temporary directory instead of /local
+    setattr(DestinationDuckdb, "_get_destination_path", staticmethod(lambda path: path))
+
+    rates = {}
+    for name, write in (("executemany", _executemany_write), ("column buffers", _destination_write)):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            start = time.perf_counter()
+            write(os.path.join(tmp_dir, "benchmark.duckdb"), messages)
+            rates[name] = args.records / (time.perf_counter() - start)
+        print(f"{name:<16} {rates[name]:>12,.0f} records/sec")
+    print(f"speedup: {rates['column buffers'] / rates['executemany']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
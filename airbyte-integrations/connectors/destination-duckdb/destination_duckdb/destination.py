@@ -7,9 +7,8 @@ import json
 import os
 import re
 import uuid
-from collections import defaultdict
 from logging import getLogger
-from typing import Any, Iterable, Mapping
+from typing import Any, Dict, Iterable, List, Mapping
 
 import duckdb
 from airbyte_cdk import AirbyteLogger
@@ -21,6 +20,10 @@ logger = getLogger("airbyte")
 CONFIG_MOTHERDUCK_API_KEY = "motherduck_api_key"
 CONFIG_DEFAULT_SCHEMA = "main"
 
+# A stream buffer is flushed once it reaches either bound, even if no state message was received
+MAX_BUFFERED_RECORDS_PER_STREAM = 10_000
+MAX_BUFFERED_BYTES_PER_STREAM = 32 * 1024 * 1024
+
 
 def validated_sql_name(sql_name: Any) -> str:
     """Return the input if it is a valid SQL name, otherwise raise an exception."""
@@ -32,6 +35,44 @@ def validated_sql_name(sql_name: Any) -> str:
     raise ValueError(f"Invalid SQL name: {sql_name}")
 
 
+class _StreamBuffer:
+    """
+    Column-oriented buffer of the raw records of a stream, inserted into DuckDB with a single statement.
+    """
+
+    def __init__(self, schema_name: str, stream_name: str) -> None:
+        self.table_name = f"{schema_name}._airbyte_raw_{stream_name}"
+        self.ab_ids: List[str] = []
+        self.emitted_at: List[datetime.datetime] = []
+        self.data: List[str] = []
+        self.size_in_bytes = 0
+
+    def append(self, data: Mapping[str, Any]) -> None:
+        serialized_data = json.dumps(data)
+        self.ab_ids.append(str(uuid.uuid4()))
+        self.emitted_at.append(datetime.datetime.now())
+        self.data.append(serialized_data)
+        self.size_in_bytes += len(serialized_data)
+
+    def is_full(self) -> bool:
+        return len(self.data) >= MAX_BUFFERED_RECORDS_PER_STREAM or self.size_in_bytes >= MAX_BUFFERED_BYTES_PER_STREAM
+
+    def flush(self, con: duckdb.DuckDBPyConnection) -> None:
+        if not self.data:
+            return
+        # each column is bound as a single list parameter and unnested, so the whole buffer is inserted by one statement
+        con.execute(
+            f"""
+            INSERT INTO {self.table_name}
+              (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
+            SELECT unnest(?), unnest(?), unnest(?)
+            """,
+            [self.ab_ids, self.emitted_at, self.data],
+        )
+        self.ab_ids, self.emitted_at, self.data = [], [], []
+        self.size_in_bytes = 0
+
+
 class DestinationDuckdb(Destination):
     @staticmethod
     def _get_destination_path(destination_path: str) -> str:
@@ -109,23 +150,15 @@ class DestinationDuckdb(Destination):
 
             con.execute(query)
 
-        buffer = defaultdict(list)
+        buffers: Dict[str, _StreamBuffer] = {}
 
         for message in input_messages:
             if message.type == Type.STATE:
-                # flush the buffer
-                for stream_name in buffer.keys():
-                    logger.info(f"flushing buffer for state: {message}")
-                    table_name = f"_airbyte_raw_{stream_name}"
-                    query = f"""
-                    INSERT INTO {schema_name}.{table_name}
-                      (_airbyte_ab_id, _airbyte_emitted_at, _airbyte_data)
-                    VALUES (?,?,?)
-                    """
-                    con.executemany(query, buffer[stream_name])
-
+                # flush the buffers: the state is only emitted once every record received before it is committed
+                logger.info(f"flushing buffer for state: {message}")
+                for buffer in buffers.values():
+                    buffer.flush(con)
                 con.commit()
-                buffer = defaultdict(list)
 
                 yield message
             elif message.type == Type.RECORD:
@@ -136,26 +169,19 @@ class DestinationDuckdb(Destination):
                     continue
 
                 # add to buffer
-                buffer[stream].append(
-                    (
-                        str(uuid.uuid4()),
-                        datetime.datetime.now().isoformat(),
-                        json.dumps(data),
-                    )
-                )
+                buffer = buffers.get(stream)
+                if buffer is None:
+                    buffer = buffers[stream] = _StreamBuffer(schema_name, stream)
+                buffer.append(data)
+                if buffer.is_full():
+                    buffer.flush(con)
             else:
                 logger.info(f"Message type {message.type} not supported, skipping")
 
         # flush any remaining messages
-        for stream_name in buffer.keys():
-            table_name = f"_airbyte_raw_{stream_name}"
-            query = f"""
-            INSERT INTO {schema_name}.{table_name}
-            VALUES (?,?,?)
-            """
-
-            con.executemany(query, buffer[stream_name])
-            con.commit()
+        for buffer in buffers.values():
+            buffer.flush(con)
+        con.commit()
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -2,8 +2,25 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import os
+import tempfile
+
+import duckdb
 import pytest
-from destination_duckdb.destination import DestinationDuckdb, validated_sql_name
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from destination_duckdb import destination
+from destination_duckdb.destination import DestinationDuckdb, _StreamBuffer, validated_sql_name
 
 
 def test_read_invalid_path():
@@ -34,3 +51,83 @@ def test_validated_sql_name(input, expected):
             validated_sql_name(input)
     else:
         assert validated_sql_name(input) == expected
+
+
+def _record(stream: str, data: dict) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=stream, data=data, emitted_at=0))
+
+
+def _state(data: dict) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data=data))
+
+
+def _catalog(*stream_names: str) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for name in stream_names
+        ]
+    )
+
+
+def test_stream_buffer_flush_inserts_all_columns_and_empties_buffer():
+    con = duckdb.connect()
+    con.execute("CREATE TABLE _airbyte_raw_users (_airbyte_ab_id TEXT PRIMARY KEY, _airbyte_emitted_at DATETIME, _airbyte_data JSON)")
+    buffer = _StreamBuffer("main", "users")
+    buffer.append({"id": 1, "name": "é"})
+    buffer.append({"id": 2, "nested": {"a": [1, None]}})
+
+    buffer.flush(con)
+    buffer.flush(con)
+
+    rows = con.execute("SELECT _airbyte_ab_id, _airbyte_emitted_at, _airbyte_data FROM main._airbyte_raw_users").fetchall()
+    assert [json.loads(row[2]) for row in rows] == [{"id": 1, "name": "é"}, {"id": 2, "nested": {"a": [1, None]}}]
+    assert all(row[0] and row[1] for row in rows)
+    assert buffer.size_in_bytes == 0 and not buffer.data
+
+
+@pytest.mark.parametrize(
+    "max_records, max_bytes, expected_full",
+    [
+        pytest.param(2, 1_000_000, True, id="test_record_count_reached"),
+        pytest.param(100, 10, True, id="test_byte_size_reached"),
+        pytest.param(100, 1_000_000, False, id="test_under_bounds"),
+    ],
+)
+def test_stream_buffer_is_full(monkeypatch, max_records, max_bytes, expected_full):
+    monkeypatch.setattr(destination, "MAX_BUFFERED_RECORDS_PER_STREAM", max_records)
+    monkeypatch.setattr(destination, "MAX_BUFFERED_BYTES_PER_STREAM", max_bytes)
+    buffer = _StreamBuffer("main", "users")
+
+    buffer.append({"id": 1, "name": "a name"})
+    buffer.append({"id": 2, "name": "another name"})
+
+    assert buffer.is_full() == expected_full
+
+
+def test_given_buffer_bound_reached_when_write_then_flush_before_state(monkeypatch):
+    monkeypatch.setattr(destination, "MAX_BUFFERED_RECORDS_PER_STREAM", 2)
+    monkeypatch.setattr(DestinationDuckdb, "_get_destination_path", lambda _, x: x)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "test.duckdb")
+        inserted_counts = []
+        flush = _StreamBuffer.flush
+
+        def spy_flush(buffer, con):
+            inserted_counts.append(len(buffer.data))
+            flush(buffer, con)
+
+        monkeypatch.setattr(_StreamBuffer, "flush", spy_flush)
+        messages = [_record("users", {"id": i}) for i in range(5)] + [_record("orders", {"id": 1}), _state({"cursor": 1})]
+
+        output = list(DestinationDuckdb().write({"destination_path": path}, _catalog("users", "orders"), messages))
+
+        assert output == [_state({"cursor": 1})]
+        assert inserted_counts == [2, 2, 1, 1, 0, 0]
+        con = duckdb.connect(path)
+        assert con.execute("SELECT count(*) FROM main._airbyte_raw_users").fetchone() == (5,)
+        assert con.execute("SELECT count(*) FROM main._airbyte_raw_orders").fetchone() == (1,)
@@ -0,0 +1,125 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares records/sec of `DestinationSqlite.write`, which commits bounded per-stream batches on a WAL journal, against the previous
+path buffering every record until a state message on the default journal, on a local SQLite file.
+
+Usage: python benchmarks/benchmark_write.py [--records 1000000] [--streams 4] [--state-every 100000]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from typing import Iterable, List
+
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from destination_sqlite import DestinationSqlite
+
+_POOL_SIZE = 10_000
+
+
+def _stream_names(streams: int) -> List[str]:
+    return [f"benchmark_{i}" for i in range(streams)]
+
+
+def _messages(records: int, streams: int, state_every: int) -> Iterable[AirbyteMessage]:
+    # messages are built once and replayed so that the benchmark measures the destination rather than the creation of pydantic models
+    stream_names = _stream_names(streams)
+    pool = [
+        AirbyteMessage(
+            type=Type.RECORD,
+            record=AirbyteRecordMessage(
+                stream=stream_names[i % streams],
+                data={"id": i, "name": f"name {i}", "email": f"user{i}@example.com", "amount": i * 1.5, "tags": ["a", "b"]},
+                emitted_at=0,
+            ),
+        )
+        for i in range(_POOL_SIZE - _POOL_SIZE % streams)
+    ]
+    for i in range(records):
+        yield pool[i % len(pool)]
+        if (i + 1) % state_every == 0:
+            yield AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": i}))
+
+
+def _catalog(streams: int) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for name in _stream_names(streams)
+        ]
+    )
+
+
+def _executemany_write(path: str, streams: int, messages: Iterable[AirbyteMessage]) -> None:
+    con = sqlite3.connect(path)
+    with con:
+        for name in _stream_names(streams):
+            con.execute(
+                f"CREATE TABLE IF NOT EXISTS _airbyte_raw_{name} "
+                "(_airbyte_ab_id TEXT PRIMARY KEY, _airbyte_emitted_at TEXT, _airbyte_data TEXT)"
+            )
+        buffer = defaultdict(list)
+        for message in messages:
+            if message.type == Type.STATE:
+                for stream_name in buffer.keys():
+                    con.executemany(f"INSERT INTO _airbyte_raw_{stream_name} VALUES (?,?,?)", buffer[stream_name])
+                con.commit()
+                buffer = defaultdict(list)
+            elif message.type == Type.RECORD:
+                buffer[message.record.stream].append(
+                    (str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(message.record.data))
+                )
+        for stream_name in buffer.keys():
+            con.executemany(f"INSERT INTO _airbyte_raw_{stream_name} VALUES (?,?,?)", buffer[stream_name])
+        con.commit()
+
+
+def _destination_write(path: str, streams: int, messages: Iterable[AirbyteMessage]) -> None:
+    for _ in DestinationSqlite().write({"destination_path": path}, _catalog(streams), messages):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--streams", type=int, default=4)
+    parser.add_argument("--state-every", type=int, default=100_000)
+    args = parser.parse_args()
+    # the benchmark writes to a temporary directory instead of /local
+    setattr(DestinationSqlite, "_get_destination_path", staticmethod(lambda path: path))
+
+    rates = {}
+    for name, write in (("previous path", _executemany_write), ("batched WAL", _destination_write)):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            start = time.perf_counter()
+            write(os.path.join(tmp_dir, "benchmark.db"), args.streams, _messages(args.records, args.streams, args.state_every))
+            rates[name] = args.records / (time.perf_counter() - start)
+        print(f"{name:<16} {rates[name]:>12,.0f} records/sec")
+    print(f"speedup: {rates['batched WAL'] / rates['previous path']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,13 +8,61 @@ import os
 import sqlite3
 import uuid
 from asyncio.log import logger
-from collections import defaultdict
-from typing import Any, Iterable, Mapping
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
 
 from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.destinations import Destination
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
 
+# A stream buffer is written in its own transaction once it reaches either bound, even if no state message was received
+MAX_BUFFERED_RECORDS_PER_STREAM = 10_000
+MAX_BUFFERED_BYTES_PER_STREAM = 32 * 1024 * 1024
+
+# WAL lets readers query the database while a sync is writing to it and turns each commit into a sequential append to the log.
+# With WAL, synchronous=NORMAL only syncs the log on checkpoints, which is safe against application crashes.
+_CONNECTION_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # in KiB, i.e. 64 MiB
+    "PRAGMA temp_store=MEMORY",
+]
+
+# same output as `json.dumps` without building an encoder for every record
+_JSON_ENCODER = json.JSONEncoder()
+
+
+class _StreamBuffer:
+    """
+    Buffer of the raw records of a stream, written with a single prepared INSERT statement.
+    """
+
+    def __init__(self, stream_name: str) -> None:
+        # sqlite3 keeps the statements it prepared in a per-connection cache keyed by their SQL so using the same query string for every
+        # flush reuses the prepared statement
+        self.query = """
+        INSERT INTO {table_name}
+        VALUES (?,?,?)
+        """.format(
+            table_name=f"_airbyte_raw_{stream_name}"
+        )
+        self.data: List[Tuple[str, str, str]] = []
+        self.size_in_bytes = 0
+
+    def append(self, data: Mapping[str, Any]) -> None:
+        serialized_data = _JSON_ENCODER.encode(data)
+        self.data.append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), serialized_data))
+        self.size_in_bytes += len(serialized_data)
+
+    def is_full(self) -> bool:
+        return len(self.data) >= MAX_BUFFERED_RECORDS_PER_STREAM or self.size_in_bytes >= MAX_BUFFERED_BYTES_PER_STREAM
+
+    def flush(self, con: sqlite3.Connection) -> None:
+        if not self.data:
+            return
+        con.executemany(self.query, self.data)
+        self.data = []
+        self.size_in_bytes = 0
+
 
 class DestinationSqlite(Destination):
     @staticmethod
@@ -56,6 +104,8 @@ class DestinationSqlite(Destination):
         path = config.get("destination_path")
         path = self._get_destination_path(path)
         con = sqlite3.connect(path)
+        for pragma in _CONNECTION_PRAGMAS:
+            con.execute(pragma)
         with con:
             # create the tables if needed
             for configured_stream in configured_catalog.streams:
@@ -81,24 +131,15 @@ class DestinationSqlite(Destination):
                 )
                 con.execute(query)
 
-            buffer = defaultdict(list)
+            buffers: Dict[str, _StreamBuffer] = {}
 
             for message in input_messages:
                 if message.type == Type.STATE:
-                    # flush the buffer
-                    for stream_name in buffer.keys():
-
-                        query = """
-                        INSERT INTO {table_name}
-                        VALUES (?,?,?)
-                        """.format(
-                            table_name=f"_airbyte_raw_{stream_name}"
-                        )
-
-                        con.executemany(query, buffer[stream_name])
+                    # flush the buffers: the state is only emitted once every record received before it is committed
+                    for buffer in buffers.values():
+                        buffer.flush(con)
 
                     con.commit()
-                    buffer = defaultdict(list)
 
                     yield message
                 elif message.type == Type.RECORD:
@@ -109,21 +150,21 @@ class DestinationSqlite(Destination):
                         continue
 
                     # add to buffer
-                    buffer[stream].append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(data)))
+                    buffer = buffers.get(stream)
+                    if buffer is None:
+                        buffer = buffers[stream] = _StreamBuffer(stream)
+                    buffer.append(data)
+                    if buffer.is_full():
+                        buffer.flush(con)
+                        con.commit()
 
             # flush any remaining messages
-            for stream_name in buffer.keys():
-
-                query = """
-                INSERT INTO {table_name}
-                VALUES (?,?,?)
-                """.format(
-                    table_name=f"_airbyte_raw_{stream_name}"
-                )
-
-                con.executemany(query, buffer[stream_name])
+            for buffer in buffers.values():
+                buffer.flush(con)
 
             con.commit()
+            # move the content of the write-ahead log into the database file so that it is complete on its own
+            con.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
     def check(self, logger: AirbyteLogger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -2,8 +2,26 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import os
+import random
+import sqlite3
+import tempfile
+
 import pytest
-from destination_sqlite import DestinationSqlite
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+from destination_sqlite import DestinationSqlite, destination
+from destination_sqlite.destination import _StreamBuffer
 
 
 def test_get_destination_path():
@@ -22,3 +40,80 @@ def test_get_destination_path():
     invalid_input = "/sqlite.db"
     with pytest.raises(ValueError):
         _ = DestinationSqlite._get_destination_path(invalid_input)
+
+
+def _record(stream: str, data: dict) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream=stream, data=data, emitted_at=0))
+
+
+def _state(data: dict) -> AirbyteMessage:
+    return AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data=data))
+
+
+def _catalog(*stream_names: str) -> ConfiguredAirbyteCatalog:
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for name in stream_names
+        ]
+    )
+
+
+def test_given_seeded_random_when_write_twice_in_append_mode_then_ids_do_not_collide(monkeypatch):
+    monkeypatch.setattr(DestinationSqlite, "_get_destination_path", lambda _, x: x)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "test.db")
+        for _ in range(2):
+            random.seed(0)
+            list(DestinationSqlite().write({"destination_path": path}, _catalog("users"), [_record("users", {"id": 1})]))
+
+        con = sqlite3.connect(path)
+        assert con.execute("SELECT count(DISTINCT _airbyte_ab_id) FROM _airbyte_raw_users").fetchone() == (2,)
+
+
+@pytest.mark.parametrize(
+    "max_records, max_bytes, expected_full",
+    [
+        pytest.param(2, 1_000_000, True, id="test_record_count_reached"),
+        pytest.param(100, 10, True, id="test_byte_size_reached"),
+        pytest.param(100, 1_000_000, False, id="test_under_bounds"),
+    ],
+)
+def test_stream_buffer_is_full(monkeypatch, max_records, max_bytes, expected_full):
+    monkeypatch.setattr(destination, "MAX_BUFFERED_RECORDS_PER_STREAM", max_records)
+    monkeypatch.setattr(destination, "MAX_BUFFERED_BYTES_PER_STREAM", max_bytes)
+    buffer = _StreamBuffer("users")
+
+    buffer.append({"id": 1, "name": "a name"})
+    buffer.append({"id": 2, "name": "another name"})
+
+    assert buffer.is_full() == expected_full
+
+
+def test_given_buffer_bound_reached_when_write_then_commit_before_state(monkeypatch):
+    monkeypatch.setattr(destination, "MAX_BUFFERED_RECORDS_PER_STREAM", 2)
+    monkeypatch.setattr(DestinationSqlite, "_get_destination_path", lambda _, x: x)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "test.db")
+        flushed_counts = []
+        flush = _StreamBuffer.flush
+
+        def spy_flush(buffer, con):
+            flushed_counts.append(len(buffer.data))
+            flush(buffer, con)
+
+        monkeypatch.setattr(_StreamBuffer, "flush", spy_flush)
+        messages = [_record("users", {"id": i}) for i in range(5)] + [_record("orders", {"id": 1}), _state({"cursor": 1})]
+
+        output = list(DestinationSqlite().write({"destination_path": path}, _catalog("users", "orders"), messages))
+
+        assert output == [_state({"cursor": 1})]
+        assert flushed_counts == [2, 2, 1, 1, 0, 0]
+        con = sqlite3.connect(path)
+        assert con.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert [json.loads(row[0]) for row in con.execute("SELECT _airbyte_data FROM _airbyte_raw_users")] == [{"id": i} for i in range(5)]
+        assert con.execute("SELECT count(*) FROM _airbyte_raw_orders").fetchone() == (1,)
@@ -5,12 +5,14 @@
 import json
 import logging
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from functools import cached_property, lru_cache
+from functools import cached_property, lru_cache, partial
 from http import HTTPStatus
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 import backoff
 import pendulum as pendulum
@@ -173,6 +175,24 @@ class HubspotAvailabilityStrategy(HttpAvailabilityStrategy):
             return is_available, reason
 
 
+class ThreadSafeOauth2Authenticator(Oauth2Authenticator):
+    """
+    Oauth2Authenticator whose token refresh is guarded by a lock, as the property chunks of a page are requested by several threads
+    sharing the session and the authenticator of their stream. The threads waiting for the lock use the token refreshed by the first one.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._token_refresh_lock = threading.Lock()
+
+    def get_access_token(self) -> str:
+        if self.token_has_expired():
+            with self._token_refresh_lock:
+                # the token is refreshed only if it was not refreshed by another thread in the meantime
+                return super().get_access_token()
+        return self.access_token
+
+
 class API:
     """HubSpot API interface, authorize, retrieve and post, supports backoff logic."""
 
@@ -192,7 +212,7 @@ class API:
 
     def get_authenticator(self) -> Optional[Oauth2Authenticator]:
         if self.is_oauth2():
-            return Oauth2Authenticator(
+            return ThreadSafeOauth2Authenticator(
                 token_refresh_endpoint=self.BASE_URL + "/oauth/v1/token",
                 client_id=self.credentials["client_id"],
                 client_secret=self.credentials["client_secret"],
@@ -333,6 +353,9 @@ class Stream(HttpStream, ABC):
     granted_scopes: Set = None
     properties_scopes: Set = None
     unnest_fields: Optional[List[str]] = None
+    # number of property chunks of the same page requested concurrently, kept low as all the streams share HubSpot's rate limits.
+    # The threads share the session of the stream and its authenticator, whose OAuth token refresh is guarded by a lock.
+    property_chunks_max_workers: int = 4
 
     @cached_property
     def record_unnester(self):
@@ -490,12 +513,28 @@ class Stream(HttpStream, ABC):
         response = None
 
         properties = self._property_wrapper
-        for chunk in properties.split():
-            response = self.handle_request(
-                stream_slice=stream_slice, stream_state=stream_state, next_page_token=next_page_token, properties=chunk
-            )
-            for record in self._transform(self.parse_response(response, stream_state=stream_state)):
-                post_processor.add_record(record)
+        max_workers = 1 if self.use_cache else self.property_chunks_max_workers
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{self.name}_properties") as executor:
+            requests_by_chunk = [
+                executor.submit(
+                    self.handle_request,
+                    stream_slice=stream_slice,
+                    stream_state=stream_state,
+                    next_page_token=next_page_token,
+                    properties=chunk,
+                )
+                for chunk in properties.split()
+            ]
+            try:
+                # responses are merged in the order of the chunks as soon as they are received, while the next chunks are still requested
+                for request in requests_by_chunk:
+                    response = request.result()
+                    for record in self._transform(self.parse_response(response, stream_state=stream_state)):
+                        post_processor.add_record(record)
+            except BaseException:
+                for request in requests_by_chunk:
+                    request.cancel()
+                raise
 
         return post_processor.flat, response
 
@@ -644,27 +683,43 @@ class Stream(HttpStream, ABC):
 
         return casted_value
 
+    @classmethod
+    def _get_property_casters(cls, properties: Mapping[str, Any]) -> Mapping[str, Callable[..., Any]]:
+        """Return the function casting the values of each property according to its declared type and format"""
+        casters = {}
+        for field_name, field_schema in properties.items():
+            declared_field_types = field_schema.get("type", [])
+            if not isinstance(declared_field_types, Iterable):
+                declared_field_types = [declared_field_types]
+            casters[field_name] = partial(
+                cls._cast_value,
+                declared_field_types=declared_field_types,
+                field_name=field_name,
+                declared_format=field_schema.get("format"),
+            )
+        return casters
+
+    @cached_property
+    def _property_casters(self) -> Mapping[str, Callable[..., Any]]:
+        return self._get_property_casters(self.properties)
+
     def _cast_record_fields_if_needed(self, record: Mapping, properties: Mapping[str, Any] = None) -> Mapping:
         if not self.entity or not record.get("properties"):
             return record
 
-        properties = properties or self.properties
+        casters = self._get_property_casters(properties) if properties else self._property_casters
 
-        for field_name, field_value in record["properties"].items():
-            if field_name not in properties:
+        record_properties = record["properties"]
+        for field_name, field_value in record_properties.items():
+            caster = casters.get(field_name)
+            if caster is None:
                 self.logger.info(
                     "Property discarded: not maching with properties schema: record id:{}, property_value: {}".format(
                         record.get("id"), field_name
                     )
                 )
                 continue
-            declared_field_types = properties[field_name].get("type", [])
-            if not isinstance(declared_field_types, Iterable):
-                declared_field_types = [declared_field_types]
-            format = properties[field_name].get("format")
-            record["properties"][field_name] = self._cast_value(
-                declared_field_types=declared_field_types, field_name=field_name, field_value=field_value, declared_format=format
-            )
+            record_properties[field_name] = caster(field_value=field_value)
 
         return record
 
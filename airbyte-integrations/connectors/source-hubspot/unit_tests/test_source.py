@@ -4,6 +4,8 @@
 
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from http import HTTPStatus
 from unittest.mock import MagicMock
@@ -15,7 +17,7 @@ from airbyte_cdk.models import ConfiguredAirbyteCatalog, SyncMode, Type
 from source_hubspot.errors import HubspotRateLimited, InvalidStartDateConfigError
 from source_hubspot.helpers import APIv3Property
 from source_hubspot.source import SourceHubspot
-from source_hubspot.streams import API, Companies, Deals, Engagements, MarketingEmails, Products, Stream
+from source_hubspot.streams import API, Companies, Deals, Engagements, MarketingEmails, Products, Stream, ThreadSafeOauth2Authenticator
 
 from .utils import read_full_refresh, read_incremental
 
@@ -127,6 +129,46 @@ def test_convert_datetime_to_string():
     assert Stream._convert_datetime_to_string(pendulum_time, declared_format="date-time")
 
 
+def test_cast_record_fields_if_needed(common_params):
+    record = {"id": "1", "properties": {"amount": "1,234.5", "is_active": "true", "closedate": "", "unknown": "value"}}
+    properties = {
+        "amount": {"type": ["null", "number"]},
+        "is_active": {"type": ["null", "boolean"]},
+        "closedate": {"type": ["null", "string"], "format": "date-time"},
+    }
+
+    casted_record = Companies(**common_params)._cast_record_fields_if_needed(record, properties=properties)
+
+    assert casted_record["properties"] == {"amount": 1234.5, "is_active": True, "closedate": None, "unknown": "value"}
+
+
+def test_oauth_token_is_refreshed_once_when_requested_by_concurrent_threads(mocker):
+    authenticator = ThreadSafeOauth2Authenticator(
+        token_refresh_endpoint="https://api.hubapi.com/oauth/v1/token",
+        client_id="client_id",
+        client_secret="client_secret",
+        refresh_token="refresh_token",
+    )
+    barrier = threading.Barrier(4)
+
+    def refresh_access_token():
+        # leave time to the other threads to ask for the token while it is refreshed, time.sleep being mocked in these tests
+        threading.Event().wait(0.1)
+        return "access_token", 1800
+
+    refresh = mocker.patch.object(authenticator, "refresh_access_token", side_effect=refresh_access_token)
+
+    def get_access_token():
+        barrier.wait()
+        return authenticator.get_access_token()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        tokens = list(executor.map(lambda _: get_access_token(), range(4)))
+
+    assert tokens == ["access_token"] * 4
+    assert refresh.call_count == 1
+
+
 def test_cast_datetime(common_params, caplog):
     field_value = pendulum.now()
     field_name = "current_time"
@@ -385,6 +427,40 @@ class TestSplittingPropertiesFunctionality:
 
         assert len(stream_records) == 6
 
+    def test_stream_with_splitting_properties_merges_chunks_in_order(self, requests_mock, common_params, api, fake_properties_list):
+        """
+        Check that the records keep the order of the first chunk when the chunks return the records in different orders
+        """
+
+        parsed_properties = list(APIv3Property(fake_properties_list).split())
+        self.set_mock_properties(requests_mock, "/properties/v2/product/properties", fake_properties_list)
+
+        test_stream = Products(**common_params)
+
+        ids_list = ["6043593519", "1092593519", "1092593518", "1092593517", "1092593516"]
+        for property_slice in parsed_properties:
+            record_responses = [
+                {
+                    "json": {
+                        "results": [
+                            {**self.BASE_OBJECT_BODY, **{"id": id, "properties": {p: "fake_data" for p in property_slice.properties}}}
+                            for id in ids_list
+                        ],
+                        "paging": {},
+                    },
+                    "status_code": 200,
+                }
+            ]
+            prop_key, prop_val = next(iter(property_slice.as_url_param().items()))
+            requests_mock.register_uri("GET", f"{test_stream.url}?{prop_key}={prop_val}", record_responses)
+            ids_list = ids_list[1:] + ids_list[:1]
+
+        stream_records = list(test_stream.read_records(sync_mode=SyncMode.incremental))
+
+        assert [record["id"] for record in stream_records] == ["6043593519", "1092593519", "1092593518", "1092593517", "1092593516"]
+        for record in stream_records:
+            assert len(record["properties"]) == NUMBER_OF_PROPERTIES
+
 
 @pytest.fixture(name="configured_catalog")
 def configured_catalog_fixture():
@@ -10,12 +10,12 @@ import time
 import urllib.parse
 import uuid
 from abc import ABC
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import closing
 from datetime import timedelta
 from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
 import backoff
-import pandas as pd
 import pendulum
 import requests  # type: ignore[import]
 from airbyte_cdk.models import ConfiguredAirbyteCatalog, FailureType, SyncMode
@@ -26,7 +26,6 @@ from airbyte_cdk.sources.streams.core import Stream, StreamData
 from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from airbyte_cdk.utils import AirbyteTracedException
-from numpy import nan
 from pendulum import DateTime  # type: ignore[attr-defined]
 from requests import codes, exceptions
 from requests.models import PreparedRequest
@@ -41,6 +40,30 @@ CSV_FIELD_SIZE_LIMIT = int(ctypes.c_ulong(-1).value // 2)
 csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
 
 DEFAULT_ENCODING = "utf-8"
+# values read as null from bulk results, matching the defaults of the pandas CSV reader that was used before
+NULL_VALUES = frozenset(
+    (
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    )
+)
 LOOKBACK_SECONDS = 600  # based on https://trailhead.salesforce.com/trailblazer-community/feed/0D54V00007T48TASAZ
 _JOB_TRANSIENT_ERRORS_MAX_RETRY = 1
 
@@ -350,6 +373,9 @@ class BulkSalesforceStream(SalesforceStream):
     DEFAULT_WAIT_TIMEOUT_SECONDS = 86400  # 24-hour bulk job running time
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
+    # results are paged so that a page can be parsed while the next one is downloaded
+    RESULTS_PAGE_MAX_RECORDS = 100000
+    DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
 
     def path(self, next_page_token: Mapping[str, Any] = None, **kwargs: Any) -> str:
         return f"/services/data/{self.sf_api.version}/jobs/query"
@@ -549,11 +575,11 @@ class BulkSalesforceStream(SalesforceStream):
         return self.encoding
 
     @default_backoff_handler(max_tries=5, backoff_method=backoff.constant, backoff_params={"interval": 5})
-    def download_data(self, url: str, chunk_size: int = 1024) -> tuple[str, str, dict]:
+    def download_data(self, url: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> tuple[str, str, dict]:
         """
         Retrieves binary data result from successfully `executed_job`, using chunks, to avoid local memory limitations.
         @ url: string - the url of the `executed_job`
-        @ chunk_size: int - the buffer size for each chunk to fetch from stream, in bytes, default: 1024 bytes
+        @ chunk_size: int - the buffer size for each chunk to fetch from stream, in bytes, default: 4 MiB
         Return the tuple containing string with file path of downloaded binary data (Saved temporarily) and file encoding.
         """
         # set filepath for binary data from response
@@ -571,29 +597,55 @@ class BulkSalesforceStream(SalesforceStream):
         else:
             raise TmpFileIOError(f"The IO/Error occured while verifying binary data. Stream: {self.name}, file {tmp_file} doesn't exist.")
 
-    def read_with_chunks(self, path: str, file_encoding: str, chunk_size: int = 100) -> Iterable[Tuple[int, Mapping[str, Any]]]:
+    def read_with_chunks(self, path: str, file_encoding: str) -> Iterable[Mapping[str, Any]]:
         """
-        Reads the downloaded binary data, using lines chunks, set by `chunk_size`.
+        Reads the downloaded binary data one row at a time. Every value is a string, empty values and NULL_VALUES are returned as None.
+        Rows shorter than the header are padded with None while rows longer than the header raise a SalesforceException.
         @ path: string - the path to the downloaded temporarily binary data.
         @ file_encoding: string - encoding for binary data file according to Standard Encodings from codecs module
-        @ chunk_size: int - the number of lines to read at a time, default: 100 lines / time.
         """
         try:
-            with open(path, "r", encoding=file_encoding) as data:
-                chunks = pd.read_csv(data, chunksize=chunk_size, iterator=True, dialect="unix", dtype=object)
-                for chunk in chunks:
-                    chunk = chunk.replace({nan: None}).to_dict(orient="records")
-                    for row in chunk:
-                        yield row
-        except pd.errors.EmptyDataError as e:
-            self.logger.info(f"Empty data received. {e}")
-            yield from []
+            with open(path, "r", encoding=file_encoding, newline="") as data:
+                reader = csv.reader(data, dialect="unix")
+                header = next(reader, None)
+                if header is None:
+                    self.logger.info("Empty data received.")
+                    return
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) > len(header):
+                        raise SalesforceException(
+                            f"Unexpected bulk results for stream {self.name}: line {reader.line_num} has {len(row)} fields "
+                            f"while the header has {len(header)}."
+                        )
+                    if len(row) < len(header):
+                        row += [""] * (len(header) - len(row))
+                    yield dict(zip(header, [None if value in NULL_VALUES else value for value in row]))
         except IOError as ioe:
             raise TmpFileIOError(f"The IO/Error occured while reading tmp data. Called: {path}. Stream: {self.name}", ioe)
         finally:
             # remove binary tmp file, after data is read
             os.remove(path)
 
+    def get_results_url(self, job_full_url: str, locator: Optional[str] = None) -> str:
+        req = PreparedRequest()
+        req.prepare_url(f"{job_full_url}/results", {"maxRecords": self.RESULTS_PAGE_MAX_RECORDS, "locator": locator})
+        return req.url
+
+    def discard_download(self, download: Future) -> None:
+        """
+        Cancels a download which results won't be read or removes the file it downloaded
+        """
+        if download.cancel():
+            return
+        try:
+            tmp_file, _, _ = download.result()
+        except Exception:
+            return
+        if os.path.isfile(tmp_file):
+            os.remove(tmp_file)
+
     def abort_job(self, url: str):
         data = {"state": "Aborted"}
         self._send_http_request("PATCH", url=url, json=data)
@@ -669,27 +721,33 @@ class BulkSalesforceStream(SalesforceStream):
                 )
                 return
             raise SalesforceException(f"Job for {self.name} stream using BULK API was failed.")
-        salesforce_bulk_api_locator = None
-        while True:
-            req = PreparedRequest()
-            req.prepare_url(f"{job_full_url}/results", {"locator": salesforce_bulk_api_locator})
-            try:
-                tmp_file, response_encoding, response_headers = self.download_data(url=req.url)
-            except TRANSIENT_EXCEPTIONS as exception:
-                if call_count >= _JOB_TRANSIENT_ERRORS_MAX_RETRY:
-                    self.logger.error(f"Downloading data failed even after {call_count} retries. Stopping retry and raising exception")
-                    raise exception
-                self.logger.warning(f"Downloading data failed after {call_count} retries. Retrying the whole job...")
-                call_count += 1
-                yield from self.read_records(sync_mode, cursor_field, stream_slice, stream_state, call_count=call_count)
-                return
+        # the next page of results is downloaded while the current one is parsed
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.name}_results")
+        download: Optional[Future] = executor.submit(self.download_data, url=self.get_results_url(job_full_url))
+        try:
+            while download is not None:
+                try:
+                    tmp_file, response_encoding, response_headers = download.result()
+                except TRANSIENT_EXCEPTIONS as exception:
+                    download = None
+                    if call_count >= _JOB_TRANSIENT_ERRORS_MAX_RETRY:
+                        self.logger.error(f"Downloading data failed even after {call_count} retries. Stopping retry and raising exception")
+                        raise exception
+                    self.logger.warning(f"Downloading data failed after {call_count} retries. Retrying the whole job...")
+                    call_count += 1
+                    yield from self.read_records(sync_mode, cursor_field, stream_slice, stream_state, call_count=call_count)
+                    return
 
-            for record in self.read_with_chunks(tmp_file, response_encoding):
-                yield record
+                salesforce_bulk_api_locator = response_headers.get("Sforce-Locator", "null")
+                download = None
+                if salesforce_bulk_api_locator != "null":
+                    download = executor.submit(self.download_data, url=self.get_results_url(job_full_url, salesforce_bulk_api_locator))
 
-            if response_headers.get("Sforce-Locator", "null") == "null":
-                break
-            salesforce_bulk_api_locator = response_headers.get("Sforce-Locator")
+                yield from self.read_with_chunks(tmp_file, response_encoding)
+        finally:
+            if download is not None:
+                self.discard_download(download)
+            executor.shutdown()
         self.delete_job(url=job_full_url)
 
     def get_standard_instance(self) -> SalesforceStream:
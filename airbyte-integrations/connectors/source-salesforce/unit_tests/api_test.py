@@ -33,7 +33,7 @@ from airbyte_cdk.utils import AirbyteTracedException
 from conftest import encoding_symbols_parameters, generate_stream
 from requests.exceptions import ChunkedEncodingError, HTTPError
 from source_salesforce.api import Salesforce
-from source_salesforce.exceptions import AUTHENTICATION_ERROR_MESSAGE_MAPPING
+from source_salesforce.exceptions import AUTHENTICATION_ERROR_MESSAGE_MAPPING, SalesforceException
 from source_salesforce.source import SourceSalesforce
 from source_salesforce.streams import (
     CSV_FIELD_SIZE_LIMIT,
@@ -199,8 +199,9 @@ def test_bulk_sync_pagination(stream_config, stream_api, requests_mock):
     loaded_ids = [int(record["ID"]) for record in stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slices)]
     assert loaded_ids == [0, 1, 2, 3, 4, 0, 1, 2, 3, 4, 0, 1, 2, 3, 4]
     assert result_uri.call_count == 3
-    assert result_uri.request_history[1].query == "locator=somelocator_1"
-    assert result_uri.request_history[2].query == "locator=somelocator_2"
+    assert result_uri.request_history[0].query == "maxrecords=100000"
+    assert result_uri.request_history[1].query == "maxrecords=100000&locator=somelocator_1"
+    assert result_uri.request_history[2].query == "maxrecords=100000&locator=somelocator_2"
 
 
 def _prepare_mock(m, stream):
@@ -353,6 +354,57 @@ def test_read_with_chunks_should_return_null_value_when_no_data_is_provided(stre
         assert res == [{"IsDeleted": "false", "Age": None, "Name": "Airbyte"}]
 
 
+def test_read_with_chunks_should_return_null_for_null_values(stream_config, stream_api):
+    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", job_full_url_results, content=b'"Region","Code","Name"\n"NA","null",""\n"EU","NaN","None"\n"Nan"\n')
+        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
+        res = list(stream.read_with_chunks(tmp_file, response_encoding))
+        assert res == [
+            {"Region": None, "Code": None, "Name": None},
+            {"Region": "EU", "Code": None, "Name": None},
+            {"Region": "Nan", "Code": None, "Name": None},
+        ]
+
+
+def test_read_with_chunks_should_raise_when_row_has_more_fields_than_header(stream_config, stream_api):
+    job_full_url_results: str = "https://fase-account.salesforce.com/services/data/v57.0/jobs/query/7504W00000bkgnpQAA/results"
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", job_full_url_results, content=b'"Id","Name"\n"1","Airbyte"\n"2","Airbyte","unexpected"\n')
+        tmp_file, response_encoding, _ = stream.download_data(url=job_full_url_results)
+        records = stream.read_with_chunks(tmp_file, response_encoding)
+        assert next(records) == {"Id": "1", "Name": "Airbyte"}
+        with pytest.raises(SalesforceException, match="line 3 has 3 fields while the header has 2"):
+            next(records)
+
+
+def test_bulk_sync_when_stopped_before_last_page_then_remove_prefetched_page(
+    stream_config, stream_api, requests_mock, tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    job_id = "fake_job"
+    requests_mock.register_uri("POST", stream.path(), json={"id": job_id})
+    requests_mock.register_uri("GET", stream.path() + f"/{job_id}", json={"state": "JobComplete"})
+    resp_text = "\n".join(["Field1,LastModifiedDate,ID"] + [f"test,2021-11-16,{i}" for i in range(5)])
+    requests_mock.register_uri(
+        "GET",
+        stream.path() + f"/{job_id}/results",
+        [{"text": resp_text, "headers": {"Sforce-Locator": "somelocator_1"}}, {"text": resp_text, "headers": {"Sforce-Locator": "null"}}],
+    )
+
+    stream_slices = next(iter(stream.stream_slices(sync_mode=SyncMode.incremental)))
+    records = stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slices)
+    next(records)
+    records.close()
+
+    assert list(tmp_path.iterdir()) == []
+
+
 @pytest.mark.parametrize(
     "chunk_size, content_type_header, content, expected_result",
     encoding_symbols_parameters(),
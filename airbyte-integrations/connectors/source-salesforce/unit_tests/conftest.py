@@ -136,14 +136,14 @@ def generate_stream(stream_name, stream_config, stream_api, state=None, legacy=T
 def encoding_symbols_parameters():
     return (
         [
-            (x, {"Content-Type": "text/csv; charset=ISO-8859-1"}, b'"\xc4"\n,"4"\n\x00,"\xca \xfc"', [{"Ä": "4"}, {"Ä": "Ê ü"}])
+            (x, {"Content-Type": "text/csv; charset=ISO-8859-1"}, b'"\xc4"\n"4"\n\x00"\xca \xfc"', [{"Ä": "4"}, {"Ä": "Ê ü"}])
             for x in range(1, 11)
         ]
         + [
             (
                 x,
                 {"Content-Type": "text/csv; charset=utf-8"},
-                b'"\xd5\x80"\n "\xd5\xaf","\xd5\xaf"\n\x00,"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
+                b'"\xd5\x80"\n"\xd5\xaf"\n\x00"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
                 [{"Հ": "կ"}, {"Հ": "も ヤ ヤ 𝜵"}],
             )
             for x in range(1, 11)
@@ -152,7 +152,7 @@ def encoding_symbols_parameters():
             (
                 x,
                 {"Content-Type": "text/csv"},
-                b'"\xd5\x80"\n "\xd5\xaf","\xd5\xaf"\n\x00,"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
+                b'"\xd5\x80"\n"\xd5\xaf"\n\x00"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
                 [{"Հ": "կ"}, {"Հ": "も ヤ ヤ 𝜵"}],
             )
             for x in range(1, 11)
@@ -161,7 +161,7 @@ def encoding_symbols_parameters():
             (
                 x,
                 {},
-                b'"\xd5\x80"\n "\xd5\xaf","\xd5\xaf"\n\x00,"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
+                b'"\xd5\x80"\n"\xd5\xaf"\n\x00"\xe3\x82\x82 \xe3\x83\xa4 \xe3\x83\xa4 \xf0\x9d\x9c\xb5"',
                 [{"Հ": "կ"}, {"Հ": "も ヤ ヤ 𝜵"}],
             )
             for x in range(1, 11)
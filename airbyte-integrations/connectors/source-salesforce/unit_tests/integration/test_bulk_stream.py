@@ -12,10 +12,11 @@ from airbyte_protocol.models import SyncMode
 from config_builder import ConfigBuilder
 from integration.utils import create_base_url, given_authentication, given_stream, read
 from salesforce_describe_response_builder import SalesforceDescribeResponseBuilder
-from source_salesforce.streams import LOOKBACK_SECONDS
+from source_salesforce.streams import LOOKBACK_SECONDS, BulkSalesforceStream
 
 _A_FIELD_NAME = "a_field"
 _ACCESS_TOKEN = "an_access_token"
+_A_LOCATOR = "a_locator"
 _CLIENT_ID = "a_client_id"
 _CLIENT_SECRET = "a_client_secret"
 _CURSOR_FIELD = "SystemModstamp"
@@ -24,6 +25,7 @@ _JOB_ID = "a-job-id"
 _LOOKBACK_WINDOW = timedelta(seconds=LOOKBACK_SECONDS)
 _NOW = datetime.now(timezone.utc)
 _REFRESH_TOKEN = "a_refresh_token"
+_RESULTS_PAGE_MAX_RECORDS = BulkSalesforceStream.RESULTS_PAGE_MAX_RECORDS
 _STREAM_NAME = "a_stream_name"
 
 _BASE_URL = create_base_url(_INSTANCE_URL)
@@ -66,10 +68,35 @@ class FullRefreshTest(TestCase):
             HttpResponse(json.dumps({"state": "JobComplete"})),
         )
         http_mocker.get(
-            HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}/results"),
+            HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}/results", query_params={"maxRecords": _RESULTS_PAGE_MAX_RECORDS}),
             HttpResponse(f"{_A_FIELD_NAME}\nfield_value"),
         )
 
         output = read(_STREAM_NAME, SyncMode.full_refresh, self._config)
 
         assert len(output.records) == 1
+
+    @HttpMocker()
+    def test_given_locator_when_read_then_extract_records_from_every_result_page(self, http_mocker: HttpMocker) -> None:
+        given_authentication(http_mocker, _CLIENT_ID, _CLIENT_SECRET, _REFRESH_TOKEN, _INSTANCE_URL)
+        given_stream(http_mocker, _BASE_URL, _STREAM_NAME, SalesforceDescribeResponseBuilder().field(_A_FIELD_NAME))
+        http_mocker.post(
+            HttpRequest(f"{_BASE_URL}/jobs/query", body=json.dumps({"operation": "queryAll", "query": "SELECT a_field FROM a_stream_name", "contentType": "CSV", "columnDelimiter": "COMMA", "lineEnding": "LF"})),
+            HttpResponse(json.dumps({"id": _JOB_ID})),
+        )
+        http_mocker.get(
+            HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}"),
+            HttpResponse(json.dumps({"state": "JobComplete"})),
+        )
+        http_mocker.get(
+            HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}/results", query_params={"maxRecords": _RESULTS_PAGE_MAX_RECORDS}),
+            HttpResponse(f"{_A_FIELD_NAME}\nfirst_page_value", headers={"Sforce-Locator": _A_LOCATOR}),
+        )
+        http_mocker.get(
+            HttpRequest(f"{_BASE_URL}/jobs/query/{_JOB_ID}/results", query_params={"maxRecords": _RESULTS_PAGE_MAX_RECORDS, "locator": _A_LOCATOR}),
+            HttpResponse(f"{_A_FIELD_NAME}\nsecond_page_value", headers={"Sforce-Locator": "null"}),
+        )
+
+        output = read(_STREAM_NAME, SyncMode.full_refresh, self._config)
+
+        assert [record.record.data[_A_FIELD_NAME] for record in output.records] == ["first_page_value", "second_page_value"]